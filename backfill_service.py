@@ -0,0 +1,229 @@
+"""
+채널 기록 백필 모듈
+
+DB를 잃었거나 봇이 꺼져 있던 기간의 인증 기록을 인증 채널의 메시지 기록으로 다시 채웁니다.
+기간을 하루씩 나눠 병렬 스캐너로 읽고, 인증 메시지를 메시지 ID 기준으로 중복 없이
+BACKFILL_BATCH_SIZE개 메시지 단위의 트랜잭션으로 저장합니다. 진행 위치도 같은 트랜잭션에
+저장하므로 중단되면 같은 기간으로 다시 실행해 마지막으로 저장한 메시지 이후부터 이어서 진행합니다.
+
+실행: python -m backfill_service 시작날짜 [종료날짜] [--channel 채널ID]
+"""
+import time
+import asyncio
+import argparse
+import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import discord
+from config_manager import ConfigManager
+from db import AsyncBackfillJobManager, VerificationArchiver
+from history_scanner import HistoryScanner
+from message_utils import MessageUtility
+from time_utils import TimeUtility
+from verification_service import VerificationService
+from logging_utils import get_logger
+
+logger = get_logger()
+
+# 하루 길이의 스노우플레이크 간격
+_DAY_SNOWFLAKES = 86400000 << 22
+
+
+class BackfillResult(NamedTuple):
+    """백필 실행 결과"""
+    job_id: int
+    start_date: datetime.date
+    end_date: datetime.date
+    scanned: int
+    inserted: int
+    elapsed: float
+    resumed: bool
+
+    @property
+    def messages_per_second(self) -> float:
+        """이번 실행에서 스캔한 초당 메시지 수"""
+        return self.scanned / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class BackfillService:
+    """인증 채널 메시지 기록으로 인증 기록을 다시 채우는 서비스"""
+
+    def __init__(self, config, verification_service: VerificationService,
+                 backfill_job_manager: AsyncBackfillJobManager,
+                 history_scanner: HistoryScanner = None, archiver: Optional[VerificationArchiver] = None):
+        """
+        Args:
+            config: 설정
+            verification_service: 메시지를 인증 기록으로 변환할 인증 서비스
+            backfill_job_manager: 백필 작업 매니저
+            history_scanner: 채널 기록 스캐너 (없으면 설정값으로 생성)
+            archiver: 아카이브 작업 (있으면 보관 대상 기간은 백필하지 않음)
+        """
+        self.config = config
+        self.verification_service = verification_service
+        self.backfill_job_manager = backfill_job_manager
+        self.history_scanner = history_scanner or HistoryScanner.from_config(config)
+        self.archiver = archiver
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """백필이 진행 중인지 여부"""
+        return self._lock.locked()
+
+    def _clamp_range(self, start_date: datetime.date,
+                     end_date: datetime.date) -> Tuple[datetime.date, datetime.date]:
+        """아카이브로 옮겨질 기간과 미래 날짜를 제외한 백필 기간"""
+        if end_date < start_date:
+            raise ValueError("종료 날짜가 시작 날짜보다 빠릅니다.")
+        today = datetime.datetime.now(self.config.TIMEZONE).date()
+        end_date = min(end_date, today)
+        if self.archiver is not None:
+            # 아카이브 파일의 기록은 중복 확인 대상이 아니므로 보관 대상 기간은 다시 채우지 않음
+            cutoff = datetime.date.fromisoformat(self.archiver.cutoff_date(today))
+            if start_date < cutoff:
+                logger.warning(
+                    f"보관 기간이 지난 {start_date} ~ {cutoff - datetime.timedelta(days=1)}은 백필하지 않습니다."
+                )
+                start_date = cutoff
+        if end_date < start_date:
+            raise ValueError("백필할 수 있는 기간이 없습니다 (미래 또는 보관 기간이 지난 날짜).")
+        return start_date, end_date
+
+    def _local_midnight(self, date: datetime.date) -> datetime.datetime:
+        """설정 시간대의 그날 0시"""
+        return self.config.TIMEZONE.localize(datetime.datetime.combine(date, datetime.time.min))
+
+    async def run(self, channel: discord.abc.Messageable, start_date: datetime.date,
+                  end_date: datetime.date) -> BackfillResult:
+        """
+        기간의 채널 기록을 스캔해 빠진 인증 기록 저장 (같은 기간의 중단된 작업은 이어서 진행)
+
+        Args:
+            channel: 인증 채널
+            start_date: 시작 날짜 (포함)
+            end_date: 종료 날짜 (포함, 오늘 이후는 오늘까지)
+
+        Returns:
+            백필 결과
+
+        Raises:
+            ValueError: 기간이 올바르지 않음
+            RuntimeError: 이미 백필이 진행 중이거나 작업/진행 위치를 저장하지 못함
+        """
+        if self.is_running:
+            raise RuntimeError("이미 백필이 진행 중입니다.")
+        async with self._lock:
+            start_date, end_date = self._clamp_range(start_date, end_date)
+            start_at = self._local_midnight(start_date)
+            end_at = self._local_midnight(end_date + datetime.timedelta(days=1))
+            job = await self.backfill_job_manager.start_job(str(channel.id), start_at, end_at)
+            if job is None:
+                raise RuntimeError("백필 작업을 시작하지 못했습니다.")
+
+            # 시작 시각과 같은 밀리초의 메시지도 포함하도록 경계를 하나 앞당김
+            lower_id = discord.utils.time_snowflake(start_at) - 1
+            resumed = job.last_message_id is not None
+            if resumed:
+                lower_id = max(lower_id, job.last_message_id)
+                logger.info(f"백필 이어서 진행: {start_date} ~ {end_date} (이미 {job.scanned}개 메시지 확인)")
+            upper_id = discord.utils.time_snowflake(min(end_at, discord.utils.utcnow()))
+
+            started = time.perf_counter()
+            last_report = started
+            scanned = inserted = batch_scanned = 0
+            pending: List[Dict] = []
+            last_message = None
+            async for message in self._scan_by_day(channel, lower_id, upper_id):
+                scanned += 1
+                batch_scanned += 1
+                last_message = message
+                record = self.verification_service.history_record(message)
+                if record:
+                    pending.append(record)
+                if batch_scanned >= self.config.BACKFILL_BATCH_SIZE:
+                    inserted += await self._save_batch(job.id, pending, last_message, batch_scanned)
+                    pending, batch_scanned = [], 0
+                    now = time.perf_counter()
+                    if now - last_report >= self.config.BACKFILL_PROGRESS_SECONDS:
+                        last_report = now
+                        reached = last_message.created_at.astimezone(self.config.TIMEZONE)
+                        logger.info(
+                            f"백필 진행: {scanned}개 메시지 ({scanned / (now - started):,.0f}개/초), "
+                            f"인증 {inserted}건 저장, {reached:%Y-%m-%d %H:%M}까지"
+                        )
+            if last_message is not None and batch_scanned:
+                inserted += await self._save_batch(job.id, pending, last_message, batch_scanned)
+            await self.backfill_job_manager.finish_job(job.id)
+
+            result = BackfillResult(
+                job.id, start_date, end_date, scanned, inserted, time.perf_counter() - started, resumed
+            )
+            logger.info(
+                f"백필 완료: {start_date} ~ {end_date} {scanned}개 메시지, 인증 {inserted}건 저장 "
+                f"({result.elapsed:.1f}초, {result.messages_per_second:,.0f}개/초)"
+            )
+            return result
+
+    async def _save_batch(self, job_id: int, pending: List[Dict], last_message: discord.Message,
+                          scanned: int) -> int:
+        """인증 기록과 진행 위치 저장 (실패 시 진행 위치를 옮기지 않고 중단)"""
+        inserted = await self.backfill_job_manager.save_progress(job_id, pending, last_message.id, scanned)
+        if inserted < 0:
+            raise RuntimeError("백필 기록을 저장하지 못해 중단합니다. 같은 기간으로 다시 실행하면 이어서 진행합니다.")
+        return inserted
+
+    async def _scan_by_day(self, channel: discord.abc.Messageable, lower_id: int, upper_id: int):
+        """
+        (lower_id, upper_id) 구간을 하루씩 차례로 스캔
+
+        병렬 스캐너는 앞 구간을 기다리는 동안 뒤 구간의 메시지를 쌓아 두므로,
+        긴 기간을 한 번에 넘기지 않고 하루 단위로 나눠 쌓이는 양을 제한합니다.
+        """
+        cursor = lower_id
+        while cursor < upper_id:
+            slice_end = min(upper_id, cursor + _DAY_SNOWFLAKES)
+            async for message in self.history_scanner.scan(channel, cursor, slice_end):
+                yield message
+            if slice_end == upper_id:
+                return
+            cursor = slice_end - 1  # before는 포함하지 않으므로 다음 구간은 slice_end부터
+
+
+async def _run_cli(start_date: datetime.date, end_date: datetime.date, channel_id: Optional[int]) -> BackfillResult:
+    """봇을 띄우지 않고 REST 로그인만으로 백필 실행"""
+    config = ConfigManager()
+    client = discord.Client(intents=discord.Intents.none())
+    try:
+        await client.login(config.TOKEN)
+        channel = await client.fetch_channel(channel_id or config.ALLOWED_CHANNELS[0])
+        verification_service = VerificationService(
+            config, client, MessageUtility(config), TimeUtility(config),
+            verification_manager=config.async_verification_manager
+        )
+        service = BackfillService(
+            config, verification_service, config.async_backfill_job_manager, archiver=config.verification_archiver
+        )
+        return await service.run(channel, start_date, end_date)
+    finally:
+        await client.close()
+        config.db_executor.shutdown()
+        config.db_manager.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """명령줄 진입점"""
+    parser = argparse.ArgumentParser(description="인증 채널 메시지 기록으로 인증 기록 다시 채우기")
+    parser.add_argument('start_date', type=datetime.date.fromisoformat, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument('end_date', type=datetime.date.fromisoformat, nargs='?',
+                        help="종료 날짜 (YYYY-MM-DD, 생략 시 시작 날짜와 같음)")
+    parser.add_argument('--channel', type=int, help="채널 ID (생략 시 첫 번째 허용 채널)")
+    args = parser.parse_args(argv)
+    result = asyncio.run(_run_cli(args.start_date, args.end_date or args.start_date, args.channel))
+    print(
+        f"{result.start_date} ~ {result.end_date}: 메시지 {result.scanned:,}개, 인증 {result.inserted:,}건 저장, "
+        f"{result.elapsed:.1f}초 ({result.messages_per_second:,.0f}개/초)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""
+성능 벤치마크 패키지
+
+저장소 루트에서 `python -m benchmarks.<모듈명>` 형태로 실행합니다.
+"""
@@ -0,0 +1,59 @@
+"""
+벤치마크 공통 유틸리티
+"""
+import os
+import sys
+import time
+import tempfile
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def measure_ops(func: Callable[[], object], iterations: int) -> float:
+    """
+    함수를 반복 실행하여 초당 실행 횟수(ops/sec) 측정
+    
+    Args:
+        func: 측정할 함수 (인자 없음)
+        iterations: 반복 횟수
+        
+    Returns:
+        초당 실행 횟수
+    """
+    func()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed if elapsed > 0 else float('inf')
+
+
+def measure_seconds(func: Callable[[], object], repeat: int = 5) -> float:
+    """함수를 여러 번 실행해 가장 빠른 실행 시간(초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@contextmanager
+def temp_db_path(name: str = "bench.db") -> Iterator[str]:
+    """벤치마크용 임시 데이터베이스 경로"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield os.path.join(temp_dir, name)
+
+
+def print_table(headers: Sequence[str], rows: List[Sequence[object]]):
+    """간단한 텍스트 표 출력"""
+    formatted = [[f"{cell:,.1f}" if isinstance(cell, float) else str(cell) for cell in row] for row in rows]
+    widths = [max(len(str(h)), *(len(r[i]) for r in formatted)) if formatted else len(str(h))
+              for i, h in enumerate(headers)]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in formatted:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)))
@@ -0,0 +1,110 @@
+"""
+인증 기록 보관 작업 벤치마크
+
+3년치 인증 기록을 적재한 뒤 1년이 지난 기록을 아카이브로 옮기면서, 동시에 다른
+스레드에서 인증 기록을 계속 추가해 쓰기 지연이 얼마나 늘어나는지 측정합니다.
+보관 작업은 청크마다 운영 DB 쓰기 잠금을 짧게만 잡아야 합니다.
+
+실행: python -m benchmarks.bench_archive [행 수] [청크 크기]
+"""
+import os
+import sys
+import time
+import datetime
+import threading
+
+from benchmarks._common import print_table, temp_db_path
+from db import DatabaseManager, VerificationArchiver, VerificationManager
+from db.archive import list_archive_years
+
+TODAY = datetime.date(2025, 12, 31)
+
+
+def _load(verification_manager: VerificationManager, rows: int, users: int = 200):
+    """사용자 200명이 3년 동안 매일 인증한 것처럼 날짜를 고르게 분산"""
+    days = 3 * 365
+    batch = []
+    for i in range(rows):
+        day = TODAY - datetime.timedelta(days=days - 1 - i * days // rows)
+        batch.append({
+            'user_id': str(i % users), 'username': f"user{i % users}",
+            'message_content': f"오늘의 TODO {i}: 알고리즘 문제 풀기, 운동 30분, 책 20페이지 읽기",
+            'image_urls': [f"https://cdn.example/{i}.png"],
+            'verification_datetime': datetime.datetime.combine(day, datetime.time(9, i % 60)),
+        })
+        if len(batch) == 5000:
+            verification_manager.add_verifications_bulk(batch)
+            batch = []
+    verification_manager.add_verifications_bulk(batch)
+
+
+def _percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))] if ordered else 0.0
+
+
+def _write_latencies(verification_manager: VerificationManager, stop: threading.Event):
+    """보관 작업과 동시에 인증 기록을 추가하며 건당 지연(ms) 기록"""
+    latencies = []
+    now = datetime.datetime.combine(TODAY, datetime.time(12, 0))
+    while not stop.is_set():
+        started = time.perf_counter()
+        verification_manager.add_verification("writer", "writer", "인증", [], now)
+        latencies.append((time.perf_counter() - started) * 1000)
+        time.sleep(0.002)
+    return latencies
+
+
+def main(rows: int = 100000, chunk_size: int = 500):
+    with temp_db_path("archive_bench.db") as db_path:
+        db_manager = DatabaseManager(db_path)
+        archive_dir = os.path.join(os.path.dirname(db_path), "archive")
+        verification_manager = VerificationManager(db_manager, archive_dir=archive_dir)
+        _load(verification_manager, rows)
+        db_manager.close()  # 적재 후 WAL 정리
+        db_manager = DatabaseManager(db_path)
+        verification_manager = VerificationManager(db_manager, archive_dir=archive_dir)
+
+        baseline_stop = threading.Event()
+        baseline = []
+        thread = threading.Thread(target=lambda: baseline.extend(_write_latencies(verification_manager, baseline_stop)))
+        thread.start()
+        time.sleep(1.0)
+        baseline_stop.set()
+        thread.join()
+
+        archiver = VerificationArchiver(db_manager, archive_dir, retention_days=365,
+                                        chunk_size=chunk_size, max_lock_ms=5.0, pause=0.01)
+        stop = threading.Event()
+        during = []
+        thread = threading.Thread(target=lambda: during.extend(_write_latencies(verification_manager, stop)))
+        thread.start()
+        started = time.perf_counter()
+        moved = archiver.run(today=TODAY)
+        elapsed = time.perf_counter() - started
+        stop.set()
+        thread.join()
+
+        hot_size = os.path.getsize(db_path)
+        archive_size = sum(os.path.getsize(os.path.join(archive_dir, name)) for name in os.listdir(archive_dir)
+                           if name.endswith('.db'))
+        print(f"인증 기록 {rows:,}행 중 {moved:,}행 보관 ({elapsed:.1f}초, {archiver.chunks_archived}개 청크, "
+              f"아카이브 연도 {list_archive_years(archive_dir)})")
+        print(f"청크당 최대 쓰기 잠금 {archiver.max_lock_ms_seen:.2f}ms, 마지막 청크 크기 {archiver.chunk_size}")
+        print(f"운영 DB {hot_size / 1e6:.1f}MB, 아카이브 {archive_size / 1e6:.1f}MB\n")
+
+        print("동시 인증 기록 추가 지연 (ms)")
+        print_table(
+            ["구간", "건수", "p50", "p99", "최대"],
+            [[name, len(values), _percentile(values, 0.5), _percentile(values, 0.99), max(values)]
+             for name, values in (("보관 작업 없음", baseline), ("보관 작업 중", during))]
+        )
+
+        started = time.perf_counter()
+        history = verification_manager.get_user_verifications("7")
+        print(f"\n사용자 전체 기록 조회 (아카이브 포함 {len(history)}건): {(time.perf_counter() - started) * 1000:.1f}ms")
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
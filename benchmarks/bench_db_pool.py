@@ -0,0 +1,94 @@
+"""
+연결 풀 도입 전/후 매니저 메서드 처리량(ops/sec) 비교 벤치마크
+
+실행: python -m benchmarks.bench_db_pool [반복 횟수]
+"""
+import sys
+import sqlite3
+import datetime
+import itertools
+from contextlib import contextmanager
+
+from benchmarks._common import measure_ops, print_table, temp_db_path
+from db import DatabaseManager, HolidayManager, VacationManager, VerificationManager
+
+
+class LegacyDatabaseManager(DatabaseManager):
+    """풀 도입 이전 동작 재현: 호출마다 새 연결을 열고 닫음 (기본 저널 모드)"""
+    
+    def __init__(self, db_path: str):
+        super().__init__(db_path, pool_size=1, pragmas={})
+    
+    @contextmanager
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+
+def _build_cases(db_manager: DatabaseManager):
+    """매니저별 모든 공개 메서드에 대한 측정 케이스 생성"""
+    holiday_manager = HolidayManager(db_manager)
+    vacation_manager = VacationManager(db_manager)
+    verification_manager = VerificationManager(db_manager)
+    
+    today = datetime.date(2025, 3, 3)
+    now = datetime.datetime(2025, 3, 3, 10, 0, 0)
+    counter = itertools.count()
+    
+    # 조회 대상 데이터 준비
+    for day in range(1, 29):
+        holiday_manager.add_holiday(f"2025-02-{day:02d}", f"휴일{day}")
+    for user in range(50):
+        vacation_manager.add_vacation(str(user), today.strftime('%Y-%m-%d'))
+        verification_manager.add_verification(str(user), f"user{user}", "인증", ["https://example.com/a.png"], now)
+    
+    return [
+        ("HolidayManager.add_holiday", lambda: holiday_manager.add_holiday("2025-12-25", "성탄절")),
+        ("HolidayManager.remove_holiday", lambda: holiday_manager.remove_holiday("2099-01-01")),
+        ("HolidayManager.is_holiday", lambda: holiday_manager.is_holiday(today)),
+        ("HolidayManager.get_holidays", lambda: holiday_manager.get_holidays(2025)),
+        ("HolidayManager.get_holiday_count", holiday_manager.get_holiday_count),
+        ("VacationManager.add_vacation", lambda: vacation_manager.add_vacation(f"bench{next(counter)}", "2025-03-04")),
+        ("VacationManager.remove_vacation", lambda: vacation_manager.remove_vacation("nobody", "2025-03-04")),
+        ("VacationManager.remove_all_vacations", lambda: vacation_manager.remove_all_vacations("nobody")),
+        ("VacationManager.is_user_on_vacation", lambda: vacation_manager.is_user_on_vacation("1", today)),
+        ("VacationManager.get_user_vacations", lambda: vacation_manager.get_user_vacations("1")),
+        ("VacationManager.get_all_vacations_by_date", lambda: vacation_manager.get_all_vacations_by_date(today)),
+        ("VerificationManager.add_verification", lambda: verification_manager.add_verification(
+            "1", "user1", "인증", ["https://example.com/a.png"], now)),
+        ("VerificationManager.get_verifications_by_date", lambda: verification_manager.get_verifications_by_date(today)),
+        ("VerificationManager.get_user_verifications", lambda: verification_manager.get_user_verifications("1")),
+        ("VerificationManager.has_user_verified_on_date", lambda: verification_manager.has_user_verified_on_date("1", today)),
+        ("VerificationManager.get_verified_users_on_date", lambda: verification_manager.get_verified_users_on_date(today)),
+    ]
+
+
+def main(iterations: int = 500):
+    rows = []
+    with temp_db_path("legacy.db") as legacy_path, temp_db_path("pooled.db") as pooled_path:
+        legacy_manager = LegacyDatabaseManager(legacy_path)
+        pooled_manager = DatabaseManager(pooled_path)
+        
+        legacy_cases = _build_cases(legacy_manager)
+        pooled_cases = _build_cases(pooled_manager)
+        
+        for (name, legacy_func), (_, pooled_func) in zip(legacy_cases, pooled_cases):
+            before = measure_ops(legacy_func, iterations)
+            after = measure_ops(pooled_func, iterations)
+            rows.append((name, before, after, f"x{after / before:.1f}"))
+        
+        pooled_manager.close()
+    
+    print(f"반복 횟수: {iterations}")
+    print_table(("메서드", "이전 ops/s", "풀 ops/s", "향상"), rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,147 @@
+"""
+채널 기록 병렬 스캔 벤치마크
+
+로컬 가짜 디스코드 HTTP 서버(메시지 조회 API만 구현, 요청마다 고정 지연)에 discord.py 클라이언트를
+붙이고, 같은 기간을 하위 구간 수를 바꿔 가며 HistoryScanner로 읽어 소요 시간을 비교합니다.
+모든 구간은 구간 수만큼의 동시 요청 예산을 나눠 씁니다. 서버는 디스코드처럼 X-RateLimit 헤더로
+초당 요청 한도를 알리고 넘으면 429로 응답하므로 discord.py의 버킷 제한도 함께 측정됩니다.
+
+실행: python -m benchmarks.bench_history_scan [메시지 수] [요청 지연(ms)] [초당 요청 한도]
+"""
+import sys
+import json
+import time
+import asyncio
+import datetime
+from bisect import bisect_left, bisect_right
+
+import discord
+from aiohttp import web
+
+from benchmarks._common import print_table
+from history_scanner import HistoryScanner, RequestBudget
+
+CHANNEL_ID = 1000
+WINDOW_COUNTS = [1, 2, 4, 8, 16]
+START = datetime.datetime(2025, 3, 3, tzinfo=datetime.timezone.utc)
+
+
+def _message_payload(message_id: int) -> dict:
+    return {
+        'id': str(message_id), 'channel_id': str(CHANNEL_ID), 'type': 0, 'content': "인증사진",
+        'author': {'id': str(message_id % 97 + 1), 'username': "user", 'discriminator': "0", 'avatar': None},
+        'timestamp': discord.utils.snowflake_time(message_id).isoformat(), 'edited_timestamp': None,
+        'tts': False, 'mention_everyone': False, 'mentions': [], 'mention_roles': [], 'attachments': [],
+        'embeds': [], 'pinned': False,
+    }
+
+
+def _json(data) -> web.Response:
+    # discord.py는 Content-Type이 정확히 application/json일 때만 JSON으로 해석
+    return web.Response(body=json.dumps(data).encode(), headers={'Content-Type': 'application/json'})
+
+
+class _FixedWindowLimit:
+    """1초 고정 윈도 요청 한도 (디스코드 X-RateLimit 헤더 형식)"""
+
+    def __init__(self, per_second: int):
+        self.per_second = per_second
+        self.window_start = 0.0
+        self.used = 0
+        self.rejected = 0
+
+    def take(self) -> dict:
+        now = time.time()
+        if now - self.window_start >= 1:
+            self.window_start, self.used = now, 0
+        self.used += 1
+        reset_after = max(0.001, 1 - (now - self.window_start))
+        return {
+            'X-RateLimit-Limit': str(self.per_second),
+            'X-RateLimit-Remaining': str(max(0, self.per_second - self.used)),
+            'X-RateLimit-Reset-After': f"{reset_after:.3f}",
+            'X-RateLimit-Reset': f"{now + reset_after:.3f}",
+            'X-RateLimit-Bucket': "messages",
+        }
+
+
+def _fake_discord_app(message_ids, latency: float, rate_limit: _FixedWindowLimit) -> web.Application:
+    """after/before/limit을 지원하는 메시지 조회 API (디스코드처럼 최신순으로 응답)"""
+    payloads = {message_id: _message_payload(message_id) for message_id in message_ids}
+
+    async def get_messages(request: web.Request) -> web.Response:
+        headers = rate_limit.take()
+        if rate_limit.used > rate_limit.per_second:
+            rate_limit.rejected += 1
+            retry_after = float(headers['X-RateLimit-Reset-After'])
+            response = _json({'message': "You are being rate limited.", 'retry_after': retry_after, 'global': False})
+            response.set_status(429)
+            # discord.py는 Via 헤더가 없는 429를 Cloudflare 차단으로 보고 재시도하지 않음
+            response.headers.update(headers, Via="1.1 google")
+            return response
+        await asyncio.sleep(latency)
+        limit = int(request.query.get('limit', 50))
+        if 'after' in request.query:
+            start = bisect_right(message_ids, int(request.query['after']))
+            selected = message_ids[start:start + limit]
+        else:
+            end = bisect_left(message_ids, int(request.query.get('before', 1 << 63)))
+            selected = message_ids[max(0, end - limit):end]
+        response = _json([payloads[message_id] for message_id in reversed(selected)])
+        response.headers.update(headers)
+        return response
+
+    async def get_me(request: web.Request) -> web.Response:
+        return _json({'id': "1", 'username': "bench", 'discriminator': "0", 'avatar': None, 'bot': True})
+
+    app = web.Application()
+    app.router.add_get(f'/api/v10/channels/{CHANNEL_ID}/messages', get_messages)
+    app.router.add_get('/api/v10/users/@me', get_me)
+    return app
+
+
+async def _run(messages: int, latency_ms: float, per_second: int):
+    # 하루 동안 고르게 흩어진 메시지
+    step = datetime.timedelta(days=1) / messages
+    message_ids = [discord.utils.time_snowflake(START + step * (i + 0.5)) for i in range(messages)]
+    rate_limit = _FixedWindowLimit(per_second)
+    runner = web.AppRunner(_fake_discord_app(message_ids, latency_ms / 1000, rate_limit))
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    discord.http.Route.BASE = f"http://127.0.0.1:{port}/api/v10"
+    client = discord.Client(intents=discord.Intents.none())
+    await client.http.static_login("bench-token")
+    channel = client.get_partial_messageable(CHANNEL_ID)
+
+    table = []
+    baseline = None
+    for windows in WINDOW_COUNTS:
+        scanner = HistoryScanner(windows=windows, min_window=datetime.timedelta(minutes=1),
+                                 budget=RequestBudget(max_concurrent=windows))
+        rate_limit.rejected = 0
+        started = time.perf_counter()
+        count = 0
+        async for _ in scanner.scan(channel, START, START + datetime.timedelta(days=1)):
+            count += 1
+        elapsed = time.perf_counter() - started
+        assert count == messages, f"{count} != {messages}"
+        baseline = baseline or elapsed
+        table.append([
+            windows, scanner.budget.requests, rate_limit.rejected, elapsed, count / elapsed, baseline / elapsed
+        ])
+
+    print(f"메시지 {messages:,}개, 요청당 지연 {latency_ms:.0f}ms, 초당 요청 한도 {per_second}\n")
+    print_table(["구간 수", "요청 수", "429 응답", "시간 (초)", "메시지/초", "배율"], table)
+    await client.http.close()
+    await runner.cleanup()
+
+
+def main(messages: int = 20000, latency_ms: int = 50, per_second: int = 50):
+    asyncio.run(_run(messages, latency_ms, per_second))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
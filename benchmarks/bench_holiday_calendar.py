@@ -0,0 +1,76 @@
+"""
+공휴일 달력 색인과 SQL 조회 경로의 지연 시간/메모리 비교 벤치마크
+
+실행: python -m benchmarks.bench_holiday_calendar [반복 횟수]
+"""
+import sys
+import datetime
+import tracemalloc
+
+from benchmarks._common import measure_ops, print_table, temp_db_path
+from db import DatabaseManager, HolidayManager
+from holiday_calendar import HolidayCalendar
+
+
+def _sample_holidays(years=range(2015, 2036)):
+    """연도마다 15개 정도의 공휴일 생성"""
+    holidays = []
+    for year in years:
+        for month, day in [(1, 1), (3, 1), (5, 5), (6, 6), (8, 15), (10, 3), (10, 9), (12, 25),
+                           (1, 28), (1, 29), (1, 30), (5, 15), (9, 16), (9, 17), (9, 18)]:
+            holidays.append(datetime.date(year, month, day).strftime('%Y-%m-%d'))
+    return holidays
+
+
+def _measure_memory(factory):
+    tracemalloc.start()
+    obj = factory()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current
+
+
+def main(iterations: int = 20000):
+    holidays = _sample_holidays()
+    probe = datetime.date(2025, 10, 3)
+    start, end = datetime.date(2025, 1, 1), datetime.date(2025, 12, 31)
+    
+    with temp_db_path() as db_path:
+        db_manager = DatabaseManager(db_path)
+        holiday_manager = HolidayManager(db_manager)
+        holiday_manager.add_holidays_bulk((date, "휴일") for date in holidays)
+        
+        calendar, calendar_bytes = _measure_memory(lambda: HolidayCalendar(holidays))
+        holiday_set, set_bytes = _measure_memory(lambda: {date for date in holidays})
+        
+        def sql_business_days():
+            # 색인 이전 방식: 하루씩 SQL로 공휴일 여부 확인
+            count, current = 0, start
+            while current < end:
+                if current.weekday() < 5 and not holiday_manager.is_holiday(current):
+                    count += 1
+                current += datetime.timedelta(days=1)
+            return count
+        
+        assert sql_business_days() == calendar.business_days_between(start, end)
+        
+        rows = [
+            ("is_holiday (SQL)", measure_ops(lambda: holiday_manager.is_holiday(probe), iterations)),
+            ("is_holiday (색인)", measure_ops(lambda: calendar.is_holiday(probe), iterations)),
+            ("business_days_between 1년 (SQL 순회)", measure_ops(sql_business_days, max(1, iterations // 1000))),
+            ("business_days_between 1년 (색인)", measure_ops(lambda: calendar.business_days_between(start, end), iterations)),
+            ("next_business_day (색인)", measure_ops(lambda: calendar.next_business_day(probe), iterations)),
+        ]
+        db_manager.close()
+    
+    print(f"공휴일 {len(holidays)}개, 반복 횟수: {iterations}")
+    print_table(("작업", "ops/s"), rows)
+    print()
+    print_table(("자료구조", "메모리(bytes)"), [
+        ("HolidayCalendar (비트셋 + 영업일 누적합)", calendar_bytes),
+        ("문자열 set (기존 HOLIDAYS)", set_bytes),
+    ])
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
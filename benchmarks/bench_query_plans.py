@@ -0,0 +1,371 @@
+"""
+매니저 SQL 쿼리 계획 점검 및 데이터 규모별 실행 시간 벤치마크
+
+db/database.py 매니저의 모든 공개 메서드를 실제로 호출하면서 실행된 SQL을 추적하고,
+각 문장에 EXPLAIN QUERY PLAN을 실행해 테이블 전체 스캔이나 임시 B-tree 정렬이 없는지 확인합니다.
+의도적으로 전체를 읽는 단계는 ALLOWED_PLAN_STEPS에 이유와 함께 등록합니다.
+같은 점검을 tests/unit/test_query_plans.py에서 회귀 테스트로 실행합니다.
+
+실행: python -m benchmarks.bench_query_plans [행 수 ...]  (기본 10,000 / 100,000 / 1,000,000)
+"""
+import re
+import sys
+import math
+import time
+import random
+import sqlite3
+import datetime
+import statistics
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, NamedTuple, Tuple
+
+from benchmarks._common import print_table, temp_db_path
+from db import (
+    BackfillJobManager, DailySummaryManager, DatabaseManager, HistoryCursorManager, HolidayManager,
+    VacationManager, VerificationManager
+)
+
+SEED_START = datetime.date(2023, 1, 2)
+
+# SQL을 실행하지 않아 점검 대상에서 제외하는 공개 메서드
+NON_SQL_METHODS = {'add_change_listener', 'encode_cursor', 'decode_cursor', 'build_match_query'}
+
+# 의도적으로 허용하는 계획 단계 (워크로드 이름 -> ((계획 정규식, 이유), ...))
+ALLOWED_PLAN_STEPS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    'HolidayManager.get_holidays[all]': (
+        (r'^SCAN holidays', "전체 공휴일 목록 반환 (연 15건 정도라 작음)"),
+    ),
+    'HolidayManager.get_holiday_count': (
+        (r'^SCAN holidays USING COVERING INDEX', "COUNT(*)는 가장 작은 인덱스 전체를 읽음"),
+    ),
+    'VacationManager.get_vacationers_among[temp]': (
+        (r'^SCAN l\b', "조회할 ID를 담은 임시 테이블이 조인의 바깥 루프"),
+    ),
+    'VerificationManager.get_verifications_by_date': (
+        (r'^USE TEMP B-TREE FOR ORDER BY', "하루치 인증 기록만 시간순 정렬"),
+    ),
+    'VerificationManager.search_verifications': (
+        (r'^SCAN f VIRTUAL TABLE INDEX \d+:=?M', "FTS5 전문 색인 MATCH 조회"),
+        (r'^USE TEMP B-TREE FOR ORDER BY', "검색어와 일치한 행만 정렬"),
+    ),
+    'VerificationManager.search_verifications[recent]': (
+        (r'^SCAN f VIRTUAL TABLE INDEX \d+:=?M', "FTS5 색인을 rowid 역순으로 읽다가 LIMIT에서 중단"),
+    ),
+    'VerificationManager.migrate_legacy_image_urls': (
+        (r'^SCAN verifications USING INDEX idx_verifications_legacy_image_urls',
+         "이전되지 않은 행만 담은 부분 인덱스 (이전이 끝나면 비어 있음)"),
+    ),
+}
+
+_PROBLEM_PATTERN = re.compile(r'^SCAN (?!CONSTANT ROW)|USE TEMP B-TREE')
+_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST_PATTERN = re.compile(r'\(\?(?:\s*,\s*\?)+\)')
+_PLANNED_PREFIXES = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH', 'REPLACE')
+# FTS5 모듈이 내부적으로 실행하는 섀도 테이블 문장 (트리거를 통해 추적됨)
+_INTERNAL_STATEMENT_PATTERN = re.compile(r"'\w+'\.'\w+_(?:config|data|idx|docsize|content)'")
+
+
+class PlannedStatement(NamedTuple):
+    """워크로드 하나가 실행한 SQL 문과 쿼리 계획"""
+    workload: str
+    sql: str
+    plan: List[str]
+
+
+class Managers(NamedTuple):
+    holidays: HolidayManager
+    vacations: VacationManager
+    verifications: VerificationManager
+    summaries: DailySummaryManager
+    cursors: HistoryCursorManager
+    backfills: BackfillJobManager
+
+    @classmethod
+    def create(cls, db_manager: DatabaseManager) -> 'Managers':
+        verifications = VerificationManager(db_manager)
+        return cls(HolidayManager(db_manager), VacationManager(db_manager),
+                   verifications, DailySummaryManager(db_manager),
+                   HistoryCursorManager(db_manager), BackfillJobManager(db_manager, verifications))
+
+
+def _normalize(sql: str) -> str:
+    """값만 다른 문장을 하나로 묶기 위한 키 (리터럴과 IN 목록 길이 제거)"""
+    key = _LITERAL_PATTERN.sub('?', ' '.join(sql.split()))
+    return _IN_LIST_PATTERN.sub('(?...)', key)
+
+
+def seed_database(db_path: str, rows: int, seed: int = 42) -> Tuple[DatabaseManager, Dict[str, object]]:
+    """
+    인증 기록 rows행 규모의 데이터베이스 생성
+
+    사용자 수와 기간을 모두 sqrt(rows) 정도로 늘려 사용자별/날짜별 조회가 함께 커지도록 합니다.
+    휴가는 사용자마다 약 한 달에 한 번 1~5일, 공휴일은 연 15일입니다.
+
+    Returns:
+        (DatabaseManager, 워크로드에 쓸 조회 값)
+    """
+    rng = random.Random(seed)
+    users = max(20, int(math.sqrt(rows)))
+    days = max(1, rows // users)
+    db_manager = DatabaseManager(db_path)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.executemany("INSERT OR IGNORE INTO holidays (date, name) VALUES (?, ?)", [
+        ((SEED_START + datetime.timedelta(days=offset)).isoformat(), f"공휴일 {offset}")
+        for offset in range(0, days, 24)
+    ])
+
+    def verification_rows():
+        record_id = 0
+        for day in range(days):
+            date = (SEED_START + datetime.timedelta(days=day)).isoformat()
+            for user in range(users):
+                record_id += 1
+                if record_id > rows:
+                    return
+                yield (record_id, str(user), f"user{user}", "오늘의 TODO 인증", date,
+                       f"{rng.randrange(24):02d}:{rng.randrange(60):02d}:00")
+
+    conn.executemany("""
+        INSERT INTO verifications (id, user_id, username, message_content, verification_date, verification_time)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, verification_rows())
+    conn.execute("""
+        INSERT INTO verification_attachments (verification_id, ordinal, url)
+        SELECT id, 0, 'https://cdn.example/' || id || '.png' FROM verifications
+    """)
+    conn.execute("""
+        INSERT INTO daily_verification (verification_date, user_id, first_time, last_time, post_count)
+        SELECT verification_date, user_id, MIN(verification_time), MAX(verification_time), COUNT(*)
+        FROM verifications GROUP BY verification_date, user_id
+    """)
+    # 모든 날짜에 전체 사용자가 체크 대상이었던 것으로 기록
+    conn.execute("""
+        INSERT INTO daily_roster (check_date, user_id)
+        SELECT dates.verification_date, users.user_id
+        FROM (SELECT DISTINCT verification_date FROM daily_verification) AS dates,
+             (SELECT DISTINCT user_id FROM daily_verification) AS users
+    """)
+
+    def vacation_rows():
+        for user in range(users):
+            day = rng.randrange(30)
+            while day < days:
+                start = SEED_START + datetime.timedelta(days=day)
+                yield (str(user), start.isoformat(), (start + datetime.timedelta(days=rng.randrange(5))).isoformat())
+                day += 30 + rng.randrange(10)
+
+    conn.executemany("INSERT INTO vacation_periods (user_id, start_date, end_date) VALUES (?, ?, ?)", vacation_rows())
+    conn.commit()
+    conn.close()
+
+    probe_date = SEED_START + datetime.timedelta(days=days // 2)
+    return db_manager, {
+        'users': [str(user) for user in range(users)],
+        'user_id': str(users // 2),
+        'date': probe_date,
+        'year': probe_date.year,
+    }
+
+
+def build_workload(managers: Managers, probe: Dict[str, object]) -> Dict[str, Callable[[], object]]:
+    """
+    매니저 공개 메서드별 호출 목록 (이름은 '클래스.메서드' 또는 '클래스.메서드[변형]')
+
+    데이터를 바꾸는 호출은 별도 사용자/날짜를 사용해 조회 결과에 영향을 주지 않습니다.
+    """
+    holidays, vacations, verifications, summaries, cursors, backfills = managers
+    user_id, date, year = probe['user_id'], probe['date'], probe['year']
+    users = probe['users']
+    week_later = date + datetime.timedelta(days=7)
+    now = datetime.datetime.combine(date, datetime.time(9, 0))
+
+    def page_with_cursor():
+        page = verifications.get_user_verifications_page(user_id, limit=20)
+        return verifications.get_user_verifications_page(user_id, cursor=page.next_cursor, limit=20)
+
+    def scanned_in_transaction():
+        with verifications.db_manager.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            inserted = verifications.insert_scanned_verification(conn, {
+                'user_id': 'probe', 'username': "probe", 'message_content': "인증",
+                'image_urls': ["https://a/5.png"], 'verification_datetime': now, 'message_id': 3,
+                'attachments': [{'attachment_id': '3', 'url': "https://a/5.png"}]})
+            conn.commit()
+            return inserted
+
+    return {
+        'HolidayManager.add_holiday': lambda: holidays.add_holiday('2099-01-01', "테스트"),
+        'HolidayManager.remove_holiday': lambda: holidays.remove_holiday('2099-01-01'),
+        'HolidayManager.is_holiday': lambda: holidays.is_holiday(date),
+        'HolidayManager.get_holidays[year]': lambda: holidays.get_holidays(year),
+        'HolidayManager.get_holidays[all]': lambda: holidays.get_holidays(),
+        'HolidayManager.add_holidays_bulk': lambda: holidays.add_holidays_bulk([('2099-01-02', "테스트")]),
+        'HolidayManager.get_holiday_count': holidays.get_holiday_count,
+        'VacationManager.add_vacation_range': lambda: vacations.add_vacation_range('probe', date, week_later),
+        'VacationManager.add_vacation': lambda: vacations.add_vacation('probe', '2099-01-01'),
+        'VacationManager.add_vacations_bulk': lambda: vacations.add_vacations_bulk([('probe', '2099-02-01')]),
+        'VacationManager.remove_vacation_range': lambda: vacations.remove_vacation_range('probe', date, date),
+        'VacationManager.remove_vacation': lambda: vacations.remove_vacation('probe', '2099-01-01'),
+        'VacationManager.remove_all_vacations': lambda: vacations.remove_all_vacations('probe'),
+        'VacationManager.is_user_on_vacation': lambda: vacations.is_user_on_vacation(user_id, date),
+        'VacationManager.get_user_vacation_periods': lambda: vacations.get_user_vacation_periods(user_id),
+        'VacationManager.get_user_vacations': lambda: vacations.get_user_vacations(user_id),
+        'VacationManager.get_all_vacations_by_date': lambda: vacations.get_all_vacations_by_date(date),
+        'VacationManager.get_vacationers_among[in]': lambda: vacations.get_vacationers_among(users[:100], date),
+        'VacationManager.get_vacationers_among[temp]': lambda: vacations.get_vacationers_among(
+            [*users, *(f"extra{i}" for i in range(VacationManager.TEMP_TABLE_THRESHOLD))], date),
+        'VacationManager.get_vacations_in_range': lambda: vacations.get_vacations_in_range(date, week_later),
+        'VerificationManager.add_verification': lambda: verifications.add_verification(
+            'probe', "probe", "인증", ["https://a/1.png"], now, message_id=2),
+        'VerificationManager.update_verification': lambda: verifications.update_verification(
+            2, "인증 수정", [{'attachment_id': '2', 'url': "https://a/1.png"}]),
+        'VerificationManager.retract_verifications': lambda: verifications.retract_verifications([2]),
+        'VerificationManager.add_verifications_bulk': lambda: verifications.add_verifications_bulk([{
+            'user_id': 'probe', 'username': "probe", 'message_content': "인증",
+            'image_urls': ["https://a/2.png"], 'verification_datetime': now}]),
+        'VerificationManager.add_missing_verifications': lambda: verifications.add_missing_verifications([{
+            'user_id': 'probe', 'username': "probe", 'message_content': "인증",
+            'image_urls': ["https://a/3.png"], 'verification_datetime': now}]),
+        'VerificationManager.insert_scanned_verification': scanned_in_transaction,
+        'VerificationManager.get_attachments': lambda: verifications.get_attachments(1),
+        'VerificationManager.get_verifications_by_date': lambda: verifications.get_verifications_by_date(date),
+        'VerificationManager.get_user_verifications': lambda: verifications.get_user_verifications(
+            user_id, date - datetime.timedelta(days=30), date),
+        'VerificationManager.get_user_verifications_page': page_with_cursor,
+        'VerificationManager.migrate_legacy_image_urls': verifications.migrate_legacy_image_urls,
+        'VerificationManager.has_user_verified_on_date': lambda: verifications.has_user_verified_on_date(user_id, date),
+        'VerificationManager.get_verified_users_on_date': lambda: verifications.get_verified_users_on_date(date),
+        'VerificationManager.get_daily_verification': lambda: verifications.get_daily_verification(user_id, date),
+        'DailySummaryManager.record_check': lambda: summaries.record_check(date, users),
+        'DailySummaryManager.rebuild': lambda: summaries.rebuild(date, week_later),
+        'DailySummaryManager.get_summary': lambda: summaries.get_summary(date),
+        'DailySummaryManager.get_summaries': lambda: summaries.get_summaries(date, week_later),
+        'HistoryCursorManager.save_cursor': lambda: cursors.save_cursor('probe', 1, now),
+        'HistoryCursorManager.get_cursor': lambda: cursors.get_cursor('probe'),
+        'BackfillJobManager.start_job': lambda: backfills.start_job('probe', now, now + datetime.timedelta(days=1)),
+        'BackfillJobManager.save_progress': lambda: backfills.save_progress(1, [{
+            'user_id': 'probe', 'username': "probe", 'message_content': "인증",
+            'image_urls': ["https://a/4.png"], 'verification_datetime': now, 'message_id': 1,
+            'attachments': [{'attachment_id': '1', 'url': "https://a/4.png"}]}], 1, 1),
+        'BackfillJobManager.finish_job': lambda: backfills.finish_job(1),
+        'VerificationManager.search_verifications': lambda: verifications.search_verifications(
+            "TODO", user_id=user_id, start_date=date - datetime.timedelta(days=30)),
+        'VerificationManager.search_verifications[recent]': lambda: verifications.search_verifications(
+            "TODO", user_id=user_id, order='recent'),
+    }
+
+
+def public_sql_methods() -> List[str]:
+    """점검 대상 공개 메서드 이름 목록 ('클래스.메서드')"""
+    names = []
+    for cls in (HolidayManager, VacationManager, VerificationManager, DailySummaryManager, HistoryCursorManager,
+                BackfillJobManager):
+        for name, value in vars(cls).items():
+            if not name.startswith('_') and callable(value) and name not in NON_SQL_METHODS:
+                names.append(f"{cls.__name__}.{name}")
+    return names
+
+
+@contextmanager
+def capture_statements(db_manager: DatabaseManager) -> Iterator[List[str]]:
+    """매니저가 풀에서 빌린 연결로 실행한 SQL 문(값이 채워진 형태)을 기록"""
+    statements: List[str] = []
+    original = db_manager.get_connection
+
+    @contextmanager
+    def traced_connection():
+        with original() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                yield conn
+            finally:
+                conn.set_trace_callback(None)
+
+    db_manager.get_connection = traced_connection
+    try:
+        yield statements
+    finally:
+        del db_manager.get_connection
+
+
+def explain_workload(db_manager: DatabaseManager,
+                     workload: Dict[str, Callable[[], object]]) -> List[PlannedStatement]:
+    """워크로드를 한 번씩 실행하고, 실행된 문장(값만 다른 문장은 하나로)의 쿼리 계획 수집"""
+    planned: List[PlannedStatement] = []
+    with db_manager.get_connection() as explain_conn:
+        for name, call in workload.items():
+            with capture_statements(db_manager) as statements:
+                call()
+            seen = set()
+            for sql in statements:
+                stripped = sql.lstrip().upper()
+                if stripped.startswith('CREATE TEMP'):
+                    # 임시 테이블을 쓰는 문장도 계획을 볼 수 있도록 같은 테이블을 만들어 둠
+                    explain_conn.execute(sql)
+                    continue
+                if not stripped.startswith(_PLANNED_PREFIXES) or _INTERNAL_STATEMENT_PATTERN.search(sql):
+                    continue
+                key = _normalize(sql)
+                if key in seen:
+                    continue
+                seen.add(key)
+                plan = [row[3] for row in explain_conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+                planned.append(PlannedStatement(name, ' '.join(sql.split()), plan))
+        explain_conn.rollback()
+    return planned
+
+
+def find_plan_problems(planned: List[PlannedStatement]) -> List[str]:
+    """허용 목록에 없는 전체 스캔/임시 B-tree 단계 설명 목록"""
+    problems = []
+    for statement in planned:
+        allowed = ALLOWED_PLAN_STEPS.get(statement.workload, ())
+        for step in statement.plan:
+            if not _PROBLEM_PATTERN.search(step):
+                continue
+            if any(re.search(pattern, step) for pattern, _ in allowed):
+                continue
+            problems.append(f"{statement.workload}: {step}\n    {statement.sql[:300]}")
+    return problems
+
+
+def time_workload(workload: Dict[str, Callable[[], object]], repeat: int = 15) -> Dict[str, float]:
+    """워크로드별 실행 시간 중앙값 (µs)"""
+    timings = {}
+    for name, call in workload.items():
+        call()  # 워밍업
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            call()
+            samples.append((time.perf_counter() - started) * 1e6)
+        timings[name] = statistics.median(samples)
+    return timings
+
+
+def main(sizes: List[int]):
+    timings_by_size = []
+    for rows in sizes:
+        with temp_db_path(f"plans_{rows}.db") as db_path:
+            started = time.perf_counter()
+            db_manager, probe = seed_database(db_path, rows)
+            managers = Managers.create(db_manager)
+            workload = build_workload(managers, probe)
+            problems = find_plan_problems(explain_workload(db_manager, workload))
+            print(f"{rows:,}행 적재 {time.perf_counter() - started:.1f}초, 계획 문제 {len(problems)}건")
+            for problem in problems:
+                print(f"  - {problem}")
+            timings_by_size.append(time_workload(workload))
+            db_manager.close()
+
+    print()
+    print_table(
+        ["워크로드", *(f"{rows:,}행 µs" for rows in sizes)],
+        [[name, *(timings[name] for timings in timings_by_size)] for name in timings_by_size[0]]
+    )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000])
@@ -0,0 +1,98 @@
+"""
+인증 기록 조회 결과의 행당 메모리 비교 벤치마크 (딕셔너리 vs __slots__ 레코드)
+
+실행: python -m benchmarks.bench_record_memory [행 수]
+"""
+import sys
+import gc
+import time
+import tracemalloc
+
+from benchmarks._common import print_table, temp_db_path
+from db import DatabaseManager, VerificationManager
+from db.records import VerificationRecord
+
+
+def _populate(db_manager: DatabaseManager, rows: int):
+    """마이그레이션 전 형식(쉼표 구분 image_urls)의 인증 기록 적재"""
+    with db_manager.get_connection() as conn:
+        conn.executemany("""
+            INSERT INTO verifications (user_id, username, message_content, image_urls, verification_date, verification_time)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (
+            (str(100000000000000000 + i % 5000), f"user{i % 5000}", "오늘의 인증 TODO 완료",
+             f"https://cdn.discordapp.com/attachments/1/{i}/image.png",
+             f"2025-{i // 100000 % 12 + 1:02d}-{i % 28 + 1:02d}", "09:30:00")
+            for i in range(rows)
+        ))
+        conn.commit()
+
+
+def _legacy_dicts(db_manager: DatabaseManager):
+    """이전 방식: sqlite3.Row를 받아 행마다 7개 키 딕셔너리와 URL 목록 생성"""
+    with db_manager.get_connection() as conn:
+        cursor = conn.execute("""
+            SELECT user_id, username, message_content, image_urls,
+                   verification_date, verification_time, created_at
+            FROM verifications
+        """)
+        results = []
+        for row in cursor.fetchall():
+            image_urls = row['image_urls'].split(',') if row['image_urls'] else []
+            results.append({
+                'user_id': row['user_id'],
+                'username': row['username'],
+                'message_content': row['message_content'],
+                'image_urls': image_urls,
+                'verification_date': row['verification_date'],
+                'verification_time': row['verification_time'],
+                'created_at': row['created_at']
+            })
+        return results
+
+
+def _slotted_records(db_manager: DatabaseManager):
+    """현재 방식: row_factory로 VerificationRecord 직접 생성"""
+    with db_manager.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = VerificationRecord.row_factory
+        cursor.execute(f"SELECT {VerificationRecord.COLUMNS} FROM verifications AS v")
+        return cursor.fetchall()
+
+
+def _measure(func, rows: int):
+    """결과를 유지한 상태의 할당 메모리(행당 bytes)와 소요 시간"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result) == rows
+    del result
+    gc.collect()
+    return current / rows, peak / rows, elapsed
+
+
+def main(rows: int = 1_000_000):
+    table = []
+    with temp_db_path() as db_path:
+        db_manager = DatabaseManager(db_path)
+        _populate(db_manager, rows)
+        
+        table.append(("dict + sqlite3.Row (이전 방식)", *_measure(lambda: _legacy_dicts(db_manager), rows)))
+        table.append(("VerificationRecord (기존 image_urls)", *_measure(lambda: _slotted_records(db_manager), rows)))
+        
+        verification_manager = VerificationManager(db_manager)
+        while verification_manager.migrate_legacy_image_urls(batch_size=50000):
+            pass
+        table.append(("VerificationRecord (첨부 파일 테이블)", *_measure(lambda: _slotted_records(db_manager), rows)))
+        db_manager.close()
+    
+    print(f"인증 기록 {rows:,}행 (tracemalloc 측정, 시간은 추적 오버헤드 포함)")
+    print_table(("방식", "유지 bytes/행", "최대 bytes/행", "초"), table)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,90 @@
+"""
+인증 메시지 전문 검색 벤치마크
+
+인증 기록을 적재한 뒤 같은 검색어를 FTS5 색인 검색(search_verifications)과
+message_content LIKE '%검색어%' 전체 스캔으로 각각 조회해 지연 시간을 비교합니다.
+LIKE 쪽도 같은 조건으로 최신 10건만 가져옵니다.
+
+실행: python -m benchmarks.bench_search [행 수]
+"""
+import sys
+import random
+import datetime
+
+from benchmarks._common import measure_seconds, print_table, temp_db_path
+from db import DatabaseManager, VerificationManager
+
+# 대부분의 메시지에 쓰이는 흔한 단어 (앞쪽일수록 자주 등장)
+VOCABULARY = [
+    "인증", "오늘", "TODO", "운동", "공부", "독서", "알고리즘", "산책", "running", "study",
+    "영어", "단어", "회고", "리팩토링", "논문", "스쿼트", "명상",
+]
+# 가끔만 등장하는 주제어와 등장 확률 (관리자가 찾으려는 대상)
+RARE_TOPICS = [("바이올린", 0.001), ("kubernetes", 0.0001)]
+LIKE_SQL = """
+    SELECT id, user_id, verification_date, message_content FROM verifications
+    WHERE message_content LIKE ? {user_filter}
+    ORDER BY verification_date DESC, verification_time DESC, id DESC LIMIT 10
+"""
+
+
+def _message(rng: random.Random, i: int) -> str:
+    words = rng.choices(VOCABULARY, weights=[1 / (rank + 1) for rank in range(len(VOCABULARY))], k=8)
+    words += [topic for topic, probability in RARE_TOPICS if rng.random() < probability]
+    return f"{i}번째 인증: " + " ".join(words)
+
+
+def _load(verification_manager: VerificationManager, rows: int, users: int = 500):
+    rng = random.Random(42)
+    start = datetime.datetime(2023, 1, 1, 9, 0)
+    batch = []
+    for i in range(rows):
+        batch.append({
+            'user_id': str(i % users), 'username': f"user{i % users}",
+            'message_content': _message(rng, i), 'image_urls': [],
+            'verification_datetime': start + datetime.timedelta(minutes=i),
+        })
+        if len(batch) == 10000:
+            verification_manager.add_verifications_bulk(batch)
+            batch = []
+    verification_manager.add_verifications_bulk(batch)
+
+
+def _like(db_manager: DatabaseManager, term: str, user_id=None):
+    query = LIKE_SQL.format(user_filter="AND user_id = ?" if user_id else "")
+    params = [f"%{term}%"] + ([user_id] if user_id else [])
+    with db_manager.get_connection() as conn:
+        return conn.execute(query, params).fetchall()
+
+
+def main(rows: int = 1000000):
+    with temp_db_path("search_bench.db") as db_path:
+        db_manager = DatabaseManager(db_path)
+        verification_manager = VerificationManager(db_manager)
+        load_seconds = measure_seconds(lambda: _load(verification_manager, rows), repeat=1)
+        print(f"인증 기록 {rows:,}행 적재 (FTS 트리거 포함): {load_seconds:.1f}초\n")
+
+        cases = [
+            ("흔한 단어", "공부", None, 'recent'),
+            ("드문 단어", "바이올린", None, 'recent'),
+            ("접두사", "kube", None, 'recent'),
+            ("두 단어", "독서 명상", None, 'recent'),
+            ("드문 단어, 관련도순", "바이올린", None, 'rank'),
+            ("드문 단어 + 사용자", "바이올린", "7", 'recent'),
+            ("일치 없음", "첼로", None, 'recent'),
+        ]
+        table = []
+        for name, term, user_id, order in cases:
+            fts = measure_seconds(
+                lambda: verification_manager.search_verifications(term, user_id=user_id, order=order), repeat=3
+            )
+            # LIKE는 한 단어 부분 문자열만 비교 가능 (여러 단어는 첫 단어로)
+            like = measure_seconds(lambda: _like(db_manager, term.split()[0], user_id), repeat=3)
+            table.append([name, term, order, fts * 1000, like * 1000, like / fts if fts else float('inf')])
+
+        print_table(["검색", "검색어", "정렬", "FTS5 (ms)", "LIKE (ms)", "배율"], table)
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,58 @@
+"""
+데이터베이스 시작 시간 벤치마크 (스키마 버전 확인 vs 매번 DDL 실행)
+
+실행: python -m benchmarks.bench_startup [반복 횟수]
+"""
+import sys
+import sqlite3
+
+from benchmarks._common import measure_seconds, print_table, temp_db_path
+from db import DatabaseManager
+from db.schema import MIGRATIONS, migrate_schema
+
+
+def _run_all_ddl(conn: sqlite3.Connection):
+    """버전 관리 이전 방식: 시작할 때마다 모든 CREATE ... IF NOT EXISTS 실행"""
+    for migration in MIGRATIONS:
+        for statement in migration.statements:
+            conn.execute(statement)
+    conn.commit()
+
+
+def _check_version(conn: sqlite3.Connection, db_path: str):
+    """버전 기반 방식: user_version과 체크섬만 확인"""
+    assert migrate_schema(conn, db_path) == []
+
+
+def main(repeat: int = 50):
+    rows = []
+    with temp_db_path() as db_path:
+        created = measure_seconds(lambda: DatabaseManager(db_path, pool_size=1).close(), repeat=1)
+        rows.append(("새 데이터베이스 생성 + 마이그레이션", created * 1e6))
+        rows.append(("DatabaseManager 시작 (스키마 최신)",
+                     measure_seconds(lambda: DatabaseManager(db_path, pool_size=1).close(), repeat) * 1e6))
+        # 연결 생성 비용을 빼고 스키마 확인 단계만 비교
+        conn = sqlite3.connect(db_path)
+        rows.append(("스키마 확인 (버전/체크섬만)",
+                     measure_seconds(lambda: _check_version(conn, db_path), repeat) * 1e6))
+        rows.append(("스키마 확인 (매번 DDL 실행, 이전 방식)",
+                     measure_seconds(lambda: _run_all_ddl(conn), repeat) * 1e6))
+        conn.close()
+    
+    with temp_db_path() as db_path:
+        # 버전 관리 이전 데이터베이스 (하루 단위 휴가 1만 행) 업그레이드
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE vacations (id INTEGER PRIMARY KEY, user_id TEXT, date TEXT, UNIQUE(user_id, date))")
+        conn.executemany("INSERT INTO vacations (user_id, date) VALUES (?, ?)",
+                         ((str(i % 500), f"2025-{i // 500 % 12 + 1:02d}-{i // 6000 + 1:02d}") for i in range(10000)))
+        conn.commit()
+        conn.close()
+        upgraded = measure_seconds(lambda: DatabaseManager(db_path, pool_size=1).close(), repeat=1)
+        rows.append(("v0 -> 최신 업그레이드 (백업 포함)", upgraded * 1e6))
+    
+    print(f"반복 횟수: {repeat} (최소 시간)")
+    print_table(("시나리오", "µs"), rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
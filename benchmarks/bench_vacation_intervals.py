@@ -0,0 +1,152 @@
+"""
+하루 단위 휴가 행과 [시작일, 종료일] 구간 저장 방식의 조회 성능 비교 벤치마크
+
+사용자 10,000명이 1년 동안 여러 번 휴가를 쓰는 데이터를 기존 vacations 테이블에 넣고,
+DatabaseManager 초기화 시 구간으로 압축한 뒤 같은 조회를 두 방식으로 측정합니다.
+
+실행: python -m benchmarks.bench_vacation_intervals [사용자 수] [반복 횟수]
+"""
+import sys
+import time
+import random
+import sqlite3
+import datetime
+
+from benchmarks._common import measure_ops, print_table, temp_db_path
+from db import DatabaseManager, VacationManager
+
+YEAR_START = datetime.date(2025, 1, 1)
+
+
+def _sample_vacation_days(users: int, seed: int = 42):
+    """사용자마다 1~10일짜리 휴가를 2~6번 (연간 약 20일) 생성"""
+    rng = random.Random(seed)
+    for user_id in range(users):
+        days = set()
+        for _ in range(rng.randint(2, 6)):
+            start = rng.randrange(365)
+            for offset in range(rng.randint(1, 10)):
+                if start + offset < 365:
+                    days.add(start + offset)
+        for day in sorted(days):
+            yield str(user_id), (YEAR_START + datetime.timedelta(days=day)).isoformat()
+
+
+def _create_legacy_table(db_path: str, rows) -> int:
+    """기존 스키마(사용자/날짜당 1행)로 데이터 적재"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE vacations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            date TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(user_id, date)
+        )
+    """)
+    conn.execute("CREATE INDEX idx_vacations_user_date ON vacations(user_id, date)")
+    conn.execute("CREATE INDEX idx_vacations_date ON vacations(date)")
+    conn.executemany("INSERT INTO vacations (user_id, date) VALUES (?, ?)", rows)
+    conn.commit()
+    count = conn.execute("SELECT COUNT(*) FROM vacations").fetchone()[0]
+    conn.close()
+    return count
+
+
+def main(users: int = 10000, iterations: int = 2000):
+    rows = list(_sample_vacation_days(users))
+    rng = random.Random(7)
+    probes = [(str(rng.randrange(users)), YEAR_START + datetime.timedelta(days=rng.randrange(365)))
+              for _ in range(256)]
+    range_start = datetime.date(2025, 7, 1)
+    range_end = range_start + datetime.timedelta(days=13)
+    
+    with temp_db_path("legacy.db") as legacy_path, temp_db_path("interval.db") as interval_path:
+        legacy_rows = _create_legacy_table(legacy_path, rows)
+        _create_legacy_table(interval_path, rows)
+        
+        # DatabaseManager 초기화 시 기존 vacations 테이블이 구간으로 압축됨
+        started = time.perf_counter()
+        db_manager = DatabaseManager(interval_path)
+        compaction_seconds = time.perf_counter() - started
+        vacation_manager = VacationManager(db_manager)
+        with db_manager.get_connection() as conn:
+            periods = conn.execute("SELECT COUNT(*) FROM vacation_periods").fetchone()[0]
+        
+        # 연결 풀 오버헤드를 빼고 같은 조건(원시 연결)에서 두 스키마의 쿼리만 비교
+        legacy = sqlite3.connect(legacy_path)
+        interval = sqlite3.connect(interval_path)
+        
+        def cycle(func):
+            state = {'i': 0}
+            def run():
+                user_id, date = probes[state['i'] % len(probes)]
+                state['i'] += 1
+                return func(user_id, date)
+            return run
+        
+        def legacy_point(user_id, date):
+            return legacy.execute("SELECT 1 FROM vacations WHERE user_id = ? AND date = ?",
+                                  (user_id, date.isoformat())).fetchone() is not None
+        
+        def legacy_by_date(_, date):
+            return {row[0] for row in legacy.execute("SELECT user_id FROM vacations WHERE date = ?",
+                                                      (date.isoformat(),))}
+        
+        def legacy_range():
+            result = {}
+            for user_id, date in legacy.execute("SELECT user_id, date FROM vacations WHERE date BETWEEN ? AND ?",
+                                                (range_start.isoformat(), range_end.isoformat())):
+                result.setdefault(date, set()).add(user_id)
+            return result
+        
+        def interval_point(user_id, date):
+            row = interval.execute("""
+                SELECT end_date FROM vacation_periods
+                WHERE user_id = ? AND start_date <= ? ORDER BY start_date DESC LIMIT 1
+            """, (user_id, date.isoformat())).fetchone()
+            return row is not None and row[0] >= date.isoformat()
+        
+        def interval_by_date(_, date):
+            return {row[0] for row in interval.execute(
+                f"SELECT user_id FROM vacation_periods WHERE {VacationManager._OVERLAP_SQL}",
+                {'start': date.isoformat(), 'end': date.isoformat()})}
+        
+        def interval_range():
+            result = {}
+            for user_id, start, end in interval.execute(
+                    f"SELECT user_id, start_date, end_date FROM vacation_periods WHERE {VacationManager._OVERLAP_SQL}",
+                    {'start': range_start.isoformat(), 'end': range_end.isoformat()}):
+                first = max(datetime.date.fromisoformat(start), range_start)
+                last = min(datetime.date.fromisoformat(end), range_end)
+                for offset in range((last - first).days + 1):
+                    result.setdefault((first + datetime.timedelta(days=offset)).isoformat(), set()).add(user_id)
+            return result
+        
+        assert all(interval_point(u, d) == vacation_manager.is_user_on_vacation(u, d) for u, d in probes)
+        assert all(legacy_by_date(u, d) == interval_by_date(u, d) for u, d in probes[:16])
+        assert all(legacy_point(u, d) == vacation_manager.is_user_on_vacation(u, d) for u, d in probes)
+        assert legacy_range() == vacation_manager.get_vacations_in_range(range_start, range_end)
+        
+        table = [
+            ("특정 사용자/날짜 (하루 단위)", measure_ops(cycle(legacy_point), iterations)),
+            ("특정 사용자/날짜 (구간)", measure_ops(cycle(interval_point), iterations)),
+            ("날짜별 휴가자 (하루 단위)", measure_ops(cycle(legacy_by_date), max(1, iterations // 10))),
+            ("날짜별 휴가자 (구간)", measure_ops(cycle(interval_by_date), max(1, iterations // 10))),
+            ("2주 기간 휴가자 (하루 단위)", measure_ops(legacy_range, max(1, iterations // 100))),
+            ("2주 기간 휴가자 (구간)", measure_ops(interval_range, max(1, iterations // 100))),
+            ("특정 사용자/날짜 (VacationManager)",
+             measure_ops(cycle(vacation_manager.is_user_on_vacation), iterations)),
+        ]
+        interval.close()
+        legacy.close()
+        db_manager.close()
+    
+    print(f"사용자 {users:,}명 x 1년, 하루 단위 {legacy_rows:,}행 -> 구간 {periods:,}개 "
+          f"(압축 {compaction_seconds * 1000:.1f}ms)")
+    print_table(("조회", "ops/s"), table)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 2000)
@@ -11,12 +11,35 @@ from time_utils import TimeUtility
 from webhook_service import WebhookService
 from verification_service import VerificationService
 from vacation_service import VacationService
+from roster_service import MemberRosterService
+from backfill_service import BackfillService
+from ingest_queue import VerificationIngestQueue
 from tasks import TaskManager
 from commands import CommandSetup
+from db import VerificationWriteBuffer
 from logging_utils import get_logger
 
 logger = get_logger()
 
+class _ShutdownHookBot(commands.Bot):
+    """종료 시 등록된 비동기 훅을 실행하는 Bot"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._shutdown_hooks = []
+    
+    def add_shutdown_hook(self, hook):
+        """종료 훅 등록 (등록 순서대로 실행)"""
+        self._shutdown_hooks.append(hook)
+    
+    async def close(self):
+        for hook in self._shutdown_hooks:
+            try:
+                await hook()
+            except Exception as e:
+                logger.error(f"종료 훅 실행 중 오류: {e}", exc_info=True)
+        await super().close()
+
 class VerificationBot:
     """인증 봇 클래스"""
     
@@ -41,28 +64,67 @@ class VerificationBot:
             intents.members = True
             
         # 슬래시 명령어만 사용하므로 빈 문자열로 설정
-        self.bot = commands.Bot(command_prefix="", intents=intents)
+        self.bot = _ShutdownHookBot(command_prefix="", intents=intents)
         
         # 서비스 초기화 (데이터베이스 매니저 공유)
         self.webhook_service = WebhookService(self.config)
-        self.vacation_service = VacationService(self.config, self.time_util, self.config.vacation_manager)
+        self.vacation_service = VacationService(self.config, self.time_util, self.config.async_vacation_manager)
+        self.roster_service = MemberRosterService(self.config)
+        self.verification_writer = VerificationWriteBuffer(
+            self.config.async_verification_manager,
+            flush_interval=self.config.WRITE_BEHIND_FLUSH_INTERVAL,
+            max_batch_size=self.config.WRITE_BEHIND_MAX_BATCH_SIZE
+        )
         self.verification_service = VerificationService(
             self.config, self.bot, self.message_util, self.time_util, self.webhook_service,
-            self.vacation_service, self.config.verification_manager
+            self.vacation_service, self.config.async_verification_manager, self.verification_writer,
+            self.config.async_daily_summary_manager, self.config.async_history_cursor_manager,
+            self.roster_service
         )
+        self.ingest_queue = VerificationIngestQueue.from_config(self.config, self.verification_service)
+        
+        self.backfill_service = BackfillService(
+            self.config, self.verification_service, self.config.async_backfill_job_manager,
+            archiver=self.config.verification_archiver
+        )
+        
+        # 종료 시 대기열에 남은 메시지를 처리한 뒤 버퍼에 남은 인증 기록 커밋
+        self.bot.add_shutdown_hook(self.ingest_queue.close)
+        self.bot.add_shutdown_hook(self.verification_writer.close)
         
         # 태스크 관리자 초기화
-        self.task_manager = TaskManager(self.bot, self.config, self.verification_service)
+        self.task_manager = TaskManager(self.bot, self.config, self.verification_service, self.ingest_queue)
         
         # 명령어 핸들러 초기화
         self.command_handler = CommandSetup(
             self.bot, self.config, self.verification_service, self.task_manager, 
-            self.time_util, self.vacation_service
+            self.time_util, self.vacation_service, self.backfill_service
         )
         
+        # 기존 인증 기록 첨부 파일 이전 작업 (on_ready가 여러 번 호출되어도 한 번만 실행)
+        self._attachment_migration_task = None
+        # 멤버 명단 생성 작업 (게이트웨이 청크 대기 동안 on_ready를 막지 않음)
+        self._roster_seed_task = None
+        
         # 이벤트 핸들러 등록
         self._setup_event_handlers()
     
+    async def _migrate_legacy_attachments(self):
+        """쉼표 구분 image_urls를 배치 단위로 첨부 파일 테이블로 이전 (배치 사이에 양보)"""
+        manager = self.config.async_verification_manager
+        migrated = 0
+        try:
+            while True:
+                count = await manager.migrate_legacy_image_urls(self.config.ATTACHMENT_MIGRATION_BATCH_SIZE)
+                if count == 0:
+                    break
+                migrated += count
+                await asyncio.sleep(self.config.ATTACHMENT_MIGRATION_PAUSE)
+            if migrated:
+                logger.info(f"기존 인증 기록 첨부 파일 이전 완료: {migrated}건")
+        except Exception as e:
+            logger.error(f"첨부 파일 이전 중 오류: {e}", exc_info=True)
+    
     def _setup_event_handlers(self):
         """이벤트 핸들러 등록"""
         
@@ -81,6 +143,11 @@ class VerificationBot:
             logger.info(f"KST time: {now_kst}")
             logger.info("================")
             
+            if self._attachment_migration_task is None:
+                self._attachment_migration_task = asyncio.create_task(self._migrate_legacy_attachments())
+            if self._roster_seed_task is None:
+                self._roster_seed_task = asyncio.create_task(self.roster_service.seed_all(self.bot.guilds))
+            
             # 태스크 설정 및 시작
             self.task_manager.setup_tasks()
             self.task_manager.start_tasks()
@@ -90,6 +157,31 @@ class VerificationBot:
             
             logger.info(f'Logged in as {self.bot.user}')
         
+        @self.bot.event
+        async def on_member_join(member):
+            self.roster_service.on_member_join(member)
+        
+        @self.bot.event
+        async def on_raw_member_remove(payload):
+            # 캐시에 없던 멤버의 퇴장도 받도록 raw 이벤트 사용
+            self.roster_service.on_member_remove(payload.guild_id, payload.user.id)
+        
+        @self.bot.event
+        async def on_member_update(before, after):
+            self.roster_service.on_member_update(before, after)
+        
+        @self.bot.event
+        async def on_guild_role_update(before, after):
+            self.roster_service.on_guild_role_update(before, after)
+        
+        @self.bot.event
+        async def on_guild_role_delete(role):
+            self.roster_service.on_guild_role_delete(role)
+        
+        @self.bot.event
+        async def on_guild_channel_update(before, after):
+            self.roster_service.on_guild_channel_update(before, after)
+        
         @self.bot.event
         async def on_message(message):
             if message.author == self.bot.user:
@@ -99,11 +191,34 @@ class VerificationBot:
             if message.channel.id in self.config.ALLOWED_CHANNELS:
                 try:
                     if self.message_util.is_verification_message(message.content):
-                        await self.verification_service.process_verification_message(message)
+                        # ⏳ 반응만 바로 보내고 저장과 응답은 대기열 작업자가 처리
+                        await self.ingest_queue.submit(message)
                 except Exception as e:
                     logger.error(f"메시지 처리 중 오류: {e}", exc_info=True)
             
             # 슬래시 명령어만 사용하므로 process_commands 호출하지 않음
+        
+        @self.bot.event
+        async def on_raw_message_edit(payload):
+            # 캐시에 없는 오래된 메시지의 수정도 받도록 raw 이벤트 사용
+            try:
+                await self.verification_service.handle_message_edit(payload)
+            except Exception as e:
+                logger.error(f"메시지 수정 처리 중 오류: {e}", exc_info=True)
+        
+        @self.bot.event
+        async def on_raw_message_delete(payload):
+            try:
+                await self.verification_service.handle_message_delete(payload.channel_id, [payload.message_id])
+            except Exception as e:
+                logger.error(f"메시지 삭제 처리 중 오류: {e}", exc_info=True)
+        
+        @self.bot.event
+        async def on_raw_bulk_message_delete(payload):
+            try:
+                await self.verification_service.handle_message_delete(payload.channel_id, payload.message_ids)
+            except Exception as e:
+                logger.error(f"메시지 일괄 삭제 처리 중 오류: {e}", exc_info=True)
     
     async def _sync_commands(self):
         """슬래시 명령어 동기화"""
@@ -146,5 +261,9 @@ class VerificationBot:
                         loop.close()
                     except Exception as e:
                         logger.error(f"웹훅 서비스 정리 중 오류: {e}", exc_info=True)
+                
+                # DB 실행기 및 연결 풀 정리
+                self.config.db_executor.shutdown()
+                self.config.db_manager.close()
             except Exception as e:
                 logger.error(f"종료 처리 중 오류: {e}", exc_info=True) 
\ No newline at end of file
@@ -6,6 +6,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from typing import Optional, List
+from db import BackupError
 from logging_utils import get_logger
 
 logger = get_logger()
@@ -52,6 +53,166 @@ class BaseCommands(commands.Cog):
             
         return channel, None
 
+class VerificationHistoryView(discord.ui.View):
+    """인증 기록 페이지 넘김 뷰 (버튼을 누를 때마다 해당 페이지만 조회)"""
+    
+    PAGE_SIZE = 10
+    
+    def __init__(self, verification_manager, user: discord.abc.User, descending: bool = True,
+                 start_date: Optional[datetime.date] = None, end_date: Optional[datetime.date] = None,
+                 timeout: float = 180):
+        super().__init__(timeout=timeout)
+        self.verification_manager = verification_manager
+        self.user = user
+        self.descending = descending
+        self.start_date = start_date
+        self.end_date = end_date
+        
+        # 방문한 페이지의 시작 커서 (이전 페이지로 돌아갈 때 재사용)
+        self._page_cursors: List[Optional[str]] = [None]
+        self._page_index = 0
+        self._next_cursor: Optional[str] = None
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """명령어를 실행한 사용자만 페이지를 넘길 수 있음"""
+        if interaction.user.id != self.user.id:
+            await interaction.response.send_message("본인의 인증 기록만 넘겨볼 수 있습니다.", ephemeral=True)
+            return False
+        return True
+    
+    async def render_page(self) -> discord.Embed:
+        """현재 페이지를 조회하여 임베드 생성 및 버튼 상태 갱신"""
+        page = await self.verification_manager.get_user_verifications_page(
+            str(self.user.id), self._page_cursors[self._page_index], self.PAGE_SIZE,
+            self.descending, self.start_date, self.end_date
+        )
+        self._next_cursor = page.next_cursor
+        self.previous_page.disabled = self._page_index == 0
+        self.next_page.disabled = page.next_cursor is None
+        
+        embed = discord.Embed(
+            title="📜 인증 기록",
+            description=f"{self.user.mention}님의 인증 기록입니다. ({'최신순' if self.descending else '오래된 순'})",
+            color=discord.Color.blue()
+        )
+        if page.records:
+            lines = []
+            for record in page.records:
+                image_count = len(record.image_urls)
+                lines.append(f"• {record.verification_date} {record.verification_time} - 이미지 {image_count}장")
+            embed.add_field(name="기록", value="\n".join(lines), inline=False)
+        else:
+            embed.add_field(name="기록", value="조회된 인증 기록이 없습니다.", inline=False)
+        
+        if self.start_date or self.end_date:
+            embed.add_field(
+                name="기간",
+                value=f"{self.start_date or '처음'} ~ {self.end_date or '현재'}",
+                inline=False
+            )
+        embed.set_footer(text=f"페이지 {self._page_index + 1}")
+        return embed
+    
+    @discord.ui.button(label="◀ 이전", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self._page_index = max(0, self._page_index - 1)
+        await interaction.response.edit_message(embed=await self.render_page(), view=self)
+    
+    @discord.ui.button(label="다음 ▶", style=discord.ButtonStyle.primary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self._next_cursor is not None:
+            del self._page_cursors[self._page_index + 1:]
+            self._page_cursors.append(self._next_cursor)
+            self._page_index += 1
+        await interaction.response.edit_message(embed=await self.render_page(), view=self)
+
+class SearchResultsView(discord.ui.View):
+    """인증 메시지 검색 결과 페이지 넘김 뷰"""
+    
+    PAGE_SIZE = 10
+    SNIPPET_LENGTH = 80
+    
+    def __init__(self, verification_manager, requester: discord.abc.User, query: str,
+                 user: Optional[discord.abc.User] = None, order: str = 'rank',
+                 start_date: Optional[datetime.date] = None, end_date: Optional[datetime.date] = None,
+                 timeout: float = 180):
+        super().__init__(timeout=timeout)
+        self.verification_manager = verification_manager
+        self.requester = requester
+        self.query = query
+        self.user = user
+        self.order = order
+        self.start_date = start_date
+        self.end_date = end_date
+        
+        # 방문한 페이지의 시작 커서 (이전 페이지로 돌아갈 때 재사용)
+        self._page_cursors: List[Optional[str]] = [None]
+        self._page_index = 0
+        self._next_cursor: Optional[str] = None
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """명령어를 실행한 사용자만 페이지를 넘길 수 있음"""
+        if interaction.user.id != self.requester.id:
+            await interaction.response.send_message("검색한 사용자만 결과를 넘겨볼 수 있습니다.", ephemeral=True)
+            return False
+        return True
+    
+    def _snippet(self, content: Optional[str]) -> str:
+        text = " ".join((content or "").split())
+        if len(text) > self.SNIPPET_LENGTH:
+            text = text[:self.SNIPPET_LENGTH - 1] + "…"
+        return discord.utils.escape_markdown(text) or "(내용 없음)"
+    
+    async def render_page(self) -> discord.Embed:
+        """현재 페이지를 검색하여 임베드 생성 및 버튼 상태 갱신"""
+        page = await self.verification_manager.search_verifications(
+            self.query, str(self.user.id) if self.user else None, self.start_date, self.end_date,
+            self.PAGE_SIZE, self._page_cursors[self._page_index], self.order
+        )
+        self._next_cursor = page.next_cursor
+        self.previous_page.disabled = self._page_index == 0
+        self.next_page.disabled = page.next_cursor is None
+        
+        embed = discord.Embed(
+            title="🔎 인증 메시지 검색",
+            description=f"검색어: `{self.query}` ({'관련도순' if self.order == 'rank' else '최신순'})",
+            color=discord.Color.blue()
+        )
+        if page.records:
+            lines = [
+                f"• {record.verification_date} {record.verification_time} <@{record.user_id}> - "
+                f"{self._snippet(record.message_content)}"
+                for record in page.records
+            ]
+            embed.add_field(name="결과", value="\n".join(lines)[:1024], inline=False)
+        else:
+            embed.add_field(name="결과", value="일치하는 인증 메시지가 없습니다.", inline=False)
+        
+        if self.user:
+            embed.add_field(name="사용자", value=self.user.mention, inline=True)
+        if self.start_date or self.end_date:
+            embed.add_field(
+                name="기간",
+                value=f"{self.start_date or '처음'} ~ {self.end_date or '현재'}",
+                inline=True
+            )
+        embed.set_footer(text=f"페이지 {self._page_index + 1}")
+        return embed
+    
+    @discord.ui.button(label="◀ 이전", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self._page_index = max(0, self._page_index - 1)
+        await interaction.response.edit_message(embed=await self.render_page(), view=self)
+    
+    @discord.ui.button(label="다음 ▶", style=discord.ButtonStyle.primary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self._next_cursor is not None:
+            del self._page_cursors[self._page_index + 1:]
+            self._page_cursors.append(self._next_cursor)
+            self._page_index += 1
+        await interaction.response.edit_message(embed=await self.render_page(), view=self)
+
+
 class VerificationCommands(BaseCommands):
     """인증 관련 명령어 Cog"""
     
@@ -71,6 +232,41 @@ class VerificationCommands(BaseCommands):
         """인사 명령어"""
         await interaction.response.send_message('안녕하세요! 인증 봇입니다. 👋', ephemeral=True)
     
+    @app_commands.command(name="history", description="내 인증 기록 조회")
+    @app_commands.describe(
+        order="정렬 순서",
+        start_date="조회 시작 날짜 (YYYY-MM-DD 형식, 생략 시 제한 없음)",
+        end_date="조회 종료 날짜 (YYYY-MM-DD 형식, 생략 시 제한 없음)"
+    )
+    @app_commands.choices(order=[
+        app_commands.Choice(name="최신순", value="desc"),
+        app_commands.Choice(name="오래된 순", value="asc")
+    ])
+    async def history(self, interaction: discord.Interaction,
+                      order: Optional[app_commands.Choice[str]] = None,
+                      start_date: Optional[str] = None, end_date: Optional[str] = None):
+        """사용자의 인증 기록을 페이지 단위로 표시합니다"""
+        try:
+            start = datetime.date.fromisoformat(start_date) if start_date else None
+            end = datetime.date.fromisoformat(end_date) if end_date else None
+        except ValueError:
+            await interaction.response.send_message(
+                "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.", ephemeral=True
+            )
+            return
+        
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        try:
+            view = VerificationHistoryView(
+                self.verification_service.verification_manager, interaction.user,
+                descending=(order is None or order.value == "desc"), start_date=start, end_date=end
+            )
+            embed = await view.render_page()
+            await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+        except Exception as e:
+            logger.error(f"인증 기록 조회 중 오류: {e}", exc_info=True)
+            await interaction.followup.send("인증 기록 조회 중 오류가 발생했습니다.", ephemeral=True)
+    
     @app_commands.command(name="verify_status", description="내 인증 상태 확인")
     async def verify_status(self, interaction: discord.Interaction):
         """사용자의 현재 인증 상태를 확인합니다"""
@@ -95,30 +291,11 @@ class VerificationCommands(BaseCommands):
             yesterday = self.time_util.now() - datetime.timedelta(days=1)
             yesterday_start, yesterday_end = self.time_util.get_check_date_range(yesterday)
             
-            # 검색할 사용자 ID
-            user_id = interaction.user.id
-            is_verified_today = False
-            is_verified_yesterday = False
-            verification_time_today = None
-            verification_time_yesterday = None
-            
-            # 오늘 인증 여부 확인
-            async for message in channel.history(after=today_start, before=today_end, limit=self.config.MESSAGE_HISTORY_LIMIT):
-                if (message.author.id == user_id and 
-                    self.verification_service.message_util.is_verification_message(message.content) and 
-                    any(self.verification_service.message_util.is_valid_image(attachment) for attachment in message.attachments)):
-                    is_verified_today = True
-                    verification_time_today = message.created_at
-                    break
-            
-            # 어제 인증 여부 확인
-            async for message in channel.history(after=yesterday_start, before=yesterday_end, limit=self.config.MESSAGE_HISTORY_LIMIT):
-                if (message.author.id == user_id and 
-                    self.verification_service.message_util.is_verification_message(message.content) and 
-                    any(self.verification_service.message_util.is_valid_image(attachment) for attachment in message.attachments)):
-                    is_verified_yesterday = True
-                    verification_time_yesterday = message.created_at
-                    break
+            # 사용자/날짜별 인증 요약 조회 (채널 메시지를 훑지 않고 기본 키로 한 행씩 조회)
+            user_id = str(interaction.user.id)
+            verification_manager = self.verification_service.verification_manager
+            today_record = await verification_manager.get_daily_verification(user_id, today_start.date())
+            yesterday_record = await verification_manager.get_daily_verification(user_id, yesterday_start.date())
             
             # 결과 표시할 임베드 생성
             embed = discord.Embed(
@@ -128,10 +305,11 @@ class VerificationCommands(BaseCommands):
             )
             
             # 오늘 인증 상태
-            if is_verified_today:
+            if today_record:
                 embed.add_field(
                     name="✅ 오늘 인증 완료",
-                    value=f"인증 시간: {verification_time_today.strftime('%Y-%m-%d %H:%M:%S')}",
+                    value=f"인증 시간: {today_record.first_verified_at.strftime('%Y-%m-%d %H:%M:%S')}"
+                          f" (오늘 {today_record.post_count}회 인증)",
                     inline=False
                 )
             else:
@@ -194,10 +372,11 @@ class VerificationCommands(BaseCommands):
                     value=f"어제는 {reason}이었습니다.",
                     inline=False
                 )
-            elif is_verified_yesterday:
+            elif yesterday_record:
                 embed.add_field(
                     name="✅ 어제 인증 완료",
-                    value=f"인증 시간: {verification_time_yesterday.strftime('%Y-%m-%d %H:%M:%S')}",
+                    value=f"인증 시간: {yesterday_record.first_verified_at.strftime('%Y-%m-%d %H:%M:%S')}"
+                          f" (어제 {yesterday_record.post_count}회 인증)",
                     inline=False
                 )
             else:
@@ -522,9 +701,10 @@ class HolidayCommands(BaseCommands):
 class AdminCommands(BaseCommands):
     """관리자 전용 명령어 Cog"""
     
-    def __init__(self, bot, config, verification_service):
+    def __init__(self, bot, config, verification_service, backfill_service=None):
         super().__init__(bot, config)
         self.verification_service = verification_service
+        self.backfill_service = backfill_service
     
     @commands.Cog.listener()
     async def on_ready(self):
@@ -597,6 +777,203 @@ class AdminCommands(BaseCommands):
         )
         
         await interaction.followup.send(embed=embed)
+    
+    @app_commands.command(name="search", description="인증 메시지 전문 검색 (관리자 전용)")
+    @app_commands.describe(
+        query="검색어 (공백으로 구분한 단어를 모두 포함, 단어 앞부분만 입력해도 일치)",
+        user="특정 사용자의 인증만 검색",
+        start_date="검색 시작 날짜 (YYYY-MM-DD 형식, 생략 시 제한 없음)",
+        end_date="검색 종료 날짜 (YYYY-MM-DD 형식, 생략 시 제한 없음)",
+        order="정렬 순서"
+    )
+    @app_commands.choices(order=[
+        app_commands.Choice(name="관련도순", value="rank"),
+        app_commands.Choice(name="최신순", value="recent")
+    ])
+    async def search(self, interaction: discord.Interaction, query: str,
+                     user: Optional[discord.Member] = None,
+                     start_date: Optional[str] = None, end_date: Optional[str] = None,
+                     order: Optional[app_commands.Choice[str]] = None):
+        """인증 메시지 내용을 검색하여 페이지 단위로 표시합니다 (관리자 전용)"""
+        # 관리자 권한 체크
+        if not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message(
+                self.config.MESSAGES['permission_error'],
+                ephemeral=True
+            )
+            return
+        
+        # 채널 권한 체크 - 허용되지 않은 채널에서는 조용히 무시
+        if not self._check_channel_permission(interaction):
+            return
+        
+        if not query.strip():
+            await interaction.response.send_message("검색어를 입력해주세요.", ephemeral=True)
+            return
+        try:
+            start = datetime.date.fromisoformat(start_date) if start_date else None
+            end = datetime.date.fromisoformat(end_date) if end_date else None
+        except ValueError:
+            await interaction.response.send_message(
+                "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.", ephemeral=True
+            )
+            return
+        
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        try:
+            view = SearchResultsView(
+                self.verification_service.verification_manager, interaction.user, query.strip(),
+                user=user, order=order.value if order else 'rank', start_date=start, end_date=end
+            )
+            embed = await view.render_page()
+            await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+        except Exception as e:
+            logger.error(f"인증 메시지 검색 중 오류: {e}", exc_info=True)
+            await interaction.followup.send("인증 메시지 검색 중 오류가 발생했습니다.", ephemeral=True)
+    
+    @app_commands.command(name="rebuild_summary", description="기간의 날짜별 인증 현황 다시 계산 (관리자 전용)")
+    @app_commands.describe(
+        start_date="시작 날짜 (YYYY-MM-DD 형식)",
+        end_date="종료 날짜 (YYYY-MM-DD 형식, 생략 시 시작 날짜와 같음)"
+    )
+    async def rebuild_summary(self, interaction: discord.Interaction, start_date: str,
+                              end_date: Optional[str] = None):
+        """인증 기록, 휴가, 체크 대상으로부터 날짜별 요약을 다시 계산합니다 (관리자 전용)"""
+        # 관리자 권한 체크
+        if not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message(
+                self.config.MESSAGES['permission_error'],
+                ephemeral=True
+            )
+            return
+        
+        # 채널 권한 체크 - 허용되지 않은 채널에서는 조용히 무시
+        if not self._check_channel_permission(interaction):
+            return
+        
+        try:
+            start = datetime.date.fromisoformat(start_date)
+            end = datetime.date.fromisoformat(end_date) if end_date else start
+        except ValueError:
+            await interaction.response.send_message(
+                "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.", ephemeral=True
+            )
+            return
+        if end < start:
+            await interaction.response.send_message("종료 날짜가 시작 날짜보다 빠릅니다.", ephemeral=True)
+            return
+        
+        await interaction.response.defer(thinking=True, ephemeral=True)
+        count = await self.config.async_daily_summary_manager.rebuild(start, end)
+        if count < 0:
+            await interaction.followup.send("❌ 인증 현황 재계산 중 오류가 발생했습니다. 로그를 확인하세요.", ephemeral=True)
+            return
+        await interaction.followup.send(f"✅ {start} ~ {end} 인증 현황을 다시 계산했습니다. ({count}일)", ephemeral=True)
+    
+    @app_commands.command(name="backfill", description="채널 기록으로 기간의 인증 기록 다시 채우기 (관리자 전용)")
+    @app_commands.describe(
+        start_date="시작 날짜 (YYYY-MM-DD 형식)",
+        end_date="종료 날짜 (YYYY-MM-DD 형식, 생략 시 시작 날짜와 같음)"
+    )
+    async def backfill(self, interaction: discord.Interaction, start_date: str,
+                       end_date: Optional[str] = None):
+        """인증 채널의 메시지 기록에서 빠진 인증 기록을 찾아 저장합니다 (관리자 전용)"""
+        # 관리자 권한 체크
+        if not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message(
+                self.config.MESSAGES['permission_error'],
+                ephemeral=True
+            )
+            return
+        
+        # 채널 권한 체크 - 허용되지 않은 채널에서는 조용히 무시
+        if not self._check_channel_permission(interaction):
+            return
+        
+        if self.backfill_service is None:
+            await interaction.response.send_message("백필 기능이 설정되지 않았습니다.", ephemeral=True)
+            return
+        if self.backfill_service.is_running:
+            await interaction.response.send_message("이미 백필이 진행 중입니다.", ephemeral=True)
+            return
+        try:
+            start = datetime.date.fromisoformat(start_date)
+            end = datetime.date.fromisoformat(end_date) if end_date else start
+        except ValueError:
+            await interaction.response.send_message(
+                "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.", ephemeral=True
+            )
+            return
+        
+        channel, error_message = self._get_verification_channel(interaction)
+        if not channel:
+            await interaction.response.send_message(error_message, ephemeral=True)
+            return
+        
+        await interaction.response.defer(thinking=True, ephemeral=True)
+        try:
+            result = await self.backfill_service.run(channel, start, end)
+        except ValueError as e:
+            await interaction.followup.send(f"❌ {e}", ephemeral=True)
+            return
+        except Exception as e:
+            logger.error(f"백필 명령어 오류: {e}", exc_info=True)
+            await interaction.followup.send(
+                "❌ 백필 중 오류가 발생했습니다. 같은 기간으로 다시 실행하면 이어서 진행합니다.", ephemeral=True
+            )
+            return
+        
+        embed = discord.Embed(
+            title="✅ 인증 기록 백필 완료",
+            description=f"{result.start_date} ~ {result.end_date}" + (" (이어서 진행)" if result.resumed else ""),
+            color=discord.Color.green()
+        )
+        embed.add_field(name="확인한 메시지", value=f"{result.scanned:,}개")
+        embed.add_field(name="저장한 인증", value=f"{result.inserted:,}건")
+        embed.add_field(name="소요 시간", value=f"{result.elapsed:.1f}초 ({result.messages_per_second:,.0f}개/초)")
+        
+        await interaction.followup.send(embed=embed, ephemeral=True)
+    
+    @app_commands.command(name="backup", description="데이터베이스 온라인 백업 생성 (관리자 전용)")
+    async def backup(self, interaction: discord.Interaction):
+        """실행 중인 데이터베이스의 스냅샷을 만듭니다 (관리자 전용)"""
+        # 관리자 권한 체크
+        if not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message(
+                self.config.MESSAGES['permission_error'],
+                ephemeral=True
+            )
+            return
+            
+        # 채널 권한 체크 - 허용되지 않은 채널에서는 조용히 무시
+        if not self._check_channel_permission(interaction):
+            return
+        
+        await interaction.response.defer(thinking=True, ephemeral=True)
+        
+        try:
+            result = await self.config.database_backup.create_snapshot_async()
+        except BackupError as e:
+            await interaction.followup.send(f"❌ 백업 실패: {e}", ephemeral=True)
+            return
+        except Exception as e:
+            logger.error(f"백업 명령어 오류: {e}", exc_info=True)
+            await interaction.followup.send("❌ 백업 중 오류가 발생했습니다. 로그를 확인하세요.", ephemeral=True)
+            return
+        
+        embed = discord.Embed(
+            title="✅ 데이터베이스 백업 완료",
+            description=f"`{result.path}`",
+            color=discord.Color.green()
+        )
+        embed.add_field(name="크기", value=f"{result.size_bytes / 1024 / 1024:.1f}MB ({result.pages}페이지)")
+        embed.add_field(name="소요 시간", value=f"{result.elapsed:.2f}초 ({result.pages_per_second:,.0f}페이지/초)")
+        embed.add_field(name="최대 단계 시간", value=f"{result.max_step_ms:.1f}ms")
+        embed.add_field(name="무결성 검사", value="ok")
+        embed.add_field(name="재시작", value=f"{result.restarts}회")
+        embed.add_field(name="삭제한 이전 스냅샷", value=f"{len(result.removed)}개")
+        
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
 
 class StatusCommands(BaseCommands):
@@ -683,11 +1060,42 @@ class StatusCommands(BaseCommands):
             inline=False
         )
         
+        # 최근 7일 인증 현황 (날짜별 요약 테이블에서 조회)
+        embed.add_field(
+            name="📈 최근 7일 인증 현황",
+            value=await self._format_recent_summaries(now.date()),
+            inline=False
+        )
+        
         # 봇 정보
         embed.set_footer(text=f"Discord Verification Bot | {self.bot.user.name}")
         
         await interaction.response.send_message(embed=embed)
     
+    async def _format_recent_summaries(self, today: datetime.date, days: int = 7) -> str:
+        """최근 며칠의 날짜별 인증 현황과 기간 인증률"""
+        summaries = await self.config.async_daily_summary_manager.get_summaries(
+            today - datetime.timedelta(days=days - 1), today
+        )
+        if not summaries:
+            return "기록된 인증 현황이 없습니다."
+        
+        lines = []
+        for summary in summaries:
+            if summary.required or summary.on_vacation:
+                lines.append(
+                    f"{summary.summary_date}: 인증 {summary.verified}명 / 대상 {summary.required}명 "
+                    f"(휴가 {summary.on_vacation}명, 미인증 {summary.missed}명)"
+                )
+            else:
+                lines.append(f"{summary.summary_date}: 인증 {summary.verified}명 (체크 전)")
+        
+        required = sum(summary.required for summary in summaries)
+        if required:
+            missed = sum(summary.missed for summary in summaries)
+            lines.append(f"기간 인증률: {(required - missed) / required:.0%}")
+        return "\n".join(lines)
+    
     @app_commands.command(name="help", description="인증 봇 도움말")
     async def help_command(self, interaction: discord.Interaction):
         """인증 봇 도움말을 표시합니다"""
@@ -702,14 +1110,15 @@ class StatusCommands(BaseCommands):
             name="🔹 일반 명령어",
             value="`/hello` - 인사 테스트\n"
                   "`/verify_status` - 내 인증 상태 확인\n"
+                  "`/history` - 내 인증 기록 페이지별 조회\n"
                   "`/time_check` - 현재 시간 확인\n"
                   "`/next_check` - 다음 인증 체크 시간 확인\n"
                   "`/check_settings` - 현재 설정 확인\n"
                   "`/check_holidays` - 공휴일 목록 확인\n"
                   "`/status` - 봇 상태 정보 확인\n"
                   "`/help` - 이 도움말 표시\n"
-                  "`/vacation` - 휴가 등록 (YYYY-MM-DD, 생략 시 오늘)\n"
-                  "`/cancel_vacation` - 모든 휴가 취소\n"
+                  "`/vacation` - 휴가 등록 (시작일, 종료일 YYYY-MM-DD, 생략 시 오늘 하루)\n"
+                  "`/cancel_vacation` - 휴가 취소 (날짜 생략 시 모든 휴가)\n"
                   "`/my_vacations` - 내 휴가 목록 확인",
             inline=False
         )
@@ -720,7 +1129,11 @@ class StatusCommands(BaseCommands):
             value="`/test_check` - 인증 체크 즉시 테스트\n"
                   "`/check_now` - 즉시 인증 체크 실행\n"
                   "`/toggle_holiday_check` - 공휴일 체크 기능 켜기/끄기\n"
-                  "`/reload_holidays` - 공휴일 목록 다시 로드",
+                  "`/reload_holidays` - 공휴일 목록 다시 로드\n"
+                  "`/search` - 인증 메시지 전문 검색\n"
+                  "`/rebuild_summary` - 날짜별 인증 현황 다시 계산\n"
+                  "`/backfill` - 채널 기록으로 인증 기록 다시 채우기\n"
+                  "`/backup` - 데이터베이스 온라인 백업 생성",
             inline=False
         )
         
@@ -767,14 +1180,20 @@ class VacationCommands(BaseCommands):
         """봇이 준비되었을 때 실행"""
         logger.info("VacationCommands Cog loaded")
         
-    async def _vacation_logic(self, interaction: discord.Interaction, date: Optional[str] = None):
+    async def _format_vacation_periods(self, user_id: int) -> List[str]:
+        """사용자의 휴가 구간을 표시용 문자열 목록으로 변환"""
+        periods = await self.vacation_service.get_user_vacation_periods(user_id)
+        return [f"• {self.vacation_service.format_period(period.start_date, period.end_date)}" for period in periods]
+    
+    async def _vacation_logic(self, interaction: discord.Interaction, date: Optional[str] = None,
+                              end_date: Optional[str] = None):
         """휴가 등록 로직"""
-        result = self.vacation_service.register_vacation(interaction.user.id, date)
+        result = await self.vacation_service.register_vacation(interaction.user.id, date, end_date)
         
-        if "이미 휴가로 등록" in result:
+        if "이미 휴가로 등록되어" in result:
             color = discord.Color.yellow()
             title = "⚠️ 이미 등록된 휴가"
-        elif "날짜 형식이 올바르지 않습니다" in result or "과거 날짜는 휴가로" in result:
+        elif "휴가로 등록되었습니다" not in result:
             color = discord.Color.red()
             title = "❌ 휴가 등록 실패"
         else:
@@ -783,25 +1202,35 @@ class VacationCommands(BaseCommands):
         
         embed = discord.Embed(title=title, description=result, color=color)
         
-        vacations = self.vacation_service.get_user_vacations(interaction.user.id)
-        if vacations:
-            vacation_list = "\n".join([f"• {date}" for date in vacations])
-            embed.add_field(name="📅 등록된 휴가 목록", value=vacation_list, inline=False)
+        vacation_list = await self._format_vacation_periods(interaction.user.id)
+        if vacation_list:
+            embed.add_field(name="📅 등록된 휴가 목록", value="\n".join(vacation_list), inline=False)
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(name="vacation", description="휴가 등록")
-    @app_commands.describe(date="휴가 날짜 (YYYY-MM-DD 형식, 생략 시 오늘)")
-    async def vacation(self, interaction: discord.Interaction, date: Optional[str] = None):
-        await self._vacation_logic(interaction, date)
+    @app_commands.describe(
+        date="휴가 시작 날짜 (YYYY-MM-DD 형식, 생략 시 오늘)",
+        end_date="휴가 종료 날짜 (YYYY-MM-DD 형식, 생략 시 하루만)"
+    )
+    async def vacation(self, interaction: discord.Interaction, date: Optional[str] = None,
+                       end_date: Optional[str] = None):
+        await self._vacation_logic(interaction, date, end_date)
             
-    async def _cancel_vacation_logic(self, interaction: discord.Interaction):
-        """휴가 취소 로직"""
-        result = self.vacation_service.cancel_all_vacations(interaction.user.id)
+    async def _cancel_vacation_logic(self, interaction: discord.Interaction, date: Optional[str] = None,
+                                     end_date: Optional[str] = None):
+        """휴가 취소 로직 (날짜 생략 시 모든 휴가 취소)"""
+        if date is None:
+            result = await self.vacation_service.cancel_all_vacations(interaction.user.id)
+        else:
+            result = await self.vacation_service.cancel_vacation(interaction.user.id, date, end_date)
         
         if "등록된 휴가가 없습니다" in result:
             color = discord.Color.blue()
             title = "ℹ️ 휴가 정보"
+        elif "취소되었습니다" not in result:
+            color = discord.Color.red()
+            title = "❌ 휴가 취소 실패"
         else:
             color = discord.Color.green()
             title = "✅ 휴가 취소 완료"
@@ -809,20 +1238,28 @@ class VacationCommands(BaseCommands):
         embed = discord.Embed(title=title, description=result, color=color)
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    @app_commands.command(name="cancel_vacation", description="모든 휴가 취소")
-    async def cancel_vacation(self, interaction: discord.Interaction):
-        await self._cancel_vacation_logic(interaction)
+    @app_commands.command(name="cancel_vacation", description="휴가 취소 (날짜 생략 시 모든 휴가 취소)")
+    @app_commands.describe(
+        date="취소할 시작 날짜 (YYYY-MM-DD 형식, 생략 시 모든 휴가)",
+        end_date="취소할 종료 날짜 (YYYY-MM-DD 형식, 생략 시 하루만)"
+    )
+    async def cancel_vacation(self, interaction: discord.Interaction, date: Optional[str] = None,
+                              end_date: Optional[str] = None):
+        await self._cancel_vacation_logic(interaction, date, end_date)
             
     async def _my_vacations_logic(self, interaction: discord.Interaction):
         """내 휴가 목록 확인 로직"""
-        vacations = self.vacation_service.get_user_vacations(interaction.user.id)
+        periods = await self.vacation_service.get_user_vacation_periods(interaction.user.id)
         
-        if not vacations:
+        if not periods:
             embed = discord.Embed(title="📅 내 휴가 목록", description="등록된 휴가가 없습니다.", color=discord.Color.blue())
         else:
-            vacation_list = "\n".join([f"• {date}" for date in vacations])
-            embed = discord.Embed(title="📅 내 휴가 목록", description=f"총 {len(vacations)}개의 휴가가 등록되어 있습니다.", color=discord.Color.green())
-            embed.add_field(name="등록된 날짜", value=vacation_list, inline=False)
+            total_days = sum(period.days for period in periods)
+            vacation_list = "\n".join(
+                f"• {self.vacation_service.format_period(period.start_date, period.end_date)}" for period in periods
+            )
+            embed = discord.Embed(title="📅 내 휴가 목록", description=f"총 {total_days}일의 휴가가 등록되어 있습니다.", color=discord.Color.green())
+            embed.add_field(name="등록된 기간", value=vacation_list, inline=False)
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -834,13 +1271,15 @@ class VacationCommands(BaseCommands):
 class CommandSetup:
     """명령어 설정 클래스"""
     
-    def __init__(self, bot, config, verification_service, task_manager, time_util, vacation_service):
+    def __init__(self, bot, config, verification_service, task_manager, time_util, vacation_service,
+                 backfill_service=None):
         self.bot = bot
         self.config = config
         self.verification_service = verification_service
         self.task_manager = task_manager
         self.time_util = time_util
         self.vacation_service = vacation_service
+        self.backfill_service = backfill_service
         
         # 기존 명령어 제거 (필요한 경우)
         self._remove_commands()
@@ -872,7 +1311,7 @@ class CommandSetup:
         
         # 관리자 전용 명령어
         admin_commands = AdminCommands(
-            self.bot, self.config, self.verification_service
+            self.bot, self.config, self.verification_service, self.backfill_service
         )
         await self.bot.add_cog(admin_commands)
         
@@ -6,8 +6,15 @@ import pytz
 import yaml
 import os
 from dotenv import load_dotenv
-from db import DatabaseManager, HolidayManager, VacationManager, VerificationManager
+from db import (
+    DatabaseManager, HolidayManager, VacationManager, VerificationManager, VerificationArchiver, DatabaseBackup,
+    DailySummaryManager, AsyncDatabaseExecutor, AsyncHolidayManager, AsyncVacationManager,
+    AsyncVerificationManager, AsyncDailySummaryManager, HistoryCursorManager, AsyncHistoryCursorManager,
+    BackfillJobManager, AsyncBackfillJobManager
+)
+from db.database import DEFAULT_PRAGMAS
 from db.migration import DataMigration
+from holiday_calendar import HolidayCalendar
 from logging_utils import configure_logging, get_logger
 
 # 로거 초기화
@@ -26,12 +33,48 @@ class ConfigManager:
         self.load_config()
         
         # 데이터베이스 매니저 초기화
-        self.db_manager = DatabaseManager()
+        self.db_manager = DatabaseManager(
+            self.DATABASE_PATH,
+            pool_size=self.DATABASE_POOL_SIZE,
+            busy_timeout=self.DATABASE_BUSY_TIMEOUT,
+            pragmas=self.DATABASE_PRAGMAS
+        )
         self.holiday_manager = HolidayManager(self.db_manager)
         self.vacation_manager = VacationManager(self.db_manager)
-        self.verification_manager = VerificationManager(self.db_manager)
+        # 보관 기능을 끈 뒤에도 이미 옮긴 기록은 조회되도록 아카이브 디렉토리는 항상 전달
+        self.verification_manager = VerificationManager(self.db_manager, archive_dir=self.ARCHIVE_DIR)
+        self.daily_summary_manager = DailySummaryManager(self.db_manager)
+        self.history_cursor_manager = HistoryCursorManager(self.db_manager)
+        self.backfill_job_manager = BackfillJobManager(self.db_manager, self.verification_manager)
+        self.verification_archiver = VerificationArchiver(
+            self.db_manager, self.ARCHIVE_DIR, self.RETENTION_DAYS,
+            chunk_size=self.ARCHIVE_CHUNK_SIZE,
+            max_lock_ms=self.ARCHIVE_MAX_LOCK_MS,
+            pause=self.ARCHIVE_PAUSE
+        ) if self.RETENTION_ENABLED else None
+        self.database_backup = DatabaseBackup(
+            self.db_manager, self.BACKUP_DIR,
+            keep=self.BACKUP_KEEP,
+            pages_per_step=self.BACKUP_PAGES_PER_STEP,
+            step_pause=self.BACKUP_STEP_PAUSE
+        )
         
-        # 공휴일 로드
+        # 이벤트 루프를 막지 않도록 DB 전용 실행기에서 동작하는 비동기 매니저
+        self.db_executor = AsyncDatabaseExecutor(
+            max_workers=self.DATABASE_EXECUTOR_WORKERS,
+            queue_size=self.DATABASE_EXECUTOR_QUEUE_SIZE
+        )
+        self.async_holiday_manager = AsyncHolidayManager(self.holiday_manager, self.db_executor)
+        self.async_vacation_manager = AsyncVacationManager(self.vacation_manager, self.db_executor)
+        self.async_verification_manager = AsyncVerificationManager(self.verification_manager, self.db_executor)
+        self.async_daily_summary_manager = AsyncDailySummaryManager(self.daily_summary_manager, self.db_executor)
+        self.async_history_cursor_manager = AsyncHistoryCursorManager(self.history_cursor_manager, self.db_executor)
+        self.async_backfill_job_manager = AsyncBackfillJobManager(self.backfill_job_manager, self.db_executor)
+        
+        # 공휴일 로드 (DB 변경 시 달력 색인 자동 재생성)
+        self.HOLIDAYS = set()
+        self.holiday_calendar = HolidayCalendar()
+        self.holiday_manager.add_change_listener(self.refresh_holiday_calendar)
         self.load_holidays()
         
         # 인증 설정 검증
@@ -95,6 +138,8 @@ class ConfigManager:
         self.VERIFICATION_KEYWORDS = verification_config.get('keywords', [
             "인증", "TODO", "계획", "인증사진", "투두"
         ])
+        # 최근 처리한 메시지 ID 수 (게이트웨이 재전송 등 중복 이벤트를 DB 조회 없이 건너뜀)
+        self.RECENT_MESSAGE_CACHE_SIZE = verification_config.get('recent_message_cache_size', 10000)
         
         # 메시지 제한
         message_limits = config.get('message_limits', {})
@@ -103,6 +148,39 @@ class ConfigManager:
         self.MESSAGE_HISTORY_LIMIT = message_limits.get('history_limit', 1000)
         self.MAX_MENTIONS_PER_CHUNK = message_limits.get('max_mentions_per_chunk', 20)
         
+        # 멤버 명단 설정
+        roster_config = config.get('roster', {})
+        self.ROSTER_PARTICIPANT_ROLES = [int(role_id) for role_id in roster_config.get('participant_roles') or []]
+        self.ROSTER_REQUIRE_CHANNEL_ACCESS = roster_config.get('require_channel_access', False)
+        self.ROSTER_RECONCILE_MINUTES = roster_config.get('reconcile_minutes', 60)
+        self.ROSTER_RECONCILE_BATCH_SIZE = roster_config.get('reconcile_batch_size', 1000)
+        
+        # 체크 단계별 제한 시간 (초)
+        check_config = config.get('check', {})
+        self.CHECK_HISTORY_TIMEOUT = check_config.get('history_timeout', 300)
+        self.CHECK_DATABASE_TIMEOUT = check_config.get('database_timeout', 30)
+        self.CHECK_MEMBERS_TIMEOUT = check_config.get('members_timeout', 120)
+        
+        # 채널 기록 병렬 스캔 설정
+        history_scan_config = config.get('history_scan', {})
+        self.HISTORY_SCAN_WINDOWS = history_scan_config.get('windows', 4)
+        self.HISTORY_SCAN_MIN_WINDOW_MINUTES = history_scan_config.get('min_window_minutes', 60)
+        self.HISTORY_SCAN_MAX_CONCURRENT = history_scan_config.get('max_concurrent_requests', 4)
+        self.HISTORY_SCAN_REQUESTS_PER_SECOND = history_scan_config.get('requests_per_second', 10)
+        self.HISTORY_SCAN_BUFFER_SIZE = history_scan_config.get('buffer_size', 0)
+        
+        # 채널 기록 백필 설정
+        backfill_config = config.get('backfill', {})
+        self.BACKFILL_BATCH_SIZE = backfill_config.get('batch_size', 5000)
+        self.BACKFILL_PROGRESS_SECONDS = backfill_config.get('progress_seconds', 30)
+        
+        # 인증 메시지 접수 대기열 설정
+        ingest_config = config.get('ingest', {})
+        self.INGEST_WORKERS = ingest_config.get('workers', 4)
+        self.INGEST_QUEUE_SIZE = ingest_config.get('queue_size', 1000)
+        self.INGEST_ENQUEUE_TIMEOUT = ingest_config.get('enqueue_timeout_ms', 2000) / 1000
+        self.INGEST_STATS_LOG_MINUTES = ingest_config.get('stats_log_minutes', 10)
+        
         # 재시도 설정
         retry_config = config.get('retry', {})
         self.MAX_RETRY_ATTEMPTS = retry_config.get('max_attempts', 3)
@@ -137,6 +215,41 @@ class ConfigManager:
         self.HOLIDAYS_FILE = holidays_config.get('file', 'holidays.csv')
         self.SKIP_HOLIDAYS = holidays_config.get('skip', True)
         
+        # 휴가 설정
+        vacation_config = config.get('vacation', {})
+        self.VACATION_MAX_DAYS = vacation_config.get('max_days', 60)
+        
+        # 데이터베이스 설정
+        database_config = config.get('database', {})
+        self.DATABASE_PATH = database_config.get('path', 'db/discord_bot.db')
+        self.DATABASE_POOL_SIZE = database_config.get('pool_size', 4)
+        self.DATABASE_BUSY_TIMEOUT = database_config.get('busy_timeout', 5000)
+        self.DATABASE_PRAGMAS = {**DEFAULT_PRAGMAS, **(database_config.get('pragmas') or {})}
+        executor_config = database_config.get('executor', {})
+        self.DATABASE_EXECUTOR_WORKERS = executor_config.get('workers', 2)
+        self.DATABASE_EXECUTOR_QUEUE_SIZE = executor_config.get('queue_size', 64)
+        write_behind_config = database_config.get('write_behind', {})
+        self.WRITE_BEHIND_FLUSH_INTERVAL = write_behind_config.get('flush_interval_ms', 50) / 1000
+        self.WRITE_BEHIND_MAX_BATCH_SIZE = write_behind_config.get('max_batch_size', 100)
+        attachment_migration_config = database_config.get('attachment_migration', {})
+        self.ATTACHMENT_MIGRATION_BATCH_SIZE = attachment_migration_config.get('batch_size', 500)
+        self.ATTACHMENT_MIGRATION_PAUSE = attachment_migration_config.get('pause_ms', 20) / 1000
+        retention_config = database_config.get('retention', {})
+        self.RETENTION_ENABLED = retention_config.get('enabled', False)
+        self.RETENTION_DAYS = retention_config.get('days', 365)
+        self.ARCHIVE_DIR = retention_config.get('archive_dir', 'db/archive')
+        self.ARCHIVE_CHUNK_SIZE = retention_config.get('chunk_size', 500)
+        self.ARCHIVE_MAX_LOCK_MS = retention_config.get('max_lock_ms', 5)
+        self.ARCHIVE_PAUSE = retention_config.get('pause_ms', 50) / 1000
+        self.ARCHIVE_INTERVAL_HOURS = retention_config.get('interval_hours', 24)
+        backup_config = database_config.get('backup', {})
+        self.BACKUP_ENABLED = backup_config.get('enabled', True)
+        self.BACKUP_DIR = backup_config.get('dir', 'db/backups')
+        self.BACKUP_INTERVAL_HOURS = backup_config.get('interval_hours', 24)
+        self.BACKUP_KEEP = backup_config.get('keep', 7)
+        self.BACKUP_PAGES_PER_STEP = backup_config.get('pages_per_step', 256)
+        self.BACKUP_STEP_PAUSE = backup_config.get('step_pause_ms', 10) / 1000
+        
         # 메시지 템플릿
         self.MESSAGES = config.get('messages', {
             'verification_success': "{name}, Your time has been recorded. The bill comes due. Always!",
@@ -176,9 +289,7 @@ class ConfigManager:
                 migration.migrate_holidays_from_csv(self.HOLIDAYS_FILE)
                 holiday_count = self.holiday_manager.get_holiday_count()
             
-            # 하위 호환성을 위해 HOLIDAYS 집합 생성
-            holidays_list = self.holiday_manager.get_holidays()
-            self.HOLIDAYS = {holiday['date'] for holiday in holidays_list}
+            self.refresh_holiday_calendar()
             
             logger.info(f"데이터베이스에서 {holiday_count}개의 공휴일을 로드했습니다.")
             
@@ -186,10 +297,21 @@ class ConfigManager:
             logger.error(f"공휴일 로드 중 오류: {str(e)}")
             # 오류 발생 시 빈 집합으로 초기화
             self.HOLIDAYS = set()
+            self.holiday_calendar = HolidayCalendar()
+    
+    def refresh_holiday_calendar(self):
+        """DB에서 공휴일을 읽어 HOLIDAYS 집합과 달력 색인을 새로 만들어 교체"""
+        holidays_list = self.holiday_manager.get_holidays()
+        holidays = {holiday['date'] for holiday in holidays_list}
+        calendar = HolidayCalendar(holidays)
+        
+        # 완성된 객체로 한 번에 교체하여 조회 중인 코드가 중간 상태를 보지 않도록 함
+        self.HOLIDAYS = holidays  # 하위 호환성을 위한 집합
+        self.holiday_calendar = calendar
     
     def is_holiday(self, date):
-        """주어진 날짜가 공휴일인지 확인"""
-        return self.holiday_manager.is_holiday(date)
+        """주어진 날짜가 공휴일인지 확인 (메모리 색인, O(1))"""
+        return self.holiday_calendar.is_holiday(date)
     
     def validate_config(self):
         """필수 설정 검증"""
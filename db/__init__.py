@@ -2,6 +2,30 @@
 데이터베이스 관리 모듈
 """
 
-from .database import DatabaseManager, HolidayManager, VacationManager, VerificationManager
+from .database import (
+    BackfillJobManager, DailySummaryManager, DatabaseManager, HistoryCursorManager, HolidayManager,
+    VacationManager, VerificationManager
+)
+from .async_database import (
+    AsyncBackfillJobManager, AsyncDailySummaryManager, AsyncDatabaseExecutor, AsyncHistoryCursorManager,
+    AsyncHolidayManager, AsyncVacationManager, AsyncVerificationManager
+)
+from .write_behind import VerificationWriteBuffer
+from .archive import VerificationArchiver
+from .backup import BackupError, BackupResult, DatabaseBackup
+from .records import (
+    BackfillJobRecord, DailySummaryRecord, DailyVerificationRecord, HistoryCursorRecord, HolidayRecord,
+    VacationRecord, VerificationPage, VerificationRecord
+)
+from .schema import SCHEMA_VERSION, SchemaMigrationError
 
-__all__ = ['DatabaseManager', 'HolidayManager', 'VacationManager', 'VerificationManager']
\ No newline at end of file
+__all__ = [
+    'DatabaseManager', 'HolidayManager', 'VacationManager', 'VerificationManager', 'DailySummaryManager',
+    'HistoryCursorManager', 'BackfillJobManager',
+    'AsyncDatabaseExecutor', 'AsyncHolidayManager', 'AsyncVacationManager', 'AsyncVerificationManager',
+    'AsyncDailySummaryManager', 'AsyncHistoryCursorManager', 'AsyncBackfillJobManager',
+    'VerificationWriteBuffer', 'VerificationArchiver', 'DatabaseBackup', 'BackupError', 'BackupResult',
+    'SCHEMA_VERSION', 'SchemaMigrationError',
+    'BackfillJobRecord', 'DailySummaryRecord', 'DailyVerificationRecord', 'HistoryCursorRecord', 'HolidayRecord',
+    'VacationRecord', 'VerificationPage', 'VerificationRecord'
+]
\ No newline at end of file
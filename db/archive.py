@@ -0,0 +1,381 @@
+"""
+인증 기록 보관(아카이브) 모듈
+
+보존 기간이 지난 인증 기록을 연도별 아카이브 SQLite 파일로 옮깁니다.
+메시지 내용은 zlib으로 압축해 저장하고, 조회 시에는 ATTACH로 아카이브 파일을
+붙여 운영 데이터와 함께 읽습니다 (VerificationManager 참고).
+
+한 청크의 이동 순서:
+    1. 운영 DB에서 대상 행을 읽기만 함 (쓰기 잠금 없음)
+    2. 아카이브 파일에 INSERT OR IGNORE 후 커밋 (운영 DB 잠금과 무관)
+    3. 운영 DB에서 해당 ID만 삭제 (쓰기 잠금은 이 짧은 구간에만 잡음)
+2와 3 사이에 중단되어도 다음 실행에서 같은 행을 다시 옮기고 지우므로 데이터가 유실되지 않습니다.
+
+디스코드 메시지 ID도 함께 옮기지만, 아카이브 파일의 기록은 원본 메시지의 수정/삭제를 반영하지 않습니다.
+"""
+import os
+import re
+import time
+import zlib
+import asyncio
+import logging
+import sqlite3
+import datetime
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .async_database import AsyncDatabaseExecutor
+    from .database import DatabaseManager
+
+logger = logging.getLogger('verification_bot')
+
+_ARCHIVE_FILE_PATTERN = re.compile(r'^verifications_(\d{4})\.db$')
+
+# 한 연결에 ATTACH할 수 있는 데이터베이스 수 (SQLite 기본 컴파일 한도)
+MAX_ATTACHED = 10
+
+ARCHIVE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS archived_verifications (
+        id INTEGER PRIMARY KEY,
+        user_id TEXT NOT NULL,
+        username TEXT NOT NULL,
+        message_content BLOB,
+        verification_date TEXT NOT NULL,
+        verification_time TEXT NOT NULL,
+        created_at TIMESTAMP,
+        archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        message_id INTEGER
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS archived_attachments (
+        verification_id INTEGER NOT NULL,
+        ordinal INTEGER NOT NULL,
+        attachment_id TEXT,
+        url TEXT NOT NULL,
+        content_type TEXT,
+        size INTEGER,
+        PRIMARY KEY (verification_id, ordinal)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_archived_user_keyset "
+    "ON archived_verifications(user_id, verification_date, verification_time, id)",
+    "CREATE INDEX IF NOT EXISTS idx_archived_date ON archived_verifications(verification_date)",
+)
+
+
+def compress_text(text: Optional[str]) -> Optional[bytes]:
+    """메시지 내용 압축 (None은 그대로)"""
+    if text is None:
+        return None
+    return zlib.compress(text.encode('utf-8'), 9)
+
+
+def decompress_text(data: Optional[bytes]) -> Optional[str]:
+    """압축된 메시지 내용 복원 (SQLite 함수 zlib_decompress로도 등록됨)"""
+    if data is None:
+        return None
+    return zlib.decompress(data).decode('utf-8')
+
+
+def archive_path(archive_dir: str, year: int) -> str:
+    """연도별 아카이브 파일 경로"""
+    return os.path.join(archive_dir, f"verifications_{year:04d}.db")
+
+
+def list_archive_years(archive_dir: Optional[str]) -> List[int]:
+    """아카이브 파일이 있는 연도 목록 (오름차순)"""
+    if not archive_dir or not os.path.isdir(archive_dir):
+        return []
+    years = []
+    for name in os.listdir(archive_dir):
+        match = _ARCHIVE_FILE_PATTERN.match(name)
+        if match:
+            years.append(int(match.group(1)))
+    return sorted(years)
+
+
+def archive_columns(schema: str) -> str:
+    """
+    아카이브 테이블에서 VerificationRecord.COLUMNS와 같은 순서로 읽는 SELECT 컬럼 (별칭 v)
+
+    Args:
+        schema: ATTACH한 아카이브 스키마 이름
+    """
+    return f"""
+        v.id, v.user_id, v.username, zlib_decompress(v.message_content), v.verification_date,
+        v.verification_time, v.created_at,
+        (SELECT json_group_array(json_array(a.ordinal, a.attachment_id, a.url, a.content_type, a.size))
+         FROM {schema}.archived_attachments AS a WHERE a.verification_id = v.id),
+        NULL
+    """
+
+
+@contextmanager
+def attached_archives(conn: sqlite3.Connection, archive_dir: str, years: Sequence[int]) -> Iterator[List[str]]:
+    """
+    연도별 아카이브 파일을 연결에 ATTACH하고 끝나면 DETACH
+
+    한도를 넘으면 최근 연도부터 붙이고 나머지는 경고 후 제외합니다.
+
+    Args:
+        conn: 운영 DB 연결 (트랜잭션 밖이어야 함)
+        archive_dir: 아카이브 파일 디렉토리
+        years: 붙일 연도 목록
+
+    Yields:
+        ATTACH한 스키마 이름 목록
+    """
+    years = sorted(years)
+    if len(years) > MAX_ATTACHED:
+        logger.warning(f"아카이브 연도가 너무 많아 {years[-MAX_ATTACHED]}년 이전 기록은 조회에서 제외합니다.")
+        years = years[-MAX_ATTACHED:]
+
+    schemas: List[str] = []
+    try:
+        for year in years:
+            schema = f"archive_{year:04d}"
+            conn.execute(f"ATTACH DATABASE ? AS {schema}", (archive_path(archive_dir, year),))
+            schemas.append(schema)
+        yield schemas
+    finally:
+        for schema in schemas:
+            conn.execute(f"DETACH DATABASE {schema}")
+
+
+class VerificationArchiver:
+    """보존 기간이 지난 인증 기록을 연도별 아카이브 파일로 옮기는 작업"""
+
+    def __init__(self, db_manager: 'DatabaseManager', archive_dir: str, retention_days: int,
+                 chunk_size: int = 500, max_lock_ms: float = 5.0, pause: float = 0.05):
+        """
+        아카이브 작업 초기화
+
+        Args:
+            db_manager: 운영 데이터베이스 매니저
+            archive_dir: 아카이브 파일 디렉토리
+            retention_days: 운영 DB에 남길 기간 (일)
+            chunk_size: 한 번에 옮길 최대 행 수 (잠금 시간에 맞춰 자동 조절)
+            max_lock_ms: 청크 삭제 시 운영 DB 쓰기 잠금을 잡을 목표 최대 시간 (밀리초)
+            pause: 청크 사이 대기 시간 (초)
+        """
+        self.db_manager = db_manager
+        self.archive_dir = archive_dir
+        self.retention_days = max(1, int(retention_days))
+        self.max_chunk_size = max(1, int(chunk_size))
+        self.max_lock_ms = float(max_lock_ms)
+        self.pause = max(0.0, float(pause))
+
+        self.chunk_size = min(self.max_chunk_size, 100)  # 행당 비용을 측정하기 전에는 작게 시작
+        self._ms_per_row: Optional[float] = None
+        self._archive_connections: Dict[int, sqlite3.Connection] = {}
+
+        # 통계
+        self.rows_archived = 0
+        self.chunks_archived = 0
+        self.max_lock_ms_seen = 0.0
+        self.last_run_at: Optional[datetime.datetime] = None
+
+    def cutoff_date(self, today: Optional[datetime.date] = None) -> str:
+        """이 날짜(YYYY-MM-DD)보다 이전 인증 기록이 보관 대상"""
+        today = today or datetime.date.today()
+        return (today - datetime.timedelta(days=self.retention_days)).strftime('%Y-%m-%d')
+
+    def _archive_connection(self, year: int) -> sqlite3.Connection:
+        """연도별 아카이브 연결 (처음 사용할 때 파일과 테이블 생성)"""
+        conn = self._archive_connections.get(year)
+        if conn is None:
+            os.makedirs(self.archive_dir, exist_ok=True)
+            conn = sqlite3.connect(archive_path(self.archive_dir, year), timeout=self.db_manager.busy_timeout / 1000)
+            conn.execute("PRAGMA journal_mode = WAL")
+            for statement in ARCHIVE_SCHEMA:
+                conn.execute(statement)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(archived_verifications)")}
+            if 'message_id' not in columns:
+                # 메시지 ID를 저장하기 전에 만든 아카이브 파일
+                conn.execute("ALTER TABLE archived_verifications ADD COLUMN message_id INTEGER")
+            conn.commit()
+            self._archive_connections[year] = conn
+        return conn
+
+    def close(self):
+        """열려 있는 아카이브 연결 종료"""
+        for conn in self._archive_connections.values():
+            conn.close()
+        self._archive_connections.clear()
+
+    def archive_chunk(self, cutoff: str) -> int:
+        """
+        보관 대상 인증 기록 한 청크를 아카이브로 이동
+
+        Args:
+            cutoff: 이 날짜(YYYY-MM-DD)보다 이전 기록이 대상
+
+        Returns:
+            이동한 행 수 (0이면 더 옮길 기록 없음)
+        """
+        with self.db_manager.get_connection() as conn:
+            rows = conn.execute("""
+                SELECT id, user_id, username, message_content, image_urls,
+                       verification_date, verification_time, created_at, message_id
+                FROM verifications
+                WHERE verification_date < ?
+                ORDER BY verification_date, id
+                LIMIT ?
+            """, (cutoff, self.chunk_size)).fetchall()
+            if not rows:
+                return 0
+
+            ids = [row['id'] for row in rows]
+            placeholders = ','.join('?' * len(ids))
+            attachments = conn.execute(f"""
+                SELECT verification_id, ordinal, attachment_id, url, content_type, size
+                FROM verification_attachments
+                WHERE verification_id IN ({placeholders})
+            """, ids).fetchall()
+
+        self._write_archive(rows, attachments)
+        lock_ms = self._delete_archived(ids)
+        self._adjust_chunk_size(lock_ms, len(ids))
+
+        self.rows_archived += len(ids)
+        self.chunks_archived += 1
+        return len(ids)
+
+    def _write_archive(self, rows: Sequence[sqlite3.Row], attachments: Sequence[sqlite3.Row]):
+        """연도별 아카이브 파일에 행 기록 (같은 ID는 무시하므로 재실행해도 안전)"""
+        year_by_id = {row['id']: int(row['verification_date'][:4]) for row in rows}
+        attachments_by_year: Dict[int, List[tuple]] = {}
+        migrated_ids = set()
+        for item in attachments:
+            migrated_ids.add(item['verification_id'])
+            attachments_by_year.setdefault(year_by_id[item['verification_id']], []).append(tuple(item))
+
+        rows_by_year: Dict[int, List[tuple]] = {}
+        for row in rows:
+            year = year_by_id[row['id']]
+            rows_by_year.setdefault(year, []).append((
+                row['id'], row['user_id'], row['username'], compress_text(row['message_content']),
+                row['verification_date'], row['verification_time'], row['created_at'], row['message_id']
+            ))
+            if row['id'] not in migrated_ids and row['image_urls']:
+                # 첨부 파일 테이블로 이전되기 전의 기존 행
+                attachments_by_year.setdefault(year, []).extend(
+                    (row['id'], ordinal, None, url, None, None)
+                    for ordinal, url in enumerate(row['image_urls'].split(','))
+                )
+
+        for year, year_rows in rows_by_year.items():
+            archive_conn = self._archive_connection(year)
+            archive_conn.executemany("""
+                INSERT OR IGNORE INTO archived_verifications
+                (id, user_id, username, message_content, verification_date, verification_time, created_at,
+                 message_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, year_rows)
+            archive_conn.executemany("""
+                INSERT OR IGNORE INTO archived_attachments
+                (verification_id, ordinal, attachment_id, url, content_type, size)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, attachments_by_year.get(year, []))
+            archive_conn.commit()
+
+    def _delete_archived(self, ids: List[int]) -> float:
+        """운영 DB에서 옮긴 행과 첨부 파일 삭제, 쓰기 잠금 유지 시간(ms) 반환"""
+        placeholders = ','.join('?' * len(ids))
+        with self.db_manager.get_connection() as conn:
+            # 커밋 안에서 자동 체크포인트가 돌면 잠금 구간이 길어 보이므로 끄고,
+            # 잠금을 놓은 뒤 쓰기를 막지 않는 PASSIVE 체크포인트를 따로 실행
+            autocheckpoint = conn.execute("PRAGMA wal_autocheckpoint").fetchone()[0]
+            conn.execute("PRAGMA wal_autocheckpoint = 0")
+            try:
+                started = time.perf_counter()
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(f"DELETE FROM verification_attachments WHERE verification_id IN ({placeholders})", ids)
+                conn.execute(f"DELETE FROM verifications WHERE id IN ({placeholders})", ids)
+                conn.commit()
+                lock_ms = (time.perf_counter() - started) * 1000
+            finally:
+                conn.execute(f"PRAGMA wal_autocheckpoint = {int(autocheckpoint)}")
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        self.max_lock_ms_seen = max(self.max_lock_ms_seen, lock_ms)
+        return lock_ms
+
+    def _adjust_chunk_size(self, lock_ms: float, rows: int):
+        """
+        행당 삭제 비용의 이동 평균으로 다음 청크 크기 결정
+
+        체크포인트 등으로 한 번 튀는 값에 흔들리지 않도록 평균을 사용하고,
+        목표 잠금 시간의 절반에 맞춰 여유를 둡니다.
+        """
+        ms_per_row = lock_ms / rows
+        if self._ms_per_row is None:
+            self._ms_per_row = ms_per_row
+        else:
+            self._ms_per_row = 0.8 * self._ms_per_row + 0.2 * ms_per_row
+        target_rows = int(self.max_lock_ms / 2 / max(self._ms_per_row, 1e-6))
+        self.chunk_size = max(1, min(self.max_chunk_size, target_rows))
+
+    def run(self, today: Optional[datetime.date] = None) -> int:
+        """
+        보관 대상이 없어질 때까지 청크 단위로 이동 (동기, 청크 사이 대기)
+
+        Returns:
+            이동한 전체 행 수
+        """
+        cutoff = self.cutoff_date(today)
+        total = 0
+        started = time.perf_counter()
+        try:
+            while True:
+                moved = self.archive_chunk(cutoff)
+                if moved == 0:
+                    break
+                total += moved
+                time.sleep(self.pause)
+        finally:
+            self.close()
+        self._log_run(total, cutoff, started)
+        return total
+
+    async def run_async(self, executor: 'AsyncDatabaseExecutor', today: Optional[datetime.date] = None) -> int:
+        """
+        run()의 비동기 버전 (청크는 DB 실행기에서 처리하고 사이마다 이벤트 루프에 양보)
+
+        Returns:
+            이동한 전체 행 수
+        """
+        cutoff = self.cutoff_date(today)
+        total = 0
+        started = time.perf_counter()
+        try:
+            while True:
+                moved = await executor.run(self.archive_chunk, cutoff)
+                if moved == 0:
+                    break
+                total += moved
+                await asyncio.sleep(self.pause)
+        finally:
+            await executor.run(self.close)
+        self._log_run(total, cutoff, started)
+        return total
+
+    def _log_run(self, total: int, cutoff: str, started: float):
+        self.last_run_at = datetime.datetime.now()
+        if total:
+            logger.info(
+                f"인증 기록 보관 완료: {cutoff} 이전 {total}건 "
+                f"({time.perf_counter() - started:.1f}초, 최대 잠금 {self.max_lock_ms_seen:.2f}ms)"
+            )
+
+    def get_stats(self) -> Dict[str, object]:
+        """보관 작업 통계"""
+        return {
+            'rows_archived': self.rows_archived,
+            'chunks_archived': self.chunks_archived,
+            'chunk_size': self.chunk_size,
+            'max_lock_ms_seen': self.max_lock_ms_seen,
+            'last_run_at': self.last_run_at,
+        }
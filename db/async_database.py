@@ -0,0 +1,320 @@
+"""
+비동기 데이터베이스 접근 모듈
+
+동기 매니저 호출을 전용 DB 스레드 풀에서 실행하여
+discord.py 이벤트 루프가 디스크 I/O로 멈추지 않도록 합니다.
+"""
+import asyncio
+import datetime
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from .database import (
+    BackfillJobManager, DailySummaryManager, HistoryCursorManager, HolidayManager, VacationManager,
+    VerificationManager, ProgressCallback
+)
+from .records import (
+    BackfillJobRecord, DailySummaryRecord, DailyVerificationRecord, HistoryCursorRecord, HolidayRecord, VacationRecord, VerificationPage,
+    VerificationRecord
+)
+
+logger = logging.getLogger('verification_bot')
+
+class AsyncDatabaseExecutor:
+    """대기열 크기가 제한된 DB 전용 실행기"""
+    
+    def __init__(self, max_workers: int = 2, queue_size: int = 64):
+        """
+        실행기 초기화
+        
+        Args:
+            max_workers: DB 작업을 실행할 스레드 수
+            queue_size: 동시에 대기/실행 가능한 최대 작업 수 (초과 시 호출자가 대기)
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.queue_size = max(1, int(queue_size))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='db')
+        self._semaphore = asyncio.Semaphore(self.queue_size)
+    
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        동기 함수를 DB 스레드에서 실행하고 결과를 기다림
+        
+        Args:
+            func: 실행할 동기 함수
+            *args, **kwargs: 함수 인자
+            
+        Returns:
+            함수 반환값
+        """
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    def shutdown(self, wait: bool = True):
+        """실행기 종료"""
+        self._executor.shutdown(wait=wait)
+        logger.info("DB 실행기 종료 완료")
+
+
+class _AsyncManagerBase:
+    """동기 매니저를 감싸는 비동기 매니저 공통 클래스"""
+    
+    def __init__(self, manager, executor: AsyncDatabaseExecutor):
+        self.sync = manager  # 스크립트/마이그레이션용 동기 API
+        self.db_manager = manager.db_manager
+        self.executor = executor
+    
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        return await self.executor.run(func, *args, **kwargs)
+
+
+class AsyncHolidayManager(_AsyncManagerBase):
+    """HolidayManager의 비동기 버전"""
+    
+    def __init__(self, manager: HolidayManager, executor: AsyncDatabaseExecutor):
+        super().__init__(manager, executor)
+    
+    async def add_holiday(self, date: str, name: str) -> bool:
+        """공휴일 추가"""
+        return await self._run(self.sync.add_holiday, date, name)
+    
+    async def add_holidays_bulk(self, holidays: Iterable[Tuple[str, str]], batch_size: int = 500,
+                                progress_callback: Optional[ProgressCallback] = None) -> Optional[Dict[str, int]]:
+        """공휴일 일괄 추가 (단일 트랜잭션)"""
+        return await self._run(self.sync.add_holidays_bulk, holidays, batch_size, progress_callback)
+    
+    async def remove_holiday(self, date: str) -> bool:
+        """공휴일 제거"""
+        return await self._run(self.sync.remove_holiday, date)
+    
+    async def is_holiday(self, date: datetime.date) -> bool:
+        """특정 날짜가 공휴일인지 확인"""
+        return await self._run(self.sync.is_holiday, date)
+    
+    async def get_holidays(self, year: Optional[int] = None) -> List[HolidayRecord]:
+        """공휴일 목록 조회"""
+        return await self._run(self.sync.get_holidays, year)
+    
+    async def get_holiday_count(self) -> int:
+        """등록된 공휴일 총 개수 반환"""
+        return await self._run(self.sync.get_holiday_count)
+
+
+class AsyncVacationManager(_AsyncManagerBase):
+    """VacationManager의 비동기 버전"""
+    
+    def __init__(self, manager: VacationManager, executor: AsyncDatabaseExecutor):
+        super().__init__(manager, executor)
+    
+    async def add_vacation(self, user_id: str, date: str) -> bool:
+        """사용자 휴가 추가"""
+        return await self._run(self.sync.add_vacation, user_id, date)
+    
+    async def add_vacation_range(self, user_id: str, start_date, end_date) -> int:
+        """사용자 휴가 기간 추가 (기존 구간과 병합)"""
+        return await self._run(self.sync.add_vacation_range, user_id, start_date, end_date)
+    
+    async def add_vacations_bulk(self, vacations: Iterable[Tuple[str, str]], batch_size: int = 1000,
+                                 progress_callback: Optional[ProgressCallback] = None) -> Optional[Dict[str, int]]:
+        """휴가 일괄 추가 (단일 트랜잭션)"""
+        return await self._run(self.sync.add_vacations_bulk, vacations, batch_size, progress_callback)
+    
+    async def remove_vacation(self, user_id: str, date: str) -> bool:
+        """사용자 휴가 제거"""
+        return await self._run(self.sync.remove_vacation, user_id, date)
+    
+    async def remove_vacation_range(self, user_id: str, start_date, end_date) -> int:
+        """사용자 휴가 기간 제거 (걸쳐 있는 구간은 분할)"""
+        return await self._run(self.sync.remove_vacation_range, user_id, start_date, end_date)
+    
+    async def remove_all_vacations(self, user_id: str) -> int:
+        """사용자의 모든 휴가 제거"""
+        return await self._run(self.sync.remove_all_vacations, user_id)
+    
+    async def is_user_on_vacation(self, user_id: str, date: Optional[datetime.date] = None) -> bool:
+        """사용자가 특정 날짜에 휴가인지 확인"""
+        return await self._run(self.sync.is_user_on_vacation, user_id, date)
+    
+    async def get_user_vacation_periods(self, user_id: str) -> List[VacationRecord]:
+        """사용자의 휴가 구간 조회"""
+        return await self._run(self.sync.get_user_vacation_periods, user_id)
+    
+    async def get_user_vacations(self, user_id: str) -> Set[str]:
+        """사용자의 모든 휴가 날짜 조회"""
+        return await self._run(self.sync.get_user_vacations, user_id)
+    
+    async def get_all_vacations_by_date(self, date: datetime.date) -> Set[str]:
+        """특정 날짜의 모든 휴가자 조회"""
+        return await self._run(self.sync.get_all_vacations_by_date, date)
+    
+    async def get_vacationers_among(self, user_ids: Iterable[str], date: datetime.date) -> Set[str]:
+        """주어진 사용자 중 특정 날짜에 휴가인 사용자 조회"""
+        return await self._run(self.sync.get_vacationers_among, list(user_ids), date)
+    
+    async def get_vacations_in_range(self, start_date: datetime.date,
+                                     end_date: datetime.date) -> Dict[str, Set[str]]:
+        """기간 내 날짜별 휴가자 조회"""
+        return await self._run(self.sync.get_vacations_in_range, start_date, end_date)
+
+
+class AsyncVerificationManager(_AsyncManagerBase):
+    """VerificationManager의 비동기 버전"""
+    
+    def __init__(self, manager: VerificationManager, executor: AsyncDatabaseExecutor):
+        super().__init__(manager, executor)
+    
+    async def add_verification(self, user_id: str, username: str, message_content: str,
+                               image_urls: List[str], verification_datetime: datetime.datetime,
+                               attachments: Optional[List[Dict]] = None, message_id: Optional[int] = None) -> bool:
+        """인증 기록 추가 (첨부 파일 포함, 이미 저장된 메시지 ID는 건너뜀)"""
+        return await self._run(self.sync.add_verification, user_id, username, message_content,
+                               image_urls, verification_datetime, attachments, message_id)
+    
+    async def update_verification(self, message_id: int, message_content: str, attachments: List[Dict]) -> bool:
+        """수정된 메시지의 인증 기록 내용과 첨부 파일 갱신"""
+        return await self._run(self.sync.update_verification, message_id, message_content, attachments)
+    
+    async def retract_verifications(self, message_ids: Iterable[int]) -> int:
+        """삭제되었거나 더 이상 인증이 아닌 메시지의 인증 기록 취소"""
+        return await self._run(self.sync.retract_verifications, list(message_ids))
+    
+    async def add_verifications_bulk(self, records: List[Dict]) -> bool:
+        """여러 인증 기록을 하나의 트랜잭션으로 추가"""
+        return await self._run(self.sync.add_verifications_bulk, records)
+    
+    async def get_verifications_by_date(self, date: datetime.date) -> List[VerificationRecord]:
+        """특정 날짜의 모든 인증 기록 조회"""
+        return await self._run(self.sync.get_verifications_by_date, date)
+    
+    async def get_user_verifications(self, user_id: str, start_date: Optional[datetime.date] = None,
+                                     end_date: Optional[datetime.date] = None) -> List[VerificationRecord]:
+        """사용자의 인증 기록 조회"""
+        return await self._run(self.sync.get_user_verifications, user_id, start_date, end_date)
+    
+    async def get_user_verifications_page(self, user_id: str, cursor: Optional[str] = None, limit: int = 50,
+                                          descending: bool = True, start_date: Optional[datetime.date] = None,
+                                          end_date: Optional[datetime.date] = None) -> VerificationPage:
+        """사용자의 인증 기록을 키셋 기준으로 한 페이지 조회"""
+        return await self._run(self.sync.get_user_verifications_page, user_id, cursor, limit,
+                               descending, start_date, end_date)
+    
+    async def iter_user_verification_pages(self, user_id: str, cursor: Optional[str] = None,
+                                           page_size: int = 50, descending: bool = True,
+                                           start_date: Optional[datetime.date] = None,
+                                           end_date: Optional[datetime.date] = None) -> AsyncIterator[VerificationPage]:
+        """
+        사용자의 인증 기록을 페이지 단위로 스트리밍 (다음 페이지는 소비자가 요청할 때 조회)
+        
+        각 페이지의 next_cursor를 저장해 두면 나중에 그 위치부터 다시 이어서 읽을 수 있습니다.
+        """
+        while True:
+            page = await self.get_user_verifications_page(user_id, cursor, page_size, descending,
+                                                          start_date, end_date)
+            if page.records:
+                yield page
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+    
+    async def iter_user_verifications(self, user_id: str, cursor: Optional[str] = None,
+                                      page_size: int = 50, descending: bool = True,
+                                      start_date: Optional[datetime.date] = None,
+                                      end_date: Optional[datetime.date] = None) -> AsyncIterator[VerificationRecord]:
+        """사용자의 인증 기록을 한 건씩 스트리밍 (내부적으로 page_size 단위로 조회)"""
+        async for page in self.iter_user_verification_pages(user_id, cursor, page_size, descending,
+                                                            start_date, end_date):
+            for record in page.records:
+                yield record
+    
+    async def search_verifications(self, text: str, user_id: Optional[str] = None,
+                                   start_date: Optional[datetime.date] = None,
+                                   end_date: Optional[datetime.date] = None, limit: int = 10,
+                                   cursor: Optional[str] = None, order: str = 'rank') -> VerificationPage:
+        """인증 메시지 전문 검색 (한 페이지)"""
+        return await self._run(self.sync.search_verifications, text, user_id, start_date, end_date,
+                               limit, cursor, order)
+    
+    async def get_attachments(self, verification_id: int) -> List[Dict]:
+        """인증 기록 하나의 첨부 파일 조회"""
+        return await self._run(self.sync.get_attachments, verification_id)
+    
+    async def migrate_legacy_image_urls(self, batch_size: int = 500) -> int:
+        """기존 image_urls 값을 첨부 파일 테이블로 이전 (한 배치)"""
+        return await self._run(self.sync.migrate_legacy_image_urls, batch_size)
+    
+    async def has_user_verified_on_date(self, user_id: str, date: datetime.date) -> bool:
+        """사용자가 특정 날짜에 인증했는지 확인"""
+        return await self._run(self.sync.has_user_verified_on_date, user_id, date)
+    
+    async def get_daily_verification(self, user_id: str,
+                                     date: datetime.date) -> Optional[DailyVerificationRecord]:
+        """사용자의 특정 날짜 인증 요약 조회"""
+        return await self._run(self.sync.get_daily_verification, user_id, date)
+    
+    async def get_verified_users_on_date(self, date: datetime.date) -> Set[str]:
+        """특정 날짜에 인증한 모든 사용자 ID 조회"""
+        return await self._run(self.sync.get_verified_users_on_date, date)
+    
+    async def add_missing_verifications(self, records: List[Dict]) -> int:
+        """메시지 기록에서 찾은 인증 중 저장되지 않은 것만 추가"""
+        return await self._run(self.sync.add_missing_verifications, records)
+
+
+class AsyncDailySummaryManager(_AsyncManagerBase):
+    """DailySummaryManager의 비동기 버전"""
+    
+    def __init__(self, manager: DailySummaryManager, executor: AsyncDatabaseExecutor):
+        super().__init__(manager, executor)
+    
+    async def record_check(self, date: datetime.date, member_ids: Iterable[str]) -> Optional[DailySummaryRecord]:
+        """체크 실행 결과 기록"""
+        return await self._run(self.sync.record_check, date, list(member_ids))
+    
+    async def rebuild(self, start_date: datetime.date, end_date: datetime.date) -> int:
+        """기간의 요약 재계산"""
+        return await self._run(self.sync.rebuild, start_date, end_date)
+    
+    async def get_summary(self, date: datetime.date) -> Optional[DailySummaryRecord]:
+        """특정 날짜의 인증 현황 요약 조회"""
+        return await self._run(self.sync.get_summary, date)
+    
+    async def get_summaries(self, start_date: datetime.date, end_date: datetime.date) -> List[DailySummaryRecord]:
+        """기간의 인증 현황 요약 조회"""
+        return await self._run(self.sync.get_summaries, start_date, end_date)
+
+
+class AsyncHistoryCursorManager(_AsyncManagerBase):
+    """HistoryCursorManager의 비동기 버전"""
+    
+    def __init__(self, manager: HistoryCursorManager, executor: AsyncDatabaseExecutor):
+        super().__init__(manager, executor)
+    
+    async def get_cursor(self, channel_id: str) -> Optional[HistoryCursorRecord]:
+        """채널의 마지막 스캔 위치 조회"""
+        return await self._run(self.sync.get_cursor, channel_id)
+    
+    async def save_cursor(self, channel_id: str, message_id: int, message_at: datetime.datetime) -> bool:
+        """채널의 스캔 위치 저장"""
+        return await self._run(self.sync.save_cursor, channel_id, message_id, message_at)
+
+
+class AsyncBackfillJobManager(_AsyncManagerBase):
+    """BackfillJobManager의 비동기 버전"""
+    
+    def __init__(self, manager: BackfillJobManager, executor: AsyncDatabaseExecutor):
+        super().__init__(manager, executor)
+    
+    async def start_job(self, channel_id: str, start_at: datetime.datetime,
+                        end_at: datetime.datetime) -> Optional[BackfillJobRecord]:
+        """백필 작업 시작 (중단된 작업은 이어서 진행)"""
+        return await self._run(self.sync.start_job, channel_id, start_at, end_at)
+    
+    async def save_progress(self, job_id: int, records: List[Dict], last_message_id: int, scanned: int) -> int:
+        """인증 기록과 진행 위치를 하나의 트랜잭션으로 저장"""
+        return await self._run(self.sync.save_progress, job_id, records, last_message_id, scanned)
+    
+    async def finish_job(self, job_id: int) -> bool:
+        """백필 작업을 완료로 표시"""
+        return await self._run(self.sync.finish_job, job_id)
@@ -0,0 +1,228 @@
+"""
+온라인 데이터베이스 백업 모듈
+
+봇이 쓰는 중에도 파일을 그대로 복사하지 않고 SQLite 백업 API로 일관된 스냅샷을 만듭니다.
+한 단계에 pages_per_step 페이지씩 복사하고 단계 사이에 잠시 쉬어 쓰기 요청이 끼어들 틈을 줍니다.
+복사는 기본 스레드 풀에서 실행되므로 이벤트 루프와 DB 실행기 작업을 막지 않습니다.
+
+다른 연결이 복사 도중 원본을 수정하면 SQLite가 처음부터 다시 복사합니다. 재시작이
+max_restarts번을 넘으면 남은 복사를 한 단계로 끝냅니다 (WAL 모드에서는 읽기 스냅샷이라
+쓰기를 막지 않음).
+"""
+import os
+import re
+import time
+import asyncio
+import logging
+import sqlite3
+import datetime
+import threading
+from typing import TYPE_CHECKING, List, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from .database import DatabaseManager
+
+logger = logging.getLogger('verification_bot')
+
+
+class BackupError(Exception):
+    """백업을 만들 수 없거나 무결성 검사에 실패한 경우"""
+
+
+class BackupResult(NamedTuple):
+    """백업 결과"""
+    path: str
+    pages: int
+    size_bytes: int
+    elapsed: float  # 초
+    steps: int
+    max_step_ms: float  # 한 단계에서 원본을 읽은 최대 시간
+    restarts: int  # 원본 변경으로 복사를 다시 시작한 횟수
+    removed: List[str]  # 보관 개수를 넘어 삭제한 이전 스냅샷
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.elapsed if self.elapsed > 0 else float('inf')
+
+
+class _BackupRestarted(Exception):
+    """재시작 한도 초과 (단계별 복사 중단용)"""
+
+
+class _ProgressTracker:
+    """백업 단계 진행 콜백 (단계 시간 측정, 재시작 감지, 단계 사이 대기)"""
+
+    def __init__(self, step_pause: float, max_restarts: int):
+        self.step_pause = step_pause
+        self.max_restarts = max_restarts
+        self.steps = 0
+        self.restarts = 0
+        self.max_step_ms = 0.0
+        self.pages = 0
+        self._remaining: Optional[int] = None
+        self._step_started = time.perf_counter()
+
+    def __call__(self, status: int, remaining: int, total: int):
+        step_ms = (time.perf_counter() - self._step_started) * 1000
+        self.steps += 1
+        self.max_step_ms = max(self.max_step_ms, step_ms)
+        self.pages = total
+        if self._remaining is not None and remaining > self._remaining:
+            self.restarts += 1
+            if self.restarts > self.max_restarts:
+                raise _BackupRestarted()
+        self._remaining = remaining
+        if remaining and self.step_pause:
+            time.sleep(self.step_pause)
+        self._step_started = time.perf_counter()
+
+
+class DatabaseBackup:
+    """SQLite 백업 API 기반 온라인 스냅샷 생성 및 보관 개수 관리"""
+
+    def __init__(self, db_manager: 'DatabaseManager', backup_dir: str, keep: int = 7,
+                 pages_per_step: int = 256, step_pause: float = 0.01, max_restarts: int = 3):
+        """
+        백업 관리자 초기화
+
+        Args:
+            db_manager: 원본 데이터베이스 매니저
+            backup_dir: 스냅샷 저장 디렉토리
+            keep: 유지할 최근 스냅샷 수
+            pages_per_step: 한 단계에 복사할 페이지 수
+            step_pause: 단계 사이 대기 시간 (초)
+            max_restarts: 단계별 복사를 포기하고 한 번에 복사하기 전까지 허용할 재시작 횟수
+        """
+        self.db_manager = db_manager
+        self.backup_dir = backup_dir
+        self.keep = max(1, int(keep))
+        self.pages_per_step = max(1, int(pages_per_step))
+        self.step_pause = max(0.0, float(step_pause))
+        self.max_restarts = max(0, int(max_restarts))
+
+        stem = os.path.splitext(os.path.basename(db_manager.db_path))[0]
+        self._stem = stem
+        self._snapshot_pattern = re.compile(rf'^{re.escape(stem)}_\d{{8}}_\d{{6}}\.db$')
+        self._lock = threading.Lock()
+        self.last_result: Optional[BackupResult] = None
+
+    def snapshot_path(self, now: Optional[datetime.datetime] = None) -> str:
+        """스냅샷 파일 경로 (이름순 정렬이 시간순과 같도록 타임스탬프 사용)"""
+        now = now or datetime.datetime.now()
+        return os.path.join(self.backup_dir, f"{self._stem}_{now.strftime('%Y%m%d_%H%M%S')}.db")
+
+    def list_snapshots(self) -> List[str]:
+        """저장된 스냅샷 경로 목록 (오래된 순)"""
+        if not os.path.isdir(self.backup_dir):
+            return []
+        return [
+            os.path.join(self.backup_dir, name)
+            for name in sorted(os.listdir(self.backup_dir)) if self._snapshot_pattern.match(name)
+        ]
+
+    def rotate(self) -> List[str]:
+        """
+        최근 keep개만 남기고 이전 스냅샷 삭제
+
+        Returns:
+            삭제한 스냅샷 경로 목록
+        """
+        snapshots = self.list_snapshots()
+        removed = snapshots[:-self.keep]
+        for path in removed:
+            os.remove(path)
+        return removed
+
+    @staticmethod
+    def verify(path: str):
+        """
+        스냅샷 무결성 검사
+
+        Raises:
+            BackupError: PRAGMA integrity_check 결과가 ok가 아닌 경우
+        """
+        conn = sqlite3.connect(path)
+        try:
+            rows = [row[0] for row in conn.execute("PRAGMA integrity_check")]
+        except sqlite3.DatabaseError as e:
+            raise BackupError(f"백업 무결성 검사 실패 ({path}): {e}") from e
+        finally:
+            conn.close()
+        if rows != ['ok']:
+            raise BackupError(f"백업 무결성 검사 실패 ({path}): {'; '.join(rows[:5])}")
+
+    def create_snapshot(self) -> BackupResult:
+        """
+        온라인 스냅샷 생성, 무결성 검사, 보관 개수 정리 (동기)
+
+        임시 파일에 복사하고 검사를 통과한 뒤에만 최종 이름으로 바꾸므로
+        중간에 실패해도 불완전한 스냅샷이 남지 않습니다.
+
+        Returns:
+            백업 결과
+
+        Raises:
+            BackupError: 다른 백업이 진행 중이거나 무결성 검사 실패
+        """
+        if not self._lock.acquire(blocking=False):
+            raise BackupError("이미 백업이 진행 중입니다.")
+        try:
+            return self._create_snapshot()
+        finally:
+            self._lock.release()
+
+    def _create_snapshot(self) -> BackupResult:
+        os.makedirs(self.backup_dir, exist_ok=True)
+        path = self.snapshot_path()
+        partial_path = path + '.partial'
+        tracker = _ProgressTracker(self.step_pause, self.max_restarts)
+
+        started = time.perf_counter()
+        source = sqlite3.connect(self.db_manager.db_path, timeout=self.db_manager.busy_timeout / 1000)
+        target = sqlite3.connect(partial_path)
+        try:
+            try:
+                source.backup(target, pages=self.pages_per_step, progress=tracker)
+            except _BackupRestarted:
+                logger.warning(
+                    f"백업 중 원본이 계속 변경되어 {tracker.restarts}번 재시작, 남은 복사를 한 단계로 진행합니다."
+                )
+                step_started = time.perf_counter()
+                source.backup(target)
+                tracker.steps += 1
+                tracker.max_step_ms = max(tracker.max_step_ms, (time.perf_counter() - step_started) * 1000)
+            # 스냅샷은 단일 파일로 보관 (WAL 헤더가 복사되어도 -wal 파일이 생기지 않도록)
+            target.execute("PRAGMA journal_mode = DELETE")
+            pages = target.execute("PRAGMA page_count").fetchone()[0]
+        except Exception:
+            target.close()
+            os.remove(partial_path)
+            raise
+        finally:
+            source.close()
+        target.close()
+
+        try:
+            self.verify(partial_path)
+        except BackupError:
+            os.remove(partial_path)
+            raise
+        os.replace(partial_path, path)
+        elapsed = time.perf_counter() - started
+        removed = self.rotate()
+
+        result = BackupResult(
+            path=path, pages=pages, size_bytes=os.path.getsize(path), elapsed=elapsed,
+            steps=tracker.steps, max_step_ms=tracker.max_step_ms, restarts=tracker.restarts, removed=removed
+        )
+        self.last_result = result
+        logger.info(
+            f"온라인 백업 완료: {path} ({result.pages}페이지, {result.size_bytes / 1024 / 1024:.1f}MB, "
+            f"{elapsed:.2f}초, {result.pages_per_second:,.0f}페이지/초, {result.steps}단계, "
+            f"최대 단계 {result.max_step_ms:.1f}ms, 재시작 {result.restarts}회, 이전 스냅샷 {len(removed)}개 삭제)"
+        )
+        return result
+
+    async def create_snapshot_async(self) -> BackupResult:
+        """create_snapshot()을 기본 스레드 풀에서 실행 (DB 실행기 작업자를 점유하지 않음)"""
+        return await asyncio.to_thread(self.create_snapshot)
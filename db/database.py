@@ -3,27 +3,159 @@ SQLite 데이터베이스 관리 모듈
 """
 import sqlite3
 import os
+import re
+import json
+import base64
+import queue
 import logging
+import threading
+import time
 from contextlib import contextmanager
-from typing import List, Dict, Optional, Set
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Optional, Set, Tuple
 import datetime
+from .archive import archive_columns, attached_archives, decompress_text, list_archive_years
+from .records import (
+    BackfillJobRecord, DailySummaryRecord, DailyVerificationRecord, HistoryCursorRecord, HolidayRecord,
+    VacationRecord, VerificationPage, VerificationRecord
+)
+from .schema import SCHEMA_VERSION, migrate_schema
 
 logger = logging.getLogger('verification_bot')
 
+# 연결마다 한 번만 적용되는 기본 PRAGMA 값
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -16000,  # 음수는 KiB 단위 (약 16MB)
+    'mmap_size': 268435456,  # 256MB
+    'temp_store': 'MEMORY',
+    'foreign_keys': 'ON'  # 인증 기록 삭제 시 첨부 파일 행도 함께 삭제
+}
+
+_PRAGMA_NAME_PATTERN = re.compile(r'^[a-z_]+$')
+_PRAGMA_VALUE_PATTERN = re.compile(r'^-?[A-Za-z0-9_]+$')
+
+# 일괄 처리 진행 상황 콜백 (지금까지 처리한 입력 행 수)
+ProgressCallback = Callable[[int], None]
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """이터러블을 size 크기 리스트로 나누어 반환 (입력을 한 번에 메모리에 올리지 않음)"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _iter_days(start: datetime.date, end: datetime.date) -> Iterator[datetime.date]:
+    """start부터 end까지(포함) 날짜 순회"""
+    for offset in range((end - start).days + 1):
+        yield start + datetime.timedelta(days=offset)
+
+def _days_to_periods(days: Iterable[datetime.date]) -> List[Tuple[datetime.date, datetime.date]]:
+    """날짜 집합을 연속된 [시작일, 종료일] 구간 목록으로 변환"""
+    periods: List[Tuple[datetime.date, datetime.date]] = []
+    for day in sorted(days):
+        if periods and (day - periods[-1][1]).days <= 1:
+            periods[-1] = (periods[-1][0], max(periods[-1][1], day))
+        else:
+            periods.append((day, day))
+    return periods
+
+# 한 날짜의 인증 현황 재계산 (체크 대상 행마다 휴가/인증 여부를 기본 키와 인덱스로 확인)
+_REFRESH_SUMMARY_SQL = """
+    INSERT OR REPLACE INTO daily_summary (summary_date, required, verified, on_vacation, missed, updated_at)
+    SELECT :date,
+        COUNT(*) - IFNULL(SUM(on_vacation), 0),
+        (SELECT COUNT(*) FROM daily_verification WHERE verification_date = :date),
+        IFNULL(SUM(on_vacation), 0),
+        IFNULL(SUM(NOT on_vacation AND NOT verified), 0),
+        CURRENT_TIMESTAMP
+    FROM (
+        SELECT
+            EXISTS (
+                SELECT 1 FROM vacation_periods AS p
+                WHERE p.user_id = r.user_id AND p.start_date <= :date AND p.end_date >= :date
+            ) AS on_vacation,
+            EXISTS (
+                SELECT 1 FROM daily_verification AS dv
+                WHERE dv.verification_date = :date AND dv.user_id = r.user_id
+            ) AS verified
+        FROM daily_roster AS r
+        WHERE r.check_date = :date
+    )
+"""
+
+def _refresh_daily_summary(conn: sqlite3.Connection, start: datetime.date, end: datetime.date,
+                           user_id: Optional[str] = None) -> int:
+    """
+    날짜별 인증 현황을 원본 테이블에서 다시 계산 (트랜잭션은 호출자가 관리)
+    
+    Args:
+        conn: 데이터베이스 연결
+        start: 시작 날짜 (포함)
+        end: 종료 날짜 (포함)
+        user_id: 지정하면 이 사용자가 체크 대상이었던 날짜만 갱신 (휴가 변경 등 증분 갱신용)
+        
+    Returns:
+        갱신한 날짜 수
+    """
+    if user_id is None:
+        dates = [day.isoformat() for day in _iter_days(start, end)]
+    else:
+        dates = [row[0] for row in conn.execute(
+            "SELECT check_date FROM daily_roster WHERE user_id = ? AND check_date BETWEEN ? AND ?",
+            (user_id, start.isoformat(), end.isoformat())
+        )]
+    if not dates:
+        return 0
+    conn.executemany(_REFRESH_SUMMARY_SQL, [{'date': date} for date in dates])
+    # 체크 대상도 인증도 없는 날짜는 행을 남기지 않음
+    removed = conn.execute("""
+        DELETE FROM daily_summary
+        WHERE summary_date BETWEEN ? AND ? AND required = 0 AND verified = 0 AND on_vacation = 0
+    """, (dates[0], dates[-1])).rowcount
+    return len(dates) - removed
+
 class DatabaseManager:
-    """SQLite 데이터베이스 관리 클래스"""
+    """SQLite 데이터베이스 관리 클래스 (연결 풀 지원)"""
     
-    def __init__(self, db_path: str = "db/discord_bot.db"):
+    def __init__(self, db_path: str = "db/discord_bot.db", pool_size: int = 4,
+                 busy_timeout: int = 5000, pragmas: Optional[Dict[str, Any]] = None):
         """
         데이터베이스 매니저 초기화
         
         Args:
             db_path: 데이터베이스 파일 경로
+            pool_size: 풀에 유지할 최대 유휴 연결 수
+            busy_timeout: 잠금 대기 시간 (밀리초)
+            pragmas: 연결 생성 시 적용할 PRAGMA 설정 (None이면 기본값)
         """
         self.db_path = db_path
+        self.pool_size = max(1, int(pool_size))
+        self.busy_timeout = int(busy_timeout)
+        self.pragmas = dict(DEFAULT_PRAGMAS if pragmas is None else pragmas)
+        self._validate_pragmas()
+        
+        # LIFO 큐를 사용해 가장 최근에 사용한(캐시가 따뜻한) 연결을 재사용
+        self._pool: queue.LifoQueue = queue.LifoQueue(maxsize=self.pool_size)
+        self._pool_lock = threading.Lock()
+        self._closed = False
+        self.connections_created = 0
+        self.schema_check_ms = 0.0  # 마지막 스키마 확인/업그레이드 소요 시간
+        
         self._ensure_db_directory()
         self._init_database()
     
+    def _validate_pragmas(self):
+        """PRAGMA 이름/값 검증 (SQL 문자열에 직접 삽입되므로 허용 문자만 통과)"""
+        for name, value in self.pragmas.items():
+            if not _PRAGMA_NAME_PATTERN.match(str(name)):
+                raise ValueError(f"잘못된 PRAGMA 이름: {name}")
+            if not _PRAGMA_VALUE_PATTERN.match(str(value)):
+                raise ValueError(f"잘못된 PRAGMA 값: {name}={value}")
+    
     def _ensure_db_directory(self):
         """데이터베이스 디렉토리가 존재하는지 확인하고 생성"""
         db_dir = os.path.dirname(self.db_path)
@@ -31,11 +163,56 @@ class DatabaseManager:
             os.makedirs(db_dir, exist_ok=True)
             logger.info(f"데이터베이스 디렉토리 생성: {db_dir}")
     
+    def _create_connection(self) -> sqlite3.Connection:
+        """새 연결 생성 및 PRAGMA 적용 (연결당 한 번)"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout / 1000,
+            check_same_thread=False  # 풀을 통해 한 번에 한 스레드만 사용
+        )
+        conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
+        # ATTACH한 아카이브 파일의 압축된 메시지 내용을 쿼리 안에서 복원
+        conn.create_function('zlib_decompress', 1, decompress_text, deterministic=True)
+        conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        
+        with self._pool_lock:
+            self.connections_created += 1
+        return conn
+    
+    def _acquire_connection(self) -> sqlite3.Connection:
+        """풀에서 연결을 가져오고, 비어 있으면 새로 생성"""
+        if self._closed:
+            raise sqlite3.ProgrammingError("데이터베이스 매니저가 이미 종료되었습니다.")
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._create_connection()
+    
+    def _release_connection(self, conn: sqlite3.Connection):
+        """연결을 풀에 반환 (풀이 가득 찼거나 종료된 경우 연결 종료)"""
+        try:
+            if conn.in_transaction:
+                # 커밋되지 않은 트랜잭션이 다음 사용자에게 넘어가지 않도록 정리
+                conn.rollback()
+        except sqlite3.Error as e:
+            logger.warning(f"연결 반환 중 롤백 실패, 연결을 폐기합니다: {e}")
+            conn.close()
+            return
+        
+        if self._closed:
+            conn.close()
+            return
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+    
     @contextmanager
     def get_connection(self):
-        """데이터베이스 연결 컨텍스트 매니저"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
+        """데이터베이스 연결 컨텍스트 매니저 (풀에서 연결 대여)"""
+        conn = self._acquire_connection()
         try:
             yield conn
         except Exception as e:
@@ -43,57 +220,32 @@ class DatabaseManager:
             logger.error(f"데이터베이스 오류: {e}")
             raise
         finally:
+            self._release_connection(conn)
+    
+    def close(self):
+        """풀에 있는 모든 연결 종료"""
+        self._closed = True
+        closed_count = 0
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
             conn.close()
+            closed_count += 1
+        logger.info(f"데이터베이스 연결 풀 종료: {closed_count}개 연결 닫음")
     
     def _init_database(self):
-        """데이터베이스 및 테이블 초기화"""
+        """스키마 버전 확인 및 필요한 마이그레이션 적용 (최신이면 DDL 없이 통과)"""
+        started = time.perf_counter()
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # 공휴일 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS holidays (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date TEXT UNIQUE NOT NULL,
-                    name TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # 휴가 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS vacations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT NOT NULL,
-                    date TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(user_id, date)
-                )
-            """)
-            
-            # 인증 기록 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS verifications (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT NOT NULL,
-                    username TEXT NOT NULL,
-                    message_content TEXT,
-                    image_urls TEXT,
-                    verification_date TEXT NOT NULL,
-                    verification_time TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # 인덱스 생성
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_holidays_date ON holidays(date)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_vacations_user_date ON vacations(user_id, date)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_vacations_date ON vacations(date)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_verifications_user_date ON verifications(user_id, verification_date)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_verifications_date ON verifications(verification_date)")
-            
-            conn.commit()
-            logger.info("데이터베이스 초기화 완료")
+            applied = migrate_schema(conn, self.db_path)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.schema_check_ms = elapsed_ms
+        if applied:
+            logger.info(f"데이터베이스 초기화 완료 (스키마 v{SCHEMA_VERSION}, {elapsed_ms:.1f}ms)")
+        else:
+            logger.info(f"데이터베이스 스키마 최신 상태 (v{SCHEMA_VERSION}, {elapsed_ms:.1f}ms)")
 
 
 class HolidayManager:
@@ -101,6 +253,18 @@ class HolidayManager:
     
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        self._change_listeners: List[Callable[[], None]] = []
+    
+    def add_change_listener(self, listener: Callable[[], None]):
+        """공휴일 데이터 변경 시 호출할 콜백 등록 (달력 색인 재생성 등)"""
+        self._change_listeners.append(listener)
+    
+    def _notify_change(self):
+        for listener in self._change_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error(f"공휴일 변경 알림 처리 오류: {e}")
     
     def add_holiday(self, date: str, name: str) -> bool:
         """
@@ -122,7 +286,8 @@ class HolidayManager:
                 )
                 conn.commit()
                 logger.debug(f"공휴일 추가: {date} - {name}")
-                return True
+            self._notify_change()
+            return True
         except Exception as e:
             logger.error(f"공휴일 추가 오류: {e}")
             return False
@@ -143,7 +308,10 @@ class HolidayManager:
                 cursor.execute("DELETE FROM holidays WHERE date = ?", (date,))
                 conn.commit()
                 logger.debug(f"공휴일 제거: {date}")
-                return cursor.rowcount > 0
+                removed = cursor.rowcount > 0
+            if removed:
+                self._notify_change()
+            return removed
         except Exception as e:
             logger.error(f"공휴일 제거 오류: {e}")
             return False
@@ -168,7 +336,7 @@ class HolidayManager:
             logger.error(f"공휴일 확인 오류: {e}")
             return False
     
-    def get_holidays(self, year: Optional[int] = None) -> List[Dict]:
+    def get_holidays(self, year: Optional[int] = None) -> List[HolidayRecord]:
         """
         공휴일 목록 조회
         
@@ -176,24 +344,95 @@ class HolidayManager:
             year: 특정 연도 (None이면 전체)
             
         Returns:
-            공휴일 목록 [{'date': '2025-01-01', 'name': '신정'}, ...]
+            공휴일 레코드 목록 (record.date, record.name 또는 record['date'])
         """
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = HolidayRecord.row_factory
                 if year:
+                    # LIKE 'YYYY-%'는 기본 대소문자 규칙에서 인덱스를 못 쓰므로 범위 조건 사용
                     cursor.execute(
-                        "SELECT date, name FROM holidays WHERE date LIKE ? ORDER BY date",
-                        (f"{year}-%",)
+                        f"SELECT {HolidayRecord.COLUMNS} FROM holidays WHERE date >= ? AND date < ? ORDER BY date",
+                        (f"{year:04d}-01-01", f"{year + 1:04d}-01-01")
                     )
                 else:
-                    cursor.execute("SELECT date, name FROM holidays ORDER BY date")
+                    cursor.execute(f"SELECT {HolidayRecord.COLUMNS} FROM holidays ORDER BY date")
                 
-                return [{'date': row['date'], 'name': row['name']} for row in cursor.fetchall()]
+                return cursor.fetchall()
         except Exception as e:
             logger.error(f"공휴일 목록 조회 오류: {e}")
             return []
     
+    def add_holidays_bulk(self, holidays: Iterable[Tuple[str, str]], batch_size: int = 500,
+                          progress_callback: Optional[ProgressCallback] = None) -> Optional[Dict[str, int]]:
+        """
+        공휴일 일괄 추가 (단일 트랜잭션)
+        
+        Args:
+            holidays: (YYYY-MM-DD 날짜, 공휴일 이름) 이터러블 (스트리밍 입력 가능)
+            batch_size: executemany 한 번에 처리할 행 수
+            progress_callback: 배치마다 처리한 누적 행 수를 전달받는 콜백
+            
+        Returns:
+            {'inserted': 새로 추가, 'updated': 이름 변경, 'skipped': 변경 없음/잘못된 행}
+            오류 시 전체 롤백 후 None
+        """
+        counts = {'inserted': 0, 'updated': 0, 'skipped': 0}
+        processed = 0
+        try:
+            with self.db_manager.get_connection() as conn:
+                for chunk in _chunked(holidays, batch_size):
+                    processed += len(chunk)
+                    
+                    # 배치 내 중복은 마지막 값 기준으로 정리
+                    batch: Dict[str, str] = {}
+                    for date, name in chunk:
+                        date, name = (date or '').strip(), (name or '').strip()
+                        if not date or not name:
+                            counts['skipped'] += 1
+                            continue
+                        if date in batch:
+                            counts['skipped'] += 1
+                        batch[date] = name
+                    
+                    if batch:
+                        placeholders = ','.join('?' * len(batch))
+                        existing = {
+                            row['date']: row['name'] for row in conn.execute(
+                                f"SELECT date, name FROM holidays WHERE date IN ({placeholders})",
+                                list(batch)
+                            )
+                        }
+                        
+                        rows = []
+                        for date, name in batch.items():
+                            if date not in existing:
+                                counts['inserted'] += 1
+                            elif existing[date] != name:
+                                counts['updated'] += 1
+                            else:
+                                counts['skipped'] += 1
+                                continue
+                            rows.append((date, name))
+                        
+                        conn.executemany("""
+                            INSERT INTO holidays (date, name) VALUES (?, ?)
+                            ON CONFLICT(date) DO UPDATE SET name = excluded.name
+                        """, rows)
+                    
+                    if progress_callback:
+                        progress_callback(processed)
+                
+                conn.commit()
+            logger.info(f"공휴일 일괄 추가: {counts}")
+            if counts['inserted'] or counts['updated']:
+                self._notify_change()
+            return counts
+        except Exception as e:
+            logger.error(f"공휴일 일괄 추가 오류: {e}")
+            return None
+    
     def get_holiday_count(self) -> int:
         """등록된 공휴일 총 개수 반환"""
         try:
@@ -207,62 +446,229 @@ class HolidayManager:
 
 
 class VacationManager:
-    """휴가 관리 클래스"""
+    """휴가 관리 클래스 (사용자별 [시작일, 종료일] 구간 저장)"""
+    
+    # IN 절 대신 임시 테이블 조인을 사용하는 ID 개수 기준
+    TEMP_TABLE_THRESHOLD = 500
+    
+    # 날짜 :start 이후로 끝나는 구간의 시작일 하한 (가장 긴 구간 길이는 span 인덱스에서 바로 조회)
+    # start_date 인덱스를 [하한, :end] 범위로만 탐색하여 end_date 전체를 훑지 않음
+    _OVERLAP_SQL = """
+        start_date <= :end
+        AND start_date >= date(:start, '-' || (
+            SELECT IFNULL(MAX(julianday(end_date) - julianday(start_date)), 0) FROM vacation_periods
+        ) || ' days')
+        AND end_date >= :start
+    """
     
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
     
+    @staticmethod
+    def _to_date(value) -> datetime.date:
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        if isinstance(value, datetime.date):
+            return value
+        return datetime.date.fromisoformat(str(value).strip())
+    
+    @staticmethod
+    def _span_days(start: datetime.date, end: datetime.date) -> int:
+        return (end - start).days + 1
+    
+    def _merge_period(self, conn: sqlite3.Connection, user_id: str,
+                      start: datetime.date, end: datetime.date) -> int:
+        """
+        구간을 추가하면서 겹치거나 맞닿은 기존 구간과 병합 (트랜잭션은 호출자가 관리)
+        
+        Returns:
+            새로 휴가로 지정된 일 수 (이미 모두 등록된 경우 0)
+        """
+        one_day = datetime.timedelta(days=1)
+        rows = conn.execute("""
+            SELECT id, start_date, end_date FROM vacation_periods
+            WHERE user_id = ? AND start_date <= ? AND end_date >= ?
+        """, (user_id, (end + one_day).isoformat(), (start - one_day).isoformat())).fetchall()
+        
+        merged_start, merged_end = start, end
+        existing_days = 0
+        for row in rows:
+            row_start, row_end = self._to_date(row['start_date']), self._to_date(row['end_date'])
+            if row_start <= start and end <= row_end:
+                return 0  # 이미 전체 구간이 휴가로 등록됨
+            merged_start, merged_end = min(merged_start, row_start), max(merged_end, row_end)
+            existing_days += self._span_days(row_start, row_end)
+        
+        if rows:
+            conn.executemany("DELETE FROM vacation_periods WHERE id = ?", [(row['id'],) for row in rows])
+        conn.execute(
+            "INSERT INTO vacation_periods (user_id, start_date, end_date) VALUES (?, ?, ?)",
+            (user_id, merged_start.isoformat(), merged_end.isoformat())
+        )
+        return self._span_days(merged_start, merged_end) - existing_days
+    
+    def add_vacation_range(self, user_id: str, start_date, end_date) -> int:
+        """
+        사용자 휴가 기간 추가 (기존 구간과 병합)
+        
+        Args:
+            user_id: 사용자 ID
+            start_date: 시작 날짜 (datetime.date 또는 YYYY-MM-DD)
+            end_date: 종료 날짜 (포함)
+            
+        Returns:
+            새로 추가된 휴가 일 수 (0이면 이미 등록됨, 오류 시 -1)
+        """
+        try:
+            start, end = self._to_date(start_date), self._to_date(end_date)
+            if end < start:
+                raise ValueError(f"종료일이 시작일보다 빠릅니다: {start} ~ {end}")
+            
+            with self.db_manager.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")  # 같은 사용자의 동시 병합 방지
+                added_days = self._merge_period(conn, user_id, start, end)
+                if added_days:
+                    _refresh_daily_summary(conn, start, end, user_id)
+                conn.commit()
+            if added_days:
+                logger.debug(f"휴가 추가: {user_id} - {start} ~ {end} ({added_days}일)")
+            return added_days
+        except Exception as e:
+            logger.error(f"휴가 기간 추가 오류: {e}")
+            return -1
+    
     def add_vacation(self, user_id: str, date: str) -> bool:
         """
-        사용자 휴가 추가
+        사용자 휴가 추가 (하루)
         
         Args:
             user_id: 사용자 ID
             date: YYYY-MM-DD 형식의 날짜
             
         Returns:
-            추가 성공 여부
+            추가 성공 여부 (이미 존재하는 경우 False)
+        """
+        return self.add_vacation_range(user_id, date, date) > 0
+    
+    def add_vacations_bulk(self, vacations: Iterable[Tuple[str, str]], batch_size: int = 1000,
+                           progress_callback: Optional[ProgressCallback] = None) -> Optional[Dict[str, int]]:
+        """
+        휴가 일괄 추가 (단일 트랜잭션)
+        
+        배치마다 사용자별 연속된 날짜를 구간으로 묶은 뒤 기존 구간과 병합합니다.
+        
+        Args:
+            vacations: (사용자 ID, YYYY-MM-DD 날짜) 이터러블 (스트리밍 입력 가능)
+            batch_size: 한 번에 묶어 처리할 행 수
+            progress_callback: 배치마다 처리한 누적 행 수를 전달받는 콜백
+            
+        Returns:
+            {'inserted': 새로 추가된 일 수, 'updated': 항상 0, 'skipped': 이미 존재/잘못된 행}
+            오류 시 전체 롤백 후 None
         """
+        counts = {'inserted': 0, 'updated': 0, 'skipped': 0}
+        processed = 0
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT OR IGNORE INTO vacations (user_id, date) VALUES (?, ?)",
-                    (user_id, date)
-                )
+                conn.execute("BEGIN IMMEDIATE")
+                for chunk in _chunked(vacations, batch_size):
+                    processed += len(chunk)
+                    
+                    days_by_user: Dict[str, Set[datetime.date]] = {}
+                    for user_id, date in chunk:
+                        try:
+                            day = self._to_date(date)
+                        except (TypeError, ValueError):
+                            day = None
+                        if not user_id or day is None:
+                            counts['skipped'] += 1
+                            continue
+                        days = days_by_user.setdefault(str(user_id), set())
+                        if day in days:
+                            counts['skipped'] += 1
+                        days.add(day)
+                    
+                    for user_id, days in days_by_user.items():
+                        added_days = 0
+                        for start, end in _days_to_periods(days):
+                            added_days += self._merge_period(conn, user_id, start, end)
+                        if added_days:
+                            _refresh_daily_summary(conn, min(days), max(days), user_id)
+                        counts['inserted'] += added_days
+                        counts['skipped'] += len(days) - added_days
+                    
+                    if progress_callback:
+                        progress_callback(processed)
+                
                 conn.commit()
-                if cursor.rowcount > 0:
-                    logger.debug(f"휴가 추가: {user_id} - {date}")
-                    return True
-                return False  # 이미 존재하는 경우
+            logger.info(f"휴가 일괄 추가: {counts}")
+            return counts
         except Exception as e:
-            logger.error(f"휴가 추가 오류: {e}")
-            return False
+            logger.error(f"휴가 일괄 추가 오류: {e}")
+            return None
     
-    def remove_vacation(self, user_id: str, date: str) -> bool:
+    def remove_vacation_range(self, user_id: str, start_date, end_date) -> int:
         """
-        사용자 휴가 제거
+        사용자 휴가 기간 제거 (걸쳐 있는 구간은 분할)
         
         Args:
             user_id: 사용자 ID
-            date: YYYY-MM-DD 형식의 날짜
+            start_date: 시작 날짜
+            end_date: 종료 날짜 (포함)
             
         Returns:
-            제거 성공 여부
+            제거된 휴가 일 수
         """
         try:
+            start, end = self._to_date(start_date), self._to_date(end_date)
+            one_day = datetime.timedelta(days=1)
+            removed_days = 0
+            
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM vacations WHERE user_id = ? AND date = ?",
-                    (user_id, date)
-                )
+                conn.execute("BEGIN IMMEDIATE")
+                rows = conn.execute("""
+                    SELECT id, start_date, end_date FROM vacation_periods
+                    WHERE user_id = ? AND start_date <= ? AND end_date >= ?
+                """, (user_id, end.isoformat(), start.isoformat())).fetchall()
+                
+                for row in rows:
+                    row_start, row_end = self._to_date(row['start_date']), self._to_date(row['end_date'])
+                    conn.execute("DELETE FROM vacation_periods WHERE id = ?", (row['id'],))
+                    
+                    # 취소 구간 앞뒤로 남는 부분은 새 구간으로 분할
+                    remainders = []
+                    if row_start < start:
+                        remainders.append((row_start, start - one_day))
+                    if row_end > end:
+                        remainders.append((end + one_day, row_end))
+                    conn.executemany(
+                        "INSERT INTO vacation_periods (user_id, start_date, end_date) VALUES (?, ?, ?)",
+                        [(user_id, s.isoformat(), e.isoformat()) for s, e in remainders]
+                    )
+                    removed_days += self._span_days(max(row_start, start), min(row_end, end))
+                
+                if removed_days:
+                    _refresh_daily_summary(conn, start, end, user_id)
                 conn.commit()
-                logger.debug(f"휴가 제거: {user_id} - {date}")
-                return cursor.rowcount > 0
+            if removed_days:
+                logger.debug(f"휴가 제거: {user_id} - {start} ~ {end} ({removed_days}일)")
+            return removed_days
         except Exception as e:
-            logger.error(f"휴가 제거 오류: {e}")
-            return False
+            logger.error(f"휴가 기간 제거 오류: {e}")
+            return 0
+    
+    def remove_vacation(self, user_id: str, date: str) -> bool:
+        """
+        사용자 휴가 제거 (하루)
+        
+        Args:
+            user_id: 사용자 ID
+            date: YYYY-MM-DD 형식의 날짜
+            
+        Returns:
+            제거 성공 여부
+        """
+        return self.remove_vacation_range(user_id, date, date) > 0
     
     def remove_all_vacations(self, user_id: str) -> int:
         """
@@ -272,15 +678,23 @@ class VacationManager:
             user_id: 사용자 ID
             
         Returns:
-            제거된 휴가 개수
+            제거된 휴가 일 수
         """
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("DELETE FROM vacations WHERE user_id = ?", (user_id,))
+                cursor.execute("""
+                    SELECT COALESCE(SUM(julianday(end_date) - julianday(start_date) + 1), 0),
+                           MIN(start_date), MAX(end_date)
+                    FROM vacation_periods WHERE user_id = ?
+                """, (user_id,))
+                total, first_date, last_date = cursor.fetchone()
+                removed_count = int(total)
+                cursor.execute("DELETE FROM vacation_periods WHERE user_id = ?", (user_id,))
+                if removed_count:
+                    _refresh_daily_summary(conn, self._to_date(first_date), self._to_date(last_date), user_id)
                 conn.commit()
-                removed_count = cursor.rowcount
-                logger.debug(f"사용자 {user_id}의 모든 휴가 제거: {removed_count}개")
+                logger.debug(f"사용자 {user_id}의 모든 휴가 제거: {removed_count}일")
                 return removed_count
         except Exception as e:
             logger.error(f"모든 휴가 제거 오류: {e}")
@@ -304,36 +718,55 @@ class VacationManager:
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT 1 FROM vacations WHERE user_id = ? AND date = ?",
-                    (user_id, date_str)
-                )
-                return cursor.fetchone() is not None
+                # 사용자 구간은 겹치지 않으므로 시작일이 가장 늦은 후보 하나만 확인
+                cursor.execute("""
+                    SELECT end_date FROM vacation_periods
+                    WHERE user_id = ? AND start_date <= ?
+                    ORDER BY start_date DESC LIMIT 1
+                """, (user_id, date_str))
+                row = cursor.fetchone()
+                return row is not None and row['end_date'] >= date_str
         except Exception as e:
             logger.error(f"휴가 확인 오류: {e}")
             return False
     
-    def get_user_vacations(self, user_id: str) -> Set[str]:
+    def get_user_vacation_periods(self, user_id: str) -> List[VacationRecord]:
         """
-        사용자의 모든 휴가 날짜 조회
+        사용자의 휴가 구간 조회
         
         Args:
             user_id: 사용자 ID
             
         Returns:
-            휴가 날짜 집합 {'2025-01-01', '2025-01-02', ...}
+            휴가 구간 레코드 목록 (시작일 순)
         """
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = VacationRecord.row_factory
                 cursor.execute(
-                    "SELECT date FROM vacations WHERE user_id = ? ORDER BY date",
+                    f"SELECT {VacationRecord.COLUMNS} FROM vacation_periods WHERE user_id = ? ORDER BY start_date",
                     (user_id,)
                 )
-                return {row['date'] for row in cursor.fetchall()}
+                return cursor.fetchall()
         except Exception as e:
-            logger.error(f"사용자 휴가 조회 오류: {e}")
-            return set()
+            logger.error(f"사용자 휴가 구간 조회 오류: {e}")
+            return []
+    
+    def get_user_vacations(self, user_id: str) -> Set[str]:
+        """
+        사용자의 모든 휴가 날짜 조회
+        
+        Args:
+            user_id: 사용자 ID
+            
+        Returns:
+            휴가 날짜 집합 {'2025-01-01', '2025-01-02', ...}
+        """
+        dates = set()
+        for period in self.get_user_vacation_periods(user_id):
+            dates.update(day.isoformat() for day in _iter_days(period.start, period.end))
+        return dates
     
     def get_all_vacations_by_date(self, date: datetime.date) -> Set[str]:
         """
@@ -350,56 +783,488 @@ class VacationManager:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    "SELECT user_id FROM vacations WHERE date = ?",
-                    (date_str,)
+                    f"SELECT user_id FROM vacation_periods WHERE {self._OVERLAP_SQL}",
+                    {'start': date_str, 'end': date_str}
                 )
                 return {row['user_id'] for row in cursor.fetchall()}
         except Exception as e:
             logger.error(f"날짜별 휴가자 조회 오류: {e}")
             return set()
+    
+    def get_vacationers_among(self, user_ids: Iterable[str], date: datetime.date) -> Set[str]:
+        """
+        주어진 사용자 중 특정 날짜에 휴가인 사용자 조회 (단일 쿼리)
+        
+        ID가 많으면 임시 테이블에 넣고 조인하여 SQLite 변수 개수 제한을 피합니다.
+        
+        Args:
+            user_ids: 확인할 사용자 ID 목록
+            date: 확인할 날짜
+            
+        Returns:
+            휴가 중인 사용자 ID 집합
+        """
+        ids = list({str(user_id) for user_id in user_ids})
+        if not ids:
+            return set()
+        
+        date_str = date.strftime('%Y-%m-%d')
+        try:
+            with self.db_manager.get_connection() as conn:
+                if len(ids) <= self.TEMP_TABLE_THRESHOLD:
+                    placeholders = ','.join('?' * len(ids))
+                    cursor = conn.execute(f"""
+                        SELECT user_id FROM vacation_periods
+                        WHERE user_id IN ({placeholders}) AND start_date <= ? AND end_date >= ?
+                    """, [*ids, date_str, date_str])
+                    return {row['user_id'] for row in cursor.fetchall()}
+                
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS lookup_user_ids (user_id TEXT PRIMARY KEY)")
+                conn.executemany("INSERT OR IGNORE INTO lookup_user_ids (user_id) VALUES (?)", ((i,) for i in ids))
+                cursor = conn.execute("""
+                    SELECT p.user_id FROM lookup_user_ids AS l
+                    JOIN vacation_periods AS p ON p.user_id = l.user_id
+                    WHERE p.start_date <= ? AND p.end_date >= ?
+                """, (date_str, date_str))
+                result = {row['user_id'] for row in cursor.fetchall()}
+                # 임시 테이블 입력은 롤백으로 비워 다음 사용자에게 남기지 않음
+                conn.rollback()
+                return result
+        except Exception as e:
+            logger.error(f"사용자 목록 휴가 조회 오류: {e}")
+            return set()
+    
+    def get_vacations_in_range(self, start_date: datetime.date, end_date: datetime.date) -> Dict[str, Set[str]]:
+        """
+        기간 내 날짜별 휴가자 조회 (양 끝 포함, 단일 쿼리)
+        
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            
+        Returns:
+            {'YYYY-MM-DD': {사용자 ID, ...}, ...} (휴가자가 있는 날짜만 포함)
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.execute(
+                    f"SELECT user_id, start_date, end_date FROM vacation_periods WHERE {self._OVERLAP_SQL}",
+                    {'start': start_date.strftime('%Y-%m-%d'), 'end': end_date.strftime('%Y-%m-%d')}
+                )
+                result: Dict[str, Set[str]] = {}
+                for row in cursor.fetchall():
+                    first = max(self._to_date(row['start_date']), start_date)
+                    last = min(self._to_date(row['end_date']), end_date)
+                    for day in _iter_days(first, last):
+                        result.setdefault(day.isoformat(), set()).add(row['user_id'])
+                return dict(sorted(result.items()))
+        except Exception as e:
+            logger.error(f"기간별 휴가자 조회 오류: {e}")
+            return {}
 
 
 class VerificationManager:
     """인증 기록 관리 클래스"""
     
-    def __init__(self, db_manager: DatabaseManager):
+    # 같은 메시지 ID가 이미 있으면 건너뜀 (메시지 ID가 없는 기록은 항상 추가)
+    _INSERT_VERIFICATION_SQL = """
+        INSERT INTO verifications 
+        (user_id, username, message_content, image_urls, verification_date, verification_time, message_id) 
+        VALUES (?, ?, ?, NULL, ?, ?, ?)
+        ON CONFLICT (message_id) WHERE message_id IS NOT NULL DO NOTHING
+    """
+    
+    _INSERT_ATTACHMENT_SQL = """
+        INSERT INTO verification_attachments
+        (verification_id, ordinal, attachment_id, url, content_type, size)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    
+    # 사용자/날짜별 요약 갱신 (첫/마지막 인증 시각과 횟수, 시간순이 아닌 입력도 처리)
+    _UPSERT_DAILY_SQL = """
+        INSERT INTO daily_verification (verification_date, user_id, first_time, last_time, post_count)
+        VALUES (?, ?, ?, ?, 1)
+        ON CONFLICT (verification_date, user_id) DO UPDATE SET
+            first_time = MIN(first_time, excluded.first_time),
+            last_time = MAX(last_time, excluded.last_time),
+            post_count = post_count + 1
+    """
+    
+    # 이미 저장된 첨부 파일 (메시지 ID가 없는 기존 기록과 같은 메시지인지 확인)
+    _ATTACHMENT_EXISTS_SQL = "SELECT 1 FROM verification_attachments WHERE attachment_id = ? LIMIT 1"
+    
+    # 그날 메시지 ID 없이 저장된 같은 사용자의 기록 (업그레이드 전 실시간 인증)
+    _LEGACY_VERIFICATION_EXISTS_SQL = (
+        "SELECT 1 FROM verifications WHERE user_id = ? AND verification_date = ? AND message_id IS NULL LIMIT 1"
+    )
+    
+    _SELECT_VERIFICATION_SQL = f"SELECT {VerificationRecord.COLUMNS} FROM verifications AS v"
+    
+    _SEARCH_VERIFICATION_SQL = (
+        f"SELECT {VerificationRecord.COLUMNS} FROM verifications_fts AS f"
+        " JOIN verifications AS v ON v.id = f.rowid WHERE f.verifications_fts MATCH ?"
+    )
+    
+    def __init__(self, db_manager: DatabaseManager, archive_dir: Optional[str] = None):
+        """
+        Args:
+            db_manager: 데이터베이스 매니저
+            archive_dir: 연도별 아카이브 파일 디렉토리 (None이면 운영 DB만 조회)
+        """
         self.db_manager = db_manager
+        self.archive_dir = archive_dir
+    
+    def _archive_years(self, start_date: Optional[datetime.date],
+                       end_date: Optional[datetime.date]) -> List[int]:
+        """조회 범위와 겹치는 아카이브 파일 연도 목록"""
+        return [
+            year for year in list_archive_years(self.archive_dir)
+            if (start_date is None or year >= start_date.year) and (end_date is None or year <= end_date.year)
+        ]
+    
+    def _fetch_records(self, conn: sqlite3.Connection, where: str, params: List[Any], order: str,
+                       limit: Optional[int] = None, start_date: Optional[datetime.date] = None,
+                       end_date: Optional[datetime.date] = None) -> List[VerificationRecord]:
+        """
+        운영 DB와 (범위가 겹치는) 아카이브 파일에서 인증 기록 조회
+        
+        아카이브가 있으면 연도별 파일을 ATTACH해 UNION ALL로 합칩니다. 각 분기는
+        자기 인덱스로 정렬/LIMIT을 먼저 적용하고, 바깥에서 다시 정렬합니다.
+        아카이브 이동이 중단되어 양쪽에 같은 ID가 있으면 운영 DB 행을 사용합니다.
+        
+        Args:
+            conn: 데이터베이스 연결
+            where: 별칭 v 기준 WHERE 조건
+            params: 조건 파라미터
+            order: ORDER BY 절 (컬럼은 v.id, v.verification_date, v.verification_time만 사용)
+            limit: 최대 행 수 (None이면 제한 없음)
+            start_date: 조회 시작 날짜 (아카이브 연도 선택용)
+            end_date: 조회 종료 날짜 (아카이브 연도 선택용)
+        """
+        limit_sql = f" LIMIT {int(limit)}" if limit is not None else ""
+        hot_query = f"{self._SELECT_VERIFICATION_SQL} WHERE {where} ORDER BY {order}{limit_sql}"
+        years = self._archive_years(start_date, end_date)
+        
+        cursor = conn.cursor()
+        cursor.row_factory = VerificationRecord.row_factory
+        if not years:
+            cursor.execute(hot_query, params)
+            return cursor.fetchall()
+        
+        with attached_archives(conn, self.archive_dir, years) as schemas:
+            branches = [f"SELECT * FROM ({hot_query})"]
+            for schema in schemas:
+                branches.append(
+                    f"SELECT * FROM (SELECT {archive_columns(schema)} FROM {schema}.archived_verifications AS v"
+                    f" WHERE {where} AND NOT EXISTS (SELECT 1 FROM main.verifications AS h WHERE h.id = v.id)"
+                    f" ORDER BY {order}{limit_sql})"
+                )
+            # 합친 결과의 컬럼 이름은 별칭 없이 id, verification_date, verification_time
+            outer_order = order.replace('v.', '')
+            query = " UNION ALL ".join(branches) + f" ORDER BY {outer_order}{limit_sql}"
+            cursor.execute(query, list(params) * len(branches))
+            return cursor.fetchall()
     
     def add_verification(self, user_id: str, username: str, message_content: str, 
-                        image_urls: List[str], verification_datetime: datetime.datetime) -> bool:
+                        image_urls: List[str], verification_datetime: datetime.datetime,
+                        attachments: Optional[List[Dict]] = None, message_id: Optional[int] = None) -> bool:
         """
-        인증 기록 추가
+        인증 기록 추가 (첨부 파일은 같은 트랜잭션으로 저장)
         
         Args:
             user_id: 사용자 ID
             username: 사용자 이름
             message_content: 메시지 내용
-            image_urls: 이미지 URL 목록
+            image_urls: 이미지 URL 목록 (attachments가 없을 때 사용)
             verification_datetime: 인증 일시
+            attachments: 첨부 파일 정보 목록
+                ({'attachment_id', 'url', 'content_type', 'size'}, 생략 가능한 키는 None)
+            message_id: 디스코드 메시지 ID (이미 저장된 메시지면 추가하지 않음)
             
         Returns:
-            추가 성공 여부
+            저장 성공 여부 (이미 저장된 메시지도 True)
         """
         try:
-            verification_date = verification_datetime.strftime('%Y-%m-%d')
-            verification_time = verification_datetime.strftime('%H:%M:%S')
-            image_urls_json = ','.join(image_urls) if image_urls else ''
+            record = {
+                'user_id': user_id, 'username': username, 'message_content': message_content,
+                'image_urls': image_urls, 'verification_datetime': verification_datetime,
+                'attachments': attachments, 'message_id': message_id
+            }
             
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO verifications 
-                    (user_id, username, message_content, image_urls, verification_date, verification_time) 
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (user_id, username, message_content, image_urls_json, verification_date, verification_time))
+                row = self._insert_verification(conn, record)
                 conn.commit()
-                logger.info(f"인증 기록 저장: {username} ({user_id}) - {verification_date} {verification_time}")
+                if row is None:
+                    logger.info(f"이미 저장된 인증 메시지: {username} ({user_id}) - {message_id}")
+                else:
+                    logger.info(f"인증 기록 저장: {username} ({user_id}) - {row[3]} {row[4]}")
                 return True
         except Exception as e:
             logger.error(f"인증 기록 저장 오류: {e}")
             return False
     
-    def get_verifications_by_date(self, date: datetime.date) -> List[Dict]:
+    def add_verifications_bulk(self, records: List[Dict]) -> bool:
+        """
+        여러 인증 기록을 하나의 트랜잭션으로 추가 (그룹 커밋)
+        
+        Args:
+            records: add_verification 인자와 같은 키를 가진 딕셔너리 목록
+            
+        Returns:
+            추가 성공 여부 (실패 시 전체 롤백)
+        """
+        if not records:
+            return True
+        
+        try:
+            with self.db_manager.get_connection() as conn:
+                for record in records:
+                    self._insert_verification(conn, record)
+                conn.commit()
+                logger.info(f"인증 기록 일괄 저장: {len(records)}건")
+                return True
+        except Exception as e:
+            logger.error(f"인증 기록 일괄 저장 오류: {e}")
+            return False
+
+    def add_missing_verifications(self, records: List[Dict]) -> int:
+        """
+        메시지 기록에서 찾은 인증 중 아직 저장되지 않은 것만 추가 (하나의 트랜잭션)
+    
+        중복은 백필과 같은 규칙(insert_scanned_verification)으로 판단하므로, 실시간 인증처럼 하루 여러
+        메시지도 각각 저장됩니다.
+    
+        Args:
+            records: add_verification 인자와 message_id 키를 가진 딕셔너리 목록 (작성 순)
+    
+        Returns:
+            추가한 인증 기록 수 (오류 시 -1)
+        """
+        if not records:
+            return 0
+    
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                added = 0
+                for record in records:
+                    if self.insert_scanned_verification(conn, record):
+                        added += 1
+                conn.commit()
+            if added:
+                logger.info(f"누락된 인증 기록 저장: {added}건 (확인 {len(records)}건)")
+            return added
+        except Exception as e:
+            logger.error(f"누락된 인증 기록 저장 오류: {e}")
+            return -1
+    
+    def insert_scanned_verification(self, conn: sqlite3.Connection, record: Dict) -> bool:
+        """
+        메시지 기록에서 찾은 인증을 아직 저장되지 않았을 때만 추가 (채널 기록 확인과 백필이 함께 사용)
+        
+        호출자가 연 트랜잭션 안에서 실행하며 커밋은 호출자가 수행합니다.
+        
+        Args:
+            conn: 트랜잭션을 시작한 연결
+            record: add_verification 인자와 message_id 키를 가진 딕셔너리
+            
+        Returns:
+            새로 저장했는지 여부
+        """
+        return not self._is_recorded(conn, record) and self._insert_verification(conn, record) is not None
+    
+    def _is_recorded(self, conn: sqlite3.Connection, record: Dict) -> bool:
+        """
+        메시지 기록에서 찾은 인증이 이미 저장되어 있는지 확인
+        
+        메시지 ID가 같은 기록은 INSERT의 ON CONFLICT가 건너뛰므로, 여기서는 메시지 ID 없이 저장된
+        기존 기록만 확인합니다. 첨부 파일 ID가 이미 있거나, 그날 같은 사용자의 메시지 ID 없는 기록이
+        있으면 같은 메시지로 봅니다 (업그레이드 전 기록과 image_urls에서 옮긴 첨부 파일은 ID가 없음).
+        메시지 ID가 없는 입력은 같은 메시지인지 알 수 없으므로 그날 인증 기록이 있는 사용자를 건너뜁니다.
+        """
+        verification_date = record['verification_datetime'].strftime('%Y-%m-%d')
+        if record.get('message_id') is None:
+            return conn.execute(
+                "SELECT 1 FROM daily_verification WHERE verification_date = ? AND user_id = ?",
+                (verification_date, record['user_id'])
+            ).fetchone() is not None
+        if any(
+            conn.execute(self._ATTACHMENT_EXISTS_SQL, (item['attachment_id'],)).fetchone()
+            for item in record.get('attachments') or [] if item.get('attachment_id')
+        ):
+            return True
+        return conn.execute(self._LEGACY_VERIFICATION_EXISTS_SQL, (record['user_id'], verification_date)).fetchone() \
+            is not None
+    
+    def _insert_verification(self, conn: sqlite3.Connection, record: Dict) -> Optional[tuple]:
+        """
+        인증 기록, 첨부 파일 행 INSERT와 날짜별 요약 갱신 (커밋은 호출자가 수행)
+        
+        Returns:
+            저장한 행의 파라미터 튜플 (record['message_id']가 이미 저장된 메시지면 None)
+        """
+        row = self._verification_row(
+            record['user_id'], record['username'], record['message_content'],
+            record.get('image_urls'), record['verification_datetime']
+        )
+        cursor = conn.execute(self._INSERT_VERIFICATION_SQL, row + (record.get('message_id'),))
+        if cursor.rowcount == 0:
+            return None
+        user_id, _, _, verification_date, verification_time = row
+        conn.execute(self._UPSERT_DAILY_SQL, (verification_date, user_id, verification_time, verification_time))
+        attachments = self._normalize_attachments(record.get('image_urls'), record.get('attachments'))
+        if attachments:
+            conn.executemany(self._INSERT_ATTACHMENT_SQL, [
+                (cursor.lastrowid, ordinal, item.get('attachment_id'), item['url'],
+                 item.get('content_type'), item.get('size'))
+                for ordinal, item in enumerate(attachments)
+            ])
+        return row
+    
+    def update_verification(self, message_id: int, message_content: str, attachments: List[Dict]) -> bool:
+        """
+        수정된 메시지의 인증 기록 내용과 첨부 파일 갱신 (인증 날짜/시각은 그대로)
+        
+        운영 DB의 기록만 갱신합니다. 보존 기간이 지나 아카이브로 옮긴 기록은 수정하지 않습니다.
+        
+        Args:
+            message_id: 디스코드 메시지 ID
+            message_content: 수정된 메시지 내용
+            attachments: 수정 후 남은 유효한 이미지 첨부 파일 정보 목록
+            
+        Returns:
+            갱신한 인증 기록이 있는지 여부 (메시지 ID로 저장된 기록이 없으면 False)
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute("SELECT id FROM verifications WHERE message_id = ?", (int(message_id),)).fetchone()
+                if row is None:
+                    conn.rollback()
+                    return False
+                verification_id = row['id']
+                conn.execute(
+                    "UPDATE verifications SET message_content = ? WHERE id = ? AND message_content IS NOT ?",
+                    (message_content, verification_id, message_content)
+                )
+                conn.execute("DELETE FROM verification_attachments WHERE verification_id = ?", (verification_id,))
+                conn.executemany(self._INSERT_ATTACHMENT_SQL, [
+                    (verification_id, ordinal, item.get('attachment_id'), item['url'],
+                     item.get('content_type'), item.get('size'))
+                    for ordinal, item in enumerate(attachments)
+                ])
+                conn.commit()
+                logger.info(f"수정된 인증 메시지 반영: {message_id}")
+                return True
+        except Exception as e:
+            logger.error(f"인증 기록 수정 오류: {e}")
+            return False
+    
+    def retract_verifications(self, message_ids: Iterable[int]) -> int:
+        """
+        삭제되었거나 더 이상 인증이 아닌 메시지의 인증 기록 취소
+        
+        사용자/날짜별 요약은 남은 기록으로 다시 계산하고, 남은 기록이 없으면 삭제합니다
+        (날짜별 인증 현황은 daily_verification 트리거로 함께 갱신됨). 보존 기간이 지나 아카이브로
+        옮긴 기록은 취소하지 않습니다.
+        
+        Args:
+            message_ids: 디스코드 메시지 ID 목록
+            
+        Returns:
+            취소한 인증 기록 수 (오류 시 -1)
+        """
+        message_ids = [int(message_id) for message_id in message_ids]
+        if not message_ids:
+            return 0
+        
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                retracted = 0
+                affected = set()
+                for chunk in _chunked(message_ids, 500):
+                    placeholders = ','.join('?' * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT user_id, verification_date FROM verifications WHERE message_id IN ({placeholders})",
+                        chunk
+                    ).fetchall()
+                    if rows:
+                        conn.execute(f"DELETE FROM verifications WHERE message_id IN ({placeholders})", chunk)
+                    retracted += len(rows)
+                    affected.update((row['verification_date'], row['user_id']) for row in rows)
+                for verification_date, user_id in affected:
+                    self._refresh_daily_verification(conn, verification_date, user_id)
+                conn.commit()
+            if retracted:
+                logger.info(f"인증 기록 취소: {retracted}건")
+            return retracted
+        except Exception as e:
+            logger.error(f"인증 기록 취소 오류: {e}")
+            return -1
+    
+    @staticmethod
+    def _refresh_daily_verification(conn: sqlite3.Connection, verification_date: str, user_id: str):
+        """남은 인증 기록으로 사용자/날짜별 요약 다시 계산 (남은 기록이 없으면 삭제)"""
+        first_time, last_time, post_count = conn.execute(
+            """
+            SELECT MIN(verification_time), MAX(verification_time), COUNT(*) FROM verifications
+            WHERE user_id = ? AND verification_date = ?
+            """,
+            (user_id, verification_date)
+        ).fetchone()
+        if post_count:
+            conn.execute(
+                """
+                UPDATE daily_verification SET first_time = ?, last_time = ?, post_count = ?
+                WHERE verification_date = ? AND user_id = ?
+                """,
+                (first_time, last_time, post_count, verification_date, user_id)
+            )
+        else:
+            conn.execute(
+                "DELETE FROM daily_verification WHERE verification_date = ? AND user_id = ?",
+                (verification_date, user_id)
+            )
+    
+    @staticmethod
+    def _normalize_attachments(image_urls: Optional[List[str]],
+                               attachments: Optional[List[Dict]]) -> List[Dict]:
+        """첨부 파일 정보가 없으면 URL 목록으로 대체"""
+        if attachments:
+            return attachments
+        return [{'url': url} for url in image_urls or []]
+    
+    @staticmethod
+    def _verification_row(user_id: str, username: str, message_content: str,
+                          image_urls: List[str], verification_datetime: datetime.datetime) -> tuple:
+        """INSERT 파라미터 튜플 생성 (이미지 URL은 첨부 파일 테이블에 따로 저장)"""
+        verification_date = verification_datetime.strftime('%Y-%m-%d')
+        verification_time = verification_datetime.strftime('%H:%M:%S')
+        return (user_id, username, message_content, verification_date, verification_time)
+    
+    def get_attachments(self, verification_id: int) -> List[Dict]:
+        """
+        인증 기록 하나의 첨부 파일 조회
+        
+        Args:
+            verification_id: 인증 기록 ID
+            
+        Returns:
+            첨부 파일 정보 목록 (ordinal 순)
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = VerificationRecord.row_factory
+                cursor.execute(self._SELECT_VERIFICATION_SQL + " WHERE v.id = ?", (verification_id,))
+                record = cursor.fetchone()
+                return record.attachments if record else []
+        except Exception as e:
+            logger.error(f"첨부 파일 조회 오류: {e}")
+            return []
+    
+    def get_verifications_by_date(self, date: datetime.date) -> List[VerificationRecord]:
         """
         특정 날짜의 모든 인증 기록 조회
         
@@ -407,41 +1272,23 @@ class VerificationManager:
             date: 조회할 날짜
             
         Returns:
-            인증 기록 목록
+            인증 기록 레코드 목록 (첨부 파일은 접근 시 변환)
         """
         date_str = date.strftime('%Y-%m-%d')
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT user_id, username, message_content, image_urls, 
-                           verification_date, verification_time, created_at
-                    FROM verifications 
-                    WHERE verification_date = ? 
-                    ORDER BY verification_time
-                """, (date_str,))
-                
-                results = []
-                for row in cursor.fetchall():
-                    image_urls = row['image_urls'].split(',') if row['image_urls'] else []
-                    results.append({
-                        'user_id': row['user_id'],
-                        'username': row['username'],
-                        'message_content': row['message_content'],
-                        'image_urls': image_urls,
-                        'verification_date': row['verification_date'],
-                        'verification_time': row['verification_time'],
-                        'created_at': row['created_at']
-                    })
-                return results
+                return self._fetch_records(
+                    conn, "v.verification_date = ?", [date_str], "v.verification_time",
+                    start_date=date, end_date=date
+                )
         except Exception as e:
             logger.error(f"날짜별 인증 기록 조회 오류: {e}")
             return []
     
     def get_user_verifications(self, user_id: str, start_date: Optional[datetime.date] = None, 
-                             end_date: Optional[datetime.date] = None) -> List[Dict]:
+                             end_date: Optional[datetime.date] = None) -> List[VerificationRecord]:
         """
-        사용자의 인증 기록 조회
+        사용자의 인증 기록 조회 (보관된 기록 포함)
         
         Args:
             user_id: 사용자 ID
@@ -449,48 +1296,236 @@ class VerificationManager:
             end_date: 종료 날짜 (None이면 제한 없음)
             
         Returns:
-            인증 기록 목록
+            인증 기록 레코드 목록 (최신순)
         """
         try:
-            query = """
-                SELECT user_id, username, message_content, image_urls, 
-                       verification_date, verification_time, created_at
-                FROM verifications 
-                WHERE user_id = ?
-            """
-            params = [user_id]
+            where = "v.user_id = ?"
+            params: List[Any] = [user_id]
             
             if start_date:
-                query += " AND verification_date >= ?"
+                where += " AND v.verification_date >= ?"
                 params.append(start_date.strftime('%Y-%m-%d'))
             
             if end_date:
-                query += " AND verification_date <= ?"
+                where += " AND v.verification_date <= ?"
                 params.append(end_date.strftime('%Y-%m-%d'))
             
-            query += " ORDER BY verification_date DESC, verification_time DESC"
-            
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                
-                results = []
-                for row in cursor.fetchall():
-                    image_urls = row['image_urls'].split(',') if row['image_urls'] else []
-                    results.append({
-                        'user_id': row['user_id'],
-                        'username': row['username'],
-                        'message_content': row['message_content'],
-                        'image_urls': image_urls,
-                        'verification_date': row['verification_date'],
-                        'verification_time': row['verification_time'],
-                        'created_at': row['created_at']
-                    })
-                return results
+                return self._fetch_records(
+                    conn, where, params, "v.verification_date DESC, v.verification_time DESC",
+                    start_date=start_date, end_date=end_date
+                )
         except Exception as e:
             logger.error(f"사용자 인증 기록 조회 오류: {e}")
             return []
     
+    @staticmethod
+    def encode_cursor(record: VerificationRecord, descending: bool) -> str:
+        """
+        레코드 위치를 불투명한 페이지 커서 문자열로 변환
+        
+        Args:
+            record: 페이지의 마지막 레코드
+            descending: 최신순 여부 (커서는 같은 정렬 방향에서만 사용 가능)
+            
+        Returns:
+            URL-safe base64 커서
+        """
+        payload = [record.verification_date, record.verification_time, record.id, 'd' if descending else 'a']
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode('utf-8')).decode('ascii')
+    
+    @staticmethod
+    def decode_cursor(cursor: str, descending: bool) -> Tuple[str, str, int]:
+        """
+        페이지 커서를 (날짜, 시간, ID) 키로 변환
+        
+        Raises:
+            ValueError: 형식이 잘못되었거나 다른 정렬 방향에서 만든 커서
+        """
+        try:
+            date, time_str, record_id, order = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            key = (str(date), str(time_str), int(record_id))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"잘못된 페이지 커서입니다: {cursor}") from e
+        if order != ('d' if descending else 'a'):
+            raise ValueError("정렬 방향이 다른 페이지 커서입니다.")
+        return key
+    
+    def get_user_verifications_page(self, user_id: str, cursor: Optional[str] = None, limit: int = 50,
+                                    descending: bool = True, start_date: Optional[datetime.date] = None,
+                                    end_date: Optional[datetime.date] = None) -> VerificationPage:
+        """
+        사용자의 인증 기록을 (날짜, 시간, ID) 키셋 기준으로 한 페이지 조회
+        
+        OFFSET 없이 이전 페이지의 마지막 키 다음부터 인덱스를 탐색하므로
+        기록이 많아도 페이지마다 비용이 일정합니다. 보관된 기록도 같은 커서로 이어서 조회됩니다.
+        
+        Args:
+            user_id: 사용자 ID
+            cursor: 이전 페이지의 next_cursor (None이면 처음부터)
+            limit: 페이지 크기
+            descending: True면 최신순, False면 오래된 순
+            start_date: 시작 날짜 (포함, None이면 제한 없음)
+            end_date: 종료 날짜 (포함, None이면 제한 없음)
+            
+        Returns:
+            VerificationPage(records, next_cursor)
+            
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        limit = max(1, int(limit))
+        where = "v.user_id = ?"
+        params: List[Any] = [user_id]
+        
+        if start_date:
+            where += " AND v.verification_date >= ?"
+            params.append(start_date.strftime('%Y-%m-%d'))
+        if end_date:
+            where += " AND v.verification_date <= ?"
+            params.append(end_date.strftime('%Y-%m-%d'))
+        if cursor:
+            where += f" AND (v.verification_date, v.verification_time, v.id) {'<' if descending else '>'} (?, ?, ?)"
+            params.extend(self.decode_cursor(cursor, descending))
+        
+        direction = "DESC" if descending else "ASC"
+        order = f"v.verification_date {direction}, v.verification_time {direction}, v.id {direction}"
+        
+        try:
+            with self.db_manager.get_connection() as conn:
+                # 다음 페이지 존재 여부 확인용으로 한 행 더 조회
+                records = self._fetch_records(conn, where, params, order, limit + 1, start_date, end_date)
+        except Exception as e:
+            logger.error(f"사용자 인증 기록 페이지 조회 오류: {e}")
+            return VerificationPage([], None)
+        
+        if len(records) <= limit:
+            return VerificationPage(records, None)
+        records = records[:limit]
+        return VerificationPage(records, self.encode_cursor(records[-1], descending))
+    
+    @staticmethod
+    def build_match_query(text: str) -> str:
+        """
+        검색어를 FTS5 MATCH 식으로 변환 (단어마다 접두사 검색, 모든 단어 포함)
+        
+        사용자 입력의 FTS5 연산자/특수문자가 문법 오류를 내지 않도록 단어를 따옴표로 감쌉니다.
+        
+        Raises:
+            ValueError: 검색어가 비어 있는 경우
+        """
+        terms = [term.replace('"', '""') for term in text.split()]
+        if not terms:
+            raise ValueError("검색어가 비어 있습니다.")
+        return ' '.join(f'"{term}"*' for term in terms)
+    
+    def search_verifications(self, text: str, user_id: Optional[str] = None,
+                             start_date: Optional[datetime.date] = None,
+                             end_date: Optional[datetime.date] = None, limit: int = 10,
+                             cursor: Optional[str] = None, order: str = 'rank') -> VerificationPage:
+        """
+        인증 메시지 전문 검색 (운영 DB의 기록만, 보관된 기록은 제외)
+        
+        Args:
+            text: 검색어 (공백으로 구분한 단어를 모두 포함, 단어마다 접두사 일치)
+            user_id: 사용자 ID (None이면 전체)
+            start_date: 시작 날짜 (포함, None이면 제한 없음)
+            end_date: 종료 날짜 (포함, None이면 제한 없음)
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_cursor (None이면 처음부터)
+            order: 'rank'면 관련도(bm25)순, 'recent'면 최근 기록순 (id 역순)
+            
+        Returns:
+            VerificationPage(records, next_cursor)
+            
+        Raises:
+            ValueError: 빈 검색어, 잘못된 정렬 또는 커서
+        """
+        limit = max(1, int(limit))
+        if order not in ('rank', 'recent'):
+            raise ValueError(f"알 수 없는 정렬 방식입니다: {order}")
+        try:
+            offset = int(cursor) if cursor else 0
+        except ValueError as e:
+            raise ValueError(f"잘못된 페이지 커서입니다: {cursor}") from e
+        
+        # 관련도 순위는 색인이 바뀌면 달라지므로 키셋 대신 OFFSET으로 페이지를 나눔
+        query = self._SEARCH_VERIFICATION_SQL
+        params: List[Any] = [self.build_match_query(text)]
+        # 필터 열 앞의 단항 +로 인덱스 사용을 막아 항상 FTS 색인에서 출발 (사용자/날짜 인덱스로
+        # 출발하면 행마다 MATCH를 다시 평가하여 기록이 많은 사용자일수록 느려짐)
+        if user_id:
+            query += " AND +v.user_id = ?"
+            params.append(user_id)
+        if start_date:
+            query += " AND +v.verification_date >= ?"
+            params.append(start_date.strftime('%Y-%m-%d'))
+        if end_date:
+            query += " AND +v.verification_date <= ?"
+            params.append(end_date.strftime('%Y-%m-%d'))
+        if order == 'rank':
+            query += " ORDER BY f.rank, v.id DESC"
+        else:
+            # FTS 색인을 rowid 역순으로 읽다가 LIMIT에서 멈춤 (흔한 단어도 전체 정렬 없음)
+            query += " ORDER BY f.rowid DESC"
+        query += " LIMIT ? OFFSET ?"
+        params.extend([limit + 1, offset])
+        
+        try:
+            with self.db_manager.get_connection() as conn:
+                db_cursor = conn.cursor()
+                db_cursor.row_factory = VerificationRecord.row_factory
+                db_cursor.execute(query, params)
+                records = db_cursor.fetchall()
+        except Exception as e:
+            logger.error(f"인증 메시지 검색 오류: {e}")
+            return VerificationPage([], None)
+        
+        if len(records) <= limit:
+            return VerificationPage(records, None)
+        return VerificationPage(records[:limit], str(offset + limit))
+    
+    def migrate_legacy_image_urls(self, batch_size: int = 500) -> int:
+        """
+        쉼표로 이어 붙인 기존 image_urls 값을 첨부 파일 테이블로 이전 (한 배치)
+        
+        배치마다 짧은 트랜잭션으로 처리하므로 봇이 동작하는 중에 반복 호출할 수 있습니다.
+        이전한 행의 image_urls는 NULL로 비워 다음 배치에서 다시 읽지 않습니다.
+        
+        Args:
+            batch_size: 한 번에 이전할 인증 기록 수
+            
+        Returns:
+            이번 배치에서 처리한 인증 기록 수 (0이면 이전 완료)
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                rows = conn.execute("""
+                    SELECT id, image_urls FROM verifications
+                    WHERE image_urls IS NOT NULL
+                    ORDER BY id LIMIT ?
+                """, (batch_size,)).fetchall()
+                if not rows:
+                    conn.rollback()
+                    return 0
+                
+                conn.executemany("""
+                    INSERT OR IGNORE INTO verification_attachments (verification_id, ordinal, url)
+                    VALUES (?, ?, ?)
+                """, [
+                    (row['id'], ordinal, url)
+                    for row in rows if row['image_urls']
+                    for ordinal, url in enumerate(row['image_urls'].split(','))
+                ])
+                conn.executemany("UPDATE verifications SET image_urls = NULL WHERE id = ?",
+                                 [(row['id'],) for row in rows])
+                conn.commit()
+                return len(rows)
+        except Exception as e:
+            logger.error(f"기존 이미지 URL 이전 오류: {e}")
+            return 0
+    
     def has_user_verified_on_date(self, user_id: str, date: datetime.date) -> bool:
         """
         사용자가 특정 날짜에 인증했는지 확인
@@ -507,14 +1542,39 @@ class VerificationManager:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    "SELECT 1 FROM verifications WHERE user_id = ? AND verification_date = ?",
-                    (user_id, date_str)
+                    "SELECT 1 FROM daily_verification WHERE verification_date = ? AND user_id = ?",
+                    (date_str, user_id)
                 )
                 return cursor.fetchone() is not None
         except Exception as e:
             logger.error(f"인증 확인 오류: {e}")
             return False
     
+    def get_daily_verification(self, user_id: str, date: datetime.date) -> Optional[DailyVerificationRecord]:
+        """
+        사용자의 특정 날짜 인증 요약 조회 (보관된 날짜도 포함)
+        
+        Args:
+            user_id: 사용자 ID
+            date: 확인할 날짜
+            
+        Returns:
+            첫/마지막 인증 시각과 인증 횟수 (인증하지 않았으면 None)
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = DailyVerificationRecord.row_factory
+                cursor.execute(
+                    f"SELECT {DailyVerificationRecord.COLUMNS} FROM daily_verification"
+                    " WHERE verification_date = ? AND user_id = ?",
+                    (date.strftime('%Y-%m-%d'), user_id)
+                )
+                return cursor.fetchone()
+        except Exception as e:
+            logger.error(f"날짜별 인증 요약 조회 오류: {e}")
+            return None
+    
     def get_verified_users_on_date(self, date: datetime.date) -> Set[str]:
         """
         특정 날짜에 인증한 모든 사용자 ID 조회
@@ -529,11 +1589,301 @@ class VerificationManager:
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
+                # 사용자당 하루 1행이므로 중복 제거 없이 기본 키 범위만 읽음
                 cursor.execute(
-                    "SELECT DISTINCT user_id FROM verifications WHERE verification_date = ?",
+                    "SELECT user_id FROM daily_verification WHERE verification_date = ?",
                     (date_str,)
                 )
                 return {row['user_id'] for row in cursor.fetchall()}
         except Exception as e:
             logger.error(f"날짜별 인증 사용자 조회 오류: {e}")
-            return set()
\ No newline at end of file
+            return set()
+
+class DailySummaryManager:
+    """
+    날짜별 인증 현황 요약 관리 클래스
+    
+    인증 추가/삭제는 daily_verification 트리거로, 휴가 변경은 VacationManager가 같은
+    트랜잭션에서, 체크 실행은 record_check()로 해당 날짜만 갱신합니다.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+    
+    def record_check(self, date: datetime.date, member_ids: Iterable[str]) -> Optional[DailySummaryRecord]:
+        """
+        체크 실행 결과 기록 (그날의 체크 대상 멤버를 교체하고 요약 재계산)
+        
+        Args:
+            date: 체크한 날짜
+            member_ids: 체크 대상 멤버 ID (봇 제외, 휴가자 포함)
+            
+        Returns:
+            갱신된 요약 (오류 시 None)
+        """
+        date_str = date.strftime('%Y-%m-%d')
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("DELETE FROM daily_roster WHERE check_date = ?", (date_str,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO daily_roster (check_date, user_id) VALUES (?, ?)",
+                    [(date_str, str(user_id)) for user_id in member_ids]
+                )
+                _refresh_daily_summary(conn, date, date)
+                conn.commit()
+        except Exception as e:
+            logger.error(f"체크 결과 요약 기록 오류: {e}")
+            return None
+        return self.get_summary(date)
+    
+    def rebuild(self, start_date: datetime.date, end_date: datetime.date) -> int:
+        """
+        기간의 요약을 원본 테이블에서 다시 계산
+        
+        Args:
+            start_date: 시작 날짜 (포함)
+            end_date: 종료 날짜 (포함)
+            
+        Returns:
+            다시 계산한 날짜 수 (오류 시 -1)
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                count = _refresh_daily_summary(conn, start_date, end_date)
+                conn.commit()
+            logger.info(f"인증 현황 요약 재계산: {start_date} ~ {end_date} ({count}일)")
+            return count
+        except Exception as e:
+            logger.error(f"인증 현황 요약 재계산 오류: {e}")
+            return -1
+    
+    def get_summary(self, date: datetime.date) -> Optional[DailySummaryRecord]:
+        """
+        특정 날짜의 인증 현황 요약 조회
+        
+        Args:
+            date: 조회할 날짜
+            
+        Returns:
+            요약 (체크도 인증도 없던 날짜면 None)
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = DailySummaryRecord.row_factory
+                cursor.execute(
+                    f"SELECT {DailySummaryRecord.COLUMNS} FROM daily_summary WHERE summary_date = ?",
+                    (date.strftime('%Y-%m-%d'),)
+                )
+                return cursor.fetchone()
+        except Exception as e:
+            logger.error(f"인증 현황 요약 조회 오류: {e}")
+            return None
+    
+    def get_summaries(self, start_date: datetime.date, end_date: datetime.date) -> List[DailySummaryRecord]:
+        """
+        기간의 인증 현황 요약 조회 (날짜순, 기록이 없는 날짜는 제외)
+        
+        Args:
+            start_date: 시작 날짜 (포함)
+            end_date: 종료 날짜 (포함)
+            
+        Returns:
+            요약 목록
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = DailySummaryRecord.row_factory
+                cursor.execute(
+                    f"SELECT {DailySummaryRecord.COLUMNS} FROM daily_summary"
+                    " WHERE summary_date >= ? AND summary_date <= ? ORDER BY summary_date",
+                    (start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+                )
+                return cursor.fetchall()
+        except Exception as e:
+            logger.error(f"기간별 인증 현황 요약 조회 오류: {e}")
+            return []
+
+
+class HistoryCursorManager:
+    """
+    채널별 메시지 기록 스캔 위치 관리 클래스
+    
+    체크가 채널 기록을 어디까지 확인했는지 저장해 다음 체크가 그 이후 메시지만 조회하게 합니다.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+    
+    def get_cursor(self, channel_id: str) -> Optional[HistoryCursorRecord]:
+        """
+        채널의 마지막 스캔 위치 조회
+        
+        Args:
+            channel_id: 채널 ID
+            
+        Returns:
+            스캔 위치 (한 번도 스캔하지 않았으면 None)
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = HistoryCursorRecord.row_factory
+                cursor.execute(
+                    f"SELECT {HistoryCursorRecord.COLUMNS} FROM channel_history_cursors WHERE channel_id = ?",
+                    (str(channel_id),)
+                )
+                return cursor.fetchone()
+        except Exception as e:
+            logger.error(f"메시지 기록 스캔 위치 조회 오류: {e}")
+            return None
+    
+    def save_cursor(self, channel_id: str, message_id: int, message_at: datetime.datetime) -> bool:
+        """
+        채널의 스캔 위치 저장 (저장된 위치보다 앞선 메시지로는 되돌리지 않음)
+        
+        Args:
+            channel_id: 채널 ID
+            message_id: 마지막으로 확인한 메시지 ID
+            message_at: 해당 메시지의 작성 시각
+            
+        Returns:
+            위치가 앞으로 이동했는지 여부
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO channel_history_cursors (channel_id, last_message_id, last_message_at)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(channel_id) DO UPDATE SET
+                        last_message_id = excluded.last_message_id,
+                        last_message_at = excluded.last_message_at,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE excluded.last_message_id > channel_history_cursors.last_message_id
+                    """,
+                    (str(channel_id), int(message_id), message_at.isoformat())
+                )
+                conn.commit()
+                return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"메시지 기록 스캔 위치 저장 오류: {e}")
+            return False
+
+
+class BackfillJobManager:
+    """
+    채널 기록 백필 작업 관리 클래스
+    
+    채널 기록에서 찾은 인증을 메시지 ID 기준으로 중복 없이 저장하고, 같은 트랜잭션에서
+    작업 진행 위치를 함께 저장해 중단된 작업을 마지막으로 저장한 메시지 이후부터 이어서 진행합니다.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager, verification_manager: VerificationManager):
+        self.db_manager = db_manager
+        self.verification_manager = verification_manager
+    
+    def start_job(self, channel_id: str, start_at: datetime.datetime,
+                  end_at: datetime.datetime) -> Optional[BackfillJobRecord]:
+        """
+        백필 작업 시작 (같은 채널/기간의 중단된 작업이 있으면 이어서 진행)
+        
+        이미 끝난 작업은 진행 위치를 지우고 처음부터 다시 스캔합니다 (저장은 메시지 ID로 중복 제거).
+        
+        Args:
+            channel_id: 채널 ID
+            start_at: 스캔 시작 시각 (포함하지 않음)
+            end_at: 스캔 종료 시각 (포함하지 않음)
+            
+        Returns:
+            작업 (오류 시 None)
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                params = (str(channel_id), start_at.isoformat(), end_at.isoformat())
+                conn.execute(
+                    """
+                    INSERT INTO backfill_jobs (channel_id, start_at, end_at) VALUES (?, ?, ?)
+                    ON CONFLICT (channel_id, start_at, end_at) DO UPDATE SET
+                        last_message_id = CASE WHEN status = 'done' THEN NULL ELSE last_message_id END,
+                        scanned = CASE WHEN status = 'done' THEN 0 ELSE scanned END,
+                        inserted = CASE WHEN status = 'done' THEN 0 ELSE inserted END,
+                        status = 'running',
+                        updated_at = CURRENT_TIMESTAMP
+                    """,
+                    params
+                )
+                conn.commit()
+                cursor = conn.cursor()
+                cursor.row_factory = BackfillJobRecord.row_factory
+                cursor.execute(
+                    f"SELECT {BackfillJobRecord.COLUMNS} FROM backfill_jobs"
+                    " WHERE channel_id = ? AND start_at = ? AND end_at = ?",
+                    params
+                )
+                return cursor.fetchone()
+        except Exception as e:
+            logger.error(f"백필 작업 시작 오류: {e}")
+            return None
+    
+    def save_progress(self, job_id: int, records: List[Dict], last_message_id: int, scanned: int) -> int:
+        """
+        스캔한 메시지 한 묶음의 인증 기록과 진행 위치를 하나의 트랜잭션으로 저장
+        
+        중복은 채널 기록 확인과 같은 규칙(VerificationManager.insert_scanned_verification)으로 판단합니다.
+        
+        Args:
+            job_id: 작업 ID
+            records: add_verification 인자와 message_id 키를 가진 딕셔너리 목록
+            last_message_id: 이 묶음에서 마지막으로 스캔한 메시지 ID
+            scanned: 이 묶음에서 스캔한 메시지 수
+            
+        Returns:
+            새로 저장한 인증 기록 수 (오류 시 -1, 진행 위치도 저장되지 않음)
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                inserted = 0
+                for record in records:
+                    if self.verification_manager.insert_scanned_verification(conn, record):
+                        inserted += 1
+                conn.execute(
+                    """
+                    UPDATE backfill_jobs SET
+                        last_message_id = ?, scanned = scanned + ?, inserted = inserted + ?,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                    """,
+                    (int(last_message_id), scanned, inserted, job_id)
+                )
+                conn.commit()
+                return inserted
+        except Exception as e:
+            logger.error(f"백필 진행 저장 오류: {e}")
+            return -1
+    
+    def finish_job(self, job_id: int) -> bool:
+        """
+        백필 작업을 완료로 표시
+        
+        Args:
+            job_id: 작업 ID
+            
+        Returns:
+            표시 성공 여부
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.execute(
+                    "UPDATE backfill_jobs SET status = 'done', updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    (job_id,)
+                )
+                conn.commit()
+                return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"백필 작업 완료 표시 오류: {e}")
+            return False
@@ -5,11 +5,95 @@ import csv
 import json
 import os
 import logging
-from typing import Dict, Set
-from .database import DatabaseManager, HolidayManager, VacationManager
+from typing import Any, Dict, Iterator, TextIO, Tuple
+from .database import DatabaseManager, HolidayManager, VacationManager, VerificationManager
 
 logger = logging.getLogger('verification_bot')
 
+# 진행 상황 로그를 남기는 행 간격
+PROGRESS_LOG_INTERVAL = 10000
+
+def iter_json_object_items(f: TextIO, chunk_size: int = 64 * 1024) -> Iterator[Tuple[str, Any]]:
+    """
+    최상위 JSON 객체의 (키, 값) 쌍을 스트리밍으로 파싱
+    
+    파일 전체를 읽지 않고 chunk_size 단위로 읽어 항목 하나씩 반환합니다.
+    값 하나는 메모리에 올라가지만 파일 전체 크기와는 무관합니다.
+    값 하나가 끝나지 않는 동안에는 읽는 크기를 두 배씩 늘려, 긴 값을 처음부터
+    다시 파싱하는 횟수가 값 길이에 대해 로그 수준이 되도록 합니다.
+    
+    Args:
+        f: 텍스트 파일 객체
+        chunk_size: 한 번에 읽을 최소 문자 수
+        
+    Raises:
+        ValueError: JSON 형식이 올바르지 않은 경우
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    
+    def fill(size: int = chunk_size) -> bool:
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = f.read(size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+    
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer) or not fill():
+                return
+    
+    def expect(chars: str) -> str:
+        skip_whitespace()
+        if pos >= len(buffer) or buffer[pos] not in chars:
+            found = buffer[pos] if pos < len(buffer) else 'EOF'
+            raise ValueError(f"JSON 파싱 오류: '{chars}' 필요, '{found}' 발견")
+        return buffer[pos]
+    
+    def decode_value() -> Any:
+        nonlocal pos
+        skip_whitespace()
+        read_size = chunk_size
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # 숫자 등은 버퍼 끝에서 잘렸을 수 있으므로 더 읽어서 확인
+                if end < len(buffer) or eof:
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            fill(read_size)
+            read_size *= 2
+    
+    expect('{')
+    pos += 1
+    if expect('}"') == '}':
+        return
+    while True:
+        key = decode_value()
+        expect(':')
+        pos += 1
+        value = decode_value()
+        yield key, value
+        separator = expect(',}')
+        pos += 1
+        if separator == '}':
+            return
+        expect('"')
+
 class DataMigration:
     """데이터 마이그레이션 클래스"""
     
@@ -22,6 +106,8 @@ class DataMigration:
         """
         CSV 파일에서 공휴일 데이터를 SQLite로 마이그레이션
         
+        파일을 한 줄씩 읽으며 단일 트랜잭션의 일괄 추가 경로로 전달합니다.
+        
         Args:
             csv_file: CSV 파일 경로
             
@@ -33,27 +119,21 @@ class DataMigration:
             return False
         
         try:
-            migrated_count = 0
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                # BOM 제거
-                content = f.read()
-                if content.startswith('\ufeff'):
-                    content = content[1:]
-                
-                # StringIO로 처리
-                from io import StringIO
-                csv_content = StringIO(content)
-                reader = csv.DictReader(csv_content)
-                
-                for row in reader:
-                    date_str = row.get('date', '').strip()
-                    name = row.get('holiday name', '').strip()
-                    
-                    if date_str and name:
-                        if self.holiday_manager.add_holiday(date_str, name):
-                            migrated_count += 1
+            # utf-8-sig 인코딩으로 BOM을 스트림에서 바로 제거
+            with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+                reader = csv.DictReader(f)
+                rows = (
+                    (row.get('date') or '', row.get('holiday name') or '')
+                    for row in reader
+                )
+                counts = self.holiday_manager.add_holidays_bulk(
+                    rows, progress_callback=self._progress_logger("공휴일 CSV")
+                )
             
-            logger.info(f"공휴일 CSV 마이그레이션 완료: {migrated_count}개")
+            if counts is None:
+                logger.error("공휴일 CSV 마이그레이션 실패: 일괄 추가가 롤백됨")
+                return False
+            logger.info(f"공휴일 CSV 마이그레이션 완료: {counts}")
             return True
             
         except Exception as e:
@@ -64,6 +144,9 @@ class DataMigration:
         """
         JSON 파일에서 휴가 데이터를 SQLite로 마이그레이션
         
+        최상위 객체({사용자 ID: [날짜, ...] 또는 날짜})를 항목 단위로
+        스트리밍 파싱하여 단일 트랜잭션의 일괄 추가 경로로 전달합니다.
+        
         Args:
             json_file: JSON 파일 경로
             
@@ -75,27 +158,73 @@ class DataMigration:
             return False
         
         try:
-            migrated_count = 0
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_file, 'r', encoding='utf-8-sig') as f:
+                counts = self.vacation_manager.add_vacations_bulk(
+                    self._iter_vacation_rows(iter_json_object_items(f)),
+                    progress_callback=self._progress_logger("휴가 JSON")
+                )
             
-            for user_id, dates in data.items():
-                if isinstance(dates, list):
-                    for date_str in dates:
-                        if self.vacation_manager.add_vacation(str(user_id), date_str):
-                            migrated_count += 1
-                elif isinstance(dates, str):
-                    # 단일 날짜인 경우
-                    if self.vacation_manager.add_vacation(str(user_id), dates):
-                        migrated_count += 1
-            
-            logger.info(f"휴가 JSON 마이그레이션 완료: {migrated_count}개")
+            if counts is None:
+                logger.error("휴가 JSON 마이그레이션 실패: 일괄 추가가 롤백됨")
+                return False
+            logger.info(f"휴가 JSON 마이그레이션 완료: {counts}")
             return True
             
         except Exception as e:
             logger.error(f"휴가 JSON 마이그레이션 오류: {e}")
             return False
     
+    @staticmethod
+    def _iter_vacation_rows(items: Iterator[Tuple[str, Any]]) -> Iterator[Tuple[str, str]]:
+        """(사용자 ID, 날짜 목록 또는 단일 날짜) 항목을 (사용자 ID, 날짜) 행으로 펼침"""
+        for user_id, dates in items:
+            if isinstance(dates, list):
+                for date_str in dates:
+                    yield str(user_id), date_str
+            elif isinstance(dates, str):
+                # 단일 날짜인 경우
+                yield str(user_id), dates
+    
+    @staticmethod
+    def _progress_logger(label: str, interval: int = PROGRESS_LOG_INTERVAL):
+        """처리 행 수가 interval을 넘을 때마다 진행 상황을 기록하는 콜백 생성"""
+        next_report = interval
+        
+        def report(processed: int):
+            nonlocal next_report
+            if processed >= next_report:
+                logger.info(f"{label} 마이그레이션 진행: {processed}행 처리")
+                next_report = (processed // interval + 1) * interval
+        
+        return report
+    
+    def migrate_verification_attachments(self, batch_size: int = 500) -> bool:
+        """
+        기존 인증 기록의 쉼표 구분 image_urls를 첨부 파일 테이블로 이전
+        
+        Args:
+            batch_size: 한 트랜잭션에서 이전할 인증 기록 수
+            
+        Returns:
+            마이그레이션 성공 여부
+        """
+        try:
+            verification_manager = VerificationManager(self.db_manager)
+            migrated = 0
+            while True:
+                count = verification_manager.migrate_legacy_image_urls(batch_size)
+                if count == 0:
+                    break
+                migrated += count
+                if migrated % PROGRESS_LOG_INTERVAL < count:
+                    logger.info(f"첨부 파일 이전 진행 중: {migrated}건")
+            
+            logger.info(f"첨부 파일 마이그레이션 완료: {migrated}건")
+            return True
+        except Exception as e:
+            logger.error(f"첨부 파일 마이그레이션 오류: {e}")
+            return False
+    
     def migrate_all(self, holidays_csv: str = "holidays.csv", vacations_json: str = "vacations.json") -> Dict[str, bool]:
         """
         모든 데이터를 마이그레이션
@@ -105,11 +234,12 @@ class DataMigration:
             vacations_json: 휴가 JSON 파일 경로
             
         Returns:
-            마이그레이션 결과 {'holidays': bool, 'vacations': bool}
+            마이그레이션 결과 {'holidays': bool, 'vacations': bool, 'attachments': bool}
         """
         results = {
             'holidays': self.migrate_holidays_from_csv(holidays_csv),
-            'vacations': self.migrate_vacations_from_json(vacations_json)
+            'vacations': self.migrate_vacations_from_json(vacations_json),
+            'attachments': self.migrate_verification_attachments()
         }
         
         logger.info(f"데이터 마이그레이션 결과: {results}")
@@ -0,0 +1,285 @@
+"""
+조회 결과 레코드 타입 모듈
+
+행마다 딕셔너리를 만드는 대신 __slots__ 기반 객체를 row_factory로 바로 생성합니다.
+날짜와 첨부 파일은 원본 문자열로 보관하고, 해당 속성에 접근할 때 변환합니다.
+이전 딕셔너리 결과와 호환되도록 record['key'] 형태의 조회도 지원합니다.
+"""
+import json
+import sqlite3
+from sys import intern
+import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+class _SlottedRecord:
+    """__slots__ 레코드 공통 기능 (키 조회 호환, 비교, 표현)"""
+    __slots__ = ()
+
+    # record['key']와 to_dict()로 노출할 필드 (지연 속성 포함)
+    _fields: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._fields else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__
+                           if not name.startswith('_'))
+        return f"{type(self).__name__}({values})"
+
+
+class HolidayRecord(_SlottedRecord):
+    """공휴일 레코드"""
+    __slots__ = ('date', 'name')
+    _fields = ('date', 'name')
+
+    # row_factory가 기대하는 SELECT 컬럼 순서
+    COLUMNS = "date, name"
+
+    def __init__(self, date: str, name: str):
+        self.date = date
+        self.name = name
+
+    @property
+    def day(self) -> datetime.date:
+        """날짜 (접근 시 변환)"""
+        return datetime.date.fromisoformat(self.date)
+
+    @classmethod
+    def row_factory(cls, cursor: sqlite3.Cursor, row: tuple) -> 'HolidayRecord':
+        return cls(*row)
+
+
+class VacationRecord(_SlottedRecord):
+    """휴가 구간 레코드 (양 끝 포함)"""
+    __slots__ = ('user_id', 'start_date', 'end_date')
+    _fields = ('user_id', 'start_date', 'end_date')
+
+    COLUMNS = "user_id, start_date, end_date"
+
+    def __init__(self, user_id: str, start_date: str, end_date: str):
+        self.user_id = user_id
+        self.start_date = start_date
+        self.end_date = end_date
+
+    @property
+    def start(self) -> datetime.date:
+        return datetime.date.fromisoformat(self.start_date)
+
+    @property
+    def end(self) -> datetime.date:
+        return datetime.date.fromisoformat(self.end_date)
+
+    @property
+    def days(self) -> int:
+        """구간 일 수"""
+        return (self.end - self.start).days + 1
+
+    def covers(self, date: datetime.date) -> bool:
+        """날짜가 구간 안에 있는지 확인"""
+        return self.start_date <= date.strftime('%Y-%m-%d') <= self.end_date
+
+    @classmethod
+    def row_factory(cls, cursor: sqlite3.Cursor, row: tuple) -> 'VacationRecord':
+        return cls(*row)
+
+
+class VerificationRecord(_SlottedRecord):
+    """
+    인증 기록 레코드
+
+    첨부 파일은 조회 시 JSON 문자열(또는 마이그레이션 전 쉼표 구분 URL)로 받아 두었다가
+    attachments / image_urls에 처음 접근할 때 변환합니다.
+    """
+    __slots__ = ('id', 'user_id', 'username', 'message_content', 'verification_date',
+                 'verification_time', 'created_at', '_attachments_raw', '_legacy_image_urls')
+    _fields = ('id', 'user_id', 'username', 'message_content', 'image_urls', 'attachments',
+               'verification_date', 'verification_time', 'created_at')
+
+    # row_factory가 기대하는 SELECT 컬럼 순서 (verifications 테이블 별칭 v)
+    COLUMNS = """
+        v.id, v.user_id, v.username, v.message_content, v.verification_date,
+        v.verification_time, v.created_at,
+        (SELECT json_group_array(json_array(a.ordinal, a.attachment_id, a.url, a.content_type, a.size))
+         FROM verification_attachments AS a WHERE a.verification_id = v.id),
+        v.image_urls
+    """
+
+    def __init__(self, id: int, user_id: str, username: str, message_content: Optional[str],
+                 verification_date: str, verification_time: str, created_at: Optional[str],
+                 attachments_raw: Optional[str] = None, legacy_image_urls: Optional[str] = None):
+        self.id = id
+        self.user_id = user_id
+        self.username = username
+        self.message_content = message_content
+        self.verification_date = verification_date
+        self.verification_time = verification_time
+        self.created_at = created_at
+        self._attachments_raw = attachments_raw
+        self._legacy_image_urls = legacy_image_urls
+
+    @property
+    def date(self) -> datetime.date:
+        """인증 날짜 (접근 시 변환)"""
+        return datetime.date.fromisoformat(self.verification_date)
+
+    @property
+    def verified_at(self) -> datetime.datetime:
+        """인증 일시 (접근 시 변환)"""
+        return datetime.datetime.fromisoformat(f"{self.verification_date} {self.verification_time}")
+
+    @property
+    def attachments(self) -> List[Dict[str, Any]]:
+        """첨부 파일 정보 목록 (ordinal 순, 접근할 때마다 새 목록 생성)"""
+        if self._attachments_raw and self._attachments_raw != '[]':
+            items = sorted(json.loads(self._attachments_raw), key=lambda item: item[0])
+            return [
+                {'attachment_id': attachment_id, 'url': url, 'content_type': content_type, 'size': size}
+                for _, attachment_id, url, content_type, size in items
+            ]
+        if self._legacy_image_urls:
+            # 아직 첨부 파일 테이블로 이전되지 않은 기존 행
+            return [{'attachment_id': None, 'url': url, 'content_type': None, 'size': None}
+                    for url in self._legacy_image_urls.split(',')]
+        return []
+
+    @property
+    def image_urls(self) -> List[str]:
+        return [item['url'] for item in self.attachments]
+
+    @classmethod
+    def row_factory(cls, cursor: sqlite3.Cursor, row: tuple) -> 'VerificationRecord':
+        # 같은 사용자/날짜의 행이 많으므로 반복되는 짧은 문자열은 하나의 객체를 공유
+        record_id, user_id, username, content, date, time, created_at, attachments_raw, legacy_urls = row
+        return cls(record_id, intern(user_id), intern(username), content, intern(date), intern(time),
+                   created_at, attachments_raw, legacy_urls)
+
+
+class DailyVerificationRecord(_SlottedRecord):
+    """사용자/날짜별 인증 요약 레코드 (첫 인증, 마지막 인증, 인증 횟수)"""
+    __slots__ = ('user_id', 'verification_date', 'first_time', 'last_time', 'post_count')
+    _fields = ('user_id', 'verification_date', 'first_time', 'last_time', 'post_count')
+
+    COLUMNS = "user_id, verification_date, first_time, last_time, post_count"
+
+    def __init__(self, user_id: str, verification_date: str, first_time: str, last_time: str, post_count: int):
+        self.user_id = user_id
+        self.verification_date = verification_date
+        self.first_time = first_time
+        self.last_time = last_time
+        self.post_count = post_count
+
+    @property
+    def first_verified_at(self) -> datetime.datetime:
+        """그날 첫 인증 일시"""
+        return datetime.datetime.fromisoformat(f"{self.verification_date} {self.first_time}")
+
+    @property
+    def last_verified_at(self) -> datetime.datetime:
+        """그날 마지막 인증 일시"""
+        return datetime.datetime.fromisoformat(f"{self.verification_date} {self.last_time}")
+
+    @classmethod
+    def row_factory(cls, cursor: sqlite3.Cursor, row: tuple) -> 'DailyVerificationRecord':
+        return cls(*row)
+
+
+class DailySummaryRecord(_SlottedRecord):
+    """날짜별 인증 현황 요약 레코드 (체크 실행 전 날짜는 required/on_vacation/missed가 0)"""
+    __slots__ = ('summary_date', 'required', 'verified', 'on_vacation', 'missed', 'updated_at')
+    _fields = ('summary_date', 'required', 'verified', 'on_vacation', 'missed', 'updated_at')
+
+    COLUMNS = "summary_date, required, verified, on_vacation, missed, updated_at"
+
+    def __init__(self, summary_date: str, required: int, verified: int, on_vacation: int, missed: int,
+                 updated_at: Optional[str] = None):
+        self.summary_date = summary_date
+        self.required = required
+        self.verified = verified
+        self.on_vacation = on_vacation
+        self.missed = missed
+        self.updated_at = updated_at
+
+    @property
+    def date(self) -> datetime.date:
+        return datetime.date.fromisoformat(self.summary_date)
+
+    @property
+    def compliance_rate(self) -> Optional[float]:
+        """인증 대상 중 인증한 비율 (체크 대상이 없으면 None)"""
+        if not self.required:
+            return None
+        return (self.required - self.missed) / self.required
+
+    @classmethod
+    def row_factory(cls, cursor: sqlite3.Cursor, row: tuple) -> 'DailySummaryRecord':
+        return cls(*row)
+
+
+class HistoryCursorRecord(_SlottedRecord):
+    """채널 메시지 기록 스캔 위치 레코드"""
+    __slots__ = ('channel_id', 'last_message_id', 'last_message_at')
+    _fields = ('channel_id', 'last_message_id', 'last_message_at')
+
+    COLUMNS = "channel_id, last_message_id, last_message_at"
+
+    def __init__(self, channel_id: str, last_message_id: int, last_message_at: str):
+        self.channel_id = channel_id
+        self.last_message_id = last_message_id
+        self.last_message_at = last_message_at
+
+    @property
+    def last_seen(self) -> datetime.datetime:
+        """마지막으로 확인한 메시지의 작성 시각"""
+        return datetime.datetime.fromisoformat(self.last_message_at)
+
+    @classmethod
+    def row_factory(cls, cursor: sqlite3.Cursor, row: tuple) -> 'HistoryCursorRecord':
+        return cls(*row)
+
+
+class BackfillJobRecord(_SlottedRecord):
+    """채널 기록 백필 작업 레코드"""
+    __slots__ = ('id', 'channel_id', 'start_at', 'end_at', 'last_message_id', 'scanned', 'inserted', 'status')
+    _fields = ('id', 'channel_id', 'start_at', 'end_at', 'last_message_id', 'scanned', 'inserted', 'status')
+
+    COLUMNS = "id, channel_id, start_at, end_at, last_message_id, scanned, inserted, status"
+
+    def __init__(self, id: int, channel_id: str, start_at: str, end_at: str, last_message_id: Optional[int],
+                 scanned: int, inserted: int, status: str):
+        self.id = id
+        self.channel_id = channel_id
+        self.start_at = start_at
+        self.end_at = end_at
+        self.last_message_id = last_message_id
+        self.scanned = scanned
+        self.inserted = inserted
+        self.status = status
+
+    @property
+    def is_done(self) -> bool:
+        """기간 끝까지 스캔을 마쳤는지 여부"""
+        return self.status == 'done'
+
+    @classmethod
+    def row_factory(cls, cursor: sqlite3.Cursor, row: tuple) -> 'BackfillJobRecord':
+        return cls(*row)
+
+
+class VerificationPage(NamedTuple):
+    """인증 기록 한 페이지와 다음 페이지 커서 (마지막 페이지면 None)"""
+    records: List[VerificationRecord]
+    next_cursor: Optional[str]
@@ -0,0 +1,442 @@
+"""
+버전 기반 스키마 마이그레이션 모듈
+
+스키마 버전은 PRAGMA user_version에 저장합니다. 시작 시 버전이 최신이면
+DDL을 하나도 실행하지 않고, 오래된 경우에만 백업을 만든 뒤 남은 단계를
+하나의 트랜잭션으로 적용합니다. 적용한 단계의 체크섬은 schema_migrations
+테이블에 남겨 이미 배포된 단계가 나중에 수정되면 시작 시 감지합니다.
+"""
+import time
+import hashlib
+import logging
+import sqlite3
+import datetime
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger('verification_bot')
+
+
+class SchemaMigrationError(Exception):
+    """스키마 마이그레이션을 진행할 수 없는 상태 (체크섬 불일치, 더 새로운 스키마 등)"""
+
+
+class Migration(NamedTuple):
+    """
+    스키마 마이그레이션 단계
+
+    한 번 배포된 단계는 수정하지 말고 새 버전을 추가해야 합니다 (체크섬으로 검사).
+
+    Attributes:
+        version: 적용 후 스키마 버전 (1부터 1씩 증가)
+        description: 단계 설명
+        statements: 순서대로 실행할 SQL 문
+        apply: SQL 문 실행 후 호출할 데이터 변환 함수 (트랜잭션은 엔진이 관리)
+    """
+    version: int
+    description: str
+    statements: Tuple[str, ...] = ()
+    apply: Optional[Callable[[sqlite3.Connection], None]] = None
+
+    @property
+    def checksum(self) -> str:
+        """설명, SQL 문(공백 정규화), 변환 함수 이름으로 계산한 SHA-256"""
+        digest = hashlib.sha256(self.description.encode('utf-8'))
+        for statement in self.statements:
+            digest.update(b'\0')
+            digest.update(' '.join(statement.split()).encode('utf-8'))
+        if self.apply is not None:
+            digest.update(b'\0')
+            digest.update(self.apply.__qualname__.encode('utf-8'))
+        return digest.hexdigest()
+
+
+def _compact_legacy_vacations(conn: sqlite3.Connection):
+    """
+    기존 vacations 테이블(사용자/날짜당 1행)을 연속 구간으로 묶어 vacation_periods로 이전
+
+    연속된 날짜는 (날짜 - 사용자별 순번) 값이 같다는 점을 이용해 한 번의 쿼리로 묶습니다.
+    """
+    legacy = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'vacations'"
+    ).fetchone()
+    if legacy is None:
+        return
+
+    legacy_rows = conn.execute("SELECT COUNT(*) FROM vacations").fetchone()[0]
+    conn.execute("""
+        INSERT INTO vacation_periods (user_id, start_date, end_date)
+        SELECT user_id, MIN(date), MAX(date)
+        FROM (
+            SELECT user_id, date,
+                   julianday(date) - ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY date) AS grp
+            FROM vacations
+            WHERE julianday(date) IS NOT NULL
+        )
+        GROUP BY user_id, grp
+    """)
+    periods = conn.execute("SELECT changes()").fetchone()[0]
+    conn.execute("DROP TABLE vacations")
+    logger.info(f"기존 휴가 데이터 구간 압축 완료: {legacy_rows}행 -> {periods}개 구간")
+
+
+# 버전 관리 이전에 만들어진 데이터베이스도 안전하게 올릴 수 있도록 초기 단계는 IF NOT EXISTS 사용
+MIGRATIONS: Tuple[Migration, ...] = (
+    Migration(1, "공휴일/인증 기록 기본 테이블", (
+        """
+        CREATE TABLE IF NOT EXISTS holidays (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS verifications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            username TEXT NOT NULL,
+            message_content TEXT,
+            image_urls TEXT,
+            verification_date TEXT NOT NULL,
+            verification_time TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_holidays_date ON holidays(date)",
+        "CREATE INDEX IF NOT EXISTS idx_verifications_user_date ON verifications(user_id, verification_date)",
+        "CREATE INDEX IF NOT EXISTS idx_verifications_date ON verifications(verification_date)",
+    )),
+    Migration(2, "휴가 구간 테이블 및 하루 단위 휴가 압축", (
+        # 사용자별 구간은 겹치거나 맞닿지 않도록 병합되어 저장됨
+        """
+        CREATE TABLE IF NOT EXISTS vacation_periods (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            start_date TEXT NOT NULL,
+            end_date TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            CHECK (start_date <= end_date)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_vacation_periods_user_start ON vacation_periods(user_id, start_date)",
+        "CREATE INDEX IF NOT EXISTS idx_vacation_periods_start_end ON vacation_periods(start_date, end_date, user_id)",
+        """
+        CREATE INDEX IF NOT EXISTS idx_vacation_periods_span
+        ON vacation_periods(julianday(end_date) - julianday(start_date))
+        """,
+    ), _compact_legacy_vacations),
+    Migration(3, "인증 첨부 파일 테이블", (
+        # image_urls 컬럼은 첨부 파일 테이블로 이전되기 전의 기존 행에만 남아 있음
+        """
+        CREATE TABLE IF NOT EXISTS verification_attachments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            verification_id INTEGER NOT NULL REFERENCES verifications(id) ON DELETE CASCADE,
+            ordinal INTEGER NOT NULL,
+            attachment_id TEXT,
+            url TEXT NOT NULL,
+            content_type TEXT,
+            size INTEGER,
+            UNIQUE(verification_id, ordinal)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_verification_attachments_attachment ON verification_attachments(attachment_id)",
+        # 아직 이전되지 않은 기존 행만 담는 부분 인덱스 (이전이 끝나면 비어 있음)
+        """
+        CREATE INDEX IF NOT EXISTS idx_verifications_legacy_image_urls
+        ON verifications(id) WHERE image_urls IS NOT NULL
+        """,
+    )),
+    Migration(4, "사용자 인증 기록 키셋 페이지 인덱스", (
+        # (user_id, verification_date) 인덱스는 새 인덱스의 접두사이므로 대체
+        "CREATE INDEX IF NOT EXISTS idx_verifications_user_keyset "
+        "ON verifications(user_id, verification_date, verification_time, id)",
+        "DROP INDEX IF EXISTS idx_verifications_user_date",
+    )),
+    Migration(5, "날짜별 인증 사용자 커버링 인덱스", (
+        # (verification_date) 인덱스는 새 인덱스의 접두사이므로 대체
+        "CREATE INDEX IF NOT EXISTS idx_verifications_date_user ON verifications(verification_date, user_id)",
+        "DROP INDEX IF EXISTS idx_verifications_date",
+    )),
+    Migration(6, "인증 메시지 전문 검색 색인 (FTS5)", (
+        # 본문은 verifications에만 저장하고 색인만 따로 유지 (external content)
+        # 한국어 조사가 붙은 단어도 찾을 수 있도록 접두사 검색을 쓰므로 2/3글자 접두사 색인 추가
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS verifications_fts USING fts5(
+            message_content,
+            content='verifications',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS verifications_fts_insert AFTER INSERT ON verifications BEGIN
+            INSERT INTO verifications_fts (rowid, message_content) VALUES (new.id, new.message_content);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS verifications_fts_delete AFTER DELETE ON verifications BEGIN
+            INSERT INTO verifications_fts (verifications_fts, rowid, message_content)
+            VALUES ('delete', old.id, old.message_content);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS verifications_fts_update AFTER UPDATE OF message_content ON verifications BEGIN
+            INSERT INTO verifications_fts (verifications_fts, rowid, message_content)
+            VALUES ('delete', old.id, old.message_content);
+            INSERT INTO verifications_fts (rowid, message_content) VALUES (new.id, new.message_content);
+        END
+        """,
+        # 기존 인증 기록 색인
+        "INSERT INTO verifications_fts (verifications_fts) VALUES ('rebuild')",
+    )),
+    Migration(7, "사용자/날짜별 인증 요약 테이블", (
+        # 인증 여부 조회용 좁은 테이블 (사용자당 하루 1행, 원본 기록은 verifications에 그대로 보관)
+        # 날짜 순 기본 키라 날짜별 인증 사용자 조회와 사용자/날짜 확인 모두 기본 키로 처리
+        """
+        CREATE TABLE IF NOT EXISTS daily_verification (
+            verification_date TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            first_time TEXT NOT NULL,
+            last_time TEXT NOT NULL,
+            post_count INTEGER NOT NULL DEFAULT 1,
+            PRIMARY KEY (verification_date, user_id)
+        ) WITHOUT ROWID
+        """,
+        # 기존 인증 기록으로 채우기
+        """
+        INSERT OR IGNORE INTO daily_verification (verification_date, user_id, first_time, last_time, post_count)
+        SELECT verification_date, user_id, MIN(verification_time), MAX(verification_time), COUNT(*)
+        FROM verifications
+        GROUP BY verification_date, user_id
+        """,
+    )),
+    Migration(8, "날짜별 인증 현황 요약 테이블", (
+        # 체크 실행 시점의 체크 대상 멤버 (봇은 서버 멤버 목록을 DB에 두지 않으므로 날짜별로 기록)
+        """
+        CREATE TABLE IF NOT EXISTS daily_roster (
+            check_date TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            PRIMARY KEY (check_date, user_id)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_daily_roster_user ON daily_roster(user_id, check_date)",
+        # required: 휴가가 아닌 체크 대상, verified: 그날 인증한 사용자,
+        # on_vacation: 휴가 중인 체크 대상, missed: 인증하지 않은 required 멤버
+        """
+        CREATE TABLE IF NOT EXISTS daily_summary (
+            summary_date TEXT PRIMARY KEY,
+            required INTEGER NOT NULL DEFAULT 0,
+            verified INTEGER NOT NULL DEFAULT 0,
+            on_vacation INTEGER NOT NULL DEFAULT 0,
+            missed INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        # 사용자의 그날 첫 인증 (daily_verification 행 추가)마다 증분 갱신
+        """
+        CREATE TRIGGER IF NOT EXISTS daily_summary_verified AFTER INSERT ON daily_verification BEGIN
+            INSERT INTO daily_summary (summary_date, verified) VALUES (new.verification_date, 1)
+            ON CONFLICT (summary_date) DO UPDATE SET
+                verified = verified + 1,
+                missed = missed - EXISTS (
+                    SELECT 1 FROM daily_roster AS r
+                    WHERE r.check_date = new.verification_date AND r.user_id = new.user_id
+                    AND NOT EXISTS (
+                        SELECT 1 FROM vacation_periods AS p
+                        WHERE p.user_id = new.user_id
+                        AND p.start_date <= new.verification_date AND p.end_date >= new.verification_date
+                    )
+                ),
+                updated_at = CURRENT_TIMESTAMP;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS daily_summary_unverified AFTER DELETE ON daily_verification BEGIN
+            UPDATE daily_summary SET
+                verified = verified - 1,
+                missed = missed + EXISTS (
+                    SELECT 1 FROM daily_roster AS r
+                    WHERE r.check_date = old.verification_date AND r.user_id = old.user_id
+                    AND NOT EXISTS (
+                        SELECT 1 FROM vacation_periods AS p
+                        WHERE p.user_id = old.user_id
+                        AND p.start_date <= old.verification_date AND p.end_date >= old.verification_date
+                    )
+                ),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE summary_date = old.verification_date;
+        END
+        """,
+        # 체크 대상 기록이 없는 과거 날짜는 인증 수만 채움
+        """
+        INSERT OR IGNORE INTO daily_summary (summary_date, verified)
+        SELECT verification_date, COUNT(*) FROM daily_verification GROUP BY verification_date
+        """,
+    )),
+    Migration(9, "채널별 메시지 기록 스캔 위치", (
+        # 체크 때 마지막으로 확인한 메시지 (다음 체크는 이 메시지 이후만 조회)
+        """
+        CREATE TABLE IF NOT EXISTS channel_history_cursors (
+            channel_id TEXT PRIMARY KEY,
+            last_message_id INTEGER NOT NULL,
+            last_message_at TEXT NOT NULL,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    )),
+    Migration(10, "인증 메시지 ID와 기록 백필 작업 진행 위치", (
+        # 메시지 ID가 없는 기존 행은 NULL로 남고, 부분 유니크 인덱스라 서로 충돌하지 않음
+        "ALTER TABLE verifications ADD COLUMN message_id INTEGER",
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_verifications_message_id
+        ON verifications(message_id) WHERE message_id IS NOT NULL
+        """,
+        # 채널/기간별 백필 진행 위치 (중단되면 last_message_id 이후부터 이어서 진행)
+        """
+        CREATE TABLE IF NOT EXISTS backfill_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            channel_id TEXT NOT NULL,
+            start_at TEXT NOT NULL,
+            end_at TEXT NOT NULL,
+            last_message_id INTEGER,
+            scanned INTEGER NOT NULL DEFAULT 0,
+            inserted INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'running',
+            started_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(channel_id, start_at, end_at)
+        )
+        """,
+    )),
+)
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+_CREATE_MIGRATIONS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        description TEXT NOT NULL,
+        checksum TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """현재 스키마 버전 (PRAGMA user_version)"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _validate_migrations(migrations: Tuple[Migration, ...]):
+    """단계 버전이 1부터 빠짐없이 증가하는지 확인"""
+    for expected, migration in enumerate(migrations, start=1):
+        if migration.version != expected:
+            raise SchemaMigrationError(
+                f"마이그레이션 버전 순서가 올바르지 않습니다: {migration.version} (예상 {expected})"
+            )
+
+
+def _verify_checksums(conn: sqlite3.Connection, migrations: Tuple[Migration, ...], current_version: int):
+    """이미 적용된 단계의 체크섬이 코드와 같은지 확인"""
+    applied = {
+        row[0]: row[1] for row in conn.execute(
+            "SELECT version, checksum FROM schema_migrations WHERE version <= ?", (current_version,)
+        )
+    }
+    for migration in migrations[:current_version]:
+        recorded = applied.get(migration.version)
+        if recorded is not None and recorded != migration.checksum:
+            raise SchemaMigrationError(
+                f"이미 적용된 마이그레이션 v{migration.version}({migration.description})이 변경되었습니다. "
+                f"기존 단계를 수정하지 말고 새 버전을 추가하세요."
+            )
+
+
+def _is_empty_database(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' LIMIT 1").fetchone() is None
+
+
+def backup_database(conn: sqlite3.Connection, db_path: str, label: str) -> str:
+    """
+    온라인 백업 API로 데이터베이스 파일 사본 생성
+
+    Args:
+        conn: 원본 연결
+        db_path: 원본 데이터베이스 경로 (백업 파일 이름 기준)
+        label: 백업 파일 이름에 붙일 설명
+
+    Returns:
+        백업 파일 경로
+    """
+    suffix = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    backup_path = f"{db_path}.{label}_{suffix}.bak"
+    backup_conn = sqlite3.connect(backup_path)
+    try:
+        conn.backup(backup_conn)
+    finally:
+        backup_conn.close()
+    return backup_path
+
+
+def migrate_schema(conn: sqlite3.Connection, db_path: str,
+                   migrations: Tuple[Migration, ...] = MIGRATIONS) -> List[Migration]:
+    """
+    스키마를 최신 버전으로 올림
+
+    최신 버전이면 PRAGMA user_version 조회와 체크섬 확인만 하고 DDL은 실행하지 않습니다.
+    올릴 단계가 있으면 (기존 데이터가 있는 경우) 백업을 먼저 만들고,
+    남은 단계 전체를 하나의 트랜잭션으로 적용합니다. 실패하면 전체 롤백됩니다.
+
+    Args:
+        conn: 데이터베이스 연결
+        db_path: 데이터베이스 경로 (백업 파일 위치)
+        migrations: 적용할 마이그레이션 단계 목록
+
+    Returns:
+        이번에 적용한 마이그레이션 단계 목록 (최신이면 빈 목록)
+    """
+    _validate_migrations(migrations)
+    target_version = migrations[-1].version if migrations else 0
+    current_version = get_schema_version(conn)
+
+    if current_version > target_version:
+        raise SchemaMigrationError(
+            f"데이터베이스 스키마(v{current_version})가 코드가 아는 버전(v{target_version})보다 새롭습니다."
+        )
+    if current_version > 0:
+        _verify_checksums(conn, migrations, current_version)
+    if current_version == target_version:
+        return []
+
+    pending = list(migrations[current_version:])
+    if db_path != ':memory:' and not _is_empty_database(conn):
+        backup_path = backup_database(conn, db_path, f"v{current_version}")
+        logger.info(f"스키마 업그레이드 전 백업 생성: {backup_path}")
+
+    started = time.perf_counter()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(_CREATE_MIGRATIONS_TABLE_SQL)
+        for migration in pending:
+            for statement in migration.statements:
+                conn.execute(statement)
+            if migration.apply is not None:
+                migration.apply(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO schema_migrations (version, description, checksum) VALUES (?, ?, ?)",
+                (migration.version, migration.description, migration.checksum)
+            )
+        # user_version도 트랜잭션 안에서 변경되므로 실패 시 함께 롤백됨
+        conn.execute(f"PRAGMA user_version = {int(target_version)}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info(
+        f"스키마 업그레이드 완료: v{current_version} -> v{target_version} "
+        f"({len(pending)}단계, {elapsed_ms:.1f}ms)"
+    )
+    return pending
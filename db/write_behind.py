@@ -0,0 +1,192 @@
+"""
+인증 기록 그룹 커밋(write-behind) 버퍼 모듈
+
+마감 직전처럼 인증이 몰릴 때 짧은 시간 동안 들어온 기록을 모아
+하나의 트랜잭션으로 커밋하여 fsync 횟수를 줄입니다.
+"""
+import asyncio
+import datetime
+import logging
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from .async_database import AsyncVerificationManager
+
+logger = logging.getLogger('verification_bot')
+
+class VerificationWriteBuffer:
+    """인증 기록 그룹 커밋 버퍼"""
+    
+    def __init__(self, verification_manager: AsyncVerificationManager,
+                 flush_interval: float = 0.05, max_batch_size: int = 100):
+        """
+        버퍼 초기화
+        
+        Args:
+            verification_manager: 비동기 인증 기록 매니저
+            flush_interval: 첫 기록이 들어온 뒤 커밋까지 기다리는 최대 시간 (초)
+            max_batch_size: 한 번에 커밋할 최대 기록 수 (도달 시 즉시 커밋)
+        """
+        self.verification_manager = verification_manager
+        self.flush_interval = max(0.0, float(flush_interval))
+        self.max_batch_size = max(1, int(max_batch_size))
+        
+        self._pending: List[Tuple[Dict, asyncio.Future]] = []
+        self._timer_task: Optional[asyncio.Task] = None
+        # 크기 도달로 시작한 커밋 작업 (루프는 약한 참조만 가지므로 끝날 때까지 보관)
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._closed = False
+        
+        # 통계 카운터
+        self.batches_committed = 0
+        self.records_committed = 0
+        self.failed_batches = 0
+        self.failed_records = 0
+        self.fallback_records = 0
+        self.last_batch_size = 0
+        self.max_batch_size_seen = 0
+        self.last_commit_latency = 0.0
+        self.total_commit_latency = 0.0
+    
+    async def submit(self, user_id: str, username: str, message_content: str,
+                     image_urls: List[str], verification_datetime: datetime.datetime,
+                     attachments: Optional[List[Dict]] = None, message_id: Optional[int] = None) -> bool:
+        """
+        인증 기록을 버퍼에 추가하고 커밋이 끝날 때까지 대기
+        
+        Returns:
+            저장 성공 여부 (True면 디스크에 커밋 완료, 이미 저장된 메시지 ID도 True)
+        """
+        record = {
+            'user_id': user_id,
+            'username': username,
+            'message_content': message_content,
+            'image_urls': image_urls,
+            'verification_datetime': verification_datetime,
+            'attachments': attachments,
+            'message_id': message_id
+        }
+        
+        if self._closed:
+            # 종료 이후 들어온 기록은 버퍼 없이 바로 저장
+            return await self.verification_manager.add_verifications_bulk([record])
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((record, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._cancel_timer()
+            task = asyncio.create_task(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._on_flush_done)
+        elif self._timer_task is None:
+            self._timer_task = asyncio.create_task(self._flush_after_interval())
+        
+        return await future
+    
+    async def _flush_after_interval(self):
+        """flush_interval 후 버퍼 커밋"""
+        try:
+            await asyncio.sleep(self.flush_interval)
+        except asyncio.CancelledError:
+            return
+        self._timer_task = None
+        await self.flush()
+    
+    def _on_flush_done(self, task: asyncio.Task):
+        """커밋 작업 참조 해제 및 예외 확인"""
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"인증 기록 그룹 커밋 작업 오류: {task.exception()}", exc_info=task.exception())
+    
+    def _cancel_timer(self):
+        if self._timer_task is not None:
+            self._timer_task.cancel()
+            self._timer_task = None
+    
+    async def flush(self):
+        """대기 중인 모든 기록을 max_batch_size 단위로 커밋"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        
+        async with self._flush_lock:
+            while self._pending:
+                batch = self._pending[:self.max_batch_size]
+                del self._pending[:self.max_batch_size]
+                await self._commit_batch(batch)
+    
+    async def _commit_batch(self, batch: List[Tuple[Dict, asyncio.Future]]):
+        """
+        배치 하나를 커밋하고 각 기록의 future 완료
+        
+        그룹 커밋이 실패하면 한 기록의 오류로 다른 사용자의 인증까지 실패하지 않도록
+        배치의 기록을 하나씩 다시 저장합니다.
+        """
+        start = time.perf_counter()
+        try:
+            success = await self.verification_manager.add_verifications_bulk([record for record, _ in batch])
+        except Exception as e:
+            logger.error(f"인증 기록 그룹 커밋 오류: {e}", exc_info=True)
+            success = False
+        
+        # 지연 시간은 그룹 커밋 시도만 집계 (개별 저장은 fallback_records로 따로 셈)
+        latency = time.perf_counter() - start
+        
+        self.last_batch_size = len(batch)
+        self.max_batch_size_seen = max(self.max_batch_size_seen, len(batch))
+        self.last_commit_latency = latency
+        self.total_commit_latency += latency
+        
+        if success:
+            results = [True] * len(batch)
+            self.batches_committed += 1
+            self.records_committed += len(batch)
+        else:
+            self.failed_batches += 1
+            results = [await self._commit_one(record) for record, _ in batch]
+            self.fallback_records += results.count(True)
+            self.failed_records += results.count(False)
+            logger.warning(
+                f"인증 기록 그룹 커밋 실패로 개별 저장: {len(batch)}건 중 {results.count(True)}건 성공"
+            )
+        
+        logger.debug(f"인증 기록 그룹 커밋: {len(batch)}건, {latency * 1000:.1f}ms, 성공: {success}")
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    async def _commit_one(self, record: Dict) -> bool:
+        """기록 하나를 개별 트랜잭션으로 저장"""
+        try:
+            return await self.verification_manager.add_verification(
+                record['user_id'], record['username'], record['message_content'], record['image_urls'],
+                record['verification_datetime'], record['attachments'], record['message_id']
+            )
+        except Exception as e:
+            logger.error(f"인증 기록 개별 저장 오류 (사용자 {record['user_id']}): {e}", exc_info=True)
+            return False
+    
+    def get_stats(self) -> Dict[str, float]:
+        """배치 크기 및 커밋 지연 시간 통계 반환"""
+        total_batches = self.batches_committed + self.failed_batches
+        return {
+            'batches_committed': self.batches_committed,
+            'records_committed': self.records_committed,
+            'failed_batches': self.failed_batches,
+            'failed_records': self.failed_records,
+            'fallback_records': self.fallback_records,
+            'pending': len(self._pending),
+            'last_batch_size': self.last_batch_size,
+            'max_batch_size': self.max_batch_size_seen,
+            'avg_batch_size': self.records_committed / self.batches_committed if self.batches_committed else 0.0,
+            'last_commit_latency_ms': self.last_commit_latency * 1000,
+            'avg_commit_latency_ms': self.total_commit_latency / total_batches * 1000 if total_batches else 0.0
+        }
+    
+    async def close(self):
+        """종료 훅: 타이머를 멈추고 남은 기록을 모두 커밋"""
+        self._closed = True
+        self._cancel_timer()
+        await self.flush()
+        logger.info(f"인증 기록 버퍼 종료: {self.get_stats()}")
@@ -0,0 +1,170 @@
+"""
+채널 메시지 기록 병렬 스캔 모듈
+
+긴 기간의 channel.history는 한 번에 한 페이지(100개)씩만 요청하므로 요청 지연 시간이 그대로 쌓입니다.
+스캔 구간을 스노우플레이크 경계로 여러 하위 구간으로 나눠 동시에 읽고, 결과는 오래된 순서대로
+이어 붙여 돌려줍니다. 모든 구간은 하나의 요청 예산(동시 요청 수, 초당 요청 수)을 나눠 씁니다.
+"""
+import asyncio
+import datetime
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Tuple, Union
+import discord
+
+Boundary = Union[datetime.datetime, discord.abc.Snowflake, int]
+
+# 구간 작업 종료 표시
+_DONE = object()
+
+
+class RequestBudget:
+    """여러 스캔 구간이 함께 쓰는 요청 예산 (동시 요청 수와 초당 요청 수 제한)"""
+
+    def __init__(self, max_concurrent: int = 4, per_second: float = 0):
+        """
+        Args:
+            max_concurrent: 동시에 보낼 수 있는 최대 요청 수
+            per_second: 초당 최대 요청 시작 수 (0이면 제한 없음)
+        """
+        self._semaphore = asyncio.Semaphore(max(1, int(max_concurrent)))
+        self._interval = 1 / per_second if per_second > 0 else 0.0
+        self._next_start = 0.0
+        self.requests = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        """요청 하나를 보낼 차례가 될 때까지 대기"""
+        async with self._semaphore:
+            if self._interval:
+                now = asyncio.get_running_loop().time()
+                start = max(now, self._next_start)
+                self._next_start = start + self._interval
+                if start > now:
+                    await asyncio.sleep(start - now)
+            self.requests += 1
+            yield
+
+
+class HistoryScanner:
+    """스노우플레이크 구간을 나눠 동시에 읽고 순서대로 합치는 채널 기록 스캐너"""
+
+    PAGE_SIZE = 100  # 디스코드 메시지 조회 API의 한 번 최대 개수
+
+    def __init__(self, windows: int = 4, min_window: datetime.timedelta = datetime.timedelta(hours=1),
+                 budget: Optional[RequestBudget] = None, buffer_size: int = 0):
+        """
+        Args:
+            windows: 최대 하위 구간 수
+            min_window: 하위 구간 최소 길이 (짧은 스캔은 나누지 않음)
+            budget: 요청 예산 (없으면 구간 수만큼 동시 요청 허용)
+            buffer_size: 앞 구간을 기다리는 동안 구간마다 쌓아 둘 최대 메시지 수 (0이면 제한 없음).
+                가득 찬 구간은 앞 구간을 다 돌려줄 때까지 요청을 멈추므로, 구간의 메시지 수보다
+                작으면 그만큼 동시성이 줄어듭니다.
+        """
+        self.windows = max(1, int(windows))
+        self.min_window = min_window
+        self.budget = budget or RequestBudget(self.windows)
+        self.buffer_size = max(self.PAGE_SIZE, int(buffer_size)) if buffer_size else 0
+
+    @classmethod
+    def from_config(cls, config) -> 'HistoryScanner':
+        """설정값으로 스캐너 생성"""
+        return cls(
+            windows=config.HISTORY_SCAN_WINDOWS,
+            min_window=datetime.timedelta(minutes=config.HISTORY_SCAN_MIN_WINDOW_MINUTES),
+            budget=RequestBudget(config.HISTORY_SCAN_MAX_CONCURRENT, config.HISTORY_SCAN_REQUESTS_PER_SECOND),
+            buffer_size=config.HISTORY_SCAN_BUFFER_SIZE
+        )
+
+    @staticmethod
+    def _to_snowflake(value: Boundary, high: bool) -> int:
+        if isinstance(value, datetime.datetime):
+            return discord.utils.time_snowflake(value, high=high)
+        return value if isinstance(value, int) else value.id
+
+    def split(self, lower_id: int, upper_id: int) -> List[Tuple[int, int]]:
+        """
+        (lower_id, upper_id) 열린 구간을 같은 시간 길이의 하위 구간으로 분할
+
+        Returns:
+            (after_id, before_id) 목록 (오래된 순, 인접 구간은 경계 ID를 공유)
+        """
+        span_ms = (upper_id >> 22) - (lower_id >> 22)
+        min_window_ms = self.min_window.total_seconds() * 1000
+        count = max(1, min(self.windows, int(span_ms // min_window_ms) if min_window_ms else self.windows))
+        if count == 1:
+            return [(lower_id, upper_id)]
+        # 경계는 타임스탬프만 나누고 하위 비트를 채워 경계 ID 메시지가 양쪽에서 빠지지 않게 함
+        bounds = [lower_id]
+        for index in range(1, count):
+            bounds.append((((lower_id >> 22) + span_ms * index // count) << 22) - 1)
+        bounds.append(upper_id)
+        return [(bounds[i], bounds[i + 1] + (1 if i < count - 1 else 0)) for i in range(count)]
+
+    async def scan(self, channel: discord.abc.Messageable, after: Boundary,
+                   before: Boundary) -> AsyncIterator[discord.Message]:
+        """
+        after 이후 before 이전 메시지를 오래된 순서로 반환
+
+        Args:
+            channel: 채널
+            after: 시작 경계 (시각, 메시지 또는 스노우플레이크 ID, 포함하지 않음)
+            before: 종료 경계 (포함하지 않음, 미래 시각이면 현재 시각까지)
+        """
+        if isinstance(before, datetime.datetime):
+            before = min(before, discord.utils.utcnow())
+        windows = self.split(self._to_snowflake(after, high=True), self._to_snowflake(before, high=False))
+        if len(windows) == 1:
+            lower_id, upper_id = windows[0]
+            async for message in self._walk(channel, lower_id, upper_id):
+                yield message
+            return
+
+        queues = [asyncio.Queue(maxsize=self.buffer_size) for _ in windows]
+        tasks = [
+            asyncio.create_task(self._fill(channel, lower_id, upper_id, queue))
+            for (lower_id, upper_id), queue in zip(windows, queues)
+        ]
+        try:
+            for queue in queues:
+                while True:
+                    item = await queue.get()
+                    if item is _DONE:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fill(self, channel: discord.abc.Messageable, lower_id: int, upper_id: int, queue: asyncio.Queue):
+        """하위 구간을 읽어 큐에 넣기 (오류도 큐로 전달해 순서대로 합칠 때 발생시킴)"""
+        try:
+            async for message in self._walk(channel, lower_id, upper_id):
+                await queue.put(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(_DONE)
+
+    async def _walk(self, channel: discord.abc.Messageable, lower_id: int,
+                    upper_id: int) -> AsyncIterator[discord.Message]:
+        """하위 구간을 한 페이지씩 요청 예산 안에서 읽기"""
+        cursor = lower_id
+        while True:
+            async with self.budget.slot():
+                page = [
+                    message async for message in channel.history(
+                        after=discord.Object(id=cursor), before=discord.Object(id=upper_id),
+                        limit=self.PAGE_SIZE, oldest_first=True
+                    )
+                ]
+            for message in page:
+                yield message
+            if len(page) < self.PAGE_SIZE:
+                return
+            cursor = page[-1].id
@@ -0,0 +1,140 @@
+"""
+공휴일 달력 색인 모듈
+"""
+import datetime
+from array import array
+from typing import Dict, Iterable, Tuple, Union
+
+DateLike = Union[datetime.date, str]
+
+class HolidayCalendar:
+    """
+    연도별 비트셋 기반 공휴일 색인
+    
+    한 해를 일자(day-of-year) 비트셋으로 표현해 공휴일 여부를 O(1)로 확인하고,
+    연도별 영업일 누적합으로 영업일 수 계산을 O(연도 수)로 처리합니다.
+    생성 후에는 변경하지 않으며, 공휴일이 바뀌면 새로 만들어 교체합니다.
+    """
+    
+    def __init__(self, holidays: Iterable[DateLike] = (), weekend_days: Tuple[int, ...] = (5, 6)):
+        """
+        달력 색인 생성
+        
+        Args:
+            holidays: 공휴일 날짜 (datetime.date 또는 YYYY-MM-DD 문자열)
+            weekend_days: 주말로 취급할 요일 (월: 0 ~ 일: 6)
+        """
+        self.weekend_days = frozenset(weekend_days)
+        self._year_start: Dict[int, int] = {}
+        self._bits: Dict[int, bytearray] = {}
+        self._business_prefix: Dict[int, array] = {}
+        self.count = 0
+        
+        for holiday in holidays:
+            date = self._to_date(holiday)
+            bits = self._bits.get(date.year)
+            if bits is None:
+                bits = self._bits[date.year] = bytearray(46)  # 366비트
+            index = self._day_index(date)
+            if not bits[index >> 3] & (1 << (index & 7)):
+                bits[index >> 3] |= 1 << (index & 7)
+                self.count += 1
+        
+        for year in self._bits:
+            self._business_prefix[year] = self._build_business_prefix(year)
+    
+    @staticmethod
+    def _to_date(value: DateLike) -> datetime.date:
+        if isinstance(value, str):
+            return datetime.date.fromisoformat(value.strip())
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        return value
+    
+    def _start_ordinal(self, year: int) -> int:
+        start = self._year_start.get(year)
+        if start is None:
+            start = self._year_start[year] = datetime.date(year, 1, 1).toordinal()
+        return start
+    
+    def _day_index(self, date: datetime.date) -> int:
+        """1월 1일 기준 0부터 시작하는 일자 인덱스"""
+        return date.toordinal() - self._start_ordinal(date.year)
+    
+    def _build_business_prefix(self, year: int) -> array:
+        """prefix[i] = 해당 연도 첫 i일 중 영업일 수"""
+        start = self._start_ordinal(year)
+        days = self._start_ordinal(year + 1) - start
+        bits = self._bits.get(year)
+        first_weekday = datetime.date(year, 1, 1).weekday()
+        
+        prefix = array('H', [0]) * (days + 1)
+        total = 0
+        for index in range(days):
+            is_weekend = (first_weekday + index) % 7 in self.weekend_days
+            is_holiday = bits is not None and bits[index >> 3] & (1 << (index & 7))
+            if not is_weekend and not is_holiday:
+                total += 1
+            prefix[index + 1] = total
+        return prefix
+    
+    def _prefix_for(self, year: int) -> array:
+        prefix = self._business_prefix.get(year)
+        if prefix is None:
+            # 공휴일이 없는 연도는 주말만 반영해 필요할 때 계산 (결과는 항상 동일)
+            prefix = self._business_prefix[year] = self._build_business_prefix(year)
+        return prefix
+    
+    def is_holiday(self, date: DateLike) -> bool:
+        """공휴일 여부 확인 (O(1))"""
+        date = self._to_date(date)
+        bits = self._bits.get(date.year)
+        if bits is None:
+            return False
+        index = self._day_index(date)
+        return bool(bits[index >> 3] & (1 << (index & 7)))
+    
+    def is_business_day(self, date: DateLike) -> bool:
+        """영업일(주말/공휴일이 아닌 날) 여부 확인"""
+        date = self._to_date(date)
+        return date.weekday() not in self.weekend_days and not self.is_holiday(date)
+    
+    def next_business_day(self, date: DateLike, include_start: bool = False) -> datetime.date:
+        """
+        다음 영업일 반환
+        
+        Args:
+            date: 기준 날짜
+            include_start: True면 기준 날짜가 영업일일 때 그대로 반환
+        """
+        current = self._to_date(date)
+        if not include_start:
+            current += datetime.timedelta(days=1)
+        while not self.is_business_day(current):
+            current += datetime.timedelta(days=1)
+        return current
+    
+    def business_days_between(self, start: DateLike, end: DateLike) -> int:
+        """
+        [start, end) 구간의 영업일 수 (end는 포함하지 않음)
+        
+        Returns:
+            영업일 수 (end <= start이면 0)
+        """
+        start, end = self._to_date(start), self._to_date(end)
+        if end <= start:
+            return 0
+        
+        total = 0
+        for year in range(start.year, end.year + 1):
+            prefix = self._prefix_for(year)
+            low = self._day_index(start) if year == start.year else 0
+            high = self._day_index(end) if year == end.year else len(prefix) - 1
+            total += prefix[high] - prefix[low]
+        return total
+    
+    def __contains__(self, date: DateLike) -> bool:
+        return self.is_holiday(date)
+    
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,184 @@
+"""
+인증 메시지 수집 대기열 모듈
+
+on_message가 인증 처리(반응, DB 저장, 응답 메시지)를 끝까지 기다리면 마감 직전처럼 인증이 몰릴 때
+느린 디스코드 API 호출 뒤로 이벤트가 줄을 섭니다. 메시지를 접수하면 ⏳ 반응만 바로 보내고,
+저장과 응답은 작업자들이 대기열에서 꺼내 처리합니다.
+
+같은 사용자의 메시지는 항상 같은 작업자 대기열로 보내 순서대로 처리합니다. 대기열이 가득 차면
+제한 시간까지 자리가 나기를 기다리고(역압), 그래도 자리가 없으면 접수하지 않고 사용자에게
+지연을 알립니다. 접수하지 못한 메시지는 다음 체크의 채널 기록 확인에서 저장됩니다.
+"""
+import time
+import asyncio
+from typing import Dict, List, Optional
+import discord
+from logging_utils import get_logger
+
+logger = get_logger()
+
+
+class _IngestItem:
+    """대기열 항목 (메시지, ⏳ 반응 작업, 접수 완료 이벤트, 접수 시각)"""
+    __slots__ = ('message', 'acknowledgement', 'accepted', 'enqueued_at')
+
+    def __init__(self, message: discord.Message):
+        self.message = message
+        self.acknowledgement: Optional[asyncio.Task] = None
+        self.accepted = asyncio.Event()
+        self.enqueued_at = time.perf_counter()
+
+
+class VerificationIngestQueue:
+    """사용자별 순서를 지키는 인증 메시지 수집 대기열과 작업자"""
+
+    def __init__(self, verification_service, workers: int = 4, queue_size: int = 1000,
+                 enqueue_timeout: float = 2.0):
+        """
+        Args:
+            verification_service: 접수한 메시지를 처리할 인증 서비스
+            workers: 작업자 수 (사용자 ID로 작업자를 정해 사용자별 순서 유지)
+            queue_size: 모든 작업자 대기열을 합친 최대 대기 메시지 수
+            enqueue_timeout: 대기열이 가득 찼을 때 자리가 나기를 기다리는 최대 시간 (초)
+        """
+        self.verification_service = verification_service
+        self.workers = max(1, int(workers))
+        self.queue_size = max(self.workers, int(queue_size))
+        self.enqueue_timeout = max(0.0, float(enqueue_timeout))
+
+        self._queues: List[asyncio.Queue] = []
+        self._worker_tasks: List[asyncio.Task] = []
+        self._closed = False
+
+        # 통계 카운터
+        self.accepted = 0
+        self.processed = 0
+        self.duplicates = 0
+        self.overflowed = 0
+        self.backpressured = 0
+        self.backpressure_seconds = 0.0
+        self.max_depth = 0
+        self.total_latency = 0.0
+        self._reported_overflowed = 0
+
+    @classmethod
+    def from_config(cls, config, verification_service) -> 'VerificationIngestQueue':
+        """설정값으로 대기열 생성"""
+        return cls(
+            verification_service,
+            workers=config.INGEST_WORKERS,
+            queue_size=config.INGEST_QUEUE_SIZE,
+            enqueue_timeout=config.INGEST_ENQUEUE_TIMEOUT
+        )
+
+    @property
+    def depth(self) -> int:
+        """처리를 기다리는 메시지 수"""
+        return sum(queue.qsize() for queue in self._queues)
+
+    def _start(self):
+        """작업자 시작 (이벤트 루프 안에서 처음 접수할 때)"""
+        per_worker = max(1, self.queue_size // self.workers)
+        self._queues = [asyncio.Queue(maxsize=per_worker) for _ in range(self.workers)]
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(queue), name=f"verification-ingest-{index}")
+            for index, queue in enumerate(self._queues)
+        ]
+
+    async def submit(self, message: discord.Message) -> bool:
+        """
+        인증 메시지 접수 (대기열에 넣은 뒤 ⏳ 반응을 보내고 바로 반환)
+
+        Returns:
+            접수 여부 (중복 이벤트, 대기열 초과, 종료 이후면 False)
+        """
+        if self._closed:
+            logger.warning(f"종료 중이라 인증 메시지를 접수하지 않음: {message.id}")
+            return False
+        if not self.verification_service.accept_message(message):
+            self.duplicates += 1
+            return False
+        if not self._worker_tasks:
+            self._start()
+
+        queue = self._queues[message.author.id % self.workers]
+        item = _IngestItem(message)
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.backpressured += 1
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(queue.put(item), self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                self.overflowed += 1
+                # 접수하지 않은 메시지는 다시 받으면 처리하도록 최근 ID에서 제거
+                self.verification_service.recent_message_ids.discard(message.id)
+                logger.warning(
+                    f"인증 대기열이 가득 차 메시지를 접수하지 못함: {message.id} "
+                    f"(대기 {self.depth}건, 누적 초과 {self.overflowed}건, 다음 체크의 채널 기록 확인에서 저장)"
+                )
+                await self.verification_service.notify_deferred(message)
+                return False
+            finally:
+                self.backpressure_seconds += time.perf_counter() - started
+
+        # 작업자는 반응을 지우기 전에 이 작업을 기다림
+        item.acknowledgement = asyncio.create_task(self.verification_service.acknowledge(message))
+        item.accepted.set()
+        self.accepted += 1
+        self.max_depth = max(self.max_depth, self.depth)
+        return True
+
+    async def _worker(self, queue: asyncio.Queue):
+        """대기열의 메시지를 하나씩 저장하고 응답"""
+        while True:
+            item = await queue.get()
+            try:
+                # 자리가 나기를 기다린 항목은 ⏳ 반응 작업을 붙이기 전에 꺼낼 수 있음
+                await item.accepted.wait()
+                await self.verification_service.complete_verification(item.message, item.acknowledgement)
+            except Exception as e:
+                logger.error(f"인증 대기열 처리 중 오류: {e}", exc_info=True)
+            finally:
+                self.processed += 1
+                self.total_latency += time.perf_counter() - item.enqueued_at
+                queue.task_done()
+
+    def get_stats(self) -> Dict[str, float]:
+        """대기열 깊이, 역압, 초과, 처리 지연 시간 통계 반환"""
+        return {
+            'workers': self.workers,
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'accepted': self.accepted,
+            'processed': self.processed,
+            'duplicates': self.duplicates,
+            'overflowed': self.overflowed,
+            'backpressured': self.backpressured,
+            'backpressure_wait_ms': self.backpressure_seconds * 1000,
+            'avg_latency_ms': self.total_latency / self.processed * 1000 if self.processed else 0.0
+        }
+
+    def log_stats(self):
+        """통계를 로그로 남김 (지난 기록 이후 접수하지 못한 메시지가 있으면 경고)"""
+        stats = self.get_stats()
+        overflowed = self.overflowed - self._reported_overflowed
+        self._reported_overflowed = self.overflowed
+        if overflowed:
+            logger.warning(f"인증 대기열 통계 (지난 기록 이후 초과 {overflowed}건): {stats}")
+        else:
+            logger.info(f"인증 대기열 통계: {stats}")
+
+    async def close(self, timeout: float = 30.0):
+        """종료 훅: 접수를 멈추고 대기 중인 메시지를 처리한 뒤 작업자 종료"""
+        self._closed = True
+        if self._worker_tasks:
+            try:
+                await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in self._queues)), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"인증 대기열 종료 제한 시간 초과: 처리하지 못한 메시지 {self.depth}건")
+            for task in self._worker_tasks:
+                task.cancel()
+            await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        logger.info(f"인증 대기열 종료: {self.get_stats()}")
@@ -0,0 +1,292 @@
+"""
+길드 멤버 명단 관리 모듈
+
+체크마다 guild.fetch_members()로 길드 전체를 REST로 훑는 대신, 시작할 때 게이트웨이 청크로 받은
+멤버 캐시에서 한 번 명단을 만들고 이후에는 멤버 입장/퇴장/변경 이벤트로 갱신합니다.
+이벤트를 놓친 경우에 대비해 주기적으로 캐시와 다시 맞춥니다 (REST 호출 없음).
+
+체크 대상은 봇이 아닌 멤버 중 설정한 참가자 역할을 가진 멤버(역할 설정 시)와 인증 채널을 볼 수
+있는 멤버(채널 권한 조건 사용 시)입니다. 채널 보기 권한은 멤버마다 계산하지 않고, 권한에 영향을
+주는 역할 조합별로 한 번만 계산해 캐시합니다. 역할 권한이나 채널 권한 덮어쓰기가 바뀔 때만
+명단 전체를 다시 계산합니다.
+"""
+import asyncio
+from typing import AbstractSet, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+import discord
+from logging_utils import get_logger
+
+logger = get_logger()
+
+
+class _ChannelAccess:
+    """한 채널의 보기 권한 계산기 (권한 덮어쓰기를 미리 정리하고 역할 조합별 결과 캐시)"""
+
+    def __init__(self, guild: discord.Guild, channel: discord.abc.GuildChannel):
+        self.guild = guild
+        self.role_overwrites: Dict[int, Optional[bool]] = {}
+        self.member_overwrites: Dict[int, Optional[bool]] = {}
+        for target, overwrite in channel.overwrites.items():
+            is_role = isinstance(target, discord.Role) or getattr(target, 'type', None) is discord.Role
+            (self.role_overwrites if is_role else self.member_overwrites)[target.id] = overwrite.view_channel
+
+        # 결과에 영향을 주는 역할: 서버 권한으로 보기/관리자 권한을 주거나 채널 덮어쓰기가 있는 역할
+        self.relevant_roles: FrozenSet[int] = frozenset(
+            role.id for role in guild.roles
+            if role.permissions.administrator or role.permissions.view_channel or role.id in self.role_overwrites
+        )
+        self._cache: Dict[Tuple[FrozenSet[int], Optional[int]], bool] = {}
+
+    def can_view(self, member: discord.Member) -> bool:
+        """멤버가 채널을 볼 수 있는지 확인 (같은 역할 조합은 캐시 사용)"""
+        role_ids = frozenset(role.id for role in member.roles) & self.relevant_roles
+        # 멤버별 덮어쓰기가 있거나 서버 소유자면 그 멤버만의 결과
+        personal = member.id if member.id in self.member_overwrites or member.id == self.guild.owner_id else None
+        key = (role_ids, personal)
+        if key not in self._cache:
+            self._cache[key] = self._evaluate(role_ids, personal)
+        return self._cache[key]
+
+    def _evaluate(self, role_ids: FrozenSet[int], member_id: Optional[int]) -> bool:
+        """디스코드 권한 계산 순서 (서버 권한 → @everyone → 역할 → 멤버 덮어쓰기)"""
+        if member_id is not None and member_id == self.guild.owner_id:
+            return True
+        permissions = self.guild.default_role.permissions.value
+        for role_id in role_ids:
+            role = self.guild.get_role(role_id)
+            if role is not None:
+                permissions |= role.permissions.value
+        permissions = discord.Permissions(permissions)
+        if permissions.administrator:
+            return True
+
+        can_view = permissions.view_channel
+        everyone = self.role_overwrites.get(self.guild.id)
+        if everyone is not None:
+            can_view = everyone
+        role_values = {self.role_overwrites.get(role_id) for role_id in role_ids if role_id != self.guild.id}
+        if False in role_values:
+            can_view = False
+        if True in role_values:
+            can_view = True
+        personal = self.member_overwrites.get(member_id) if member_id is not None else None
+        if personal is not None:
+            can_view = personal
+        return can_view
+
+
+class RosterFilter:
+    """체크 대상 조건 (봇 제외, 참가자 역할, 인증 채널 보기 권한)"""
+
+    def __init__(self, role_ids: Iterable[int] = (), channel_id: Optional[int] = None):
+        """
+        Args:
+            role_ids: 참가자 역할 ID (비어 있으면 역할 조건 없음)
+            channel_id: 보기 권한을 확인할 채널 ID (None이면 권한 조건 없음)
+        """
+        self.role_ids: FrozenSet[int] = frozenset(role_ids)
+        self.channel_id = channel_id
+        self._access: Dict[int, Optional[_ChannelAccess]] = {}  # 길드 ID -> 채널 권한 계산기
+
+    def invalidate(self, guild_id: int) -> None:
+        """역할/채널 권한 변경 후 캐시한 권한 계산 결과 폐기"""
+        self._access.pop(guild_id, None)
+
+    def _channel_access(self, guild: discord.Guild) -> Optional[_ChannelAccess]:
+        if self.channel_id is None:
+            return None
+        if guild.id not in self._access:
+            channel = guild.get_channel(self.channel_id)
+            # 인증 채널이 없는 길드에는 권한 조건을 적용하지 않음
+            self._access[guild.id] = _ChannelAccess(guild, channel) if channel is not None else None
+        return self._access[guild.id]
+
+    def matches(self, member: discord.Member) -> bool:
+        """멤버 한 명이 조건을 만족하는지 확인 (이벤트 반영용)"""
+        if member.bot:
+            return False
+        if self.role_ids and self.role_ids.isdisjoint(role.id for role in member.roles):
+            return False
+        access = self._channel_access(member.guild)
+        return access is None or access.can_view(member)
+
+    def compute(self, guild: discord.Guild) -> Set[int]:
+        """
+        길드 전체 명단 계산 (참가자 역할 멤버 목록의 합집합에서 봇과 채널을 볼 수 없는 멤버 제외)
+
+        Args:
+            guild: 길드
+
+        Returns:
+            체크 대상 멤버 ID 집합
+        """
+        if self.role_ids:
+            candidates: Dict[int, discord.Member] = {}
+            for role_id in self.role_ids:
+                role = guild.get_role(role_id)
+                if role is not None:
+                    candidates.update((member.id, member) for member in role.members)
+            members: Iterable[discord.Member] = candidates.values()
+        else:
+            members = guild.members
+        access = self._channel_access(guild)
+        return {
+            member.id for member in members
+            if not member.bot and (access is None or access.can_view(member))
+        }
+
+
+class MemberRosterService:
+    """길드별 체크 대상 멤버 ID 명단"""
+
+    def __init__(self, config, roster_filter: Optional[RosterFilter] = None):
+        self.config = config
+        self.filter = roster_filter or RosterFilter(
+            config.ROSTER_PARTICIPANT_ROLES,
+            config.ALLOWED_CHANNELS[0] if config.ROSTER_REQUIRE_CHANNEL_ACCESS and config.ALLOWED_CHANNELS else None
+        )
+        self._eligible: Dict[int, Set[int]] = {}  # 길드 ID -> 체크 대상 멤버 ID
+        self._seed_locks: Dict[int, asyncio.Lock] = {}
+
+    def is_ready(self, guild_id: int) -> bool:
+        """길드 명단이 만들어졌는지 확인"""
+        return guild_id in self._eligible
+
+    def eligible_ids(self, guild_id: int) -> AbstractSet[int]:
+        """
+        체크 대상 멤버 ID 집합 (복사하지 않은 읽기 전용 뷰)
+
+        Args:
+            guild_id: 길드 ID
+
+        Returns:
+            멤버 ID 집합 (명단이 없으면 빈 집합)
+        """
+        return self._eligible.get(guild_id, frozenset())
+
+    def eligible_members(self, guild: discord.Guild, exclude: Iterable[int] = ()) -> List[discord.Member]:
+        """
+        체크 대상 멤버 객체 목록 (멤버 캐시에서 조회)
+
+        Args:
+            guild: 길드
+            exclude: 제외할 멤버 ID (예: 인증한 사용자)
+
+        Returns:
+            멤버 목록 (캐시에 없는 멤버는 제외)
+        """
+        member_ids = self.eligible_ids(guild.id) - set(exclude)
+        members = [guild.get_member(member_id) for member_id in member_ids]
+        return [member for member in members if member is not None]
+
+    async def seed(self, guild: discord.Guild) -> int:
+        """
+        게이트웨이 멤버 청크로 길드 명단 생성 (이미 만들었으면 그대로 사용)
+
+        Args:
+            guild: 길드
+
+        Returns:
+            체크 대상 멤버 수
+        """
+        lock = self._seed_locks.setdefault(guild.id, asyncio.Lock())
+        async with lock:
+            if self.is_ready(guild.id):
+                return len(self._eligible[guild.id])
+            if not guild.chunked:
+                await guild.chunk()
+            self._eligible[guild.id] = self.filter.compute(guild)
+            logger.info(f"멤버 명단 생성: {guild.name} ({len(self._eligible[guild.id])}명)")
+            return len(self._eligible[guild.id])
+
+    async def seed_all(self, guilds: Iterable[discord.Guild]) -> None:
+        """봇이 속한 모든 길드의 명단 생성 (실패한 길드는 체크 때 REST로 대체)"""
+        for guild in guilds:
+            try:
+                await self.seed(guild)
+            except Exception as e:
+                logger.error(f"멤버 명단 생성 오류 ({guild.name}): {e}", exc_info=True)
+
+    def recompute(self, guild: discord.Guild) -> None:
+        """역할/채널 권한 변경 후 길드 명단 다시 계산"""
+        if not self.is_ready(guild.id):
+            return
+        self.filter.invalidate(guild.id)
+        eligible = self.filter.compute(guild)
+        logger.info(f"멤버 명단 재계산: {guild.name} ({len(self._eligible[guild.id])}명 → {len(eligible)}명)")
+        self._eligible[guild.id] = eligible
+
+    def on_member_join(self, member: discord.Member) -> None:
+        """멤버 입장 반영"""
+        self.on_member_update(None, member)
+
+    def on_member_remove(self, guild_id: int, user_id: int) -> None:
+        """멤버 퇴장 반영 (캐시에 없던 멤버도 처리하도록 ID로 받음)"""
+        eligible = self._eligible.get(guild_id)
+        if eligible is not None:
+            eligible.discard(user_id)
+
+    def on_member_update(self, before, after: discord.Member) -> None:
+        """멤버 변경 반영 (역할이 바뀐 멤버 한 명만 조건 확인 후 추가 또는 제거)"""
+        eligible = self._eligible.get(after.guild.id)
+        if eligible is None:
+            return
+        if self.filter.matches(after):
+            eligible.add(after.id)
+        else:
+            eligible.discard(after.id)
+
+    def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        """역할 권한이 바뀌어 채널 보기 권한이 달라질 수 있으면 명단 재계산"""
+        if self.filter.channel_id is not None and before.permissions != after.permissions:
+            self.recompute(after.guild)
+
+    def on_guild_role_delete(self, role: discord.Role) -> None:
+        """조건에 쓰이는 역할이 삭제되면 명단 재계산"""
+        if self.filter.channel_id is not None or role.id in self.filter.role_ids:
+            self.recompute(role.guild)
+
+    def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        """인증 채널의 권한 덮어쓰기가 바뀌면 명단 재계산"""
+        if after.id == self.filter.channel_id and before.overwrites != after.overwrites:
+            self.recompute(after.guild)
+
+    async def reconcile(self, guild: discord.Guild) -> int:
+        """
+        멤버 캐시와 명단 비교 후 차이 보정 (배치 사이에 양보해 이벤트 처리를 막지 않음)
+
+        Args:
+            guild: 길드
+
+        Returns:
+            보정한 멤버 수
+        """
+        if not self.is_ready(guild.id):
+            await self.seed(guild)
+            return 0
+
+        # 캐시와 명단을 같은 시점에 떠 두고 비교 (양보하는 동안 들어온 이벤트는 되돌리지 않음)
+        batch_size = self.config.ROSTER_RECONCILE_BATCH_SIZE
+        self.filter.invalidate(guild.id)
+        eligible = self._eligible[guild.id]
+        snapshot = set(eligible)
+        actual: Set[int] = set()
+        for index, member in enumerate(list(guild.members), start=1):
+            if self.filter.matches(member):
+                actual.add(member.id)
+            if index % batch_size == 0:
+                await asyncio.sleep(0)
+
+        added, removed = actual - snapshot, snapshot - actual
+        if added or removed:
+            eligible |= added
+            eligible -= removed
+            logger.warning(f"멤버 명단 보정: {guild.name} (추가 {len(added)}명, 제거 {len(removed)}명)")
+        return len(added) + len(removed)
+
+    async def reconcile_all(self, guilds: Iterable[discord.Guild]) -> None:
+        """모든 길드 명단 보정"""
+        for guild in guilds:
+            try:
+                await self.reconcile(guild)
+            except Exception as e:
+                logger.error(f"멤버 명단 보정 오류 ({guild.name}): {e}", exc_info=True)
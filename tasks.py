@@ -1,6 +1,7 @@
 """
 봇 태스크 스케줄링 모듈
 """
+import asyncio
 import datetime
 from discord.ext import tasks
 import threading
@@ -20,20 +21,25 @@ class TaskManager:
                     cls._instance = super(TaskManager, cls).__new__(cls)
         return cls._instance
     
-    def __init__(self, bot=None, config=None, verification_service=None):
+    def __init__(self, bot=None, config=None, verification_service=None, ingest_queue=None):
         # 스레드 안전한 초기화 체크
         if not hasattr(self, '_initialized'):
             with self._lock:
                 if not hasattr(self, '_initialized'):
-                    self._initialize(bot, config, verification_service)
+                    self._initialize(bot, config, verification_service, ingest_queue)
     
-    def _initialize(self, bot, config, verification_service):
+    def _initialize(self, bot, config, verification_service, ingest_queue=None):
         """내부 초기화 메서드"""
         self.bot = bot
         self.config = config
         self.verification_service = verification_service
+        self.ingest_queue = ingest_queue
         self.daily_check_task = None
         self.yesterday_check_task = None
+        self.archive_task = None
+        self.backup_task = None
+        self.roster_reconcile_task = None
+        self.ingest_stats_task = None
         self._tasks_started = False
         self._tasks_setup = False
         self._initialized = True
@@ -83,6 +89,70 @@ class TaskManager:
             # 태스크 참조 저장
             self.daily_check_task = check_daily_verification
             self.yesterday_check_task = check_yesterday_verification
+            
+            # 보관 기능이 켜진 경우에만 오래된 인증 기록 이동 태스크 설정
+            archiver = getattr(self.config, 'verification_archiver', None)
+            if archiver is not None:
+                @tasks.loop(hours=self.config.ARCHIVE_INTERVAL_HOURS)
+                async def archive_old_verifications():
+                    try:
+                        await archiver.run_async(self.config.db_executor)
+                    except Exception as e:
+                        logger.error(f"인증 기록 보관 작업 오류: {e}", exc_info=True)
+                
+                @archive_old_verifications.before_loop
+                async def before_archive():
+                    await self.bot.wait_until_ready()
+                    logger.info("Verification archive task ready")
+                
+                self.archive_task = archive_old_verifications
+            
+            # 주기적 온라인 백업 (관리자 명령어로도 실행 가능)
+            if getattr(self.config, 'BACKUP_ENABLED', False):
+                @tasks.loop(hours=self.config.BACKUP_INTERVAL_HOURS)
+                async def backup_database():
+                    try:
+                        await self.config.database_backup.create_snapshot_async()
+                    except Exception as e:
+                        logger.error(f"정기 백업 오류: {e}", exc_info=True)
+                
+                @backup_database.before_loop
+                async def before_backup():
+                    await self.bot.wait_until_ready()
+                    logger.info("Database backup task ready")
+                
+                self.backup_task = backup_database
+            
+            # 이벤트로 관리하는 멤버 명단을 캐시와 주기적으로 다시 맞춤 (놓친 이벤트 보정)
+            roster_service = getattr(self.verification_service, 'roster_service', None)
+            if roster_service is not None:
+                @tasks.loop(minutes=self.config.ROSTER_RECONCILE_MINUTES)
+                async def reconcile_roster():
+                    await roster_service.reconcile_all(self.bot.guilds)
+                
+                @reconcile_roster.before_loop
+                async def before_reconcile():
+                    await self.bot.wait_until_ready()
+                    # 시작 직후에는 명단 생성 작업이 있으므로 한 주기 뒤부터 보정
+                    await asyncio.sleep(self.config.ROSTER_RECONCILE_MINUTES * 60)
+                    logger.info("Member roster reconcile task ready")
+                
+                self.roster_reconcile_task = reconcile_roster
+            
+            # 인증 메시지 접수 대기열 통계 (깊이, 역압, 초과, 지연 시간)
+            stats_minutes = getattr(self.config, 'INGEST_STATS_LOG_MINUTES', 0)
+            if self.ingest_queue is not None and stats_minutes > 0:
+                @tasks.loop(minutes=stats_minutes)
+                async def log_ingest_stats():
+                    self.ingest_queue.log_stats()
+                
+                @log_ingest_stats.before_loop
+                async def before_ingest_stats():
+                    await self.bot.wait_until_ready()
+                    await asyncio.sleep(stats_minutes * 60)
+                    logger.info("Ingest queue stats task ready")
+                
+                self.ingest_stats_task = log_ingest_stats
             self._tasks_setup = True
             
             logger.info("Task setup completed")
@@ -109,6 +179,14 @@ class TaskManager:
             if self.daily_check_task and self.yesterday_check_task:
                 self.daily_check_task.start()
                 self.yesterday_check_task.start()
+                if self.archive_task:
+                    self.archive_task.start()
+                if self.backup_task:
+                    self.backup_task.start()
+                if self.roster_reconcile_task:
+                    self.roster_reconcile_task.start()
+                if self.ingest_stats_task:
+                    self.ingest_stats_task.start()
                 self._tasks_started = True
                 logger.info("All tasks started successfully")
             else:
@@ -129,6 +207,14 @@ class TaskManager:
                 self.daily_check_task.cancel()
             if self.yesterday_check_task:
                 self.yesterday_check_task.cancel()
+            if self.archive_task:
+                self.archive_task.cancel()
+            if self.backup_task:
+                self.backup_task.cancel()
+            if self.roster_reconcile_task:
+                self.roster_reconcile_task.cancel()
+            if self.ingest_stats_task:
+                self.ingest_stats_task.cancel()
             
             self._tasks_started = False
             logger.info("All tasks stopped")
@@ -143,5 +229,11 @@ class TaskManager:
             'tasks_setup': self._tasks_setup,
             'tasks_started': self._tasks_started,
             'daily_task_running': self.daily_check_task.is_running() if self.daily_check_task else False,
-            'yesterday_task_running': self.yesterday_check_task.is_running() if self.yesterday_check_task else False
+            'yesterday_task_running': self.yesterday_check_task.is_running() if self.yesterday_check_task else False,
+            'archive_task_running': self.archive_task.is_running() if self.archive_task else False,
+            'backup_task_running': self.backup_task.is_running() if self.backup_task else False,
+            'roster_reconcile_task_running': (
+                self.roster_reconcile_task.is_running() if self.roster_reconcile_task else False
+            ),
+            'ingest_stats_task_running': self.ingest_stats_task.is_running() if self.ingest_stats_task else False
         } 
\ No newline at end of file
@@ -19,6 +19,7 @@ from time_utils import TimeUtility
 from message_utils import MessageUtility
 from webhook_service import WebhookService
 from verification_service import VerificationService
+from db import DatabaseManager
 
 @pytest.fixture
 def temp_config_file():
@@ -108,6 +109,13 @@ def config_manager(temp_config_file, temp_holidays_file):
     
     return config
 
+@pytest.fixture
+def db_manager(tmp_path):
+    """임시 파일 기반 데이터베이스 매니저 픽스처"""
+    manager = DatabaseManager(str(tmp_path / "test_bot.db"), pool_size=2)
+    yield manager
+    manager.close()
+
 @pytest.fixture
 def time_util(config_manager):
     """시간 유틸리티 픽스처"""
@@ -0,0 +1,111 @@
+"""
+인증 기록 보관(아카이브) 테스트
+"""
+import datetime
+import sqlite3
+from db import VerificationArchiver, VerificationManager
+from db.archive import archive_path, decompress_text, list_archive_years
+
+TODAY = datetime.date(2025, 6, 1)
+
+def _add_days(verification_manager, user_id, days):
+    for day in days:
+        verification_manager.add_verification(
+            user_id, "user", f"{day} 인증", [f"https://a/{day}.png"],
+            datetime.datetime.combine(day, datetime.time(9, 0))
+        )
+
+def test_archive_moves_old_rows_per_year(db_manager, tmp_path):
+    """보존 기간이 지난 기록만 연도별 파일로 이동 (내용 압축, 첨부 파일 포함)"""
+    archive_dir = str(tmp_path / "archive")
+    verification_manager = VerificationManager(db_manager, archive_dir=archive_dir)
+    _add_days(verification_manager, "1", [
+        datetime.date(2024, 12, 30), datetime.date(2025, 1, 2), datetime.date(2025, 5, 30)
+    ])
+
+    archiver = VerificationArchiver(db_manager, archive_dir, retention_days=30, chunk_size=1, pause=0)
+    assert archiver.run(today=TODAY) == 2
+    assert list_archive_years(archive_dir) == [2024, 2025]
+
+    with db_manager.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM verifications").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM verification_attachments").fetchone()[0] == 1
+
+    archive_conn = sqlite3.connect(archive_path(archive_dir, 2024))
+    content, = archive_conn.execute("SELECT message_content FROM archived_verifications").fetchone()
+    archive_conn.close()
+    assert isinstance(content, bytes)
+    assert decompress_text(content) == "2024-12-30 인증"
+
+    # 다시 실행해도 옮길 기록 없음
+    assert archiver.run(today=TODAY) == 0
+
+def test_history_reads_span_archive_and_hot(db_manager, tmp_path):
+    """아카이브와 운영 DB에 걸친 조회 및 키셋 페이지"""
+    archive_dir = str(tmp_path / "archive")
+    verification_manager = VerificationManager(db_manager, archive_dir=archive_dir)
+    days = [datetime.date(2024, 12, 1) + datetime.timedelta(days=i * 20) for i in range(10)]
+    _add_days(verification_manager, "1", days)
+    expected = verification_manager.get_user_verifications("1")
+
+    VerificationArchiver(db_manager, archive_dir, retention_days=60, pause=0).run(today=TODAY)
+    with db_manager.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM verifications").fetchone()[0] == 3
+
+    records = verification_manager.get_user_verifications("1")
+    assert [record.id for record in records] == [record.id for record in expected]
+    assert records[-1].message_content == "2024-12-01 인증"
+    assert records[-1].image_urls == ["https://a/2024-12-01.png"]
+
+    ids, cursor = [], None
+    while True:
+        page = verification_manager.get_user_verifications_page("1", cursor=cursor, limit=4)
+        ids.extend(record.id for record in page.records)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert ids == [record.id for record in expected]
+
+    assert len(verification_manager.get_verifications_by_date(days[0])) == 1
+    # 아카이브 경로를 모르는 매니저는 운영 DB만 조회
+    assert len(VerificationManager(db_manager).get_user_verifications("1")) == 3
+
+def test_interrupted_archive_does_not_duplicate(db_manager, tmp_path):
+    """아카이브에 쓴 뒤 삭제 전에 중단되어도 조회 결과가 중복되지 않고 재실행으로 정리"""
+    archive_dir = str(tmp_path / "archive")
+    verification_manager = VerificationManager(db_manager, archive_dir=archive_dir)
+    _add_days(verification_manager, "1", [datetime.date(2024, 1, 5), datetime.date(2025, 5, 30)])
+
+    archiver = VerificationArchiver(db_manager, archive_dir, retention_days=30, pause=0)
+    archiver._delete_archived = lambda ids: 0.0  # 삭제 단계 직전에 중단된 상황
+    archiver.archive_chunk(archiver.cutoff_date(TODAY))
+    archiver.close()
+    assert len(verification_manager.get_user_verifications("1")) == 2
+
+    del archiver._delete_archived
+    assert archiver.run(today=TODAY) == 1
+    assert len(verification_manager.get_user_verifications("1")) == 2
+
+def test_archive_keeps_message_id_and_upgrades_old_files(db_manager, tmp_path):
+    """메시지 ID도 아카이브로 옮기고, 메시지 ID 컬럼이 없던 기존 아카이브 파일에는 컬럼 추가"""
+    archive_dir = tmp_path / "archive"
+    archive_dir.mkdir()
+    old_conn = sqlite3.connect(archive_path(str(archive_dir), 2024))
+    old_conn.execute("""
+        CREATE TABLE archived_verifications (
+            id INTEGER PRIMARY KEY, user_id TEXT NOT NULL, username TEXT NOT NULL, message_content BLOB,
+            verification_date TEXT NOT NULL, verification_time TEXT NOT NULL, created_at TIMESTAMP,
+            archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    old_conn.commit()
+    old_conn.close()
+
+    verification_manager = VerificationManager(db_manager, archive_dir=str(archive_dir))
+    verification_manager.add_verification("1", "user", "인증", ["https://a/1.png"],
+                                          datetime.datetime(2024, 12, 30, 9), message_id=1001)
+    assert VerificationArchiver(db_manager, str(archive_dir), retention_days=30, pause=0).run(today=TODAY) == 1
+
+    archive_conn = sqlite3.connect(archive_path(str(archive_dir), 2024))
+    assert archive_conn.execute("SELECT message_id FROM archived_verifications").fetchall() == [(1001,)]
+    archive_conn.close()
@@ -0,0 +1,83 @@
+"""
+비동기 데이터베이스 접근 계층 테스트
+"""
+import asyncio
+import datetime
+import threading
+import pytest
+from db import (
+    VacationManager, VerificationManager,
+    AsyncDatabaseExecutor, AsyncVacationManager, AsyncVerificationManager
+)
+
+@pytest.fixture
+def db_executor():
+    """DB 실행기 픽스처"""
+    executor = AsyncDatabaseExecutor(max_workers=1, queue_size=2)
+    yield executor
+    executor.shutdown()
+
+@pytest.mark.asyncio
+async def test_runs_off_event_loop_thread(db_executor):
+    """DB 작업이 이벤트 루프 스레드 밖에서 실행되는지 테스트"""
+    thread_name = await db_executor.run(lambda: threading.current_thread().name)
+    assert thread_name.startswith('db')
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded(db_executor):
+    """대기열 크기 제한 테스트"""
+    release = threading.Event()
+    
+    # queue_size(2)만큼 작업이 들어가면 세마포어가 잠겨야 함
+    tasks = [asyncio.create_task(db_executor.run(release.wait, 1)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    assert db_executor._semaphore.locked()
+    
+    release.set()
+    assert await asyncio.gather(*tasks) == [True, True, True]
+
+@pytest.mark.asyncio
+async def test_async_managers_roundtrip(db_manager, db_executor):
+    """비동기 매니저 조회/저장 테스트"""
+    vacation_manager = AsyncVacationManager(VacationManager(db_manager), db_executor)
+    verification_manager = AsyncVerificationManager(VerificationManager(db_manager), db_executor)
+    now = datetime.datetime(2025, 3, 3, 10, 0, 0)
+    
+    assert await vacation_manager.add_vacation("1", "2025-03-03")
+    assert await vacation_manager.is_user_on_vacation("1", now.date())
+    assert await verification_manager.add_verification("2", "user2", "인증", [], now)
+    assert await verification_manager.get_verified_users_on_date(now.date()) == {"2"}
+    
+    # 동기 API도 그대로 사용 가능해야 함
+    assert verification_manager.sync.has_user_verified_on_date("2", now.date())
+
+@pytest.mark.asyncio
+async def test_iter_user_verifications_keyset(db_manager, db_executor):
+    """키셋 페이지 스트리밍: 정렬 방향, 날짜 범위, 커서 재개"""
+    verification_manager = AsyncVerificationManager(VerificationManager(db_manager), db_executor)
+    base = datetime.datetime(2025, 3, 1, 9, 0, 0)
+    # 같은 시각의 기록도 ID로 구분되어야 함
+    records = [{
+        'user_id': "1", 'username': "user1", 'message_content': "인증", 'image_urls': [],
+        'verification_datetime': base + datetime.timedelta(days=i // 2)
+    } for i in range(7)]
+    assert await verification_manager.add_verifications_bulk(records)
+    
+    pages = [page async for page in verification_manager.iter_user_verification_pages("1", page_size=3)]
+    assert [len(page.records) for page in pages] == [3, 3, 1]
+    ids = [record.id for page in pages for record in page.records]
+    assert ids == sorted(ids, reverse=True)
+    
+    ascending = [r.id async for r in verification_manager.iter_user_verifications("1", page_size=2, descending=False)]
+    assert ascending == sorted(ids)
+    
+    # 첫 페이지 커서로 이어 읽기
+    resumed = [r.id async for r in verification_manager.iter_user_verifications("1", cursor=pages[0].next_cursor)]
+    assert resumed == ids[3:]
+    
+    bounded = [r.verification_date async for r in verification_manager.iter_user_verifications(
+        "1", start_date=datetime.date(2025, 3, 2), end_date=datetime.date(2025, 3, 3), descending=False)]
+    assert bounded == ["2025-03-02", "2025-03-02", "2025-03-03", "2025-03-03"]
+    
+    with pytest.raises(ValueError):
+        VerificationManager(db_manager).get_user_verifications_page("1", cursor=pages[0].next_cursor, descending=False)
@@ -0,0 +1,80 @@
+"""
+BackfillService 테스트
+"""
+import datetime
+import discord
+import pytest
+import pytz
+from unittest.mock import MagicMock
+from backfill_service import BackfillService
+from history_scanner import HistoryScanner
+from verification_service import VerificationService
+from db import (
+    AsyncBackfillJobManager, AsyncDatabaseExecutor, AsyncVerificationManager, BackfillJobManager,
+    VerificationManager
+)
+
+@pytest.mark.asyncio
+async def test_backfill_resumes_after_failure_without_duplicates(config_manager, mock_bot, message_util, time_util,
+                                                                 db_manager):
+    """저장 실패로 중단된 백필은 마지막으로 저장한 메시지 이후부터 이어서 진행하고 중복 저장하지 않음"""
+    config_manager.BACKFILL_BATCH_SIZE = 2
+    executor = AsyncDatabaseExecutor(max_workers=1)
+    verification_manager = VerificationManager(db_manager)
+    backfill_manager = AsyncBackfillJobManager(BackfillJobManager(db_manager, verification_manager), executor)
+    verification_service = VerificationService(
+        config_manager, mock_bot, message_util, time_util,
+        verification_manager=AsyncVerificationManager(verification_manager, executor)
+    )
+    service = BackfillService(config_manager, verification_service, backfill_manager, HistoryScanner(windows=2))
+    service.verification_service.message_util.is_valid_image = MagicMock(return_value=True)
+
+    kst = config_manager.TIMEZONE
+    messages = []
+    for index, (user_id, content) in enumerate([(1, "인증사진"), (2, "잡담"), (2, "인증사진"), (3, "인증사진"),
+                                                (4, "인증사진")]):
+        message = MagicMock()
+        message.author = MagicMock(id=user_id, bot=False)
+        message.author.name = f"user{user_id}"
+        message.content = content
+        # 하루 경계를 넘는 기간 (KST 3일 0시 ~ 4일 밤)
+        message.created_at = kst.localize(datetime.datetime(2025, 3, 3)).astimezone(pytz.utc) + \
+            datetime.timedelta(hours=index * 10)
+        message.id = discord.utils.time_snowflake(message.created_at)
+        message.attachments = [MagicMock(id=message.id, url=f"https://a/{message.id}.png",
+                                          content_type="image/png", size=1024)]
+        messages.append(message)
+
+    async def history(after, before, limit, oldest_first):
+        for message in [m for m in messages if after.id < m.id < before.id][:limit]:
+            yield message
+
+    channel = MagicMock()
+    channel.id = 42
+    channel.history = history
+
+    start, end = datetime.date(2025, 3, 3), datetime.date(2025, 3, 4)
+    save_progress = backfill_manager.save_progress
+    calls = []
+
+    async def failing_save(*args):
+        calls.append(args)
+        return -1 if len(calls) == 2 else await save_progress(*args)
+
+    backfill_manager.save_progress = failing_save
+    with pytest.raises(RuntimeError):
+        await service.run(channel, start, end)
+    assert verification_manager.get_verified_users_on_date(start) == {"1"}
+
+    backfill_manager.save_progress = save_progress
+    result = await service.run(channel, start, end)
+    assert result.resumed
+    assert (result.scanned, result.inserted) == (3, 3)
+    assert verification_manager.get_verified_users_on_date(start) == {"1", "2"}
+    assert verification_manager.get_verified_users_on_date(end) == {"3", "4"}
+
+    # 끝난 기간을 다시 실행해도 메시지 ID로 중복 제거
+    result = await service.run(channel, start, end)
+    assert (result.resumed, result.scanned, result.inserted) == (False, 5, 0)
+    assert len(verification_manager.get_verifications_by_date(start)) == 2
+    executor.shutdown()
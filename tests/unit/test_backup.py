@@ -0,0 +1,68 @@
+"""
+온라인 데이터베이스 백업 테스트
+"""
+import datetime
+import sqlite3
+import pytest
+from db import BackupError, DatabaseBackup, VerificationManager
+from db.backup import _ProgressTracker
+
+def _add_rows(db_manager, count):
+    verification_manager = VerificationManager(db_manager)
+    now = datetime.datetime(2025, 3, 3, 9, 0, 0)
+    verification_manager.add_verifications_bulk([
+        {'user_id': str(i), 'username': f"user{i}", 'message_content': "인증 " * 50,
+         'image_urls': [f"https://a/{i}.png"], 'verification_datetime': now}
+        for i in range(count)
+    ])
+
+def _count(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM verifications").fetchone()[0]
+    finally:
+        conn.close()
+
+def test_snapshot_in_steps_and_rotation(db_manager, tmp_path, monkeypatch):
+    """여러 단계로 복사한 스냅샷이 단일 파일로 검사를 통과하고 오래된 스냅샷은 삭제"""
+    _add_rows(db_manager, 500)
+    backup = DatabaseBackup(db_manager, str(tmp_path / "backups"), keep=2, pages_per_step=5, step_pause=0)
+
+    stamps = iter(datetime.datetime(2025, 3, 3, 12, 0, second) for second in range(3))
+    monkeypatch.setattr(backup, 'snapshot_path', lambda now=None: DatabaseBackup.snapshot_path(backup, next(stamps)))
+    results = [backup.create_snapshot() for _ in range(3)]
+
+    assert results[0].steps > 1
+    assert results[0].restarts == 0
+    assert results[-1].removed == [results[0].path]
+    assert backup.list_snapshots() == [results[1].path, results[2].path]
+    assert _count(results[-1].path) == 500
+
+    conn = sqlite3.connect(results[-1].path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'delete'
+    conn.close()
+
+def test_snapshot_falls_back_when_source_keeps_changing(db_manager, tmp_path, monkeypatch):
+    """복사 도중 원본이 바뀌면 재시작 한도 후 한 단계로 복사하고 변경 내용을 포함"""
+    _add_rows(db_manager, 500)
+    backup = DatabaseBackup(db_manager, str(tmp_path / "backups"), pages_per_step=5, step_pause=0, max_restarts=0)
+
+    original_call = _ProgressTracker.__call__
+
+    def write_during_copy(tracker, status, remaining, total):
+        if tracker.steps == 1:
+            _add_rows(db_manager, 1)
+        return original_call(tracker, status, remaining, total)
+
+    monkeypatch.setattr(_ProgressTracker, '__call__', write_during_copy)
+    result = backup.create_snapshot()
+
+    assert result.restarts == 1
+    assert _count(result.path) == 501
+
+def test_verify_rejects_corrupt_file(tmp_path):
+    """손상된 스냅샷은 무결성 검사에서 거부"""
+    path = tmp_path / "broken.db"
+    path.write_bytes(b"SQLite format 3\0" + b"\xff" * 4096)
+    with pytest.raises(BackupError):
+        DatabaseBackup.verify(str(path))
@@ -0,0 +1,424 @@
+"""
+데이터베이스 매니저 테스트
+"""
+import datetime
+import sqlite3
+import threading
+import pytest
+from db import (
+    BackfillJobManager, DailySummaryManager, DatabaseManager, HistoryCursorManager, HolidayManager,
+    VacationManager, VerificationManager
+)
+from db.schema import MIGRATIONS, migrate_schema
+
+def test_connection_pool_reuses_connection(db_manager):
+    """연결 풀 재사용 테스트"""
+    with db_manager.get_connection() as first:
+        pass
+    with db_manager.get_connection() as second:
+        pass
+    
+    # 같은 연결이 재사용되어야 함
+    assert first is second
+    assert db_manager.connections_created == 1
+
+def test_connection_pool_overflow(db_manager):
+    """풀 크기를 넘는 동시 대여 테스트"""
+    with db_manager.get_connection() as a, db_manager.get_connection() as b, db_manager.get_connection() as c:
+        assert len({id(a), id(b), id(c)}) == 3
+    
+    # 풀 크기(2)를 넘는 연결은 반환 시 닫혀야 함
+    assert db_manager._pool.qsize() == 2
+
+def test_pragmas_applied(db_manager):
+    """PRAGMA 설정 적용 테스트"""
+    with db_manager.get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == 'wal'
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16000
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+def test_invalid_pragma_rejected(tmp_path):
+    """잘못된 PRAGMA 값 거부 테스트"""
+    with pytest.raises(ValueError):
+        DatabaseManager(str(tmp_path / "bad.db"), pragmas={'cache_size': '1; DROP TABLE holidays'})
+
+def test_uncommitted_transaction_rolled_back_on_release(db_manager):
+    """커밋되지 않은 트랜잭션 정리 테스트"""
+    with db_manager.get_connection() as conn:
+        conn.execute("INSERT INTO holidays (date, name) VALUES ('2025-01-01', '신정')")
+    
+    assert HolidayManager(db_manager).get_holiday_count() == 0
+
+def test_managers_across_threads(db_manager):
+    """여러 스레드에서 풀 공유 테스트"""
+    verification_manager = VerificationManager(db_manager)
+    now = datetime.datetime(2025, 3, 3, 10, 0, 0)
+    
+    def worker(user_id):
+        for _ in range(10):
+            assert verification_manager.add_verification(str(user_id), "user", "인증", [], now)
+    
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert verification_manager.get_verified_users_on_date(now.date()) == {'0', '1', '2', '3'}
+
+def test_close_pool(db_manager):
+    """풀 종료 테스트"""
+    HolidayManager(db_manager).get_holiday_count()
+    db_manager.close()
+    
+    assert db_manager._pool.qsize() == 0
+    with pytest.raises(Exception):
+        with db_manager.get_connection():
+            pass
+
+def test_get_vacationers_among(db_manager):
+    """사용자 목록 휴가 일괄 조회 테스트 (IN 절 / 임시 테이블)"""
+    vacation_manager = VacationManager(db_manager)
+    date = datetime.date(2025, 3, 3)
+    vacation_manager.add_vacations_bulk([(str(i), "2025-03-03") for i in range(0, 2000, 7)])
+    vacation_manager.add_vacation("3", "2025-03-04")
+    
+    assert vacation_manager.get_vacationers_among(["0", "3", "7", "8"], date) == {"0", "7"}
+    
+    many_ids = [str(i) for i in range(2000)]
+    expected = {str(i) for i in range(0, 2000, 7)}
+    assert vacation_manager.get_vacationers_among(many_ids, date) == expected
+    # 임시 테이블 내용이 다음 조회에 남지 않아야 함
+    assert vacation_manager.get_vacationers_among(many_ids[:600], date) == {i for i in expected if int(i) < 600}
+
+def test_get_vacations_in_range(db_manager):
+    """기간별 휴가자 조회 테스트"""
+    vacation_manager = VacationManager(db_manager)
+    vacation_manager.add_vacations_bulk([("1", "2025-03-03"), ("2", "2025-03-03"), ("1", "2025-03-05"), ("1", "2025-04-01")])
+    
+    result = vacation_manager.get_vacations_in_range(datetime.date(2025, 3, 1), datetime.date(2025, 3, 31))
+    assert result == {"2025-03-03": {"1", "2"}, "2025-03-05": {"1"}}
+
+def _periods(vacation_manager, user_id):
+    return [(p.start_date, p.end_date) for p in vacation_manager.get_user_vacation_periods(user_id)]
+
+def test_vacation_range_merge_on_insert(db_manager):
+    """겹치거나 맞닿은 휴가 구간 병합 테스트"""
+    vacation_manager = VacationManager(db_manager)
+    assert vacation_manager.add_vacation_range("1", "2025-05-01", "2025-05-05") == 5
+    assert vacation_manager.add_vacation_range("1", "2025-05-10", "2025-05-12") == 3
+    assert vacation_manager.add_vacation_range("1", "2025-05-02", "2025-05-04") == 0
+    # 앞 구간과 겹치고 뒤 구간과 맞닿는 구간은 세 구간을 하나로 합침
+    assert vacation_manager.add_vacation_range("1", "2025-05-04", "2025-05-09") == 4
+    
+    assert _periods(vacation_manager, "1") == [("2025-05-01", "2025-05-12")]
+    assert vacation_manager.is_user_on_vacation("1", datetime.date(2025, 5, 7))
+    assert not vacation_manager.is_user_on_vacation("1", datetime.date(2025, 5, 13))
+    assert vacation_manager.add_vacation_range("1", "2025-05-03", "2025-05-01") == -1
+
+def test_vacation_range_split_on_cancel(db_manager):
+    """휴가 중간 취소 시 구간 분할 테스트"""
+    vacation_manager = VacationManager(db_manager)
+    vacation_manager.add_vacation_range("1", "2025-05-01", "2025-05-14")
+    
+    assert vacation_manager.remove_vacation_range("1", "2025-05-05", "2025-05-07") == 3
+    assert _periods(vacation_manager, "1") == [
+        ("2025-05-01", "2025-05-04"), ("2025-05-08", "2025-05-14")
+    ]
+    assert vacation_manager.remove_vacation("1", "2025-05-01")
+    assert not vacation_manager.remove_vacation("1", "2025-05-01")
+    assert vacation_manager.get_vacationers_among(["1"], datetime.date(2025, 5, 6)) == set()
+    assert vacation_manager.remove_all_vacations("1") == 10
+
+def test_legacy_vacations_compacted(tmp_path):
+    """하루 단위 기존 휴가 행의 구간 압축 마이그레이션 테스트"""
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE vacations (id INTEGER PRIMARY KEY, user_id TEXT, date TEXT, UNIQUE(user_id, date))")
+    conn.executemany("INSERT INTO vacations (user_id, date) VALUES (?, ?)", [
+        ("1", "2025-01-30"), ("1", "2025-01-31"), ("1", "2025-02-01"), ("1", "2025-02-03"),
+        ("2", "2025-02-01")
+    ])
+    conn.commit()
+    conn.close()
+    
+    upgraded = DatabaseManager(db_path, pool_size=1)
+    vacation_manager = VacationManager(upgraded)
+    assert _periods(vacation_manager, "1") == [
+        ("2025-01-30", "2025-02-01"), ("2025-02-03", "2025-02-03")
+    ]
+    assert _periods(vacation_manager, "2") == [("2025-02-01", "2025-02-01")]
+    with upgraded.get_connection() as conn:
+        assert conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'vacations'").fetchone() is None
+    upgraded.close()
+
+def test_verification_attachments_roundtrip(db_manager):
+    """첨부 파일 테이블 저장/조회 테스트 (쉼표가 포함된 URL 포함)"""
+    verification_manager = VerificationManager(db_manager)
+    now = datetime.datetime(2025, 3, 3, 9, 0, 0)
+    attachments = [
+        {'attachment_id': '11', 'url': 'https://cdn.example.com/a,b.png', 'content_type': 'image/png', 'size': 10},
+        {'attachment_id': '12', 'url': 'https://cdn.example.com/c.jpg', 'content_type': 'image/jpeg', 'size': 20},
+    ]
+    assert verification_manager.add_verification("1", "user1", "인증", [], now, attachments)
+    assert verification_manager.add_verifications_bulk([{
+        'user_id': "2", 'username': "user2", 'message_content': "인증",
+        'image_urls': ["https://cdn.example.com/d.png"], 'verification_datetime': now
+    }])
+    
+    records = {r['user_id']: r for r in verification_manager.get_verifications_by_date(now.date())}
+    assert records["1"]['image_urls'] == ['https://cdn.example.com/a,b.png', 'https://cdn.example.com/c.jpg']
+    assert records["1"]['attachments'] == attachments
+    assert records["2"]['image_urls'] == ["https://cdn.example.com/d.png"]
+    assert verification_manager.get_attachments(records["1"]['id']) == attachments
+
+def test_migrate_legacy_image_urls(db_manager):
+    """쉼표 구분 image_urls의 배치 이전 테스트"""
+    verification_manager = VerificationManager(db_manager)
+    with db_manager.get_connection() as conn:
+        conn.executemany("""
+            INSERT INTO verifications (user_id, username, message_content, image_urls, verification_date, verification_time)
+            VALUES (?, 'user', '인증', ?, '2025-03-03', '09:00:00')
+        """, [(str(i), f"https://a/{i}.png,https://b/{i}.png" if i % 2 else '') for i in range(5)])
+        conn.commit()
+    
+    # 이전 전에도 기존 값을 나누어 읽을 수 있어야 함
+    assert verification_manager.get_user_verifications("1")[0]['image_urls'] == ["https://a/1.png", "https://b/1.png"]
+    
+    assert verification_manager.migrate_legacy_image_urls(batch_size=3) == 3
+    assert verification_manager.migrate_legacy_image_urls(batch_size=3) == 2
+    assert verification_manager.migrate_legacy_image_urls(batch_size=3) == 0
+    
+    assert verification_manager.get_user_verifications("3")[0]['image_urls'] == ["https://a/3.png", "https://b/3.png"]
+    assert verification_manager.get_user_verifications("2")[0]['image_urls'] == []
+    with db_manager.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM verifications WHERE image_urls IS NOT NULL").fetchone()[0] == 0
+
+def test_search_verifications(db_manager):
+    """전문 검색: 접두사 일치, 사용자/기간 필터, 페이지 나눔"""
+    verification_manager = VerificationManager(db_manager)
+    base = datetime.datetime(2025, 3, 3, 9, 0, 0)
+    verification_manager.add_verifications_bulk([
+        {'user_id': str(i % 3), 'username': f"user{i % 3}",
+         'message_content': f"오늘 TODO: algorithm 문제 {i}개 풀기" if i % 2 else f"운동 {i}분 running",
+         'image_urls': [], 'verification_datetime': base + datetime.timedelta(days=i)}
+        for i in range(12)
+    ])
+    
+    first = verification_manager.search_verifications("algo", limit=4)
+    second = verification_manager.search_verifications("algo", limit=4, cursor=first.next_cursor)
+    assert len(first.records) == 4 and len(second.records) == 2
+    assert second.next_cursor is None
+    assert {r.id for r in first.records}.isdisjoint(r.id for r in second.records)
+    assert all("algorithm" in r.message_content for r in first.records + second.records)
+    
+    filtered = verification_manager.search_verifications(
+        "TODO 문제", user_id="0", start_date=datetime.date(2025, 3, 5), order='recent'
+    )
+    assert [r.verification_date for r in filtered.records] == ["2025-03-12", "2025-03-06"]
+    with pytest.raises(ValueError):
+        verification_manager.search_verifications("   ")
+
+def test_search_index_follows_updates_and_deletes(db_manager):
+    """트리거로 수정/삭제된 인증 메시지가 검색 색인에 반영됨"""
+    verification_manager = VerificationManager(db_manager)
+    now = datetime.datetime(2025, 3, 3, 9, 0, 0)
+    verification_manager.add_verification("1", "user1", "독서 30쪽", [], now)
+    verification_manager.add_verification("2", "user2", "독서 10쪽 \"따옴표\" OR", [], now)
+    with db_manager.get_connection() as conn:
+        conn.execute("UPDATE verifications SET message_content = '산책' WHERE user_id = '1'")
+        conn.execute("DELETE FROM verifications WHERE user_id = '2'")
+        conn.commit()
+    
+    assert verification_manager.search_verifications("독서").records == []
+    assert [r.user_id for r in verification_manager.search_verifications("산").records] == ["1"]
+
+def test_daily_verification_upsert(db_manager):
+    """같은 날 여러 번 인증해도 사용자/날짜당 1행, 첫/마지막 시각과 횟수 갱신"""
+    verification_manager = VerificationManager(db_manager)
+    day = datetime.date(2025, 3, 3)
+    for hour in (12, 9, 18):
+        verification_manager.add_verification(
+            "1", "user1", "인증", [], datetime.datetime.combine(day, datetime.time(hour, 0))
+        )
+    verification_manager.add_verifications_bulk([
+        {'user_id': "2", 'username': "user2", 'message_content': "인증", 'image_urls': [],
+         'verification_datetime': datetime.datetime(2025, 3, 3, 10, 30)}
+    ])
+    
+    record = verification_manager.get_daily_verification("1", day)
+    assert (record.first_time, record.last_time, record.post_count) == ("09:00:00", "18:00:00", 3)
+    assert verification_manager.get_verified_users_on_date(day) == {"1", "2"}
+    assert verification_manager.has_user_verified_on_date("2", day)
+    assert not verification_manager.has_user_verified_on_date("2", day + datetime.timedelta(days=1))
+    assert verification_manager.get_daily_verification("3", day) is None
+
+def test_daily_verification_backfilled(tmp_path):
+    """요약 테이블 추가 전에 쌓인 인증 기록으로 채워짐"""
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    migrate_schema(conn, db_path, tuple(m for m in MIGRATIONS if m.version < 7))
+    conn.executemany("""
+        INSERT INTO verifications (user_id, username, message_content, verification_date, verification_time)
+        VALUES (?, 'user', '인증', ?, ?)
+    """, [("1", "2025-03-03", "21:00:00"), ("1", "2025-03-03", "08:00:00"), ("2", "2025-03-04", "10:00:00")])
+    conn.commit()
+    conn.close()
+    
+    upgraded = DatabaseManager(db_path, pool_size=1)
+    verification_manager = VerificationManager(upgraded)
+    record = verification_manager.get_daily_verification("1", datetime.date(2025, 3, 3))
+    assert (record.first_time, record.last_time, record.post_count) == ("08:00:00", "21:00:00", 2)
+    assert verification_manager.get_verified_users_on_date(datetime.date(2025, 3, 4)) == {"2"}
+    upgraded.close()
+
+def _counts(summary):
+    return (summary.required, summary.verified, summary.on_vacation, summary.missed)
+
+def test_daily_summary_incremental_matches_rebuild(db_manager):
+    """인증/휴가/체크 실행마다 증분 갱신한 요약이 전체 재계산 결과와 같아야 함"""
+    verification_manager = VerificationManager(db_manager)
+    vacation_manager = VacationManager(db_manager)
+    summary_manager = DailySummaryManager(db_manager)
+    day = datetime.date(2025, 3, 3)
+    
+    verification_manager.add_verification("1", "user1", "인증", [], datetime.datetime(2025, 3, 3, 9))
+    assert _counts(summary_manager.get_summary(day)) == (0, 1, 0, 0)  # 체크 전에는 인증 수만
+    
+    assert _counts(summary_manager.record_check(day, ["1", "2", "3", "4"])) == (4, 1, 0, 3)
+    vacation_manager.add_vacation_range("3", day, day + datetime.timedelta(days=2))
+    verification_manager.add_verification("2", "user2", "인증", [], datetime.datetime(2025, 3, 3, 10))
+    verification_manager.add_verification("2", "user2", "인증", [], datetime.datetime(2025, 3, 3, 11))
+    verification_manager.add_verification("5", "user5", "인증", [], datetime.datetime(2025, 3, 3, 12))
+    assert _counts(summary_manager.get_summary(day)) == (3, 3, 1, 1)
+    
+    vacation_manager.remove_all_vacations("3")
+    incremental = _counts(summary_manager.get_summary(day))
+    assert incremental == (4, 3, 0, 2)
+    
+    assert summary_manager.rebuild(day - datetime.timedelta(days=3), day + datetime.timedelta(days=3)) == 1
+    assert _counts(summary_manager.get_summary(day)) == incremental
+    assert [s.summary_date for s in summary_manager.get_summaries(day, day + datetime.timedelta(days=6))] == ["2025-03-03"]
+    assert summary_manager.get_summary(day).compliance_rate == 0.5
+
+def test_daily_summary_backfilled(tmp_path):
+    """요약 테이블 추가 전 날짜는 인증 수만 채워짐"""
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    migrate_schema(conn, db_path, tuple(m for m in MIGRATIONS if m.version < 8))
+    conn.executemany("""
+        INSERT INTO daily_verification (verification_date, user_id, first_time, last_time, post_count)
+        VALUES (?, ?, '09:00:00', '09:00:00', 1)
+    """, [("2025-03-03", "1"), ("2025-03-03", "2"), ("2025-03-04", "1")])
+    conn.commit()
+    conn.close()
+    
+    upgraded = DatabaseManager(db_path, pool_size=1)
+    summaries = DailySummaryManager(upgraded).get_summaries(datetime.date(2025, 3, 1), datetime.date(2025, 3, 31))
+    assert [(s.summary_date, _counts(s)) for s in summaries] == [
+        ("2025-03-03", (0, 2, 0, 0)), ("2025-03-04", (0, 1, 0, 0))
+    ]
+    upgraded.close()
+
+def test_add_missing_verifications_skips_recorded_days(db_manager):
+    """메시지 ID가 없는 입력은 이미 인증한 날짜의 사용자를 건너뛰고 누락된 사용자는 하루 첫 메시지만 추가"""
+    verification_manager = VerificationManager(db_manager)
+    verification_manager.add_verification("1", "user1", "인증", [], datetime.datetime(2025, 3, 3, 9))
+    scanned = [
+        {'user_id': user_id, 'username': f"user{user_id}", 'message_content': "인증",
+         'image_urls': [f"https://a/{user_id}.png"], 'verification_datetime': datetime.datetime(2025, 3, 3, hour)}
+        for user_id, hour in [("1", 9), ("2", 10), ("2", 11), ("3", 12)]
+    ]
+    
+    assert verification_manager.add_missing_verifications(scanned) == 2
+    assert verification_manager.add_missing_verifications(scanned) == 0
+    assert verification_manager.get_daily_verification("2", datetime.date(2025, 3, 3)).first_time == "10:00:00"
+    assert verification_manager.get_verified_users_on_date(datetime.date(2025, 3, 3)) == {"1", "2", "3"}
+
+def test_add_missing_verifications_dedupes_by_message_id(db_manager):
+    """메시지 ID가 있는 입력은 백필과 같이 메시지 ID와 기존 기록의 첨부 파일 ID로 중복 판단"""
+    verification_manager = VerificationManager(db_manager)
+    day = datetime.datetime(2025, 3, 3, 9)
+    verification_manager.add_verification("1", "user1", "인증", [], day, message_id=101)
+    verification_manager.add_verification("2", "user2", "인증", [], day,
+                                          attachments=[{'attachment_id': 202, 'url': "https://a/202.png"}])
+    scanned = [
+        {'user_id': user_id, 'username': f"user{user_id}", 'message_content': "인증", 'message_id': message_id,
+         'attachments': [{'attachment_id': message_id, 'url': f"https://a/{message_id}.png"}],
+         'image_urls': [f"https://a/{message_id}.png"], 'verification_datetime': day.replace(hour=hour)}
+        for user_id, message_id, hour in [("1", 101, 9), ("1", 102, 10), ("2", 202, 9), ("3", 301, 12)]
+    ]
+    
+    assert verification_manager.add_missing_verifications(scanned) == 2
+    assert verification_manager.add_missing_verifications(scanned) == 0
+    assert verification_manager.get_daily_verification("1", day.date()).post_count == 2
+    assert verification_manager.get_daily_verification("2", day.date()).post_count == 1
+
+def test_history_cursor_only_moves_forward(db_manager):
+    """스캔 위치는 더 최근 메시지로만 이동"""
+    cursor_manager = HistoryCursorManager(db_manager)
+    at = datetime.datetime(2025, 3, 3, 21, tzinfo=datetime.timezone.utc)
+    assert cursor_manager.get_cursor("10") is None
+    
+    assert cursor_manager.save_cursor("10", 500, at)
+    assert not cursor_manager.save_cursor("10", 400, at - datetime.timedelta(hours=1))
+    assert cursor_manager.save_cursor("10", 600, at + datetime.timedelta(hours=1))
+    
+    cursor = cursor_manager.get_cursor("10")
+    assert (cursor.last_message_id, cursor.last_seen) == (600, at + datetime.timedelta(hours=1))
+
+def test_backfill_job_dedupes_by_message_id_and_resumes(db_manager):
+    """메시지 ID나 첨부 파일 ID로 이미 저장된 인증은 건너뛰고, 진행 위치는 기록과 함께 저장"""
+    verification_manager = VerificationManager(db_manager)
+    backfill_manager = BackfillJobManager(db_manager, verification_manager)
+    # 메시지 ID 없이 저장된 기존 기록 (첨부 파일 ID로 같은 메시지인지 확인)
+    verification_manager.add_verification(
+        "1", "user1", "인증", [], datetime.datetime(2025, 3, 3, 9),
+        attachments=[{'attachment_id': "900", 'url': "https://a/900.png"}]
+    )
+    start, end = datetime.datetime(2025, 3, 3), datetime.datetime(2025, 3, 4)
+    job = backfill_manager.start_job("10", start, end)
+    assert (job.last_message_id, job.status) == (None, 'running')
+    
+    records = [
+        {'user_id': user_id, 'username': f"user{user_id}", 'message_content': "인증",
+         'image_urls': [f"https://a/{attachment_id}.png"], 'message_id': message_id,
+         'verification_datetime': datetime.datetime(2025, 3, 3, hour),
+         'attachments': [{'attachment_id': attachment_id, 'url': f"https://a/{attachment_id}.png"}]}
+        for user_id, hour, message_id, attachment_id in [("1", 9, 100, "900"), ("2", 10, 101, "901"),
+                                                         ("2", 11, 102, "902")]
+    ]
+    assert backfill_manager.save_progress(job.id, records, 102, 3) == 2
+    assert backfill_manager.save_progress(job.id, records, 102, 3) == 0
+    assert verification_manager.get_daily_verification("2", datetime.date(2025, 3, 3)).post_count == 2
+    
+    resumed = backfill_manager.start_job("10", start, end)
+    assert (resumed.id, resumed.last_message_id, resumed.scanned, resumed.inserted) == (job.id, 102, 6, 2)
+    
+    # 끝난 작업은 처음부터 다시 스캔
+    assert backfill_manager.finish_job(job.id)
+    restarted = backfill_manager.start_job("10", start, end)
+    assert (restarted.last_message_id, restarted.scanned, restarted.status) == (None, 0, 'running')
+
+def test_verification_keyed_by_message_id_update_and_retract(db_manager):
+    """같은 메시지 ID는 한 번만 저장되고, 수정은 내용을 갱신하고 취소는 날짜별 요약도 되돌림"""
+    verification_manager = VerificationManager(db_manager)
+    summaries = DailySummaryManager(db_manager)
+    day = datetime.date(2025, 3, 3)
+    for message_id, hour in [(100, 9), (100, 9), (101, 10)]:
+        assert verification_manager.add_verification(
+            "1", "user1", "인증", ["https://a/1.png"], datetime.datetime(2025, 3, 3, hour), message_id=message_id
+        )
+    assert verification_manager.get_daily_verification("1", day).post_count == 2
+    
+    assert verification_manager.update_verification(101, "인증 수정", [{'attachment_id': "7", 'url': "https://a/7.png"}])
+    assert not verification_manager.update_verification(999, "없음", [])
+    assert [record.message_content for record in verification_manager.search_verifications("수정").records] == ["인증 수정"]
+    
+    assert verification_manager.retract_verifications([100]) == 1
+    daily = verification_manager.get_daily_verification("1", day)
+    assert (daily.first_time, daily.post_count) == ("10:00:00", 1)
+    assert verification_manager.retract_verifications([101, 999]) == 1
+    assert verification_manager.get_daily_verification("1", day) is None
+    assert summaries.get_summary(day).verified == 0
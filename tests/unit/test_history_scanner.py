@@ -0,0 +1,54 @@
+"""
+HistoryScanner 테스트
+"""
+import asyncio
+import datetime
+import discord
+import pytest
+from unittest.mock import MagicMock
+from history_scanner import HistoryScanner, RequestBudget
+
+START = datetime.datetime(2025, 3, 3, 0, 0, tzinfo=datetime.timezone.utc)
+
+def _channel(message_ids):
+    """after/before 스노우플레이크와 limit을 따르는 가짜 채널 (동시 요청 수 기록)"""
+    channel = MagicMock()
+    channel.in_flight = channel.max_in_flight = 0
+
+    async def history(after, before, limit, oldest_first):
+        channel.in_flight += 1
+        channel.max_in_flight = max(channel.max_in_flight, channel.in_flight)
+        await asyncio.sleep(0.001)
+        channel.in_flight -= 1
+        for message_id in [i for i in message_ids if after.id < i < before.id][:limit]:
+            yield MagicMock(id=message_id)
+
+    channel.history = history
+    return channel
+
+def test_split_covers_range_without_gaps():
+    """하위 구간은 인접 경계를 공유하고 짧은 구간은 나누지 않음"""
+    scanner = HistoryScanner(windows=4, min_window=datetime.timedelta(hours=1))
+    lower = discord.utils.time_snowflake(START, high=True)
+    upper = discord.utils.time_snowflake(START + datetime.timedelta(hours=8))
+    windows = scanner.split(lower, upper)
+
+    assert len(windows) == 4
+    assert windows[0][0] == lower and windows[-1][1] == upper
+    assert all(windows[i][1] == windows[i + 1][0] + 1 for i in range(3))
+    assert len(scanner.split(lower, discord.utils.time_snowflake(START + datetime.timedelta(minutes=90)))) == 1
+
+@pytest.mark.asyncio
+async def test_scan_merges_windows_in_order():
+    """여러 구간을 동시에 읽어도 경계 메시지를 포함해 오래된 순서 그대로 반환"""
+    ids = [discord.utils.time_snowflake(START + datetime.timedelta(seconds=30 * i)) for i in range(1, 2000)]
+    scanner = HistoryScanner(windows=4, min_window=datetime.timedelta(minutes=10),
+                             budget=RequestBudget(max_concurrent=3), buffer_size=100)
+    # 구간 경계와 같은 타임스탬프의 메시지
+    boundary = scanner.split(ids[0] - 1, ids[-1] + 1)[1][0]
+    ids = sorted(ids + [boundary, boundary + 1])
+    channel = _channel(ids)
+
+    scanned = [message.id async for message in scanner.scan(channel, ids[0] - 1, ids[-1] + 1)]
+    assert scanned == ids
+    assert channel.max_in_flight == 3
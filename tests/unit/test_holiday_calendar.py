@@ -0,0 +1,53 @@
+"""
+HolidayCalendar 테스트
+"""
+import datetime
+from holiday_calendar import HolidayCalendar
+from db import HolidayManager
+
+def test_is_holiday():
+    """공휴일 여부 확인 테스트"""
+    calendar = HolidayCalendar(["2025-01-01", datetime.date(2024, 12, 31), "2024-02-29"])
+    
+    assert calendar.is_holiday(datetime.date(2025, 1, 1))
+    assert calendar.is_holiday(datetime.datetime(2024, 12, 31, 15, 0))
+    assert calendar.is_holiday("2024-02-29")
+    assert not calendar.is_holiday(datetime.date(2025, 1, 2))
+    assert not calendar.is_holiday(datetime.date(2030, 1, 1))
+    assert len(calendar) == 3
+
+def test_next_business_day():
+    """다음 영업일 계산 테스트"""
+    # 2025-01-01(수) 공휴일, 2025-01-04/05 주말
+    calendar = HolidayCalendar(["2025-01-01", "2025-01-06"])
+    
+    assert calendar.next_business_day(datetime.date(2024, 12, 31)) == datetime.date(2025, 1, 2)
+    assert calendar.next_business_day(datetime.date(2025, 1, 3)) == datetime.date(2025, 1, 7)
+    assert calendar.next_business_day(datetime.date(2025, 1, 2), include_start=True) == datetime.date(2025, 1, 2)
+
+def test_business_days_between_matches_naive_count():
+    """영업일 수 계산이 단순 순회 결과와 같은지 테스트"""
+    holidays = ["2024-12-25", "2025-01-01", "2025-03-03", "2026-01-01"]
+    calendar = HolidayCalendar(holidays)
+    start, end = datetime.date(2024, 12, 1), datetime.date(2026, 2, 1)
+    
+    expected, current = 0, start
+    while current < end:
+        if current.weekday() < 5 and current.strftime('%Y-%m-%d') not in holidays:
+            expected += 1
+        current += datetime.timedelta(days=1)
+    
+    assert calendar.business_days_between(start, end) == expected
+    assert calendar.business_days_between(end, start) == 0
+
+def test_config_calendar_rebuilt_on_db_write(config_manager):
+    """DB 변경 시 달력 색인 재생성 테스트"""
+    new_holiday = datetime.date(2025, 8, 15)
+    assert not config_manager.is_holiday(new_holiday)
+    
+    config_manager.holiday_manager.add_holiday("2025-08-15", "광복절")
+    assert config_manager.is_holiday(new_holiday)
+    assert "2025-08-15" in config_manager.HOLIDAYS
+    
+    config_manager.holiday_manager.remove_holiday("2025-08-15")
+    assert not config_manager.is_holiday(new_holiday)
@@ -0,0 +1,94 @@
+"""
+VerificationIngestQueue 테스트
+"""
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from ingest_queue import VerificationIngestQueue
+from verification_service import RecentMessageIds
+
+
+class _FakeVerificationService:
+    """접수/반응/완료 순서를 기록하는 인증 서비스 대역"""
+
+    def __init__(self):
+        self.recent_message_ids = RecentMessageIds(100)
+        self.events = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    def accept_message(self, message):
+        return self.recent_message_ids.add(message.id)
+
+    async def acknowledge(self, message):
+        self.events.append(('ack', message.id))
+
+    async def notify_deferred(self, message):
+        self.events.append(('deferred', message.id))
+
+    async def complete_verification(self, message, acknowledgement=None):
+        await self.release.wait()
+        await asyncio.sleep(0.01 if message.id % 2 else 0)
+        await acknowledgement
+        self.events.append(('done', message.author.id, message.id))
+
+
+def _message(message_id, user_id):
+    message = MagicMock(id=message_id)
+    message.author = MagicMock(id=user_id)
+    return message
+
+
+@pytest.mark.asyncio
+async def test_ingest_queue_keeps_per_user_order_and_acknowledges_first():
+    """같은 사용자의 메시지는 접수 순서대로 처리하고, ⏳ 반응이 끝난 뒤에 완료"""
+    service = _FakeVerificationService()
+    queue = VerificationIngestQueue(service, workers=2, queue_size=100)
+
+    for message_id in range(1, 13):
+        assert await queue.submit(_message(message_id, user_id=message_id % 3))
+    assert not await queue.submit(_message(1, user_id=1))  # 재전송된 이벤트
+    await queue.close()
+
+    done = [event for event in service.events if event[0] == 'done']
+    assert len(done) == 12
+    for user_id in range(3):
+        ids = [message_id for _, author_id, message_id in done if author_id == user_id]
+        assert ids == sorted(ids)
+    for message_id in range(1, 13):
+        assert service.events.index(('ack', message_id)) < service.events.index(
+            next(event for event in done if event[2] == message_id))
+
+    stats = queue.get_stats()
+    assert (stats['accepted'], stats['processed'], stats['duplicates'], stats['overflowed']) == (12, 12, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_ingest_queue_backpressure_and_overflow(caplog):
+    """대기열이 가득 차면 제한 시간까지 기다리고, 넘으면 지연을 안내하고 다시 받을 수 있게 둠"""
+    service = _FakeVerificationService()
+    service.release.clear()
+    queue = VerificationIngestQueue(service, workers=1, queue_size=1, enqueue_timeout=0.05)
+
+    assert await queue.submit(_message(1, user_id=1))  # 작업자가 꺼내 처리 대기
+    await asyncio.sleep(0)
+    assert await queue.submit(_message(2, user_id=1))  # 대기열 자리 차지
+    assert not await queue.submit(_message(3, user_id=1))  # 제한 시간 초과
+    assert 3 not in service.recent_message_ids
+    assert ('deferred', 3) in service.events  # 사용자에게 지연 안내
+
+    stats = queue.get_stats()
+    assert (stats['backpressured'], stats['overflowed'], stats['max_depth']) == (1, 1, 1)
+    assert stats['backpressure_wait_ms'] >= 40
+
+    # 주기 통계는 지난 기록 이후 초과가 있을 때만 경고
+    queue.log_stats()
+    queue.log_stats()
+    assert [record.levelname for record in caplog.records if "대기열 통계" in record.getMessage()] == \
+        ['WARNING', 'INFO']
+
+    service.release.set()
+    assert await queue.submit(_message(3, user_id=1))  # 자리가 나면 기다렸다가 접수
+    await queue.close()
+    assert [event[2] for event in service.events if event[0] == 'done'] == [1, 2, 3]
+    assert not await queue.submit(_message(4, user_id=1))  # 종료 이후
@@ -0,0 +1,86 @@
+"""
+일괄 추가 API 및 데이터 마이그레이션 테스트
+"""
+import io
+import json
+import pytest
+from db import HolidayManager, VacationManager
+from db.migration import DataMigration, iter_json_object_items
+
+def test_add_holidays_bulk_counts(db_manager):
+    """공휴일 일괄 추가 결과 집계 테스트"""
+    holiday_manager = HolidayManager(db_manager)
+    holiday_manager.add_holiday("2025-01-01", "신정")
+    holiday_manager.add_holiday("2025-03-01", "삼일절")
+    
+    progress = []
+    counts = holiday_manager.add_holidays_bulk([
+        ("2025-01-01", "신정"),          # 변경 없음
+        ("2025-03-01", "3·1절"),         # 이름 변경
+        ("2025-05-05", "어린이날"),      # 신규
+        ("", "이름만"),                  # 잘못된 행
+    ], batch_size=2, progress_callback=progress.append)
+    
+    assert counts == {'inserted': 1, 'updated': 1, 'skipped': 2}
+    assert progress == [2, 4]
+    assert {h['date']: h['name'] for h in holiday_manager.get_holidays()}["2025-03-01"] == "3·1절"
+
+def test_add_vacations_bulk_counts(db_manager):
+    """휴가 일괄 추가 결과 집계 테스트"""
+    vacation_manager = VacationManager(db_manager)
+    vacation_manager.add_vacation("1", "2025-01-02")
+    
+    counts = vacation_manager.add_vacations_bulk([("1", "2025-01-02"), ("1", "2025-01-03"), (2, "2025-01-03")])
+    
+    assert counts == {'inserted': 2, 'updated': 0, 'skipped': 1}
+    assert vacation_manager.get_user_vacations("2") == {"2025-01-03"}
+
+def test_migrate_holidays_from_csv_with_bom(db_manager, tmp_path):
+    """BOM이 포함된 CSV 스트리밍 마이그레이션 테스트"""
+    csv_file = tmp_path / "holidays.csv"
+    csv_file.write_text("﻿index,date,holiday name\n1,2025-01-01,신정\n2,2025-05-05,어린이날\n", encoding='utf-8')
+    
+    assert DataMigration(db_manager).migrate_holidays_from_csv(str(csv_file))
+    assert HolidayManager(db_manager).get_holiday_count() == 2
+
+def test_migrate_vacations_from_json(db_manager, tmp_path):
+    """휴가 JSON 스트리밍 마이그레이션 테스트"""
+    json_file = tmp_path / "vacations.json"
+    json_file.write_text(json.dumps({"1": ["2025-01-02", "2025-01-03"], "2": "2025-01-04"}), encoding='utf-8')
+    
+    assert DataMigration(db_manager).migrate_vacations_from_json(str(json_file))
+    assert VacationManager(db_manager).get_user_vacations("1") == {"2025-01-02", "2025-01-03"}
+    assert VacationManager(db_manager).get_user_vacations("2") == {"2025-01-04"}
+
+def test_migrate_vacations_from_json_reports_rollback(db_manager, tmp_path):
+    """일괄 추가가 롤백되면 마이그레이션 실패로 보고하는지 테스트"""
+    json_file = tmp_path / "vacations.json"
+    json_file.write_text('{"1": ["2025-01-02"], "2": ["2025-01-', encoding='utf-8')  # 중간에 잘린 파일
+    
+    assert not DataMigration(db_manager).migrate_vacations_from_json(str(json_file))
+    assert VacationManager(db_manager).get_user_vacations("1") == set()
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_iter_json_object_items(chunk_size):
+    """청크 크기와 무관하게 동일하게 파싱되는지 테스트"""
+    data = {"1": ["2025-01-01", "2025-01-02"], "2": "2025-02-02", "3": [], "4": 12345}
+    items = list(iter_json_object_items(io.StringIO(json.dumps(data, indent=2)), chunk_size))
+    assert dict(items) == data
+
+def test_iter_json_object_items_long_value_reads_grow():
+    """여러 청크에 걸친 긴 값은 읽는 크기를 늘려 다시 파싱하는 횟수를 제한"""
+    dates = [f"2025-01-{day % 28 + 1:02d}" for day in range(5000)]
+    data = {"1": dates, "2": "2025-02-02"}
+    source = io.StringIO(json.dumps(data))
+    reads = []
+    original_read = source.read
+    source.read = lambda size: reads.append(size) or original_read(size)
+    
+    assert dict(iter_json_object_items(source, chunk_size=64)) == data
+    assert len(reads) < 20  # 고정 크기면 1,000회 이상
+    assert reads[1:4] == [64, 128, 256]
+
+def test_iter_json_object_items_invalid():
+    """잘못된 JSON 처리 테스트"""
+    with pytest.raises(ValueError):
+        list(iter_json_object_items(io.StringIO('["not", "an", "object"]')))
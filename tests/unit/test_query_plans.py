@@ -0,0 +1,43 @@
+"""
+매니저 SQL 쿼리 계획 회귀 테스트 (benchmarks/bench_query_plans.py의 워크로드 사용)
+"""
+import pytest
+from benchmarks.bench_query_plans import (
+    Managers, build_workload, explain_workload, find_plan_problems, public_sql_methods, seed_database
+)
+
+@pytest.fixture(scope="module")
+def seeded(tmp_path_factory):
+    """인증 기록 10,000행 규모로 채운 데이터베이스와 워크로드"""
+    db_manager, probe = seed_database(str(tmp_path_factory.mktemp("plans") / "plans.db"), 10000)
+    yield db_manager, build_workload(Managers.create(db_manager), probe)
+    db_manager.close()
+
+def test_workload_covers_every_manager_method(seeded):
+    """새 매니저 메서드가 추가되면 워크로드에도 추가해야 함"""
+    _, workload = seeded
+    covered = {name.split('[')[0] for name in workload}
+    assert sorted(set(public_sql_methods()) - covered) == []
+
+def test_no_full_scans_or_temp_sorts(seeded):
+    """허용 목록 외에는 테이블 전체 스캔과 임시 B-tree 정렬이 없어야 함"""
+    db_manager, workload = seeded
+    planned = explain_workload(db_manager, workload)
+    assert {statement.workload for statement in planned} == set(workload)
+    problems = find_plan_problems(planned)
+    assert not problems, "\n".join(problems)
+
+def test_dropped_index_is_detected(tmp_path):
+    """인덱스가 사라지면 해당 조회가 전체 스캔으로 보고됨"""
+    db_manager, probe = seed_database(str(tmp_path / "plans.db"), 1000)
+    with db_manager.get_connection() as conn:
+        conn.execute("DROP INDEX idx_verifications_date_user")
+        conn.commit()
+    workload = build_workload(Managers.create(db_manager), probe)
+
+    problems = find_plan_problems(explain_workload(
+        db_manager, {'VerificationManager.get_verifications_by_date':
+                     workload['VerificationManager.get_verifications_by_date']}
+    ))
+    db_manager.close()
+    assert any(problem.splitlines()[0].endswith(': SCAN v') for problem in problems)
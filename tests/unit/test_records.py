@@ -0,0 +1,33 @@
+"""
+조회 결과 레코드 타입 테스트
+"""
+import datetime
+from db import HolidayManager, VacationManager, VerificationManager, HolidayRecord, VerificationRecord
+
+def test_verification_record_lazy_fields(db_manager):
+    """인증 기록 레코드의 지연 변환 및 딕셔너리 호환 조회"""
+    verification_manager = VerificationManager(db_manager)
+    now = datetime.datetime(2025, 3, 3, 9, 30, 0)
+    verification_manager.add_verification("1", "user1", "인증", ["https://a/1.png"], now)
+    
+    record = verification_manager.get_user_verifications("1")[0]
+    assert isinstance(record, VerificationRecord)
+    assert not hasattr(record, '__dict__')
+    assert record.date == now.date()
+    assert record.verified_at == now
+    assert record.image_urls == record['image_urls'] == ["https://a/1.png"]
+    assert record.to_dict()['verification_time'] == "09:30:00"
+
+def test_holiday_and_vacation_records(db_manager):
+    """공휴일/휴가 구간 레코드"""
+    holiday_manager = HolidayManager(db_manager)
+    holiday_manager.add_holiday("2025-03-01", "3·1절")
+    assert holiday_manager.get_holidays(2025) == [HolidayRecord("2025-03-01", "3·1절")]
+    assert holiday_manager.get_holidays()[0].day == datetime.date(2025, 3, 1)
+    
+    vacation_manager = VacationManager(db_manager)
+    vacation_manager.add_vacation_range("1", "2025-05-01", "2025-05-03")
+    period = vacation_manager.get_user_vacation_periods("1")[0]
+    assert period.days == 3
+    assert period.covers(datetime.date(2025, 5, 2))
+    assert not period.covers(datetime.date(2025, 5, 4))
@@ -0,0 +1,96 @@
+"""
+MemberRosterService 테스트
+"""
+import discord
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from roster_service import MemberRosterService, RosterFilter
+
+def _member(guild, member_id, bot=False):
+    member = MagicMock(id=member_id, bot=bot)
+    member.guild = guild
+    return member
+
+def _guild(member_specs):
+    guild = MagicMock(id=1, chunked=False)
+    guild.name = "test-guild"
+    guild.members = [_member(guild, member_id, bot) for member_id, bot in member_specs]
+    guild.chunk = AsyncMock()
+    guild.get_member = lambda member_id: next((m for m in guild.members if m.id == member_id), None)
+    return guild
+
+@pytest.mark.asyncio
+async def test_seed_and_gateway_events(config_manager):
+    """청크로 받은 멤버로 명단을 만들고 입장/퇴장/변경 이벤트로 갱신"""
+    roster = MemberRosterService(config_manager)
+    guild = _guild([(1, False), (2, False), (3, True)])
+    assert not roster.is_ready(guild.id)
+
+    assert await roster.seed(guild) == 2
+    guild.chunk.assert_awaited_once()
+    assert roster.eligible_ids(guild.id) == {1, 2}
+
+    joined = _member(guild, 4)
+    guild.members.append(joined)
+    roster.on_member_join(joined)
+    roster.on_member_join(_member(guild, 5, bot=True))
+    roster.on_member_remove(guild.id, 1)
+    assert roster.eligible_ids(guild.id) == {2, 4}
+
+    assert [member.id for member in roster.eligible_members(guild, exclude={4})] == [2]
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_missed_events(config_manager):
+    """놓친 이벤트는 멤버 캐시와 비교해 보정"""
+    config_manager.ROSTER_RECONCILE_BATCH_SIZE = 1
+    roster = MemberRosterService(config_manager)
+    guild = _guild([(1, False), (2, False)])
+    await roster.seed(guild)
+
+    guild.members = [guild.members[0], _member(guild, 3)]  # 2 퇴장, 3 입장 이벤트 누락
+    assert await roster.reconcile(guild) == 2
+    assert roster.eligible_ids(guild.id) == {1, 3}
+    assert await roster.reconcile(guild) == 0
+
+def _role(guild, role_id, **permissions):
+    role = MagicMock(spec=discord.Role, id=role_id, permissions=discord.Permissions(**permissions))
+    role.guild = guild
+    return role
+
+@pytest.mark.asyncio
+async def test_participant_role_and_channel_access_filter(config_manager):
+    """참가자 역할 멤버 중 인증 채널을 볼 수 있는 멤버만 대상, 채널 권한이 바뀌면 재계산"""
+    guild = _guild([])
+    guild.owner_id = 999
+    everyone, participant, muted = _role(guild, 1, view_channel=True), _role(guild, 10), _role(guild, 20)
+    guild.default_role = everyone
+    guild.roles = [everyone, participant, muted]
+    guild.get_role = {role.id: role for role in guild.roles}.get
+    for member_id, roles, bot in [(1, [participant], False), (2, [participant, muted], False),
+                                  (3, [], False), (4, [participant], True), (5, [participant], False)]:
+        member = _member(guild, member_id, bot)
+        member.roles = [everyone, *roles]
+        guild.members.append(member)
+    participant.members = [member for member in guild.members if participant in member.roles]
+
+    channel = MagicMock(id=42)
+    channel.overwrites = {
+        muted: discord.PermissionOverwrite(view_channel=False),
+        MagicMock(spec=discord.Member, id=5): discord.PermissionOverwrite(view_channel=False),
+    }
+    guild.get_channel = lambda channel_id: channel if channel_id == 42 else None
+
+    roster = MemberRosterService(config_manager, RosterFilter(role_ids=[10], channel_id=42))
+    await roster.seed(guild)
+    assert roster.eligible_ids(guild.id) == {1}
+
+    # 음소거 역할의 채널 덮어쓰기 해제 → 재계산
+    updated = MagicMock(id=42, guild=guild, overwrites={})
+    guild.get_channel = lambda channel_id: updated
+    roster.on_guild_channel_update(channel, updated)
+    assert roster.eligible_ids(guild.id) == {1, 2, 5}
+
+    # 역할 변경은 해당 멤버만 다시 확인
+    guild.members[2].roles.append(participant)
+    roster.on_member_update(None, guild.members[2])
+    assert roster.eligible_ids(guild.id) == {1, 2, 3, 5}
@@ -0,0 +1,58 @@
+"""
+스키마 마이그레이션 테스트
+"""
+import sqlite3
+import pytest
+from db import DatabaseManager, SCHEMA_VERSION, SchemaMigrationError
+from db.schema import MIGRATIONS, Migration, get_schema_version, migrate_schema
+
+def test_fresh_database_migrated_to_latest(db_manager):
+    """새 데이터베이스는 최신 버전으로 생성되고 적용 기록이 남아야 함"""
+    with db_manager.get_connection() as conn:
+        assert get_schema_version(conn) == SCHEMA_VERSION
+        rows = conn.execute("SELECT version, checksum FROM schema_migrations ORDER BY version").fetchall()
+    assert [(row['version'], row['checksum']) for row in rows] == [(m.version, m.checksum) for m in MIGRATIONS]
+
+def test_current_schema_runs_no_ddl(db_manager):
+    """최신 스키마에서는 DDL 없이 통과해야 함"""
+    statements = []
+    with db_manager.get_connection() as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            assert migrate_schema(conn, db_manager.db_path) == []
+        finally:
+            conn.set_trace_callback(None)
+    assert not any(s.lstrip().upper().startswith(("CREATE", "DROP", "ALTER")) for s in statements)
+
+def test_upgrade_takes_backup_and_is_atomic(tmp_path):
+    """업그레이드 전 백업 생성, 실패한 업그레이드는 전체 롤백"""
+    db_path = str(tmp_path / "bot.db")
+    DatabaseManager(db_path, pool_size=1).close()
+    
+    def fail(conn):
+        raise RuntimeError("boom")
+    
+    broken = MIGRATIONS + (
+        Migration(SCHEMA_VERSION + 1, "새 테이블", ("CREATE TABLE extra (id INTEGER PRIMARY KEY)",)),
+        Migration(SCHEMA_VERSION + 2, "실패하는 단계", (), fail),
+    )
+    conn = sqlite3.connect(db_path)
+    with pytest.raises(RuntimeError):
+        migrate_schema(conn, db_path, broken)
+    assert get_schema_version(conn) == SCHEMA_VERSION
+    assert conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'extra'").fetchone() is None
+    conn.close()
+    assert list(tmp_path.glob(f"bot.db.v{SCHEMA_VERSION}_*.bak"))
+
+def test_modified_migration_detected(tmp_path):
+    """이미 적용된 단계가 변경되면 시작을 거부해야 함"""
+    db_path = str(tmp_path / "bot.db")
+    DatabaseManager(db_path, pool_size=1).close()
+    
+    changed = (MIGRATIONS[0]._replace(statements=MIGRATIONS[0].statements[:-1]),) + MIGRATIONS[1:]
+    conn = sqlite3.connect(db_path)
+    with pytest.raises(SchemaMigrationError):
+        migrate_schema(conn, db_path, changed)
+    with pytest.raises(SchemaMigrationError):
+        migrate_schema(conn, db_path, MIGRATIONS[:1])  # 데이터베이스가 코드보다 새로움
+    conn.close()
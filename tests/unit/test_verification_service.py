@@ -5,7 +5,9 @@ import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 import discord
 import datetime
+import asyncio
 import pytz
+from verification_service import VerificationService
 
 @pytest.mark.asyncio
 async def test_process_verification_message(verification_service, mock_channel):
@@ -69,4 +71,166 @@ async def test_send_unverified_messages_empty(verification_service, mock_channel
     
     # 검증 - 모든 멤버가 인증한 메시지
     mock_channel.send.assert_called_once()
-    assert verification_service.config.MESSAGES['all_verified'] in mock_channel.send.call_args[0][0] 
\ No newline at end of file
+    assert verification_service.config.MESSAGES['all_verified'] in mock_channel.send.call_args[0][0] 
+@pytest.mark.asyncio
+async def test_get_verification_data_scans_only_new_messages(config_manager, mock_bot, message_util, time_util,
+                                                             db_manager):
+    """채널 기록은 마지막 스캔 이후만 확인하고, 실시간 처리에서 빠진 인증을 저장한 뒤 DB 기준으로 답함"""
+    from db import (
+        AsyncDatabaseExecutor, AsyncHistoryCursorManager, AsyncVerificationManager, HistoryCursorManager,
+        VerificationManager
+    )
+    executor = AsyncDatabaseExecutor(max_workers=1)
+    verification_manager = AsyncVerificationManager(VerificationManager(db_manager), executor)
+    service = VerificationService(
+        config_manager, mock_bot, message_util, time_util,
+        verification_manager=verification_manager,
+        history_cursor_manager=AsyncHistoryCursorManager(HistoryCursorManager(db_manager), executor)
+    )
+    service.message_util.is_valid_image = MagicMock(return_value=True)
+    
+    kst = config_manager.TIMEZONE
+    start_time = kst.localize(datetime.datetime(2025, 3, 3, 12, 0))
+    end_time = kst.localize(datetime.datetime(2025, 3, 4, 3, 0))
+    messages = []
+    
+    def post(user_id, hour):
+        message = MagicMock()
+        message.author = MagicMock(id=user_id, bot=False)
+        message.author.name = f"user{user_id}"
+        message.content = "인증사진"
+        message.created_at = start_time.astimezone(pytz.utc) + datetime.timedelta(hours=hour)
+        message.id = discord.utils.time_snowflake(message.created_at)
+        message.attachments = [MagicMock(id=message.id, url=f"https://a/{message.id}.png",
+                                          content_type="image/png", size=1024)]
+        messages.append(message)
+    
+    requested = []
+    
+    async def history(after, before, limit, oldest_first):
+        # 하위 구간 페이지 요청 (스노우플레이크 경계)
+        requested.append(after.id)
+        for message in [m for m in messages if after.id < m.id < before.id][:limit]:
+            yield message
+    
+    channel = MagicMock()
+    channel.id = 42
+    channel.history = history
+    channel.guild.fetch_members = lambda: _members([1, 2, 3])
+    
+    # 사용자 1은 실시간 처리로 저장됨, 사용자 2는 봇이 꺼져 있어 누락됨
+    await verification_manager.add_verification("1", "user1", "인증사진", [], start_time + datetime.timedelta(hours=1))
+    post(1, 1)
+    post(2, 2)
+    verified, unverified = await service.get_verification_data(channel, start_time, end_time)
+    assert verified == {1, 2}
+    assert [member.id for member in unverified] == [3]
+    assert min(requested) == discord.utils.time_snowflake(start_time, high=True)
+    # 메시지 ID 없이 저장된 사용자 1의 기록은 다시 스캔해도 중복 저장하지 않음
+    user1_records = [record for record in await verification_manager.get_verifications_by_date(start_time.date())
+                     if record.user_id == "1"]
+    assert len(user1_records) == 1
+    assert (await verification_manager.get_daily_verification("1", start_time.date())).post_count == 1
+    
+    post(3, 3)
+    requested.clear()
+    verified, _ = await service.get_verification_data(channel, start_time, end_time)
+    assert verified == {1, 2, 3}
+    assert min(requested) == messages[1].id
+    assert (await verification_manager.get_daily_verification("2", start_time.date())).first_time == "14:00:00"
+    executor.shutdown()
+
+async def _members(ids):
+    for member_id in ids:
+        yield MagicMock(id=member_id, bot=False)
+
+@pytest.mark.asyncio
+async def test_get_verification_data_runs_stages_concurrently(config_manager, mock_bot, message_util, time_util):
+    """기록 확인과 멤버 조회가 동시에 진행되고, 늦게 확인된 인증 사용자도 미인증 목록에서 제외"""
+    verification_manager = MagicMock()
+    verification_manager.get_verified_users_on_date = AsyncMock(return_value={"1"})
+    service = VerificationService(config_manager, mock_bot, message_util, time_util,
+                                  verification_manager=verification_manager)
+    service.message_util.is_valid_image = MagicMock(return_value=True)
+    config_manager.CHECK_HISTORY_TIMEOUT = config_manager.CHECK_MEMBERS_TIMEOUT = 1
+    members_started = asyncio.Event()
+    
+    async def history(after, before, limit):
+        # 멤버 조회가 시작된 뒤에야 기록이 도착 (순서대로 실행하면 제한 시간 초과)
+        await members_started.wait()
+        message = MagicMock(content="인증사진", attachments=[MagicMock()])
+        message.author.id = 2
+        yield message
+    
+    async def fetch_members():
+        for member_id in [1, 2, 3]:
+            members_started.set()
+            yield MagicMock(id=member_id, bot=False)
+            await asyncio.sleep(0)
+    
+    channel = MagicMock()
+    channel.history = history
+    channel.guild.fetch_members = fetch_members
+    start_time = config_manager.TIMEZONE.localize(datetime.datetime(2025, 3, 3, 12, 0))
+    
+    verified, unverified = await service.get_verification_data(
+        channel, start_time, start_time + datetime.timedelta(hours=12))
+    assert verified == {1, 2}
+    assert [member.id for member in unverified] == [3]
+
+@pytest.mark.asyncio
+async def test_message_events_are_idempotent_and_follow_edits(config_manager, mock_bot, message_util, time_util,
+                                                              db_manager):
+    """재전송된 이벤트는 DB 전에 건너뛰고, 수정/삭제 이벤트는 메시지 ID로 기록을 갱신하거나 취소"""
+    from db import AsyncDatabaseExecutor, AsyncVerificationManager, VerificationManager
+    executor = AsyncDatabaseExecutor(max_workers=1)
+    verification_manager = AsyncVerificationManager(VerificationManager(db_manager), executor)
+    service = VerificationService(config_manager, mock_bot, message_util, time_util,
+                                  verification_manager=verification_manager)
+    service.message_util.is_valid_image = MagicMock(return_value=True)
+    channel_id = config_manager.ALLOWED_CHANNELS[0]
+    
+    message = MagicMock(id=1000, guild=None, content="인증사진")
+    message.author = MagicMock(id=1, bot=False)
+    message.author.name = "user1"
+    message.channel = MagicMock(id=channel_id, send=AsyncMock())
+    message.clear_reactions = AsyncMock()
+    message.attachments = [MagicMock(id=1, url="https://a/1.png", content_type="image/png", size=1024)]
+    message.created_at = datetime.datetime(2025, 3, 3, 3, tzinfo=pytz.utc)
+    
+    await service.process_verification_message(message)
+    await service.process_verification_message(message)  # RESUME 후 재전송
+    assert message.channel.send.await_count == 1
+    assert service.recent_message_ids.duplicates == 1
+    today = time_util.now().date()
+    assert len(await verification_manager.get_verifications_by_date(today)) == 1
+    
+    # 내용만 수정 -> 갱신, 키워드 삭제 -> 취소
+    edited = MagicMock(channel_id=channel_id, cached_message=None)
+    edited.message = message
+    message.content = "인증사진 오늘 운동"
+    await service.handle_message_edit(edited)
+    records = await verification_manager.get_verifications_by_date(today)
+    assert [record.message_content for record in records] == ["인증사진 오늘 운동"]
+    
+    message.content = "잡담"
+    await service.handle_message_edit(edited)
+    assert await verification_manager.get_verifications_by_date(today) == []
+    assert await verification_manager.get_verified_users_on_date(today) == set()
+    
+    # 다른 채널의 삭제는 무시
+    await verification_manager.add_verification("2", "user2", "인증", [], time_util.now(), message_id=2000)
+    await service.handle_message_delete(channel_id + 1, [2000])
+    assert await verification_manager.get_verified_users_on_date(today) == {"2"}
+    await service.handle_message_delete(channel_id, [2000])
+    assert await verification_manager.get_verified_users_on_date(today) == set()
+    executor.shutdown()
+
+def test_recent_message_ids_evicts_least_recent():
+    """가득 차면 가장 오래 전에 본 메시지 ID부터 제거"""
+    from verification_service import RecentMessageIds
+    recent = RecentMessageIds(capacity=2)
+    assert recent.add(1) and recent.add(2)
+    assert not recent.add(1)  # 1을 최근 사용으로 이동
+    assert recent.add(3)
+    assert 1 in recent and 2 not in recent and len(recent) == 2
@@ -0,0 +1,72 @@
+"""
+인증 기록 그룹 커밋 버퍼 테스트
+"""
+import asyncio
+import datetime
+import pytest
+from unittest.mock import AsyncMock
+from db import VerificationManager, AsyncDatabaseExecutor, AsyncVerificationManager, VerificationWriteBuffer
+
+NOW = datetime.datetime(2025, 3, 3, 21, 59, 0)
+
+@pytest.fixture
+def async_verification_manager(db_manager):
+    """비동기 인증 기록 매니저 픽스처"""
+    executor = AsyncDatabaseExecutor(max_workers=1)
+    yield AsyncVerificationManager(VerificationManager(db_manager), executor)
+    executor.shutdown()
+
+@pytest.mark.asyncio
+async def test_burst_is_committed_in_one_batch(async_verification_manager):
+    """짧은 시간 안의 기록들이 한 배치로 커밋되는지 테스트"""
+    buffer = VerificationWriteBuffer(async_verification_manager, flush_interval=0.05, max_batch_size=100)
+    
+    results = await asyncio.gather(*[
+        buffer.submit(str(i), f"user{i}", "인증", ["https://example.com/a.png"], NOW) for i in range(10)
+    ])
+    
+    assert results == [True] * 10
+    assert buffer.batches_committed == 1
+    assert buffer.last_batch_size == 10
+    assert len(async_verification_manager.sync.get_verified_users_on_date(NOW.date())) == 10
+
+@pytest.mark.asyncio
+async def test_max_batch_size_triggers_flush(async_verification_manager):
+    """max_batch_size 도달 시 즉시 커밋 테스트"""
+    buffer = VerificationWriteBuffer(async_verification_manager, flush_interval=60, max_batch_size=3)
+    
+    results = await asyncio.wait_for(asyncio.gather(*[
+        buffer.submit(str(i), f"user{i}", "인증", [], NOW) for i in range(3)
+    ]), timeout=5)
+    
+    assert results == [True] * 3
+    assert buffer.get_stats()['max_batch_size'] == 3
+
+@pytest.mark.asyncio
+async def test_failed_commit_retries_records_individually():
+    """그룹 커밋 실패 시 기록을 하나씩 다시 저장해 잘못된 기록만 False로 완료되는지 테스트"""
+    manager = AsyncMock()
+    manager.add_verifications_bulk = AsyncMock(return_value=False)
+    manager.add_verification = AsyncMock(side_effect=[True, RuntimeError("constraint"), True])
+    buffer = VerificationWriteBuffer(manager, flush_interval=0.01)
+    
+    results = await asyncio.gather(*[buffer.submit(str(i), "user", "인증", [], NOW) for i in range(3)])
+    
+    assert results == [True, False, True]
+    assert [call.args[0] for call in manager.add_verification.await_args_list] == ["0", "1", "2"]
+    stats = buffer.get_stats()
+    assert (stats['failed_batches'], stats['failed_records'], stats['fallback_records']) == (1, 1, 2)
+    # 개별 저장한 기록은 그룹 커밋 통계(평균 배치 크기)에 넣지 않음
+    assert (stats['records_committed'], stats['avg_batch_size']) == (0, 0.0)
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending(async_verification_manager):
+    """종료 훅이 남은 기록을 커밋하는지 테스트"""
+    buffer = VerificationWriteBuffer(async_verification_manager, flush_interval=60)
+    
+    pending = asyncio.create_task(buffer.submit("1", "user", "인증", [], NOW))
+    await asyncio.sleep(0)
+    await buffer.close()
+    
+    assert await pending is True
+    assert buffer.records_committed == 1
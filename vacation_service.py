@@ -3,8 +3,9 @@
 """
 import os
 import datetime
-from typing import Dict, List, Set, Optional
-from db import VacationManager
+from typing import Dict, Iterable, List, Set, Optional
+from db import AsyncVacationManager
+from db.records import VacationRecord
 from db.migration import DataMigration
 from logging_utils import get_logger
 
@@ -13,11 +14,11 @@ logger = get_logger()
 class VacationService:
     """휴가 관리 서비스"""
     
-    def __init__(self, config, time_util, vacation_manager=None):
+    def __init__(self, config, time_util, vacation_manager: AsyncVacationManager = None):
         self.config = config
         self.time_util = time_util
         
-        # ConfigManager에서 vacation_manager를 전달받음
+        # ConfigManager에서 비동기 vacation_manager를 전달받음
         if vacation_manager:
             self.vacation_manager = vacation_manager
             self.db_manager = vacation_manager.db_manager
@@ -42,79 +43,131 @@ class VacationService:
             logger.error(f"휴가 마이그레이션 중 오류: {e}", exc_info=True)
     
     
-    def register_vacation(self, user_id: int, date_str: Optional[str] = None) -> str:
+    @staticmethod
+    def _parse_date(date_str: str) -> Optional[datetime.date]:
+        """YYYY-MM-DD 문자열을 날짜로 변환 (형식이 올바르지 않으면 None)"""
+        try:
+            parts = date_str.strip().split('-')
+            if len(parts) != 3:
+                return None
+            year, month, day = map(int, parts)
+            return datetime.date(year, month, day)
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def format_period(start_date: str, end_date: str) -> str:
+        """휴가 구간 표시 문자열 ('YYYY-MM-DD' 또는 'YYYY-MM-DD ~ YYYY-MM-DD (N일)')"""
+        if start_date == end_date:
+            return start_date
+        days = (datetime.date.fromisoformat(end_date) - datetime.date.fromisoformat(start_date)).days + 1
+        return f"{start_date} ~ {end_date} ({days}일)"
+    
+    async def register_vacation(self, user_id: int, date_str: Optional[str] = None,
+                                end_date_str: Optional[str] = None) -> str:
         """
         사용자의 휴가를 등록합니다.
         
         Args:
             user_id: 사용자 ID
-            date_str: 휴가 날짜 (YYYY-MM-DD 형식, None인 경우 오늘)
+            date_str: 휴가 시작 날짜 (YYYY-MM-DD 형식, None인 경우 오늘)
+            end_date_str: 휴가 종료 날짜 (YYYY-MM-DD 형식, None인 경우 시작 날짜 하루만)
             
         Returns:
             등록 결과 메시지
         """
         try:
+            today = self.time_util.now().date()
+            
             # 날짜가 지정되지 않은 경우 오늘 날짜 사용
             if date_str is None:
-                target_date = self.time_util.now().date()
-                date_str = target_date.strftime('%Y-%m-%d')
+                start_date = today
             else:
-                # 날짜 형식 검증
-                try:
-                    parts = date_str.split('-')
-                    if len(parts) != 3:
-                        return "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요."
-                    
-                    year, month, day = map(int, parts)
-                    target_date = datetime.date(year, month, day)
-                    
-                    # 과거 날짜 검증
-                    if target_date < self.time_util.now().date():
-                        return "과거 날짜는 휴가로 등록할 수 없습니다."
-                    
-                except ValueError:
+                start_date = self._parse_date(date_str)
+                if start_date is None:
                     return "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요."
             
-            # 사용자 ID를 문자열로 변환
-            user_id_str = str(user_id)
+            if end_date_str is None:
+                end_date = start_date
+            else:
+                end_date = self._parse_date(end_date_str)
+                if end_date is None:
+                    return "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요."
             
-            # 이미 등록된 날짜인지 확인
-            if self.vacation_manager.is_user_on_vacation(user_id_str, target_date):
-                return f"{date_str} 날짜는 이미 휴가로 등록되어 있습니다."
+            # 과거 날짜 및 기간 검증
+            if start_date < today:
+                return "과거 날짜는 휴가로 등록할 수 없습니다."
+            if end_date < start_date:
+                return "종료 날짜는 시작 날짜보다 빠를 수 없습니다."
             
-            # 휴가 등록
-            if self.vacation_manager.add_vacation(user_id_str, date_str):
-                return f"{date_str} 날짜가 휴가로 등록되었습니다."
-            else:
-                return f"{date_str} 날짜 휴가 등록에 실패했습니다."
+            day_count = (end_date - start_date).days + 1
+            if day_count > self.config.VACATION_MAX_DAYS:
+                return f"휴가는 한 번에 최대 {self.config.VACATION_MAX_DAYS}일까지 등록할 수 있습니다."
+            
+            period = self.format_period(start_date.isoformat(), end_date.isoformat())
+            
+            # 휴가 등록 (기존 구간과 병합, 새로 추가된 일 수 반환)
+            added_days = await self.vacation_manager.add_vacation_range(str(user_id), start_date, end_date)
+            if added_days == 0:
+                return f"{period} 날짜는 이미 휴가로 등록되어 있습니다."
+            if added_days < 0:
+                return f"{period} 날짜 휴가 등록에 실패했습니다."
+            if added_days < day_count:
+                return f"{period} 날짜가 휴가로 등록되었습니다. (이미 등록된 {day_count - added_days}일 제외)"
+            return f"{period} 날짜가 휴가로 등록되었습니다."
             
         except Exception as e:
             logger.error(f"휴가 등록 중 오류: {e}", exc_info=True)
             return "휴가 등록 중 오류가 발생했습니다. 나중에 다시 시도하거나 관리자에게 문의하세요."
     
-    def cancel_all_vacations(self, user_id: int) -> str:
+    async def cancel_vacation(self, user_id: int, date_str: str, end_date_str: Optional[str] = None) -> str:
         """
-        사용자의 모든 휴가를 취소합니다.
+        사용자의 특정 날짜(또는 기간) 휴가를 취소합니다. 걸쳐 있는 휴가는 나누어 남깁니다.
         
         Args:
             user_id: 사용자 ID
+            date_str: 취소 시작 날짜 (YYYY-MM-DD 형식)
+            end_date_str: 취소 종료 날짜 (YYYY-MM-DD 형식, None인 경우 시작 날짜 하루만)
             
         Returns:
             취소 결과 메시지
         """
         try:
-            user_id_str = str(user_id)
+            start_date = self._parse_date(date_str)
+            end_date = self._parse_date(end_date_str) if end_date_str is not None else start_date
+            if start_date is None or end_date is None:
+                return "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요."
+            if end_date < start_date:
+                return "종료 날짜는 시작 날짜보다 빠를 수 없습니다."
             
-            # 현재 등록된 휴가 수 확인
-            vacation_dates = self.vacation_manager.get_user_vacations(user_id_str)
-            if not vacation_dates:
+            removed_days = await self.vacation_manager.remove_vacation_range(str(user_id), start_date, end_date)
+            if removed_days == 0:
                 return "등록된 휴가가 없습니다."
+            period = self.format_period(start_date.isoformat(), end_date.isoformat())
+            return f"{period} 기간의 휴가({removed_days}일)가 취소되었습니다."
+            
+        except Exception as e:
+            logger.error(f"휴가 취소 중 오류: {e}", exc_info=True)
+            return "휴가 취소 중 오류가 발생했습니다. 나중에 다시 시도하거나 관리자에게 문의하세요."
+    
+    async def cancel_all_vacations(self, user_id: int) -> str:
+        """
+        사용자의 모든 휴가를 취소합니다.
+        
+        Args:
+            user_id: 사용자 ID
+            
+        Returns:
+            취소 결과 메시지
+        """
+        try:
+            user_id_str = str(user_id)
             
-            # 모든 휴가 취소
-            vacation_count = self.vacation_manager.remove_all_vacations(user_id_str)
+            # 모든 휴가 취소 (취소된 일 수 반환)
+            vacation_count = await self.vacation_manager.remove_all_vacations(user_id_str)
             
             if vacation_count > 0:
-                return f"모든 휴가({vacation_count}개)가 취소되었습니다."
+                return f"모든 휴가({vacation_count}일)가 취소되었습니다."
             else:
                 return "등록된 휴가가 없습니다."
             
@@ -122,7 +175,7 @@ class VacationService:
             logger.error(f"휴가 취소 중 오류: {e}", exc_info=True)
             return "휴가 취소 중 오류가 발생했습니다. 나중에 다시 시도하거나 관리자에게 문의하세요."
     
-    def get_user_vacations(self, user_id: int) -> List[str]:
+    async def get_user_vacations(self, user_id: int) -> List[str]:
         """
         사용자의 등록된 휴가 목록을 반환합니다.
         
@@ -133,10 +186,22 @@ class VacationService:
             휴가 날짜 목록 (정렬됨)
         """
         user_id_str = str(user_id)
-        vacation_dates = self.vacation_manager.get_user_vacations(user_id_str)
+        vacation_dates = await self.vacation_manager.get_user_vacations(user_id_str)
         return sorted(list(vacation_dates))
     
-    def is_user_on_vacation(self, user_id: int, date: Optional[datetime.date] = None) -> bool:
+    async def get_user_vacation_periods(self, user_id: int) -> List[VacationRecord]:
+        """
+        사용자의 등록된 휴가 구간 목록을 반환합니다.
+        
+        Args:
+            user_id: 사용자 ID
+            
+        Returns:
+            휴가 구간 레코드 목록 (시작 날짜 순)
+        """
+        return await self.vacation_manager.get_user_vacation_periods(str(user_id))
+    
+    async def is_user_on_vacation(self, user_id: int, date: Optional[datetime.date] = None) -> bool:
         """
         지정된 날짜에 사용자가 휴가인지 확인합니다.
         
@@ -151,4 +216,35 @@ class VacationService:
             date = self.time_util.now().date()
         
         user_id_str = str(user_id)
-        return self.vacation_manager.is_user_on_vacation(user_id_str, date) 
\ No newline at end of file
+        return await self.vacation_manager.is_user_on_vacation(user_id_str, date)
+    
+    async def get_users_on_vacation(self, user_ids: Iterable[int], date: Optional[datetime.date] = None) -> Set[int]:
+        """
+        주어진 사용자 중 지정된 날짜에 휴가인 사용자를 한 번에 조회합니다.
+        
+        Args:
+            user_ids: 확인할 사용자 ID 목록
+            date: 확인할 날짜 (None인 경우 오늘)
+            
+        Returns:
+            휴가 중인 사용자 ID 집합
+        """
+        if date is None:
+            date = self.time_util.now().date()
+        
+        vacationers = await self.vacation_manager.get_vacationers_among([str(user_id) for user_id in user_ids], date)
+        return {int(user_id) for user_id in vacationers}
+    
+    async def get_vacationers_in_range(self, start_date: datetime.date, end_date: datetime.date) -> Dict[str, Set[int]]:
+        """
+        기간 내 날짜별 휴가자를 조회합니다.
+        
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜 (포함)
+            
+        Returns:
+            {'YYYY-MM-DD': {사용자 ID, ...}, ...}
+        """
+        by_date = await self.vacation_manager.get_vacations_in_range(start_date, end_date)
+        return {date_str: {int(user_id) for user_id in user_ids} for date_str, user_ids in by_date.items()}
\ No newline at end of file
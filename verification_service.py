@@ -1,18 +1,68 @@
 """
 인증 관련 서비스 모듈
 """
+import time
+import asyncio
 import discord
 import datetime
-from typing import List, Set, Tuple
-from db import VerificationManager
+from collections import OrderedDict
+from typing import Awaitable, Iterable, Dict, List, Optional, Set, Tuple
+from db import (
+    AsyncDailySummaryManager, AsyncHistoryCursorManager, AsyncVerificationManager, VerificationWriteBuffer
+)
+from roster_service import MemberRosterService
+from history_scanner import HistoryScanner
 from logging_utils import get_logger
 
 logger = get_logger()
 
+# 메시지 기록 스캔 중 누락 인증 저장과 스캔 위치 저장을 묶는 메시지 수
+HISTORY_CHECKPOINT_SIZE = 500
+
+class RecentMessageIds:
+    """최근 처리한 메시지 ID (LRU, 가득 차면 가장 오래 전에 본 ID부터 제거)"""
+    
+    def __init__(self, capacity: int = 10000):
+        self.capacity = max(1, int(capacity))
+        self._ids: OrderedDict = OrderedDict()
+        self.duplicates = 0
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def __contains__(self, message_id: int) -> bool:
+        return message_id in self._ids
+    
+    def add(self, message_id: int) -> bool:
+        """
+        메시지 ID 기록
+        
+        Returns:
+            처음 본 ID인지 여부 (이미 있으면 최근 사용으로 옮기고 False)
+        """
+        if message_id in self._ids:
+            self._ids.move_to_end(message_id)
+            self.duplicates += 1
+            return False
+        self._ids[message_id] = None
+        if len(self._ids) > self.capacity:
+            self._ids.popitem(last=False)
+        return True
+    
+    def discard(self, message_id: int) -> None:
+        """메시지 ID 제거 (처리에 실패해 다시 받으면 처리하도록)"""
+        self._ids.pop(message_id, None)
+
 class VerificationService:
     """인증 관련 서비스 클래스"""
     
-    def __init__(self, config, bot, message_util, time_util, webhook_service=None, vacation_service=None, verification_manager=None):
+    def __init__(self, config, bot, message_util, time_util, webhook_service=None, vacation_service=None,
+                 verification_manager: AsyncVerificationManager = None,
+                 verification_writer: VerificationWriteBuffer = None,
+                 daily_summary_manager: AsyncDailySummaryManager = None,
+                 history_cursor_manager: AsyncHistoryCursorManager = None,
+                 roster_service: MemberRosterService = None,
+                 history_scanner: HistoryScanner = None):
         self.config = config
         self.bot = bot
         self.message_util = message_util
@@ -20,8 +70,15 @@ class VerificationService:
         self.webhook_service = webhook_service  # 하위 호환성을 위해 유지
         self.vacation_service = vacation_service
         self._check_in_progress = False
+        self.verification_writer = verification_writer  # 없으면 기록마다 바로 커밋
+        self.daily_summary_manager = daily_summary_manager  # 없으면 체크 결과를 요약에 기록하지 않음
+        self.history_cursor_manager = history_cursor_manager  # 없으면 체크마다 그날 기록 전체를 다시 확인
+        self.roster_service = roster_service  # 없거나 명단이 준비되지 않았으면 체크마다 멤버를 REST로 조회
+        self.history_scanner = history_scanner or HistoryScanner.from_config(config)
+        # 게이트웨이 재전송(RESUME) 등으로 같은 메시지 이벤트를 다시 받으면 DB에 닿기 전에 건너뜀
+        self.recent_message_ids = RecentMessageIds(config.RECENT_MESSAGE_CACHE_SIZE)
         
-        # ConfigManager에서 verification_manager를 전달받음
+        # ConfigManager에서 비동기 verification_manager를 전달받음
         if verification_manager:
             self.verification_manager = verification_manager
             self.db_manager = verification_manager.db_manager
@@ -34,53 +91,271 @@ class VerificationService:
         start_time,
         end_time
     ) -> Tuple[Set[int], List[discord.Member]]:
-        """인증 데이터 가져오기"""
+        """
+        인증 데이터 가져오기
+        
+        채널 기록 확인, DB 조회, 멤버 조회를 동시에 실행하고 단계별로 제한 시간을 둡니다.
+        스캔 위치 매니저가 있으면 마지막 스캔 이후 메시지만 확인해 실시간 처리에서 빠진 인증을
+        DB에 기록한 뒤 DB를 조회합니다. 없으면 그날 기록을 MESSAGE_HISTORY_LIMIT까지 다시 확인합니다.
+        멤버는 받는 대로 그때까지 확인된 인증 사용자와 비교해 걸러내고, 마지막에 한 번 더 거릅니다.
+        """
         verified_users: Set[int] = set()
-        unverified_members: List[discord.Member] = []
+        candidates: Dict[int, discord.Member] = {}  # 스트리밍 중 아직 인증이 확인되지 않은 멤버
+        verification_date = start_time.date()  # start_time에서 날짜 추출
+        use_roster = self.roster_service is not None and self.roster_service.is_ready(channel.guild.id)
+        timings: Dict[str, float] = {}
         
-        try:
-            # 데이터베이스에서 인증한 사용자 확인
-            verification_date = start_time.date()  # start_time에서 날짜 추출
-            db_verified_users = self.verification_manager.get_verified_users_on_date(verification_date)
-            verified_users = {int(user_id) for user_id in db_verified_users}  # str을 int로 변환
-            
+        async def load_verified():
+            db_verified_users = await self.verification_manager.get_verified_users_on_date(verification_date)
+            verified_users.update(int(user_id) for user_id in db_verified_users)  # str을 int로 변환
+        
+        async def scan_history():
             # 메시지 히스토리도 추가로 확인 (백업용)
             async for message in channel.history(
                 after=start_time,
                 before=end_time,
                 limit=self.config.MESSAGE_HISTORY_LIMIT
             ):
-                if (self.message_util.is_verification_message(message.content) and 
-                    any(self.message_util.is_valid_image(attachment) for attachment in message.attachments)):
+                if (self.message_util.is_verification_message(message.content) and
+                        self._image_attachments(message)):
                     verified_users.add(message.author.id)
-            
-            # 인증하지 않은 멤버 확인
+        
+        async def sync_then_load():
+            # 누락 인증을 DB에 기록한 뒤 조회해야 하므로 두 단계는 순서대로 실행
+            await self._run_check_stage(
+                'history', self._sync_channel_history(channel, start_time, end_time),
+                self.config.CHECK_HISTORY_TIMEOUT, timings
+            )
+            await self._run_check_stage('database', load_verified(), self.config.CHECK_DATABASE_TIMEOUT, timings)
+        
+        async def stream_members():
             async for member in channel.guild.fetch_members():
                 if not member.bot and member.id not in verified_users:
-                    unverified_members.append(member)
-                    
+                    candidates[member.id] = member
+        
+        started = time.perf_counter()
+        stages = []
+        if self.history_cursor_manager:
+            stages.append(sync_then_load())
+        else:
+            stages.append(self._run_check_stage(
+                'history', scan_history(), self.config.CHECK_HISTORY_TIMEOUT, timings))
+            stages.append(self._run_check_stage(
+                'database', load_verified(), self.config.CHECK_DATABASE_TIMEOUT, timings))
+        if not use_roster:
+            stages.append(self._run_check_stage(
+                'members', stream_members(), self.config.CHECK_MEMBERS_TIMEOUT, timings))
+        await asyncio.gather(*stages)
+        
+        # 인증하지 않은 멤버 확인 (스트리밍 이후에 확인된 인증 사용자 제외)
+        if use_roster:
+            unverified_members = self.roster_service.eligible_members(channel.guild, exclude=verified_users)
+        else:
+            unverified_members = [
+                member for member_id, member in candidates.items() if member_id not in verified_users
+            ]
+        
+        logger.info(
+            "체크 단계별 시간: "
+            + ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in timings.items())
+            + f" (전체 {(time.perf_counter() - started) * 1000:.0f}ms, "
+            f"멤버 {'명단' if use_roster else 'REST 조회'})"
+        )
+        return verified_users, unverified_members
+    
+    async def _run_check_stage(self, name: str, stage: Awaitable, timeout: float,
+                               timings: Dict[str, float]) -> bool:
+        """
+        체크 단계 실행 (제한 시간 초과나 오류 시 로그만 남기고 그때까지의 결과로 진행)
+        
+        Returns:
+            제한 시간 안에 오류 없이 끝났는지 여부
+        """
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(stage, timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"체크 단계 제한 시간 초과: {name} ({timeout}초), 그때까지의 결과로 진행")
         except discord.Forbidden:
-            logger.error("Missing required permissions")
+            logger.error(f"Missing required permissions ({name})")
         except discord.HTTPException as e:
-            logger.error(f"Error while fetching messages/members: {e}")
+            logger.error(f"Error while fetching messages/members ({name}): {e}")
+        except Exception as e:
+            # 확인하지 못한 메시지는 다음 체크에서 이어서 확인
+            logger.error(f"체크 단계 오류 ({name}): {e}", exc_info=True)
+        finally:
+            timings[name] = time.perf_counter() - started
+        return False
+    
+    async def _sync_channel_history(self, channel: discord.TextChannel, start_time, end_time) -> None:
+        """
+        마지막 스캔 위치 이후 end_time 전까지의 메시지를 확인해 누락된 인증 기록 저장
+        
+        스캔 위치는 누락 인증을 저장한 뒤에만 앞으로 옮기므로 중간에 실패해도
+        다음 체크가 저장하지 못한 메시지부터 다시 확인합니다.
+        """
+        cursor = await self.history_cursor_manager.get_cursor(str(channel.id))
+        after = start_time
+        if cursor and cursor.last_seen > start_time:
+            after = discord.Object(id=cursor.last_message_id)
+        
+        scanned = added = 0
+        pending: List[Dict] = []
+        last_message = None
+        async for message in self.history_scanner.scan(channel, after, end_time):
+            scanned += 1
+            last_message = message
+            record = self.history_record(message)
+            if record:
+                pending.append(record)
+            if scanned % HISTORY_CHECKPOINT_SIZE == 0:
+                added += await self._checkpoint_history(channel, pending, last_message)
+                pending = []
+        if last_message is not None:
+            added += await self._checkpoint_history(channel, pending, last_message)
+        
+        logger.info(
+            f"채널 기록 확인: {'처음부터' if cursor is None else '이전 스캔 이후'} {scanned}개 메시지, "
+            f"누락된 인증 {added}건 저장"
+        )
+    
+    async def _checkpoint_history(self, channel: discord.TextChannel, pending: List[Dict],
+                                  last_message: discord.Message) -> int:
+        """누락 인증 저장 후 스캔 위치 저장 (저장 실패 시 위치를 옮기지 않음)"""
+        added = await self.verification_manager.add_missing_verifications(pending)
+        if added < 0:
+            raise RuntimeError("누락된 인증 기록을 저장하지 못해 채널 기록 스캔을 중단합니다.")
+        await self.history_cursor_manager.save_cursor(
+            str(channel.id), last_message.id, last_message.created_at.astimezone(self.config.TIMEZONE)
+        )
+        return added
+    
+    def history_record(self, message: discord.Message) -> Optional[Dict]:
+        """
+        채널 기록의 메시지를 인증 기록으로 변환
+        
+        Returns:
+            add_verification 인자와 message_id 키를 가진 딕셔너리 (인증 메시지가 아니면 None)
+        """
+        if message.author.bot or not self.message_util.is_verification_message(message.content):
+            return None
+        attachments = self._image_attachments(message)
+        if not attachments:
+            return None
+        return {
+            'user_id': str(message.author.id),
+            'username': message.author.name,
+            'message_content': message.content,
+            'image_urls': [attachment['url'] for attachment in attachments],
+            'verification_datetime': message.created_at.astimezone(self.config.TIMEZONE),
+            'attachments': attachments,
+            'message_id': message.id
+        }
+    
+    def _image_attachments(self, message: discord.Message) -> List[Dict]:
+        """메시지의 유효한 이미지 첨부 파일 정보 추출"""
+        return [
+            {
+                'attachment_id': str(attachment.id),
+                'url': attachment.url,
+                'content_type': attachment.content_type,
+                'size': attachment.size
+            }
+            for attachment in message.attachments
+            if self.message_util.is_valid_image(attachment)
+        ]
+    
+    async def _record_check_summary(self, date: datetime.date, verified_users: Set[int],
+                                    unverified_members: List[discord.Member]) -> None:
+        """체크 대상(인증한 사용자 + 휴가 제외 전 미인증 멤버)을 날짜별 요약에 기록"""
+        if not self.daily_summary_manager:
+            return
+        member_ids = {str(user_id) for user_id in verified_users}
+        member_ids.update(str(member.id) for member in unverified_members)
+        summary = await self.daily_summary_manager.record_check(date, member_ids)
+        if summary:
+            logger.info(
+                f"{date} 인증 현황: 대상 {summary.required}명, 인증 {summary.verified}명, "
+                f"휴가 {summary.on_vacation}명, 미인증 {summary.missed}명"
+            )
+    
+    async def _exclude_vacationers(self, members: List[discord.Member], date: datetime.date) -> List[discord.Member]:
+        """휴가자 제외 (휴가 조회 1회 + 집합 차집합)"""
+        member_ids = {member.id for member in members}
+        remaining_ids = member_ids - await self.vacation_service.get_users_on_vacation(member_ids, date)
+        
+        if len(remaining_ids) != len(member_ids):
+            logger.info(f"{len(member_ids) - len(remaining_ids)}명이 휴가로 인해 인증 체크에서 제외됨")
+        return [member for member in members if member.id in remaining_ids]
+    
+    def accept_message(self, message: discord.Message) -> bool:
+        """
+        처리할 메시지인지 확인 (최근에 처리한 메시지 ID면 DB에 닿기 전에 건너뜀)
+        
+        Returns:
+            처음 받은 메시지인지 여부
+        """
+        if not self.recent_message_ids.add(message.id):
+            logger.info(f"이미 처리한 인증 메시지 이벤트 건너뜀: {message.id}")
+            return False
+        return True
+    
+    async def acknowledge(self, message: discord.Message) -> None:
+        """처리 중임을 표시하는 반응 추가"""
+        if message.guild and message.channel.permissions_for(message.guild.me).add_reactions:
+            await message.add_reaction('⏳')  # 처리 중 표시
+    
+    async def notify_deferred(self, message: discord.Message) -> None:
+        """접수 대기열이 가득 차 바로 처리하지 못한 인증 메시지 안내 (다음 체크의 채널 기록 확인에서 저장)"""
+        try:
+            if message.guild and message.channel.permissions_for(message.guild.me).add_reactions:
+                await message.add_reaction('⚠️')  # 지연 표시
             
-        return verified_users, unverified_members
+            embed = discord.Embed(
+                title="⚠️ 인증 처리 지연",
+                description="인증이 몰려 지금 바로 처리하지 못했습니다.",
+                color=discord.Color.gold()
+            )
+            embed.add_field(
+                name="안내",
+                value="다음 인증 체크 때 채널 기록에서 자동으로 확인되니 다시 올리지 않아도 됩니다.",
+                inline=False
+            )
+            
+            await message.channel.send(
+                content=message.author.mention,
+                embed=embed
+            )
+        except Exception as e:
+            logger.error(f"인증 지연 안내 중 오류: {e}", exc_info=True)
     
     async def process_verification_message(self, message: discord.Message) -> None:
-        """인증 메시지 처리"""
+        """인증 메시지 처리 (최근에 처리한 메시지는 건너뜀, 저장은 메시지 ID 기준으로 중복 없이)"""
+        if not self.accept_message(message):
+            return
+        await self.complete_verification(message, asyncio.create_task(self.acknowledge(message)))
+    
+    async def complete_verification(self, message: discord.Message,
+                                    acknowledgement: Optional[asyncio.Task] = None) -> None:
+        """
+        접수한 인증 메시지 저장 및 결과 응답
+        
+        ⏳ 반응은 저장과 동시에 진행하고, 반응을 지우기 직전에만 끝나기를 기다립니다.
+        
+        Args:
+            message: accept_message로 접수한 메시지
+            acknowledgement: acknowledge() 작업 (없으면 None)
+        """
         try:
-            # 처리 중임을 표시하는 반응 추가
-            if message.guild and message.channel.permissions_for(message.guild.me).add_reactions:
-                await message.add_reaction('⏳')  # 처리 중 표시
-
-            # 이미지 URL 추출
-            image_urls = []
-            for attachment in message.attachments:
-                if self.message_util.is_valid_image(attachment):
-                    image_urls.append(attachment.url)
+            # 이미지 첨부 파일 추출
+            attachments = self._image_attachments(message)
+            image_urls = [attachment['url'] for attachment in attachments]
             
             # 이미지가 없는 경우
             if not image_urls:
+                if acknowledgement is not None:
+                    await acknowledgement
                 await message.clear_reactions()
                 if message.guild and message.channel.permissions_for(message.guild.me).add_reactions:
                     await message.add_reaction('❌')  # 실패 표시
@@ -106,15 +381,21 @@ class VerificationService:
             # 현재 시간 (KST) 가져오기
             current_time = self.time_util.now()
             
-            # 데이터베이스에 인증 기록 저장
-            success = self.verification_manager.add_verification(
+            # 데이터베이스에 인증 기록 저장 (그룹 커밋 버퍼 사용 시 커밋 완료까지 대기)
+            save = (self.verification_writer.submit if self.verification_writer
+                    else self.verification_manager.add_verification)
+            success = await save(
                 user_id=str(message.author.id),
                 username=message.author.name,
                 message_content=message.content,
                 image_urls=image_urls,
-                verification_datetime=current_time
+                verification_datetime=current_time,
+                attachments=attachments,
+                message_id=message.id
             )
             
+            if acknowledgement is not None:
+                await acknowledgement
             await message.clear_reactions()
             
             if success:
@@ -145,6 +426,9 @@ class VerificationService:
                     embed=embed
                 )
             else:
+                # 저장하지 못한 메시지는 다시 받으면 처리
+                self.recent_message_ids.discard(message.id)
+                
                 # 실패 반응 추가
                 if message.guild and message.channel.permissions_for(message.guild.me).add_reactions:
                     await message.add_reaction('❌')  # 실패 표시
@@ -169,6 +453,7 @@ class VerificationService:
         except discord.Forbidden:
             logger.error("Missing permissions for message processing")
             try:
+                await self._settle(acknowledgement)
                 await message.clear_reactions()
                 embed = discord.Embed(
                     title="⚠️ 권한 오류",
@@ -180,7 +465,9 @@ class VerificationService:
                 pass
         except Exception as e:
             logger.error(f"인증 처리 중 오류: {e}", exc_info=True)
+            self.recent_message_ids.discard(message.id)
             try:
+                await self._settle(acknowledgement)
                 await message.clear_reactions()
                 if message.guild and message.channel.permissions_for(message.guild.me).add_reactions:
                     await message.add_reaction('⚠️')  # 경고 표시
@@ -204,6 +491,41 @@ class VerificationService:
                 # 최후의 에러 처리 - 로그만 남기고 무시
                 pass
     
+    @staticmethod
+    async def _settle(acknowledgement: Optional[asyncio.Task]) -> None:
+        """⏳ 반응 작업이 끝나기를 기다림 (오류 처리 중에는 반응 작업의 오류를 무시)"""
+        if acknowledgement is not None:
+            await asyncio.gather(acknowledgement, return_exceptions=True)
+    
+    async def handle_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """
+        인증 채널 메시지 수정 반영
+        
+        수정 후에도 인증 메시지면 저장된 기록의 내용과 첨부 파일을 갱신하고, 키워드나 이미지가
+        빠졌으면 기록을 취소합니다. 저장된 기록이 없는 메시지는 수정으로 새로 인증되지 않습니다.
+        """
+        if payload.channel_id not in self.config.ALLOWED_CHANNELS:
+            return
+        message = payload.message
+        cached = payload.cached_message
+        if cached is not None and cached.content == message.content and \
+                [a.id for a in cached.attachments] == [a.id for a in message.attachments]:
+            return  # 링크 미리보기 생성 등 내용이 바뀌지 않은 수정
+        
+        record = self.history_record(message)
+        if record is None:
+            await self.verification_manager.retract_verifications([message.id])
+        else:
+            await self.verification_manager.update_verification(
+                message.id, record['message_content'], record['attachments']
+            )
+    
+    async def handle_message_delete(self, channel_id: int, message_ids: Iterable[int]) -> None:
+        """인증 채널에서 삭제된 메시지의 인증 기록 취소"""
+        if channel_id not in self.config.ALLOWED_CHANNELS:
+            return
+        await self.verification_manager.retract_verifications(message_ids)
+    
     async def send_unverified_messages(
         self,
         channel: discord.TextChannel,
@@ -352,17 +674,11 @@ class VerificationService:
             
             # 인증 데이터 가져오기
             verified_users, unverified_members = await self.get_verification_data(channel, start_time, end_time)
+            await self._record_check_summary(start_time.date(), verified_users, unverified_members)
             
             # 휴가 사용자 필터링 (휴가 서비스가 있는 경우)
             if self.vacation_service:
-                filtered_members = []
-                for member in unverified_members:
-                    if not self.vacation_service.is_user_on_vacation(member.id):
-                        filtered_members.append(member)
-                
-                if len(filtered_members) != len(unverified_members):
-                    logger.info(f"{len(unverified_members) - len(filtered_members)}명이 휴가로 인해 인증 체크에서 제외됨")
-                unverified_members = filtered_members
+                unverified_members = await self._exclude_vacationers(unverified_members, now.date())
             
             # 결과 출력
             logger.info(f"인증 완료: {len(verified_users)}명, 미완료: {len(unverified_members)}명")
@@ -407,17 +723,11 @@ class VerificationService:
             
             # 인증 데이터 가져오기
             verified_users, unverified_members = await self.get_verification_data(channel, start_time, end_time)
+            await self._record_check_summary(start_time.date(), verified_users, unverified_members)
             
             # 휴가 사용자 필터링 (휴가 서비스가 있는 경우)
             if self.vacation_service:
-                filtered_members = []
-                for member in unverified_members:
-                    if not self.vacation_service.is_user_on_vacation(member.id, yesterday.date()):
-                        filtered_members.append(member)
-                
-                if len(filtered_members) != len(unverified_members):
-                    logger.info(f"{len(unverified_members) - len(filtered_members)}명이 휴가로 인해 인증 체크에서 제외됨")
-                unverified_members = filtered_members
+                unverified_members = await self._exclude_vacationers(unverified_members, yesterday.date())
             
             # 결과 출력
             logger.info(f"전일 인증 완료: {len(verified_users)}명, 미완료: {len(unverified_members)}명")